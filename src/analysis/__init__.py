@@ -1,17 +1,38 @@
 """
 Analysis package for onsen data analysis and modeling.
+
+The main classes are re-exported lazily: importing a light submodule (such
+as ``result_cache``) must not pull in pandas, scipy and the plotting stack.
 """
 
-from .engine import AnalysisEngine
-from .data_pipeline import DataPipeline
-from .metrics import MetricsCalculator
-from .visualizations import VisualizationEngine
-from .models import ModelEngine
-
-__all__ = [
-    "AnalysisEngine",
-    "DataPipeline",
-    "MetricsCalculator",
-    "VisualizationEngine",
-    "ModelEngine",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .data_pipeline import DataPipeline
+    from .engine import AnalysisEngine
+    from .metrics import MetricsCalculator
+    from .models import ModelEngine
+    from .visualizations import VisualizationEngine
+
+_EXPORTS = {
+    "AnalysisEngine": "engine",
+    "DataPipeline": "data_pipeline",
+    "MetricsCalculator": "metrics",
+    "VisualizationEngine": "visualizations",
+    "ModelEngine": "models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
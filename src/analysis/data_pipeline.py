@@ -8,13 +8,101 @@ from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import select, text
 from loguru import logger
 
+from src.db.columnar import column_dtypes, fetch_columns, result_to_frame
 from src.db.models import Onsen, OnsenVisit, Activity
 from src.types.analysis import DataCategory
 from src.types.exercise import ExerciseType
 
+NUMERIC_COLUMN = "numeric"
+BOOLEAN_COLUMN = "boolean"
+DATETIME_COLUMN = "datetime"
+
+# Kind each known column is coerced to once, when the data is loaded
+COLUMN_SCHEMA: dict[str, str] = {
+    **dict.fromkeys(["visit_time", "recording_start", "recording_end"], DATETIME_COLUMN),
+    **dict.fromkeys(
+        [
+            "latitude",
+            "longitude",
+            "entry_fee_yen",
+            "temperature_outside_celsius",
+            "stay_length_minutes",
+            "travel_time_minutes",
+            "accessibility_rating",
+            "cleanliness_rating",
+            "navigability_rating",
+            "view_rating",
+            "atmosphere_rating",
+            "personal_rating",
+            "main_bath_temperature",
+            "sauna_temperature",
+            "outdoor_bath_temperature",
+            "smell_intensity_rating",
+            "changing_room_cleanliness_rating",
+            "locker_availability_rating",
+            "rest_area_rating",
+            "food_quality_rating",
+            "sauna_rating",
+            "outdoor_bath_rating",
+            # Activity columns
+            "duration_minutes",
+            "distance_km",
+            "calories_burned",
+            "elevation_gain_m",
+            "avg_heart_rate",
+            "min_heart_rate",
+            "max_heart_rate",
+            "energy_level_change",
+            "hydration_level",
+            "average_heart_rate",
+            "total_recording_minutes",
+            "data_points_count",
+        ],
+        NUMERIC_COLUMN,
+    ),
+    **dict.fromkeys(
+        [
+            "had_soap",
+            "had_sauna",
+            "had_outdoor_bath",
+            "had_rest_area",
+            "had_food_service",
+            "massage_chair_available",
+            "sauna_visited",
+            "sauna_steam",
+            "outdoor_bath_visited",
+            "multi_onsen_day",
+        ],
+        BOOLEAN_COLUMN,
+    ),
+}
+
+SEASON_BY_MONTH = {
+    12: "Winter",
+    1: "Winter",
+    2: "Winter",
+    3: "Spring",
+    4: "Spring",
+    5: "Spring",
+    6: "Summer",
+    7: "Summer",
+    8: "Summer",
+    9: "Autumn",
+    10: "Autumn",
+    11: "Autumn",
+}
+
+EXPERIENCE_COLUMNS = [
+    "cleanliness_rating",
+    "navigability_rating",
+    "view_rating",
+    "atmosphere_rating",
+    "changing_room_cleanliness_rating",
+]
+
 
 class DataPipeline:
     """
@@ -25,6 +113,12 @@ class DataPipeline:
         self.session = session
         self._cached_data: dict[str, pd.DataFrame] = {}
         self._data_mappings = self._initialize_data_mappings()
+        # Result labels are plain column names, so one lookup covers every table
+        self._column_dtypes = {
+            **column_dtypes(Activity),
+            **column_dtypes(OnsenVisit),
+            **column_dtypes(Onsen),
+        }
 
     def _initialize_data_mappings(self) -> dict[DataCategory, dict[str, Any]]:
         """Initialize mappings for different data categories."""
@@ -301,6 +395,16 @@ class DataPipeline:
             },
         }
 
+    def get_source_tables(self, categories: list[DataCategory]) -> set[str]:
+        """Return the database tables read when loading the given categories."""
+        tables = {"onsens"}
+        for category in categories:
+            config = self._data_mappings[category]
+            tables.add(config["table"])
+            for join in config.get("joins", []):
+                tables.add(join[0])
+        return tables
+
     def get_data_for_categories(
         self,
         categories: list[DataCategory],
@@ -452,7 +556,7 @@ class DataPipeline:
         # Execute query
         try:
             result = self.session.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+            df = result_to_frame(result, self._column_dtypes)
 
             # Clean and preprocess the data
             df = self._clean_dataframe(df)
@@ -485,20 +589,19 @@ class DataPipeline:
     ) -> pd.DataFrame:
         # pylint: disable=too-complex
         # Complexity justified: ORM fallback handles multiple data category types
-        """Fallback method using ORM queries."""
+        """Fallback method reading each category's columns with typed column fetches."""
         dfs = []
 
         for category in categories:
             if category == DataCategory.ONSEN_BASIC:
-                query = self.session.query(Onsen)
+                where = []
                 if spatial_bounds:
                     min_lat, max_lat, min_lon, max_lon = spatial_bounds
-                    query = query.filter(
+                    where += [
                         Onsen.latitude.between(min_lat, max_lat),
                         Onsen.longitude.between(min_lon, max_lon),
-                    )
-                df = pd.read_sql(query.statement, self.session.bind)
-                dfs.append(df)
+                    ]
+                dfs.append(self._fetch_category_columns(Onsen, category, where))
 
             elif category in [
                 DataCategory.VISIT_BASIC,
@@ -509,60 +612,43 @@ class DataPipeline:
                 DataCategory.TEMPORAL,
                 DataCategory.WEATHER,
             ]:
-                query = self.session.query(OnsenVisit).join(Onsen)
-
+                where = []
                 if time_range:
                     start_time, end_time = time_range
-                    query = query.filter(
-                        OnsenVisit.visit_time.between(start_time, end_time)
-                    )
+                    where.append(OnsenVisit.visit_time.between(start_time, end_time))
 
                 if spatial_bounds:
                     min_lat, max_lat, min_lon, max_lon = spatial_bounds
-                    query = query.filter(
-                        Onsen.latitude.between(min_lat, max_lat),
-                        Onsen.longitude.between(min_lon, max_lon),
+                    where.append(
+                        OnsenVisit.onsen_id.in_(
+                            select(Onsen.id).where(
+                                Onsen.latitude.between(min_lat, max_lat),
+                                Onsen.longitude.between(min_lon, max_lon),
+                            )
+                        )
                     )
 
-                df = pd.read_sql(query.statement, self.session.bind)
-                dfs.append(df)
+                dfs.append(self._fetch_category_columns(OnsenVisit, category, where))
 
             elif category in [
                 DataCategory.ACTIVITY_ALL,
                 DataCategory.ACTIVITY_EXERCISE,
                 DataCategory.ACTIVITY_METRICS,
+                DataCategory.ACTIVITY_ONSEN,
             ]:
-                query = self.session.query(Activity)
+                where = []
 
                 # Apply filters based on category
                 if category == DataCategory.ACTIVITY_EXERCISE:
-                    query = query.filter(Activity.activity_type != ExerciseType.ONSEN_MONITORING.value)
-
-                if time_range:
-                    start_time, end_time = time_range
-                    query = query.filter(
-                        Activity.recording_start.between(start_time, end_time)
-                    )
-
-                df = pd.read_sql(query.statement, self.session.bind)
-                dfs.append(df)
-
-            elif category == DataCategory.ACTIVITY_ONSEN:
-                # Join with visits for onsen monitoring activities
-                query = (
-                    self.session.query(Activity)
-                    .outerjoin(OnsenVisit, Activity.visit_id == OnsenVisit.id)
-                    .filter(Activity.activity_type == ExerciseType.ONSEN_MONITORING.value)
-                )
+                    where.append(Activity.activity_type != ExerciseType.ONSEN_MONITORING.value)
+                elif category == DataCategory.ACTIVITY_ONSEN:
+                    where.append(Activity.activity_type == ExerciseType.ONSEN_MONITORING.value)
 
                 if time_range:
                     start_time, end_time = time_range
-                    query = query.filter(
-                        Activity.recording_start.between(start_time, end_time)
-                    )
+                    where.append(Activity.recording_start.between(start_time, end_time))
 
-                df = pd.read_sql(query.statement, self.session.bind)
-                dfs.append(df)
+                dfs.append(self._fetch_category_columns(Activity, category, where))
 
         # Combine all dataframes
         if dfs:
@@ -580,113 +666,73 @@ class DataPipeline:
 
         return pd.DataFrame()
 
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and preprocess the dataframe."""
-        if df.empty:
-            return df
-
-        # Convert date columns
-        date_columns = ["visit_time", "recording_start", "recording_end"]
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce")
-
-        # Convert numeric columns
-        numeric_columns = [
-            "latitude",
-            "longitude",
-            "entry_fee_yen",
-            "temperature_outside_celsius",
-            "stay_length_minutes",
-            "travel_time_minutes",
-            "accessibility_rating",
-            "cleanliness_rating",
-            "navigability_rating",
-            "view_rating",
-            "atmosphere_rating",
-            "personal_rating",
-            "main_bath_temperature",
-            "sauna_temperature",
-            "outdoor_bath_temperature",
-            "smell_intensity_rating",
-            "changing_room_cleanliness_rating",
-            "locker_availability_rating",
-            "rest_area_rating",
-            "food_quality_rating",
-            "sauna_rating",
-            "outdoor_bath_rating",
-            # Activity columns
-            "duration_minutes",
-            "distance_km",
-            "calories_burned",
-            "elevation_gain_m",
-            "avg_heart_rate",
-            "min_heart_rate",
-            "max_heart_rate",
-            "energy_level_change",
-            "hydration_level",
-            "average_heart_rate",
-            "min_heart_rate",
-            "max_heart_rate",
-            "total_recording_minutes",
-            "data_points_count",
+    def _fetch_category_columns(
+        self, model: Any, category: DataCategory, where: list[Any]
+    ) -> pd.DataFrame:
+        """Read only a category's mapped columns of ``model`` into a typed DataFrame."""
+        table_columns = model.__table__.columns
+        columns = [
+            col for col in self._data_mappings[category]["columns"] if col in table_columns
         ]
+        if "onsen_id" in table_columns and "onsen_id" not in columns:
+            # Keep the key the per-category frames are merged on
+            columns.append("onsen_id")
+        return fetch_columns(self.session, model, columns, where=where)
 
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        # Convert boolean columns
-        boolean_columns = [
-            "had_soap",
-            "had_sauna",
-            "had_outdoor_bath",
-            "had_rest_area",
-            "had_food_service",
-            "massage_chair_available",
-            "sauna_visited",
-            "sauna_steam",
-            "outdoor_bath_visited",
-            "multi_onsen_day",
-        ]
+    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean and preprocess a freshly loaded dataframe in place.
 
-        for col in boolean_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(bool)
+        The frame is owned by the pipeline at this point, so columns are
+        coerced and added without copying the frame.
+        """
+        if df.empty:
+            return df
 
-        # Handle missing values
-        df = df.replace([np.inf, -np.inf], np.nan)
+        self._coerce_dtypes(df)
+        self._add_derived_columns(df)
+        return df
 
-        # Add derived columns
-        df = self._add_derived_columns(df)
+    @staticmethod
+    def _coerce_dtypes(df: pd.DataFrame) -> None:
+        """
+        Coerce columns to their ``COLUMN_SCHEMA`` kind and turn infinities into NaN.
 
-        return df
+        Columns that already have the target dtype (as typed reads produce)
+        are left untouched.
+        """
+        for col in df.columns:
+            kind = COLUMN_SCHEMA.get(col)
+            values = df[col]
+            if kind == DATETIME_COLUMN and not pd.api.types.is_datetime64_any_dtype(values):
+                df[col] = pd.to_datetime(values, errors="coerce")
+            elif kind == NUMERIC_COLUMN and not pd.api.types.is_numeric_dtype(values):
+                df[col] = pd.to_numeric(values, errors="coerce")
+            elif kind == BOOLEAN_COLUMN and not pd.api.types.is_bool_dtype(values):
+                df[col] = values.astype(bool)
+
+            # Handle missing values
+            values = df[col]
+            if pd.api.types.is_float_dtype(values):
+                infinite = np.isinf(values.to_numpy())
+                if infinite.any():
+                    df[col] = values.mask(infinite)
+
+    @staticmethod
+    def _add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Add useful derived columns for analysis, computed together and inserted in place."""
+        derived: dict[str, Any] = {}
 
-    def _add_derived_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add useful derived columns for analysis."""
         # Time-based columns
         if "visit_time" in df.columns:
-            df["visit_date"] = df["visit_time"].dt.date
-            df["visit_month"] = df["visit_time"].dt.month
-            df["visit_year"] = df["visit_time"].dt.year
-            df["visit_day_of_week"] = df["visit_time"].dt.day_name()
-            df["visit_hour"] = df["visit_time"].dt.hour
-            df["visit_season"] = df["visit_time"].dt.month.map(
-                {
-                    12: "Winter",
-                    1: "Winter",
-                    2: "Winter",
-                    3: "Spring",
-                    4: "Spring",
-                    5: "Spring",
-                    6: "Summer",
-                    7: "Summer",
-                    8: "Summer",
-                    9: "Autumn",
-                    10: "Autumn",
-                    11: "Autumn",
-                }
-            )
+            times = df["visit_time"].dt
+            month = times.month
+            derived["visit_date"] = times.date
+            derived["visit_month"] = month
+            derived["visit_year"] = times.year
+            derived["visit_day_of_week"] = times.day_name()
+            derived["visit_hour"] = times.hour
+            derived["visit_season"] = month.map(SEASON_BY_MONTH)
 
         # Rating aggregates
         rating_columns = [
@@ -695,25 +741,26 @@ class DataPipeline:
             if col.endswith("_rating") and col != "personal_rating"
         ]
         if rating_columns:
-            df["average_rating"] = df[rating_columns].mean(axis=1)
-            df["rating_count"] = df[rating_columns].notna().sum(axis=1)
-
-        # Distance calculations (if we have location data)
-        if all(col in df.columns for col in ("latitude", "longitude")):
-            # This would need to be enhanced with actual location data
-            pass
-
-        # Experience quality score
-        experience_columns = [
-            "cleanliness_rating",
-            "navigability_rating",
-            "view_rating",
-            "atmosphere_rating",
-            "changing_room_cleanliness_rating",
-        ]
-        if all(col in df.columns for col in experience_columns):
-            df["experience_quality_score"] = df[experience_columns].mean(axis=1)
+            ratings = df[rating_columns].to_numpy(dtype=float)
+            present = ~np.isnan(ratings)
+            rating_count = present.sum(axis=1)
+            rating_sum = np.where(present, ratings, 0.0).sum(axis=1)
+            derived["average_rating"] = np.divide(
+                rating_sum, rating_count, out=np.full(len(df), np.nan), where=rating_count > 0
+            )
+            derived["rating_count"] = rating_count
+
+            # Experience quality score
+            if all(col in rating_columns for col in EXPERIENCE_COLUMNS):
+                positions = [rating_columns.index(col) for col in EXPERIENCE_COLUMNS]
+                experience = ratings[:, positions]
+                counts = (~np.isnan(experience)).sum(axis=1)
+                derived["experience_quality_score"] = np.divide(
+                    np.nansum(experience, axis=1), counts, out=np.full(len(df), np.nan), where=counts > 0
+                )
 
+        for name, values in derived.items():
+            df[name] = values
         return df
 
     def get_onsen_summary_data(self) -> pd.DataFrame:
@@ -738,7 +785,7 @@ class DataPipeline:
 
         try:
             result = self.session.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+            df = result_to_frame(result, self._column_dtypes)
             return self._clean_dataframe(df)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Broad exception justified: any query error should return empty DataFrame
@@ -768,7 +815,7 @@ class DataPipeline:
             result = self.session.execute(
                 text(query), {"start_date": start_date, "end_date": end_date}
             )
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+            df = result_to_frame(result, self._column_dtypes)
             df["visit_date"] = pd.to_datetime(df["visit_date"])
             return df
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -795,7 +842,7 @@ class DataPipeline:
 
         try:
             result = self.session.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+            df = result_to_frame(result, self._column_dtypes)
             return self._clean_dataframe(df)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Broad exception justified: any query error should return empty DataFrame
@@ -897,5 +944,10 @@ class DataPipeline:
         return self._cached_data.get(key)
 
     def cache_data(self, key: str, data: pd.DataFrame) -> None:
-        """Cache data for future use."""
-        self._cached_data[key] = data.copy()
+        """
+        Cache data for future use.
+
+        The frame is kept as is rather than copied; cached frames are shared
+        with every caller and must be treated as read-only.
+        """
+        self._cached_data[key] = data
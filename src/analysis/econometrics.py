@@ -55,6 +55,182 @@ class RegressionResult:
     notes: list[str] = field(default_factory=list)
 
 
+@dataclass
+class OLSScreenResult:
+    """Fit statistics for one specification from the batched OLS kernel."""
+
+    model_name: str
+    dependent_var: str
+    independent_vars: list[str]
+    n_obs: int
+    coefficients: np.ndarray  # const first when a constant is included
+    std_errors: np.ndarray  # HC3 robust
+    p_values: np.ndarray
+    r_squared: float
+    adj_r_squared: float
+    f_statistic: float
+    f_pvalue: float
+    aic: float
+    bic: float
+    log_likelihood: float
+    vif: np.ndarray  # aligned with coefficients
+
+    @property
+    def max_vif(self) -> float:
+        """Largest VIF among the slope variables."""
+        slopes = self.vif[1:] if len(self.vif) > len(self.independent_vars) else self.vif
+        return float(slopes.max()) if len(slopes) else 0.0
+
+
+class BatchOLS:
+    """
+    Screen many OLS specifications drawn from one variable pool.
+
+    The pool is converted to a single float64 matrix once. Cross-products are
+    computed once per distinct set of complete rows (normally just one) and
+    every specification is solved from the matching sub-block, so screening
+    hundreds of nested subsets costs a few small linear solves each.
+    HC3 standard errors, R², AIC/BIC and VIF match statsmodels' OLS output.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        dependent_var: str,
+        variables: list[str],
+        include_constant: bool = True,
+    ):
+        self.dependent_var = dependent_var
+        self.variables = list(dict.fromkeys(variables))
+        self.include_constant = include_constant
+
+        columns = [dependent_var] + self.variables
+        matrix = data[columns].astype(np.float64).to_numpy()
+        if include_constant:
+            matrix = np.column_stack([matrix[:, :1], np.ones(len(matrix)), matrix[:, 1:]])
+
+        # Column 0 is y; design columns follow (constant first when included)
+        self._matrix = matrix
+        self._finite = np.isfinite(matrix)
+        self._offset = 2 if include_constant else 1
+        self._positions = {var: i + self._offset for i, var in enumerate(self.variables)}
+        self._gram_cache: dict[bytes, tuple[np.ndarray, np.ndarray]] = {}
+
+    def _gram_for(self, columns: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """Return (row mask, cross-product matrix) for complete cases of ``columns``."""
+        mask = self._finite[:, columns].all(axis=1)
+        key = np.packbits(mask).tobytes()
+        cached = self._gram_cache.get(key)
+        if cached is None:
+            rows = self._matrix[mask]
+            # NaNs in columns outside this specification must not poison the product
+            rows = np.where(self._finite[mask], rows, 0.0)
+            cached = (mask, rows.T @ rows)
+            self._gram_cache[key] = cached
+        return cached
+
+    def fit(self, independent_vars: list[str], model_name: str = "OLS Model") -> OLSScreenResult:
+        """
+        Fit one specification.
+
+        Raises:
+            KeyError: If a variable is not part of the pool
+            ValueError: If there are too few complete observations
+        """
+        from scipy import stats
+
+        design_cols = ([1] if self.include_constant else []) + [
+            self._positions[var] for var in independent_vars
+        ]
+        mask, gram = self._gram_for([0] + design_cols)
+
+        n = int(mask.sum())
+        k = len(design_cols)
+        if n < len(independent_vars) + 10:
+            raise ValueError(
+                f"Insufficient observations ({n}) for {len(independent_vars)} variables"
+            )
+
+        xtx = gram[np.ix_(design_cols, design_cols)]
+        xty = gram[design_cols, 0]
+        yty = gram[0, 0]
+
+        xtx_inv = np.linalg.pinv(xtx)
+        beta = xtx_inv @ xty
+
+        X = self._matrix[np.ix_(mask, design_cols)]
+        y = self._matrix[mask, 0]
+        resid = y - X @ beta
+        ssr = float(resid @ resid)
+
+        y_sum = xty[0] if self.include_constant else y.sum()
+        centered_tss = yty - y_sum**2 / n
+        tss = centered_tss if self.include_constant else yty
+        r_squared = 1.0 - ssr / tss
+        df_resid = n - k
+        df_model = k - (1 if self.include_constant else 0)
+        adj_r_squared = 1.0 - (n - (1 if self.include_constant else 0)) / df_resid * (1.0 - r_squared)
+
+        # HC3: scale squared residuals by leverage
+        xa = X @ xtx_inv
+        leverage = np.einsum("ij,ij->i", xa, X)
+        weights = resid**2 / (1.0 - leverage) ** 2
+        cov = xa.T @ (xa * weights[:, None])
+        std_errors = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_values = beta / std_errors
+        p_values = 2 * stats.norm.sf(np.abs(t_values))
+
+        # Robust Wald F-test that all slopes are zero
+        slopes = slice(1, None) if self.include_constant else slice(None)
+        f_statistic, f_pvalue = np.nan, np.nan
+        if df_model > 0:
+            b = beta[slopes]
+            v = cov[slopes, slopes]
+            f_statistic = float(b @ np.linalg.pinv(v) @ b / df_model)
+            f_pvalue = float(stats.f.sf(f_statistic, df_model, df_resid))
+
+        log_likelihood = -n / 2.0 * (np.log(2 * np.pi) + np.log(ssr / n) + 1.0)
+        aic = -2 * log_likelihood + 2 * k
+        bic = -2 * log_likelihood + np.log(n) * k
+
+        # VIF_j = TSS_j * (X'X)^-1_jj, centered whenever a constant is among the regressors
+        col_sums = xtx[0] if self.include_constant else X.sum(axis=0)
+        diag = np.diag(xtx)
+        vif_tss = diag.copy()
+        if self.include_constant:
+            vif_tss[1:] = diag[1:] - col_sums[1:] ** 2 / n
+        vif = np.maximum(vif_tss * np.diag(xtx_inv), 1.0)
+
+        return OLSScreenResult(
+            model_name=model_name,
+            dependent_var=self.dependent_var,
+            independent_vars=list(independent_vars),
+            n_obs=n,
+            coefficients=beta,
+            std_errors=std_errors,
+            p_values=p_values,
+            r_squared=float(r_squared),
+            adj_r_squared=float(adj_r_squared),
+            f_statistic=f_statistic,
+            f_pvalue=f_pvalue,
+            aic=float(aic),
+            bic=float(bic),
+            log_likelihood=float(log_likelihood),
+            vif=vif,
+        )
+
+    def fit_many(self, specifications: list[tuple[str, list[str]]]) -> list[OLSScreenResult]:
+        """Fit every specification, skipping ones that cannot be estimated."""
+        results = []
+        for model_name, indep_vars in specifications:
+            try:
+                results.append(self.fit(indep_vars, model_name))
+            except (KeyError, ValueError) as e:
+                logger.debug(f"Screening skipped {model_name}: {e}")
+        return results
+
+
 class EconometricAnalyzer:
     """
     Professional econometric analysis engine.
@@ -8,7 +8,12 @@ from typing import Optional, Any
 import time
 from datetime import datetime
 from pathlib import Path
+import dataclasses
+import hashlib
 import json
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
 from loguru import logger
 
@@ -32,11 +37,65 @@ from src.analysis.models import ModelEngine
 
 # Import new professional analysis modules
 from src.analysis.feature_engineering import FeatureEngineer
+from src.analysis.feature_store import FeatureStore
 from src.analysis.econometrics import EconometricAnalyzer
 from src.analysis.insight_discovery import InsightDiscovery
 from src.analysis.report_generator import ReportGenerator
 from src.analysis.interactive_maps import InteractiveMapGenerator
 from src.analysis.model_search import ModelSearchEngine
+from src.analysis.result_cache import (
+    AnalysisResultCache,
+    compute_data_fingerprint,
+    get_analysis_result_cache,
+)
+from src.analysis.memory_profile import MemoryTracker, run_measured
+from src.analysis.stage_executor import AnalysisStage, StageExecutor
+
+MAP_VISUALIZATION_TYPES = (
+    VisualizationType.POINT_MAP,
+    VisualizationType.HEAT_MAP,
+    VisualizationType.CLUSTER_MAP,
+    VisualizationType.CHOROPLETH,
+)
+
+
+def _render_visualization(
+    save_dir: str, data: pd.DataFrame, config: VisualizationConfig
+) -> tuple[bool, VisualizationConfig]:
+    """Create and save a visualization in a worker process."""
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    engine = VisualizationEngine(save_dir)
+    viz = engine.create_visualization(data, config)
+    if viz is None:
+        return False, config
+
+    if config.save_path:
+        engine.save_visualization(viz, config.save_path)
+
+    if hasattr(viz, "savefig"):
+        import matplotlib.pyplot as plt
+
+        plt.close(viz)
+
+    return True, config
+
+
+def _fit_model(save_dir: str, data: pd.DataFrame, config: ModelConfig) -> dict[str, Any]:
+    """
+    Fit a clustering or dimensionality reduction model in a worker process.
+
+    The worker already holds one of the engine's ``--jobs`` slots, so the
+    model engine here searches cluster counts sequentially rather than
+    opening a nested process pool.
+    """
+    engine = ModelEngine(save_dir)
+    if config.type in [ModelType.KMEANS, ModelType.DBSCAN]:
+        return engine.create_clustering_model(data, config)
+    return engine.create_dimensionality_reduction_model(data, config)
 
 
 class AnalysisEngine:
@@ -44,8 +103,17 @@ class AnalysisEngine:
     Main engine for orchestrating comprehensive onsen analysis.
     """
 
-    def __init__(self, session, output_dir: Optional[str] = None):
+    def __init__(
+        self,
+        session,
+        output_dir: Optional[str] = None,
+        result_cache: Optional[AnalysisResultCache] = None,
+        use_result_cache: bool = True,
+        jobs: int = 1,
+        feature_store: Optional[FeatureStore] = None,
+    ):
         self.session = session
+        self.jobs = max(1, jobs)
         self.base_output_dir = (
             Path(output_dir) if output_dir else Path("output/analysis")
         )
@@ -64,6 +132,17 @@ class AnalysisEngine:
         # Cache for analysis results
         self._analysis_cache: dict[str, AnalysisResult] = {}
 
+        # Persistent cache shared across CLI invocations
+        self.use_result_cache = use_result_cache
+        self._result_cache = result_cache
+
+        # Engineered per-visit features reused by econometric analyses
+        self.feature_store = feature_store
+
+        # Worker processes for plotting and model fitting, active while jobs > 1
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._memory: Optional[MemoryTracker] = None
+
     def _setup_analysis_directory(self, request: AnalysisRequest) -> None:
         """Set up the analysis-specific output directory."""
         # Create timestamp for this analysis
@@ -81,7 +160,7 @@ class AnalysisEngine:
             self.output_dir / "visualizations",
             db_session=self.session
         )
-        self.model_engine = ModelEngine(self.output_dir / "models")
+        self.model_engine = ModelEngine(self.output_dir / "models", n_jobs=self.jobs)
 
         logger.info(f"Analysis output directory: {self.output_dir}")
 
@@ -104,29 +183,43 @@ class AnalysisEngine:
             self._setup_analysis_directory(request)
 
             # Get data
-            data = self._get_analysis_data(request)
+            memory = MemoryTracker()
+            with memory.stage("load"):
+                fingerprint = self._compute_data_fingerprint(request)
+                data = self._get_analysis_data(request, fingerprint)
 
             if data.empty:
                 raise ValueError("No data available for analysis")
 
-            # Calculate metrics
-            metrics = self._calculate_metrics(data, request)
-
-            # Create visualizations
-            visualizations = self._create_visualizations(data, request)
-
-            # Create models if requested
-            models = None
-            if request.models:
-                models = self._create_models(data, request)
+            cached = self._load_cached_result(request, fingerprint)
+            stage_timings: dict[str, float] = {}
 
-            # Generate insights
-            insights = self._generate_insights(data, metrics, models, request)
-
-            # Perform statistical tests if requested
-            statistical_tests = None
-            if request.include_statistical_tests:
-                statistical_tests = self._perform_statistical_tests(data, request)
+            if cached is not None:
+                logger.info("Using cached analysis results")
+                metrics = cached["metrics"]
+                visualizations = self._restore_cached_visualizations(
+                    cached["visualizations"]
+                )
+                models = cached["models"]
+                insights = cached["insights"]
+                statistical_tests = cached["statistical_tests"]
+            else:
+                stage_results, stage_timings = self._run_stages(data, request, memory)
+                metrics = stage_results["metrics"]
+                visualizations = stage_results["visualizations"]
+                models = stage_results.get("models")
+                insights = stage_results["insights"]
+                statistical_tests = stage_results.get("statistical_tests")
+
+                self._store_cached_result(
+                    request,
+                    fingerprint,
+                    metrics=metrics,
+                    visualizations=visualizations,
+                    models=models,
+                    insights=insights,
+                    statistical_tests=statistical_tests,
+                )
 
             # Create result
             result = AnalysisResult(
@@ -144,6 +237,11 @@ class AnalysisEngine:
                     "data_columns": list(data.columns),
                     "missing_values": data.isnull().sum().to_dict(),
                     "output_directory": str(self.output_dir),
+                    "data_fingerprint": fingerprint,
+                    "result_cache_hit": cached is not None,
+                    "jobs": self.jobs,
+                    "stage_timings": stage_timings,
+                    "memory": memory.report(),
                 },
             )
 
@@ -169,6 +267,66 @@ class AnalysisEngine:
                 execution_time=time.time() - start_time,
             )
 
+    def _run_stages(
+        self,
+        data: pd.DataFrame,
+        request: AnalysisRequest,
+        memory: Optional[MemoryTracker] = None,
+    ) -> tuple[dict[str, Any], dict[str, float]]:
+        """
+        Run the analysis stages, concurrently when more than one job is allowed.
+
+        Metrics, visualizations, models and statistical tests only read the
+        data and run independently; insights wait for metrics and models.
+        """
+        stages = [
+            AnalysisStage("metrics", lambda _: self._calculate_metrics(data, request)),
+            AnalysisStage(
+                "visualizations", lambda _: self._create_visualizations(data, request)
+            ),
+        ]
+        insight_deps: tuple[str, ...] = ("metrics",)
+
+        if request.models:
+            stages.append(
+                AnalysisStage("models", lambda _: self._create_models(data, request))
+            )
+            insight_deps = ("metrics", "models")
+
+        stages.append(
+            AnalysisStage(
+                "insights",
+                lambda results: self._generate_insights(
+                    data, results["metrics"], results.get("models"), request
+                ),
+                depends_on=insight_deps,
+            )
+        )
+
+        if request.include_statistical_tests:
+            stages.append(
+                AnalysisStage(
+                    "statistical_tests",
+                    lambda _: self._perform_statistical_tests(data, request),
+                )
+            )
+
+        executor = StageExecutor(max_workers=self.jobs, memory=memory)
+        if self.jobs == 1:
+            return executor.run(stages)
+
+        # Spawned workers avoid forking a process that is running stage threads
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            self._process_pool = pool
+            self._memory = memory
+            try:
+                return executor.run(stages)
+            finally:
+                self._process_pool = None
+                self._memory = None
+
     def run_scenario_analysis(
         self, scenario: AnalysisScenario, custom_config: Optional[dict[str, Any]] = None
     ) -> AnalysisResult:
@@ -207,10 +365,14 @@ class AnalysisEngine:
 
         return self.run_analysis(request)
 
-    def _get_analysis_data(self, request: AnalysisRequest) -> pd.DataFrame:
+    def _get_analysis_data(
+        self, request: AnalysisRequest, fingerprint: Optional[str] = None
+    ) -> pd.DataFrame:
         """Get data for analysis based on the request."""
         # Check cache first
         cache_key = self._generate_cache_key(request)
+        if fingerprint:
+            cache_key = f"{cache_key}_{fingerprint}"
         cached_data = self.data_pipeline.get_cached_data(cache_key)
 
         if cached_data is not None:
@@ -253,13 +415,51 @@ class AnalysisEngine:
 
         return metrics
 
+    def _record_worker_peak(self, stage: str, peak_rss_mb: Optional[float]) -> None:
+        """Attribute memory a worker process used to the stage that submitted it."""
+        if self._memory is not None:
+            self._memory.record_worker_peak(stage, peak_rss_mb)
+
     def _create_visualizations(
         self, data: pd.DataFrame, request: AnalysisRequest
     ) -> dict[str, Any]:
         """Create visualizations based on the request."""
         visualizations = {}
+        pool = self._process_pool
+        rendering = {}
+
+        # Maps use the database session for location markers, so only charts
+        # are rendered in worker processes
+        if pool is not None:
+            for viz_type in request.visualizations:
+                if viz_type in MAP_VISUALIZATION_TYPES:
+                    continue
+                config = self._create_visualization_config(viz_type, data, request)
+                rendering[viz_type] = pool.submit(
+                    run_measured,
+                    _render_visualization,
+                    str(self.visualization_engine.save_dir),
+                    data,
+                    config,
+                )
 
         for viz_type in request.visualizations:
+            if viz_type in rendering:
+                try:
+                    (created, config), peak_rss_mb = rendering[viz_type].result()
+                    self._record_worker_peak("visualizations", peak_rss_mb)
+                    if created:
+                        visualizations[viz_type.value] = {
+                            "visualization": None,
+                            "config": config,
+                            "type": viz_type.value,
+                        }
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning(
+                        f"Failed to create visualization {viz_type.value}: {e}"
+                    )
+                continue
+
             try:
                 # Create visualization configuration
                 config = self._create_visualization_config(viz_type, data, request)
@@ -297,12 +497,7 @@ class AnalysisEngine:
             / f"{viz_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
 
-        if viz_type in [
-            VisualizationType.POINT_MAP,
-            VisualizationType.HEAT_MAP,
-            VisualizationType.CLUSTER_MAP,
-            VisualizationType.CHOROPLETH,
-        ]:
+        if viz_type in MAP_VISUALIZATION_TYPES:
             save_path = save_path.with_suffix(".html")
         else:
             save_path = save_path.with_suffix(".png")
@@ -342,6 +537,8 @@ class AnalysisEngine:
             return None
 
         models = {}
+        pool = self._process_pool
+        fitting = {}
 
         for model_type in request.models:
             try:
@@ -361,6 +558,12 @@ class AnalysisEngine:
                 # Create model configuration
                 config = self._create_model_config(model_type, data, request)
 
+                if pool is not None:
+                    fitting[model_type] = pool.submit(
+                        run_measured, _fit_model, str(self.model_engine.save_dir), data, config
+                    )
+                    continue
+
                 # Create and train model
                 if model_type in [ModelType.KMEANS, ModelType.DBSCAN]:
                     result = self.model_engine.create_clustering_model(data, config)
@@ -375,6 +578,20 @@ class AnalysisEngine:
                 logger.warning(f"Failed to create model {model_type.value}: {e}")
                 continue
 
+        for model_type, future in fitting.items():
+            try:
+                result, peak_rss_mb = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Failed to create model {model_type.value}: {e}")
+                continue
+            self._record_worker_peak("models", peak_rss_mb)
+
+            model_key = f"{model_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self.model_engine.models[model_key] = result["model"]
+            if result.get("cluster_search"):
+                self.model_engine.cluster_searches[model_key] = result["cluster_search"]
+            models[model_type.value] = result
+
         return models if models else None
 
     def _create_model_config(
@@ -404,6 +621,7 @@ class AnalysisEngine:
                 if request.custom_metrics
                 else None
             ),
+            custom_config=dict(request.model_options) if request.model_options else None,
         )
 
     def _generate_insights(
@@ -618,6 +836,148 @@ class AnalysisEngine:
 
         return "_".join(key_parts)
 
+    def _generate_result_cache_key(self, request: AnalysisRequest) -> str:
+        """Generate a persistent cache key covering every result-affecting field."""
+        key_parts = [
+            self._generate_cache_key(request),
+            ",".join(sorted(model.value for model in request.models or [])),
+            json.dumps(request.custom_metrics or {}, sort_keys=True, default=str),
+            json.dumps(request.model_options or {}, sort_keys=True, default=str),
+            str(request.include_statistical_tests),
+            str(request.confidence_level),
+        ]
+        return hashlib.sha256("|".join(key_parts).encode("utf-8")).hexdigest()
+
+    def _get_result_cache(self) -> Optional[AnalysisResultCache]:
+        """Return the persistent result cache, if enabled."""
+        if not self.use_result_cache:
+            return None
+        if self._result_cache is None:
+            self._result_cache = get_analysis_result_cache()
+        return self._result_cache
+
+    def _compute_data_fingerprint(self, request: AnalysisRequest) -> Optional[str]:
+        """Fingerprint the tables backing the request's data categories."""
+        if not self.use_result_cache:
+            return None
+        try:
+            tables = self.data_pipeline.get_source_tables(request.data_categories)
+            return compute_data_fingerprint(self.session, tables)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Broad exception justified: caching must never break an analysis
+            logger.warning(f"Could not fingerprint analysis data: {e}")
+            return None
+
+    def _load_cached_result(
+        self, request: AnalysisRequest, fingerprint: Optional[str]
+    ) -> Optional[dict[str, Any]]:
+        """Load cached stage outputs if they are still valid for the data."""
+        cache = self._get_result_cache()
+        if cache is None or fingerprint is None:
+            return None
+
+        try:
+            payload = cache.get(self._generate_result_cache_key(request), fingerprint)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to read analysis cache: {e}")
+            return None
+
+        if payload is None:
+            return None
+
+        # Rendered files may have been cleaned up since the entry was stored
+        for viz_data in payload["visualizations"].values():
+            save_path = viz_data["config"].save_path
+            if save_path and self._resolve_rendered_path(save_path) is None:
+                logger.info("Cached visualizations are missing, recomputing analysis")
+                return None
+
+        return payload
+
+    @staticmethod
+    def _resolve_rendered_path(save_path: Optional[str]) -> Optional[Path]:
+        """Return the rendered file for a configured save path, if it exists."""
+        if not save_path:
+            return None
+        path = Path(save_path)
+        if path.exists():
+            return path
+        # Interactive figures are written as HTML next to the configured path
+        if path.with_suffix(".html").exists():
+            return path.with_suffix(".html")
+        return None
+
+    def _restore_cached_visualizations(
+        self, cached_visualizations: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Copy cached rendered files into this run's output directory."""
+        viz_dir = self.output_dir / "visualizations"
+        viz_dir.mkdir(parents=True, exist_ok=True)
+
+        restored = {}
+        for viz_type, viz_data in cached_visualizations.items():
+            config = viz_data["config"]
+            source = self._resolve_rendered_path(config.save_path)
+            if source is not None:
+                target = viz_dir / source.name
+                if source.resolve() != target.resolve():
+                    shutil.copy2(source, target)
+                config = dataclasses.replace(
+                    config, save_path=str(target.with_suffix(Path(config.save_path).suffix))
+                )
+            restored[viz_type] = {**viz_data, "config": config}
+        return restored
+
+    def _store_cached_result(
+        self,
+        request: AnalysisRequest,
+        fingerprint: Optional[str],
+        metrics: dict[str, Any],
+        visualizations: dict[str, Any],
+        models: Optional[dict[str, Any]],
+        insights: list[str],
+        statistical_tests: Optional[dict[str, Any]],
+    ) -> None:
+        """Persist stage outputs for reuse by later invocations."""
+        cache = self._get_result_cache()
+        if cache is None or fingerprint is None:
+            return
+
+        # Figures are not stored; the rendered files are referenced by path instead
+        cached_visualizations = {
+            viz_type: {
+                "visualization": None,
+                "config": viz_data["config"],
+                "type": viz_data["type"],
+            }
+            for viz_type, viz_data in visualizations.items()
+        }
+
+        # Keep model summaries only, dropping fitted estimators and per-row arrays
+        cached_models = None
+        if models:
+            cached_models = {
+                model_name: {
+                    key: value
+                    for key, value in model_result.items()
+                    if key not in ("model", "cluster_labels", "transformed_data")
+                }
+                for model_name, model_result in models.items()
+            }
+
+        payload = {
+            "metrics": metrics,
+            "visualizations": cached_visualizations,
+            "models": cached_models,
+            "insights": insights,
+            "statistical_tests": statistical_tests,
+        }
+
+        try:
+            cache.set(self._generate_result_cache_key(request), fingerprint, payload)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to write analysis cache: {e}")
+
     def _save_analysis_results(self, result: AnalysisResult) -> None:
         """Save analysis results to disk."""
         try:
@@ -689,6 +1049,10 @@ class AnalysisEngine:
             "cache_size": len(self._analysis_cache),
         }
 
+        cache = self._get_result_cache()
+        if cache is not None:
+            summary["persistent_cache"] = cache.stats()
+
         # Add information about analysis directories
         analysis_dirs = self.list_analysis_directories()
         for analysis_dir in analysis_dirs:
@@ -724,11 +1088,25 @@ class AnalysisEngine:
 
         return summary
 
-    def clear_cache(self) -> None:
-        """Clear the analysis cache."""
+    def clear_cache(self) -> int:
+        """
+        Clear the in-memory and persistent analysis caches.
+
+        Returns:
+            Number of persisted result entries removed
+        """
         self._analysis_cache.clear()
         self.data_pipeline.clear_cache()
+
+        removed = 0
+        cache = self._get_result_cache()
+        if cache is not None:
+            removed = cache.clear()
+        if self.feature_store is not None:
+            self.feature_store.clear()
+
         logger.info("Analysis cache cleared")
+        return removed
 
     def cleanup_old_analysis_directories(self, keep_recent: int = 5) -> None:
         """Clean up old analysis directories, keeping only the most recent ones."""
@@ -749,8 +1127,6 @@ class AnalysisEngine:
             # Remove old directories
             to_remove = analysis_dirs[keep_recent:]
             for old_dir in to_remove:
-                import shutil
-
                 shutil.rmtree(old_dir)
                 logger.info(f"Removed old analysis directory: {old_dir.name}")
 
@@ -769,8 +1145,6 @@ class AnalysisEngine:
             for dir_name in shared_dirs:
                 shared_dir = self.base_output_dir / dir_name
                 if shared_dir.exists():
-                    import shutil
-
                     shutil.rmtree(shared_dir)
                     logger.info(f"Removed old shared directory: {dir_name}")
 
@@ -953,6 +1327,8 @@ class AnalysisEngine:
         data_categories: Optional[list[DataCategory]] = None,
         max_models: int = 20,
         analysis_name: str = "Econometric Analysis",
+        time_budget: Optional[float] = None,
+        screen_top_n: Optional[int] = None,
     ) -> dict[str, Any]:
         """
         Run comprehensive econometric analysis with automated insights.
@@ -966,6 +1342,10 @@ class AnalysisEngine:
             data_categories: Data categories to include (default: all relevant)
             max_models: Maximum number of model specifications to test
             analysis_name: Name for the analysis
+            time_budget: Optional limit in seconds for the model search
+            screen_top_n: Fully estimate only the best N specifications after
+                batched OLS screening (default: the best ``max_models`` once more
+                specifications than that are generated)
 
         Returns:
             Dict with paths to generated outputs and key results
@@ -1005,7 +1385,7 @@ class AnalysisEngine:
 
             # Step 2: Feature Engineering
             logger.info("Applying feature engineering...")
-            engineer = FeatureEngineer()
+            engineer = FeatureEngineer(feature_store=self.feature_store)
             enhanced_data = engineer.engineer_features(
                 data=data,
                 include_transformations=True,
@@ -1036,6 +1416,9 @@ class AnalysisEngine:
                 max_models=max_models,
                 include_polynomials=True,
                 include_interactions=True,
+                n_jobs=self.jobs,
+                time_budget=time_budget,
+                screen_top_n=screen_top_n,
             )
 
             logger.info(f"Estimated {len(regression_results)} models")
@@ -1045,7 +1428,7 @@ class AnalysisEngine:
 
             # Step 4: Insight Discovery
             logger.info("Discovering insights...")
-            discovery = InsightDiscovery()
+            discovery = InsightDiscovery(result_cache=self._get_result_cache())
             insights = discovery.discover_insights(
                 regression_results=best_models,
                 data=enhanced_data,
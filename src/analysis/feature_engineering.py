@@ -3,14 +3,213 @@ Advanced feature engineering for onsen analysis.
 
 This module provides comprehensive feature transformation, interaction creation,
 and aggregation capabilities for sophisticated econometric analysis.
+
+Engineered columns are collected next to the input frame and the result is
+assembled once, so the pipeline does not copy the frame at every step. With
+a :class:`~src.analysis.feature_store.FeatureStore`, per-visit features are
+computed only for new or edited visits and onsen-level aggregates are
+refreshed only for the onsens those visits belong to.
 """
 
-from typing import Any, Optional
+import hashlib
+import json
+from functools import partial
+from typing import Any, Callable, Optional
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 
+from src.analysis.feature_store import ONSEN_BLOCK, FeatureStore
+
+# Bump when the definition of a stored feature changes
+FEATURE_SET_VERSION = 1
+
+ID_COLUMNS = {'id', 'onsen_id', 'visit_id', 'ban_number'}
+
+SQUARE_CANDIDATES = {'entry_fee_yen', 'stay_length_minutes', 'travel_time_minutes',
+                     'main_bath_temperature', 'temperature_outside_celsius'}
+INVERSE_CANDIDATES = {'travel_time_minutes', 'stay_length_minutes'}
+
+# Key interaction pairs based on domain knowledge
+DEFAULT_INTERACTION_PAIRS = [
+    # Temperature interactions
+    ('main_bath_temperature', 'temperature_outside_celsius'),
+    ('sauna_temperature', 'temperature_outside_celsius'),
+    ('outdoor_bath_temperature', 'temperature_outside_celsius'),
+
+    # Facility interactions
+    ('had_sauna', 'weather'),
+    ('had_outdoor_bath', 'weather'),
+    ('had_sauna', 'main_bath_temperature'),
+
+    # Price-quality interactions
+    ('entry_fee_yen', 'cleanliness_rating'),
+    ('entry_fee_yen', 'atmosphere_rating'),
+
+    # Time interactions
+    ('stay_length_minutes', 'crowd_level'),
+
+    # Experience interactions
+    ('view_rating', 'weather'),
+    ('atmosphere_rating', 'crowd_level'),
+
+    # Heart rate (if available)
+    ('average_heart_rate', 'main_bath_temperature'),
+    ('average_heart_rate', 'stay_length_minutes'),
+]
+
+# Variables where non-linearity is expected
+DEFAULT_POLYNOMIAL_VARS = [
+    'main_bath_temperature',
+    'stay_length_minutes',
+    'entry_fee_yen',
+    'temperature_outside_celsius',
+    'travel_time_minutes',
+    'crowd_level',
+]
+
+TEMPORAL_COLUMNS = ['visit_time', 'visit_month', 'visit_year', 'visit_day_of_week', 'visit_hour']
+HEART_RATE_COLUMNS = ['average_heart_rate', 'min_heart_rate', 'max_heart_rate', 'total_recording_minutes']
+
+# Onsen-level feature -> (source column, aggregation)
+ONSEN_AGGREGATIONS = {
+    'onsen_avg_rating': ('personal_rating', 'mean'),
+    'onsen_rating_std': ('personal_rating', 'std'),
+    'onsen_visit_count': ('personal_rating', 'count'),
+    'onsen_avg_fee': ('entry_fee_yen', 'mean'),
+    'onsen_min_fee': ('entry_fee_yen', 'min'),
+    'onsen_max_fee': ('entry_fee_yen', 'max'),
+    'onsen_avg_stay': ('stay_length_minutes', 'mean'),
+    'onsen_median_stay': ('stay_length_minutes', 'median'),
+    'onsen_avg_cleanliness': ('cleanliness_rating', 'mean'),
+    'onsen_avg_atmosphere': ('atmosphere_rating', 'mean'),
+    'onsen_avg_view': ('view_rating', 'mean'),
+}
+
+
+class _ColumnView:
+    """The input frame plus the columns engineered so far, read without copying."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.added: dict[str, pd.Series] = {}
+        # Row positions in visit time order, set by the temporal step
+        self.order: Optional[np.ndarray] = None
+        # Onsen aggregation renumbers the rows, as the merge it replaces did
+        self.reset_index = False
+        # Per-visit feature blocks and onsen aggregates read from a feature store
+        self.stored: dict[str, dict[str, pd.Series]] = {}
+        self.stored_aggregates: Optional[pd.DataFrame] = None
+
+    @property
+    def index(self) -> pd.Index:
+        return self.data.index
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.data.columns) + [name for name in self.added if name not in self.data.columns]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.added or name in self.data.columns
+
+    def __getitem__(self, name: str) -> pd.Series:
+        return self.added[name] if name in self.added else self.data[name]
+
+    def __setitem__(self, name: str, values: pd.Series) -> None:
+        self.added[name] = values
+
+    def update(self, columns: dict[str, pd.Series]) -> None:
+        self.added.update(columns)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Assemble the input and engineered columns into one new frame."""
+        new = {name: values for name, values in self.added.items() if name not in self.data.columns}
+        if new:
+            frame = pd.concat([self.data, pd.DataFrame(new, index=self.data.index)], axis=1)
+        else:
+            frame = self.data.copy()
+        for name, values in self.added.items():
+            if name in self.data.columns:
+                frame[name] = values.array
+        if self.order is not None:
+            frame = frame.take(self.order)
+        if self.reset_index:
+            frame = frame.reset_index(drop=True)
+        return frame
+
+
+def _calendar_features(view: _ColumnView) -> dict[str, pd.Series]:
+    """Per-visit calendar and time-of-day indicators."""
+    times = pd.to_datetime(view['visit_time'])
+    features: dict[str, pd.Series] = {}
+
+    # Basic temporal features (some may already exist)
+    for name, field in (('visit_month', 'month'), ('visit_year', 'year'),
+                        ('visit_day_of_week', 'dayofweek'), ('visit_hour', 'hour')):
+        if name not in view:
+            features[name] = getattr(times.dt, field)
+
+    month = features['visit_month'] if 'visit_month' in features else view['visit_month']
+    day_of_week = features['visit_day_of_week'] if 'visit_day_of_week' in features else view['visit_day_of_week']
+    hour = features['visit_hour'] if 'visit_hour' in features else view['visit_hour']
+
+    # Weekend indicator
+    features['is_weekend'] = (day_of_week >= 5).astype(int)
+
+    # Quarter
+    features['visit_quarter'] = times.dt.quarter
+
+    # Season indicators (Japan-specific)
+    features['is_winter'] = month.isin([12, 1, 2]).astype(int)
+    features['is_spring'] = month.isin([3, 4, 5]).astype(int)
+    features['is_summer'] = month.isin([6, 7, 8]).astype(int)
+    features['is_autumn'] = month.isin([9, 10, 11]).astype(int)
+
+    # Time of day indicators
+    features['is_morning'] = ((hour >= 6) & (hour < 12)).astype(int)
+    features['is_afternoon'] = ((hour >= 12) & (hour < 18)).astype(int)
+    features['is_evening'] = ((hour >= 18) & (hour < 22)).astype(int)
+    features['is_night'] = ((hour >= 22) | (hour < 6)).astype(int)
+    return features
+
+
+def _heart_rate_features(view: _ColumnView) -> dict[str, pd.Series]:
+    """Per-visit heart rate variability, intensity and heat stress features."""
+    features: dict[str, pd.Series] = {}
+
+    # Heart rate variability (simple measure)
+    if 'max_heart_rate' in view and 'min_heart_rate' in view:
+        features['hr_range'] = view['max_heart_rate'] - view['min_heart_rate']
+        if 'average_heart_rate' in view:
+            features['hr_range_pct'] = (features['hr_range'] / view['average_heart_rate'] * 100).fillna(0)
+
+    # Normalized heart rate (assuming max HR = 220 - age; use 30 as default)
+    if 'average_heart_rate' in view:
+        assumed_max_hr = 190  # For 30-year-old
+        features['hr_pct_max'] = (view['average_heart_rate'] / assumed_max_hr * 100).fillna(0)
+
+        # Relaxation indicator (low HR = relaxed)
+        features['is_relaxed_hr'] = (view['average_heart_rate'] < 80).astype(int)
+        features['is_elevated_hr'] = (view['average_heart_rate'] > 100).astype(int)
+
+    # Heart rate recovery (if multiple measurements)
+    # This would require time-series HR data within a visit
+    # For now, create placeholder for future enhancement
+
+    # Interaction: HR × temperature (heat stress)
+    if 'average_heart_rate' in view and 'main_bath_temperature' in view:
+        features['hr_temp_interaction'] = view['average_heart_rate'] * view['main_bath_temperature']
+    return features
+
+
+def _numeric_interactions(view: _ColumnView, pairs: list[tuple[str, str]]) -> dict[str, pd.Series]:
+    """Products of numeric variable pairs."""
+    return {f'{var1}_X_{var2}': view[var1] * view[var2] for var1, var2 in pairs}
+
 
 class FeatureEngineer:
     """
@@ -20,11 +219,22 @@ class FeatureEngineer:
     to enable comprehensive econometric modeling.
     """
 
-    def __init__(self):
+    def __init__(self, feature_store: Optional[FeatureStore] = None, id_column: str = 'id'):
+        """
+        Initialize the feature engineer.
+
+        Args:
+            feature_store: Optional store reusing per-visit features and onsen
+                aggregates between runs
+            id_column: Column holding the visit id the store is keyed by
+        """
+        self.feature_store = feature_store
+        self.id_column = id_column
         self.transformations_applied: list[str] = []
         self.interactions_created: list[tuple[str, str]] = []
         self.polynomials_created: list[tuple[str, int]] = []
         self.aggregations_created: list[str] = []
+        self.store_stats: dict[str, Any] = {}
 
     def engineer_features(
         self,
@@ -54,94 +264,112 @@ class FeatureEngineer:
             Enhanced DataFrame with engineered features
         """
         logger.info("Starting feature engineering pipeline...")
-        df = data.copy()
+        view = _ColumnView(data)
+        include_heart_rate = include_heart_rate and self._has_heart_rate_data(data)
+
+        if self.feature_store is not None:
+            blocks: dict[str, Callable[[_ColumnView], dict[str, pd.Series]]] = {}
+            pairs: list[tuple[str, str]] = []
+            if include_temporal and 'visit_time' in data.columns:
+                blocks['temporal'] = _calendar_features
+            if include_heart_rate:
+                blocks['heart_rate'] = _heart_rate_features
+            if include_interactions:
+                pairs = self._storable_pairs(data, custom_interactions or DEFAULT_INTERACTION_PAIRS)
+                blocks['interactions'] = partial(_numeric_interactions, pairs=pairs)
+            aggregations = self._onsen_aggregations(view) if include_aggregations else {}
+            self._load_from_store(view, blocks, pairs, aggregations)
 
         if include_transformations:
-            df = self.add_transformations(df)
+            self._add_transformations(view)
 
         if include_interactions:
-            df = self.add_interactions(df, custom_pairs=custom_interactions)
+            self._add_interactions(view, custom_pairs=custom_interactions)
 
         if include_polynomials:
-            df = self.add_polynomials(df)
+            self._add_polynomials(view)
 
         if include_temporal:
-            df = self.add_temporal_features(df)
+            self._add_temporal_features(view)
 
         if include_aggregations:
-            df = self.add_aggregated_features(df)
+            self._add_aggregated_features(view)
 
-        if include_heart_rate and self._has_heart_rate_data(df):
-            df = self.add_heart_rate_features(df)
+        if include_heart_rate:
+            self._add_heart_rate_features(view)
 
+        df = view.to_frame()
         logger.info(f"Feature engineering complete. Added {len(df.columns) - len(data.columns)} features")
         return df
 
     def add_transformations(self, data: pd.DataFrame) -> pd.DataFrame:
-        # pylint: disable=too-complex
-        # Complexity justified: handles multiple transformation types with validation
         """
         Add mathematical transformations of numeric variables.
 
         Applies: log, sqrt, square, cube, inverse transformations
         Useful for addressing non-linearity and heteroskedasticity.
         """
-        df = data.copy()
+        view = _ColumnView(data)
+        self._add_transformations(view)
+        return view.to_frame()
 
+    def _add_transformations(self, view: _ColumnView) -> None:
+        # pylint: disable=too-complex
+        # Complexity justified: handles multiple transformation types with validation
         # Identify numeric columns suitable for transformation
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = [
+            col for col in view.columns
+            if pd.api.types.is_numeric_dtype(view[col]) and not pd.api.types.is_bool_dtype(view[col])
+        ]
 
         # Columns to transform (exclude IDs, binary, and already-transformed vars)
-        id_columns = {'id', 'onsen_id', 'visit_id', 'ban_number'}
         transform_candidates = []
         for col in numeric_cols:
-            if col in id_columns:
+            if col in ID_COLUMNS:
                 continue
             if col.startswith('log_') or col.startswith('sqrt_') or col.endswith('_squared'):
                 continue
             try:
-                if df[col].nunique() > 10:  # Exclude binary/categorical
+                if view[col].nunique() > 10:  # Exclude binary/categorical
                     transform_candidates.append(col)
             except (TypeError, ValueError):
                 continue
 
         for col in transform_candidates:
+            values = view[col]
             try:
                 # Skip if column has NaN or non-numeric data
-                if not pd.api.types.is_numeric_dtype(df[col]) or df[col].isna().all():
+                if values.isna().all():
                     continue
+                present = values.dropna()
 
                 # Log transformation (for positive, skewed variables)
-                if (df[col].dropna() > 0).all():
-                    col_mean = df[col].mean()
-                    col_std = df[col].std()
+                if (present > 0).all():
+                    col_mean = values.mean()
+                    col_std = values.std()
                     if col_mean > 0 and col_std / col_mean > 0.5:
-                        df[f'log_{col}'] = np.log(df[col] + 1)  # +1 to handle zeros
+                        view[f'log_{col}'] = np.log(values + 1)  # +1 to handle zeros
                         self.transformations_applied.append(f'log_{col}')
 
                 # Square root (for positive variables)
-                if (df[col].dropna() >= 0).all():
-                    df[f'sqrt_{col}'] = np.sqrt(df[col])
+                if (present >= 0).all():
+                    view[f'sqrt_{col}'] = np.sqrt(values)
                     self.transformations_applied.append(f'sqrt_{col}')
 
                 # Square (for capturing quadratic relationships)
-                square_candidates = {'entry_fee_yen', 'stay_length_minutes', 'travel_time_minutes',
-                                     'main_bath_temperature', 'temperature_outside_celsius'}
-                if col in square_candidates:
-                    df[f'{col}_squared'] = df[col] ** 2
+                if col in SQUARE_CANDIDATES:
+                    view[f'{col}_squared'] = values ** 2
                     self.transformations_applied.append(f'{col}_squared')
 
                 # Inverse (for diminishing returns effects)
-                inverse_candidates = {'travel_time_minutes', 'stay_length_minutes'}
-                if (df[col].dropna() > 0).all() and col in inverse_candidates:
-                    df[f'inv_{col}'] = 1 / (df[col] + 1)
+                if (present > 0).all() and col in INVERSE_CANDIDATES:
+                    view[f'inv_{col}'] = 1 / (values + 1)
                     self.transformations_applied.append(f'inv_{col}')
             except (TypeError, ValueError) as e:
                 logger.warning(f"Skipping transformation for {col}: {e}")
                 continue
 
         logger.info(f"Applied {len(self.transformations_applied)} transformations")
-        return df
 
     def add_interactions(
         self,
@@ -153,60 +381,43 @@ class FeatureEngineer:
 
         Interactions capture moderation effects (e.g., sauna effect varies by weather).
         """
-        df = data.copy()
+        view = _ColumnView(data)
+        self._add_interactions(view, custom_pairs)
+        return view.to_frame()
 
-        # Define key interaction pairs based on domain knowledge
-        default_pairs = [
-            # Temperature interactions
-            ('main_bath_temperature', 'temperature_outside_celsius'),
-            ('sauna_temperature', 'temperature_outside_celsius'),
-            ('outdoor_bath_temperature', 'temperature_outside_celsius'),
+    def _add_interactions(self, view: _ColumnView, custom_pairs: Optional[list[tuple[str, str]]] = None) -> None:
+        pairs_to_create = custom_pairs if custom_pairs else DEFAULT_INTERACTION_PAIRS
 
-            # Facility interactions
-            ('had_sauna', 'weather'),
-            ('had_outdoor_bath', 'weather'),
-            ('had_sauna', 'main_bath_temperature'),
+        # Per-visit products of numeric input columns, possibly read from the store
+        numeric_pairs = self._storable_pairs(view.data, pairs_to_create)
+        products = self._row_block(view, 'interactions', partial(_numeric_interactions, pairs=numeric_pairs))
 
-            # Price-quality interactions
-            ('entry_fee_yen', 'cleanliness_rating'),
-            ('entry_fee_yen', 'atmosphere_rating'),
-
-            # Time interactions
-            ('stay_length_minutes', 'crowd_level'),
-
-            # Experience interactions
-            ('view_rating', 'weather'),
-            ('atmosphere_rating', 'crowd_level'),
+        for var1, var2 in pairs_to_create:
+            if (var1, var2) in numeric_pairs:
+                view[f'{var1}_X_{var2}'] = products[f'{var1}_X_{var2}']
+                self.interactions_created.append((var1, var2))
+                continue
+            if var1 not in view or var2 not in view:
+                continue
+            numeric1 = pd.api.types.is_numeric_dtype(view[var1])
+            numeric2 = pd.api.types.is_numeric_dtype(view[var2])
 
-            # Heart rate (if available)
-            ('average_heart_rate', 'main_bath_temperature'),
-            ('average_heart_rate', 'stay_length_minutes'),
-        ]
+            # For numeric * numeric (engineered columns)
+            if numeric1 and numeric2:
+                view[f'{var1}_X_{var2}'] = view[var1] * view[var2]
+                self.interactions_created.append((var1, var2))
 
-        pairs_to_create = custom_pairs if custom_pairs else default_pairs
+            # For numeric * categorical (create separate indicators)
+            elif numeric1:
+                for category in view[var2].unique():
+                    if pd.notna(category):
+                        view[f'{var1}_X_{var2}_{category}'] = view[var1] * (view[var2] == category).astype(int)
 
-        for var1, var2 in pairs_to_create:
-            if var1 in df.columns and var2 in df.columns:
-                # For numeric * numeric
-                if pd.api.types.is_numeric_dtype(df[var1]) and pd.api.types.is_numeric_dtype(df[var2]):
-                    interaction_name = f'{var1}_X_{var2}'
-                    df[interaction_name] = df[var1] * df[var2]
-                    self.interactions_created.append((var1, var2))
-
-                # For numeric * categorical (create separate indicators)
-                elif pd.api.types.is_numeric_dtype(df[var1]) and not pd.api.types.is_numeric_dtype(df[var2]):
-                    categories = df[var2].unique()
-                    for category in categories:
-                        if pd.notna(category):
-                            interaction_name = f'{var1}_X_{var2}_{category}'
-                            df[interaction_name] = df[var1] * (df[var2] == category).astype(int)
-
-                # For categorical * categorical (create cross-categories)
-                elif not pd.api.types.is_numeric_dtype(df[var1]) and not pd.api.types.is_numeric_dtype(df[var2]):
-                    df[f'{var1}_X_{var2}'] = df[var1].astype(str) + '_' + df[var2].astype(str)
+            # For categorical * categorical (create cross-categories)
+            elif not numeric2:
+                view[f'{var1}_X_{var2}'] = view[var1].astype(str) + '_' + view[var2].astype(str)
 
         logger.info(f"Created {len(self.interactions_created)} interaction terms")
-        return df
 
     def add_polynomials(
         self,
@@ -219,167 +430,122 @@ class FeatureEngineer:
 
         Useful for testing U-shaped or inverted-U relationships (e.g., optimal temperature).
         """
-        df = data.copy()
-
-        # Default key variables where non-linearity is expected
-        default_key_vars = [
-            'main_bath_temperature',
-            'stay_length_minutes',
-            'entry_fee_yen',
-            'temperature_outside_celsius',
-            'travel_time_minutes',
-            'crowd_level',
-        ]
+        view = _ColumnView(data)
+        self._add_polynomials(view, degree, key_vars)
+        return view.to_frame()
 
-        vars_to_poly = key_vars if key_vars else default_key_vars
-        vars_to_poly = [v for v in vars_to_poly if v in df.columns]
+    def _add_polynomials(self, view: _ColumnView, degree: int = 2, key_vars: Optional[list[str]] = None) -> None:
+        vars_to_poly = key_vars if key_vars else DEFAULT_POLYNOMIAL_VARS
+        vars_to_poly = [v for v in vars_to_poly if v in view]
 
         for var in vars_to_poly:
-            if pd.api.types.is_numeric_dtype(df[var]):
+            values = view[var]
+            if pd.api.types.is_numeric_dtype(values):
                 # Standardize first to avoid numerical issues
-                var_std = (df[var] - df[var].mean()) / df[var].std()
+                var_std = (values - values.mean()) / values.std()
 
                 for deg in range(2, degree + 1):
-                    poly_name = f'{var}_deg{deg}'
-                    df[poly_name] = var_std ** deg
+                    view[f'{var}_deg{deg}'] = var_std ** deg
                     self.polynomials_created.append((var, deg))
 
         logger.info(f"Created {len(self.polynomials_created)} polynomial terms")
-        return df
 
     def add_temporal_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Extract comprehensive temporal features from visit_time.
 
-        Captures seasonality, day-of-week effects, and trends.
+        Captures seasonality, day-of-week effects, and trends. Rows are
+        returned in visit time order.
         """
-        df = data.copy()
+        view = _ColumnView(data)
+        self._add_temporal_features(view)
+        return view.to_frame()
 
-        if 'visit_time' not in df.columns:
+    def _add_temporal_features(self, view: _ColumnView) -> None:
+        if 'visit_time' not in view:
             logger.warning("No visit_time column found, skipping temporal features")
-            return df
-
-        df['visit_time'] = pd.to_datetime(df['visit_time'])
-
-        # Basic temporal features (some may already exist)
-        if 'visit_month' not in df.columns:
-            df['visit_month'] = df['visit_time'].dt.month
-        if 'visit_year' not in df.columns:
-            df['visit_year'] = df['visit_time'].dt.year
-        if 'visit_day_of_week' not in df.columns:
-            df['visit_day_of_week'] = df['visit_time'].dt.dayofweek
-        if 'visit_hour' not in df.columns:
-            df['visit_hour'] = df['visit_time'].dt.hour
-
-        # Weekend indicator
-        df['is_weekend'] = (df['visit_day_of_week'] >= 5).astype(int)
-
-        # Quarter
-        df['visit_quarter'] = df['visit_time'].dt.quarter
-
-        # Season indicators (Japan-specific)
-        df['is_winter'] = df['visit_month'].isin([12, 1, 2]).astype(int)
-        df['is_spring'] = df['visit_month'].isin([3, 4, 5]).astype(int)
-        df['is_summer'] = df['visit_month'].isin([6, 7, 8]).astype(int)
-        df['is_autumn'] = df['visit_month'].isin([9, 10, 11]).astype(int)
-
-        # Time of day indicators
-        df['is_morning'] = ((df['visit_hour'] >= 6) & (df['visit_hour'] < 12)).astype(int)
-        df['is_afternoon'] = ((df['visit_hour'] >= 12) & (df['visit_hour'] < 18)).astype(int)
-        df['is_evening'] = ((df['visit_hour'] >= 18) & (df['visit_hour'] < 22)).astype(int)
-        df['is_night'] = ((df['visit_hour'] >= 22) | (df['visit_hour'] < 6)).astype(int)
+            return
+
+        view['visit_time'] = pd.to_datetime(view['visit_time'])
+        view.update(self._row_block(view, 'temporal', _calendar_features))
+        times = view['visit_time']
 
         # Days since first visit (trend)
-        if len(df) > 0:
-            first_visit = df['visit_time'].min()
-            df['days_since_first_visit'] = (df['visit_time'] - first_visit).dt.days
+        if len(view) > 0:
+            view['days_since_first_visit'] = (times - times.min()).dt.days
 
         # Visit count over time (cumulative for panel analysis)
-        df = df.sort_values('visit_time')
-        df['cumulative_visit_count'] = range(1, len(df) + 1)
+        view.order = times.reset_index(drop=True).sort_values(kind='stable').index.to_numpy()
+        ranks = np.empty(len(view), dtype=np.int64)
+        ranks[view.order] = np.arange(1, len(view) + 1)
+        view['cumulative_visit_count'] = pd.Series(ranks, index=view.index)
 
         logger.info("Added temporal features")
-        return df
 
     def add_aggregated_features(self, data: pd.DataFrame) -> pd.DataFrame:
-        # pylint: disable=too-complex
-        # Complexity justified: builds dynamic aggregation dict based on available columns
         """
         Add onsen-level and location-level aggregated statistics.
 
         Creates features like avg_rating_per_onsen, visit_frequency, etc.
         """
-        df = data.copy()
+        view = _ColumnView(data)
+        self._add_aggregated_features(view)
+        return view.to_frame()
 
-        if 'onsen_id' not in df.columns:
+    def _add_aggregated_features(self, view: _ColumnView) -> None:
+        if 'onsen_id' not in view:
             logger.warning("No onsen_id column found, skipping aggregations")
-            return df
-
-        # Build aggregation dict dynamically based on available columns
-        agg_dict = {}
-
-        if 'personal_rating' in df.columns:
-            agg_dict['personal_rating'] = ['mean', 'std', 'count']
-
-        if 'entry_fee_yen' in df.columns:
-            agg_dict['entry_fee_yen'] = ['mean', 'min', 'max']
-
-        if 'stay_length_minutes' in df.columns:
-            agg_dict['stay_length_minutes'] = ['mean', 'median']
-
-        if 'cleanliness_rating' in df.columns:
-            agg_dict['cleanliness_rating'] = 'mean'
-
-        if 'atmosphere_rating' in df.columns:
-            agg_dict['atmosphere_rating'] = 'mean'
-
-        if 'view_rating' in df.columns:
-            agg_dict['view_rating'] = 'mean'
+            return
 
-        if not agg_dict:
+        aggregations = self._onsen_aggregations(view)
+        if not aggregations:
             logger.warning("No suitable columns for aggregation found")
-            return df
-
-        # Onsen-level aggregations
-        onsen_aggs = df.groupby('onsen_id').agg(agg_dict).reset_index()
-
-        # Flatten column names
-        onsen_aggs.columns = ['_'.join(col).strip() if col[1] else col[0]
-                               for col in onsen_aggs.columns.values]
-        onsen_aggs.columns = [col.replace('onsen_id_', 'onsen_id') for col in onsen_aggs.columns]
-
-        # Rename for clarity
-        rename_dict = {
-            'personal_rating_mean': 'onsen_avg_rating',
-            'personal_rating_std': 'onsen_rating_std',
-            'personal_rating_count': 'onsen_visit_count',
-            'entry_fee_yen_mean': 'onsen_avg_fee',
-            'entry_fee_yen_min': 'onsen_min_fee',
-            'entry_fee_yen_max': 'onsen_max_fee',
-            'stay_length_minutes_mean': 'onsen_avg_stay',
-            'stay_length_minutes_median': 'onsen_median_stay',
-            'cleanliness_rating_mean': 'onsen_avg_cleanliness',
-            'atmosphere_rating_mean': 'onsen_avg_atmosphere',
-            'view_rating_mean': 'onsen_avg_view',
-        }
-        onsen_aggs = onsen_aggs.rename(columns=rename_dict)
+            return
+
+        table = view.stored_aggregates
+        if table is None:
+            table = self._onsen_aggregate_table(view, aggregations)
 
-        # Merge back to main data
-        df = df.merge(onsen_aggs, on='onsen_id', how='left', suffixes=('', '_agg'))
+        # Onsen statistics of each visit's onsen
+        view.reset_index = True
+        per_visit = table.reindex(view['onsen_id'].array)
+        for name in table.columns:
+            view[name] = pd.Series(per_visit[name].array, index=view.index)
+        self.aggregations_created.extend(table.columns)
 
         # Deviation from onsen average (individual visit quality relative to onsen norm)
-        if 'personal_rating' in df.columns and 'onsen_avg_rating' in df.columns:
-            df['rating_deviation_from_onsen_avg'] = df['personal_rating'] - df['onsen_avg_rating']
+        if 'personal_rating' in view and 'onsen_avg_rating' in view:
+            view['rating_deviation_from_onsen_avg'] = view['personal_rating'] - view['onsen_avg_rating']
 
         # Repeat visitor indicator
-        df['is_repeat_visitor'] = (df['onsen_visit_count'] > 1).astype(int)
+        if 'onsen_visit_count' in view:
+            view['is_repeat_visitor'] = (view['onsen_visit_count'] > 1).astype(int)
 
         # Fee relative to onsen average
-        if 'entry_fee_yen' in df.columns and 'onsen_avg_fee' in df.columns:
-            df['fee_vs_onsen_avg'] = df['entry_fee_yen'] - df['onsen_avg_fee']
+        if 'entry_fee_yen' in view and 'onsen_avg_fee' in view:
+            view['fee_vs_onsen_avg'] = view['entry_fee_yen'] - view['onsen_avg_fee']
 
         logger.info("Added aggregated features at onsen level")
-        return df
+
+    @staticmethod
+    def _onsen_aggregations(view: _ColumnView) -> dict[str, tuple[str, str]]:
+        """Onsen-level aggregations whose source column is available."""
+        if 'onsen_id' not in view:
+            return {}
+        return {name: spec for name, spec in ONSEN_AGGREGATIONS.items() if spec[0] in view}
+
+    @staticmethod
+    def _onsen_aggregate_table(
+        view: _ColumnView,
+        aggregations: dict[str, tuple[str, str]],
+        onsen_ids: Optional[list] = None,
+    ) -> pd.DataFrame:
+        """Aggregate the visits of every onsen (or only of ``onsen_ids``) into a table indexed by onsen id."""
+        sources = list(dict.fromkeys(source for source, _ in aggregations.values()))
+        visits = pd.DataFrame({column: view[column].array for column in ['onsen_id', *sources]})
+        if onsen_ids is not None:
+            visits = visits[visits['onsen_id'].isin(onsen_ids)]
+        return visits.groupby('onsen_id').agg(**aggregations)
 
     def add_heart_rate_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -387,45 +553,158 @@ class FeatureEngineer:
 
         Creates recovery metrics, stress indicators, and HR-based interactions.
         """
-        df = data.copy()
+        view = _ColumnView(data)
+        self._add_heart_rate_features(view)
+        return view.to_frame()
 
-        hr_cols = ['average_heart_rate', 'min_heart_rate', 'max_heart_rate',
-                   'total_recording_minutes']
-
-        if not any(col in df.columns for col in hr_cols):
+    def _add_heart_rate_features(self, view: _ColumnView) -> None:
+        if not any(col in view for col in HEART_RATE_COLUMNS):
             logger.warning("No heart rate data found")
-            return df
-
-        # Heart rate variability (simple measure)
-        if 'max_heart_rate' in df.columns and 'min_heart_rate' in df.columns:
-            df['hr_range'] = df['max_heart_rate'] - df['min_heart_rate']
-            df['hr_range_pct'] = (df['hr_range'] / df['average_heart_rate'] * 100).fillna(0)
-
-        # Normalized heart rate (assuming max HR = 220 - age; use 30 as default)
-        if 'average_heart_rate' in df.columns:
-            assumed_max_hr = 190  # For 30-year-old
-            df['hr_pct_max'] = (df['average_heart_rate'] / assumed_max_hr * 100).fillna(0)
-
-            # Relaxation indicator (low HR = relaxed)
-            df['is_relaxed_hr'] = (df['average_heart_rate'] < 80).astype(int)
-            df['is_elevated_hr'] = (df['average_heart_rate'] > 100).astype(int)
-
-        # Heart rate recovery (if multiple measurements)
-        # This would require time-series HR data within a visit
-        # For now, create placeholder for future enhancement
-
-        # Interaction: HR × temperature (heat stress)
-        if 'average_heart_rate' in df.columns and 'main_bath_temperature' in df.columns:
-            df['hr_temp_interaction'] = df['average_heart_rate'] * df['main_bath_temperature']
+            return
 
+        view.update(self._row_block(view, 'heart_rate', _heart_rate_features))
         logger.info("Added heart rate features")
-        return df
 
     def _has_heart_rate_data(self, data: pd.DataFrame) -> bool:
         """Check if dataset contains heart rate measurements."""
         hr_cols = ['average_heart_rate', 'min_heart_rate', 'max_heart_rate']
         return any(col in data.columns for col in hr_cols)
 
+    @staticmethod
+    def _storable_pairs(data: pd.DataFrame, pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Pairs of numeric input columns, whose products depend only on the visit itself."""
+        return [
+            (var1, var2) for var1, var2 in pairs
+            if var1 in data.columns and var2 in data.columns
+            and pd.api.types.is_numeric_dtype(data[var1]) and pd.api.types.is_numeric_dtype(data[var2])
+        ]
+
+    @staticmethod
+    def _row_block(
+        view: _ColumnView,
+        block: str,
+        compute: Callable[[_ColumnView], dict[str, pd.Series]],
+    ) -> dict[str, pd.Series]:
+        """Per-visit features of a block, read from the store when loaded."""
+        stored = view.stored.get(block)
+        return stored if stored is not None else compute(view)
+
+    def _visit_ids(self, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """Visit ids usable as store keys, or None when missing, duplicated or not integral."""
+        if self.id_column not in data.columns:
+            return None
+        ids = data[self.id_column]
+        if not pd.api.types.is_numeric_dtype(ids) or ids.isna().any() or not ids.is_unique:
+            return None
+        if not pd.api.types.is_integer_dtype(ids) and (ids % 1 != 0).any():
+            return None
+        return ids.to_numpy(dtype=np.int64)
+
+    def _load_from_store(
+        self,
+        view: _ColumnView,
+        blocks: dict[str, Callable[[_ColumnView], dict[str, pd.Series]]],
+        pairs: list[tuple[str, str]],
+        aggregations: dict[str, tuple[str, str]],
+    ) -> None:
+        """
+        Bring the store up to date with ``view.data`` and load stored features into the view.
+
+        Per-visit blocks are computed only for visits that are new or whose
+        source values changed; onsen aggregates are recomputed only for the
+        onsens of those visits and of removed visits.
+        """
+        # pylint: disable=too-many-locals
+        data = view.data
+        ids = self._visit_ids(data)
+        if ids is None or data.empty or not (blocks or aggregations):
+            logger.debug("Feature store skipped: no unique integral visit ids")
+            return
+
+        store = self.feature_store
+        sources = list(dict.fromkeys(
+            column
+            for column in [
+                *(TEMPORAL_COLUMNS if 'temporal' in blocks else []),
+                *(HEART_RATE_COLUMNS + ['main_bath_temperature'] if 'heart_rate' in blocks else []),
+                *(column for pair in pairs for column in pair),
+                *(['onsen_id'] + [source for source, _ in aggregations.values()] if aggregations else []),
+            ]
+            if column in data.columns
+        ))
+        version = self._feature_set_version(data, sources, blocks, pairs, aggregations)
+        hashes = pd.util.hash_pandas_object(data[sources], index=False).to_numpy().view(np.int64)
+
+        # Visits that are new or whose source values changed since they were stored
+        states = store.visit_states(version)
+        visit_index = pd.Index(ids)
+        known = visit_index.isin(states.index)
+        fresh = ~known
+        fresh[known] = states['row_hash'].reindex(visit_index[known]).to_numpy() != hashes[known]
+        positions = np.flatnonzero(fresh)
+        removed = states.index.difference(visit_index)
+
+        if len(positions):
+            subset = _ColumnView(data.iloc[positions])
+            features: dict[str, pd.Series] = {}
+            for block, compute in blocks.items():
+                columns = compute(subset)
+                store.register_columns(version, block, {name: str(values.dtype) for name, values in columns.items()})
+                features.update(columns)
+            onsen_ids = subset['onsen_id'] if 'onsen_id' in subset else pd.Series([None] * len(positions))
+            store.write_visits(version, ids[positions], onsen_ids, hashes[positions], features)
+        store.delete_visits(version, removed)
+
+        visit_ids = ids.tolist()
+        for block in blocks:
+            names = [feature for _, feature, _ in store.columns(version, block)]
+            view.stored[block] = {
+                name: pd.Series(column.array, index=data.index, name=name)
+                for name, column in store.read_columns(version, names, visit_ids).items()
+            }
+
+        refreshed: set = set()
+        if aggregations:
+            changed = states.index.intersection(visit_index[fresh]).union(removed)
+            refreshed = set(data['onsen_id'].iloc[positions].dropna().tolist())
+            refreshed |= set(states['onsen_id'].reindex(changed).dropna().tolist())
+            if refreshed:
+                table = self._onsen_aggregate_table(view, aggregations, sorted(refreshed))
+                store.register_columns(version, ONSEN_BLOCK, {name: str(table[name].dtype) for name in table.columns})
+                store.replace_onsen_aggregates(version, refreshed, table)
+            view.stored_aggregates = store.read_onsen_aggregates(version)
+
+        self.store_stats = {
+            'version': version,
+            'reused': len(ids) - len(positions),
+            'computed': len(positions),
+            'removed': len(removed),
+            'onsens_refreshed': len(refreshed),
+        }
+        logger.info(
+            f"Feature store: reused {self.store_stats['reused']} visits, computed {len(positions)}, "
+            f"removed {len(removed)}, refreshed {len(refreshed)} onsen aggregates"
+        )
+
+    @staticmethod
+    def _feature_set_version(
+        data: pd.DataFrame,
+        sources: list[str],
+        blocks: dict[str, Callable],
+        pairs: list[tuple[str, str]],
+        aggregations: dict[str, tuple[str, str]],
+    ) -> str:
+        """Version key covering the feature definitions and the source columns they read."""
+        spec = {
+            'feature_set': FEATURE_SET_VERSION,
+            'blocks': sorted(blocks),
+            'pairs': pairs,
+            'aggregations': aggregations,
+            'columns': {column: str(data[column].dtype) for column in sources},
+        }
+        payload = json.dumps(spec, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
     def create_rating_bins(
         self,
         data: pd.DataFrame,
@@ -472,4 +751,5 @@ class FeatureEngineer:
                 'count': len(self.aggregations_created),
                 'features': self.aggregations_created,
             },
+            'feature_store': self.store_stats,
         }
@@ -0,0 +1,320 @@
+"""
+Persistent store for engineered per-visit features.
+
+Features are stored one value per (feature-set version, feature, visit id),
+clustered by feature, so a single engineered column is read with one range
+scan instead of loading and copying a whole frame. Each stored visit keeps a
+hash of the source values its features were computed from; callers compare
+hashes to compute features only for new or edited visits. Onsen-level
+aggregates are kept alongside and refreshed per onsen.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable, Mapping
+from itertools import repeat
+from threading import RLock
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.lib.cache import shared_instance
+from src.paths import PATHS
+
+ONSEN_BLOCK = "onsen"
+
+
+def _sql_values(values: pd.Series) -> list:
+    """Python scalars for SQLite, with missing values as NULL."""
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+class FeatureStore:
+    """SQLite-backed store of engineered feature columns keyed by visit id and feature-set version."""
+
+    def __init__(self, db_path: str = PATHS.FEATURE_STORE_DB):
+        self.db_path = db_path
+        self._lock = RLock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._initialise()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _initialise(self) -> None:
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS feature_visits (
+                    version TEXT NOT NULL,
+                    visit_id INTEGER NOT NULL,
+                    onsen_id INTEGER,
+                    row_hash INTEGER NOT NULL,
+                    PRIMARY KEY (version, visit_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS feature_values (
+                    version TEXT NOT NULL,
+                    feature TEXT NOT NULL,
+                    visit_id INTEGER NOT NULL,
+                    value,
+                    PRIMARY KEY (version, feature, visit_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS feature_columns (
+                    version TEXT NOT NULL,
+                    block TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    feature TEXT NOT NULL,
+                    dtype TEXT NOT NULL,
+                    PRIMARY KEY (version, block, position)
+                );
+
+                CREATE TABLE IF NOT EXISTS onsen_aggregates (
+                    version TEXT NOT NULL,
+                    onsen_id INTEGER NOT NULL,
+                    feature TEXT NOT NULL,
+                    value,
+                    PRIMARY KEY (version, onsen_id, feature)
+                ) WITHOUT ROWID;
+                """
+            )
+            connection.commit()
+
+    def visit_states(self, version: str) -> pd.DataFrame:
+        """
+        Stored visits of a feature-set version.
+
+        Returns:
+            DataFrame indexed by visit id with ``onsen_id`` and ``row_hash`` columns
+        """
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT visit_id, onsen_id, row_hash FROM feature_visits WHERE version = ?",
+                (version,),
+            ).fetchall()
+        states = pd.DataFrame(rows, columns=["visit_id", "onsen_id", "row_hash"])
+        states["row_hash"] = states["row_hash"].astype(np.int64)
+        return states.set_index("visit_id")
+
+    def columns(self, version: str, block: Optional[str] = None) -> list[tuple[str, str, str]]:
+        """Registered ``(block, feature, dtype)`` columns of a version, in insertion order."""
+        query = "SELECT block, feature, dtype FROM feature_columns WHERE version = ?"
+        params: tuple = (version,)
+        if block is not None:
+            query += " AND block = ?"
+            params += (block,)
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(query + " ORDER BY rowid", params).fetchall()
+        return [tuple(row) for row in rows]
+
+    def register_columns(self, version: str, block: str, dtypes: Mapping[str, str]) -> None:
+        """Record the feature columns of a block (once per version and block)."""
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                """
+                INSERT OR IGNORE INTO feature_columns(version, block, position, feature, dtype)
+                VALUES(?, ?, ?, ?, ?)
+                """,
+                [
+                    (version, block, position, feature, dtype)
+                    for position, (feature, dtype) in enumerate(dtypes.items())
+                ],
+            )
+            connection.commit()
+
+    def write_visits(
+        self,
+        version: str,
+        visit_ids: Iterable[int],
+        onsen_ids: pd.Series,
+        row_hashes: np.ndarray,
+        features: Mapping[str, pd.Series],
+    ) -> None:
+        """
+        Insert or replace the features of some visits.
+
+        Args:
+            version: Feature-set version
+            visit_ids: Visit ids, aligned with the other arguments
+            onsen_ids: Onsen of each visit
+            row_hashes: Hash of each visit's source values
+            features: Feature columns, aligned with ``visit_ids``
+        """
+        ids = [int(visit_id) for visit_id in visit_ids]
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                """
+                INSERT OR REPLACE INTO feature_visits(version, visit_id, onsen_id, row_hash)
+                VALUES(?, ?, ?, ?)
+                """,
+                zip(repeat(version), ids, _sql_values(onsen_ids), row_hashes.tolist()),
+            )
+            for feature, values in features.items():
+                connection.executemany(
+                    "INSERT OR REPLACE INTO feature_values(version, feature, visit_id, value) VALUES(?, ?, ?, ?)",
+                    zip(repeat(version), repeat(feature), ids, _sql_values(values)),
+                )
+            connection.commit()
+
+    def delete_visits(self, version: str, visit_ids: Iterable[int]) -> int:
+        """Remove visits and their features; returns the number of visits removed."""
+        ids = [(version, int(visit_id)) for visit_id in visit_ids]
+        if not ids:
+            return 0
+        with self._lock, self._connect() as connection:
+            removed = connection.executemany(
+                "DELETE FROM feature_visits WHERE version = ? AND visit_id = ?", ids
+            ).rowcount
+            connection.executemany(
+                "DELETE FROM feature_values WHERE version = ? AND visit_id = ?", ids
+            )
+            connection.commit()
+        return removed
+
+    def read_column(
+        self,
+        version: str,
+        feature: str,
+        visit_ids: Optional[Iterable[int]] = None,
+    ) -> pd.Series:
+        """
+        Read one feature column.
+
+        Args:
+            version: Feature-set version
+            feature: Feature name
+            visit_ids: Visits to return, in order (default: every stored visit)
+
+        Returns:
+            Series indexed by visit id; visits without a stored value are NaN
+        """
+        return self.read_columns(version, [feature], visit_ids)[feature]
+
+    def read_columns(
+        self,
+        version: str,
+        features: Iterable[str],
+        visit_ids: Optional[Iterable[int]] = None,
+    ) -> dict[str, pd.Series]:
+        """Read several feature columns, one range scan each (see :meth:`read_column`)."""
+        target = None
+        if visit_ids is not None:
+            target = pd.Index(np.fromiter(visit_ids, dtype=np.int64), name="visit_id")
+
+        columns: dict[str, pd.Series] = {}
+        stored_ids: Optional[np.ndarray] = None
+        indexer: Optional[np.ndarray] = None
+        with self._lock, self._connect() as connection:
+            dtypes = dict(
+                connection.execute(
+                    "SELECT feature, dtype FROM feature_columns WHERE version = ?", (version,)
+                ).fetchall()
+            )
+            for feature in features:
+                rows = connection.execute(
+                    """
+                    SELECT visit_id, value FROM feature_values
+                    WHERE version = ? AND feature = ? ORDER BY visit_id
+                    """,
+                    (version, feature),
+                ).fetchall()
+                ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+                values = np.array([row[1] for row in rows], dtype=float)
+
+                if target is None:
+                    column = pd.Series(values, index=pd.Index(ids, name="visit_id"), name=feature)
+                else:
+                    # Columns of a version usually hold the same visits, so the lookup is reused
+                    if stored_ids is None or not np.array_equal(ids, stored_ids):
+                        stored_ids = ids
+                        indexer = pd.Index(ids).get_indexer(target)
+                    picked = np.where(indexer >= 0, values[indexer], np.nan) if len(values) else (
+                        np.full(len(target), np.nan)
+                    )
+                    column = pd.Series(picked, index=target, name=feature)
+
+                dtype = dtypes.get(feature)
+                if dtype is not None and not column.isna().any():
+                    column = column.astype(dtype)
+                columns[feature] = column
+        return columns
+
+    def read_onsen_aggregates(self, version: str) -> pd.DataFrame:
+        """Onsen-level aggregates of a version as a DataFrame indexed by onsen id."""
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT onsen_id, feature, value FROM onsen_aggregates WHERE version = ?",
+                (version,),
+            ).fetchall()
+        columns = self.columns(version, ONSEN_BLOCK)
+
+        long = pd.DataFrame(rows, columns=["onsen_id", "feature", "value"])
+        table = long.pivot(index="onsen_id", columns="feature", values="value")
+        table = table.reindex(columns=[feature for _, feature, _ in columns])
+        for _, feature, dtype in columns:
+            values = table[feature]
+            table[feature] = values.astype(dtype) if not values.isna().any() else values.astype(float)
+        table.columns.name = None
+        return table
+
+    def replace_onsen_aggregates(
+        self,
+        version: str,
+        onsen_ids: Iterable,
+        aggregates: pd.DataFrame,
+    ) -> None:
+        """
+        Replace the aggregates of some onsens.
+
+        Args:
+            version: Feature-set version
+            onsen_ids: Onsens whose stored aggregates are dropped first
+            aggregates: New aggregates indexed by onsen id (a subset of ``onsen_ids``)
+        """
+        stale = [(version, onsen_id) for onsen_id in pd.Series(list(onsen_ids), dtype=object).tolist()]
+        rows = [
+            (version, onsen_id, feature, value)
+            for feature in aggregates.columns
+            for onsen_id, value in zip(aggregates.index.tolist(), _sql_values(aggregates[feature]))
+        ]
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM onsen_aggregates WHERE version = ? AND onsen_id = ?", stale
+            )
+            connection.executemany(
+                "INSERT INTO onsen_aggregates(version, onsen_id, feature, value) VALUES(?, ?, ?, ?)",
+                rows,
+            )
+            connection.commit()
+
+    def clear(self, version: Optional[str] = None) -> int:
+        """Remove one version (or everything) and return the number of visits removed."""
+        where, params = ("WHERE version = ?", (version,)) if version is not None else ("", ())
+        with self._lock, self._connect() as connection:
+            removed = connection.execute(f"DELETE FROM feature_visits {where}", params).rowcount
+            for table in ("feature_values", "feature_columns", "onsen_aggregates"):
+                connection.execute(f"DELETE FROM {table} {where}", params)  # nosec - fixed table names
+            connection.commit()
+        logger.debug(f"Removed {removed} visits from the feature store")
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """Return version, visit and stored value counts."""
+        with self._lock, self._connect() as connection:
+            versions, visits = connection.execute(
+                "SELECT COUNT(DISTINCT version), COUNT(*) FROM feature_visits"
+            ).fetchone()
+            values = connection.execute("SELECT COUNT(*) FROM feature_values").fetchone()[0]
+        return {"versions": versions, "visits": visits, "values": values}
+
+
+@shared_instance
+def get_feature_store() -> FeatureStore:
+    """Return the shared on-disk feature store."""
+
+    return FeatureStore()
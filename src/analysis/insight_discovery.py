@@ -3,15 +3,55 @@ Automated insight discovery system for econometric analysis.
 
 This module automatically detects interesting patterns, surprising findings,
 and actionable insights from regression results and exploratory analysis.
+
+Exploratory scans work from sufficient statistics: threshold splits from
+cumulative sums over buckets formed by the (sorted) candidate thresholds, so
+the data itself is never sorted; group comparisons from one grouped
+aggregation. Their findings depend only on the data, so they are cached per
+fingerprint of the columns they read.
 """
 
-import pandas as pd
-import numpy as np
-from typing import Any
+import hashlib
 from dataclasses import dataclass, field
+from typing import Any, Optional
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+from src.analysis.result_cache import AnalysisResultCache
+
+# Candidate thresholds per variable (ascending), tested in order
+THRESHOLD_CANDIDATES = {
+    'stay_length_minutes': [30, 45, 60],
+    'entry_fee_yen': [300, 500, 1000],
+    'main_bath_temperature': [40, 42, 44],
+    'temperature_outside_celsius': [10, 15, 25],
+}
+HEART_RATE_VARIABLES = ['average_heart_rate', 'hr_range', 'hr_pct_max']
+TEMPORAL_VARIABLES = ['visit_season', 'is_weekend']
+
+
+def _pooled_t_test(
+    n1: np.ndarray, mean1: np.ndarray, var1: np.ndarray,
+    n2: np.ndarray, mean2: np.ndarray, var2: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Two-sided equal-variance t-test from group counts, means and sample variances.
+
+    Matches ``scipy.stats.ttest_ind(a, b)`` and works elementwise, so many
+    candidate splits are tested at once.
+    """
+    from scipy import stats  # pylint: disable=import-outside-toplevel
+
+    dof = n1 + n2 - 2
+    pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / dof
+    diff = mean1 - mean2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = diff / np.sqrt(pooled * (1.0 / n1 + 1.0 / n2))
+    p_val = 2 * stats.t.sf(np.abs(t_stat), dof)
+    return t_stat, p_val
+
 
 @dataclass
 class Insight:
@@ -36,9 +76,24 @@ class InsightDiscovery:
     identify interesting, surprising, or actionable findings.
     """
 
-    def __init__(self, significance_level: float = 0.05):
+    def __init__(
+        self,
+        significance_level: float = 0.05,
+        result_cache: Optional[AnalysisResultCache] = None,
+    ):
+        """
+        Initialize the discovery engine.
+
+        Args:
+            significance_level: P-value below which findings are reported
+            result_cache: Optional persistent cache for exploratory findings,
+                shared across runs
+        """
         self.significance_level = significance_level
+        self.result_cache = result_cache
         self.insights: list[Insight] = []
+        self._exploratory_cache: dict[str, list[Insight]] = {}
+        self.cache_stats = {'hits': 0, 'misses': 0}
 
     def discover_insights(
         self,
@@ -49,6 +104,9 @@ class InsightDiscovery:
         """
         Comprehensive insight discovery from regression results and data.
 
+        Exploratory findings are reused when the columns they read are
+        unchanged since an earlier call (or run, with a result cache).
+
         Args:
             regression_results: List of RegressionResult objects from econometric analysis
             data: Original DataFrame for exploratory insights
@@ -75,9 +133,7 @@ class InsightDiscovery:
 
         # Exploratory insights from data
         if data is not None:
-            self.insights.extend(self._find_threshold_effects(data, dependent_var))
-            self.insights.extend(self._find_heart_rate_insights(data, dependent_var))
-            self.insights.extend(self._find_temporal_patterns(data, dependent_var))
+            self.insights.extend(self._exploratory_insights(data, dependent_var))
 
         # Sort by priority
         priority_order = {'high': 0, 'medium': 1, 'low': 2}
@@ -86,6 +142,55 @@ class InsightDiscovery:
         logger.info(f"Discovered {len(self.insights)} insights")
         return self.insights
 
+    def _exploratory_insights(self, data: pd.DataFrame, dependent_var: str) -> list[Insight]:
+        """Threshold, heart rate and temporal findings, cached per data fingerprint."""
+        fingerprint = self._data_fingerprint(data, dependent_var)
+        cache_key = f"insights:{dependent_var}:{self.significance_level}"
+
+        cached = self._exploratory_cache.get(fingerprint)
+        if cached is None and self.result_cache is not None:
+            try:
+                payload = self.result_cache.get(cache_key, fingerprint)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Broad exception justified: caching must never break insight discovery
+                logger.warning(f"Failed to read cached insights: {e}")
+                payload = None
+            if payload is not None:
+                cached = payload['insights']
+                self._exploratory_cache[fingerprint] = cached
+
+        if cached is not None:
+            self.cache_stats['hits'] += 1
+            logger.debug("Reusing exploratory insights for unchanged data")
+            return list(cached)
+
+        self.cache_stats['misses'] += 1
+        insights = [
+            *self._find_threshold_effects(data, dependent_var),
+            *self._find_heart_rate_insights(data, dependent_var),
+            *self._find_temporal_patterns(data, dependent_var),
+        ]
+        self._exploratory_cache[fingerprint] = insights
+        if self.result_cache is not None:
+            try:
+                self.result_cache.set(cache_key, fingerprint, {'insights': insights})
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Failed to cache insights: {e}")
+        return list(insights)
+
+    def _data_fingerprint(self, data: pd.DataFrame, dependent_var: str) -> str:
+        """Hash of the columns the exploratory scans read, with the test settings."""
+        columns = [
+            column
+            for column in (dependent_var, *THRESHOLD_CANDIDATES, *HEART_RATE_VARIABLES, *TEMPORAL_VARIABLES)
+            if column in data.columns
+        ]
+        digest = hashlib.sha256(repr((columns, dependent_var, self.significance_level)).encode('utf-8'))
+        if columns:
+            row_hashes = pd.util.hash_pandas_object(data[columns], index=False)
+            digest.update(row_hashes.to_numpy().tobytes())
+        return digest.hexdigest()
+
     def _find_strong_effects(self, result, dependent_var: str) -> list[Insight]:
         """Identify variables with strong, statistically significant effects."""
         insights = []
@@ -297,59 +402,86 @@ class InsightDiscovery:
         return insights
 
     def _find_threshold_effects(self, data: pd.DataFrame, dependent_var: str) -> list[Insight]:
-        """Identify threshold effects using binned analysis."""
+        """
+        Identify threshold effects using binned analysis.
+
+        Each variable is bucketed once against its sorted candidate thresholds;
+        cumulative sums of the per-bucket counts, sums and squared sums of the
+        (centred) ratings give the mean and variance on either side of every
+        threshold, so all candidates are tested in one pass over the data.
+        """
         insights = []
 
         if dependent_var not in data.columns:
             return insights
 
-        # Check common threshold candidates
-        threshold_vars = {
-            'stay_length_minutes': [30, 45, 60],
-            'entry_fee_yen': [300, 500, 1000],
-            'main_bath_temperature': [40, 42, 44],
-            'temperature_outside_celsius': [10, 15, 25],
-        }
-
-        for var, thresholds in threshold_vars.items():
+        for var, thresholds in THRESHOLD_CANDIDATES.items():
             if var not in data.columns:
                 continue
 
             valid_data = data[[var, dependent_var]].dropna()
+            x = valid_data[var].to_numpy(dtype=float)
+            y = valid_data[dependent_var].to_numpy(dtype=float)
+
+            n = len(y)
+            # Centring keeps the sum-of-squares differences accurate
+            offset = float(y.mean()) if n else 0.0
+            y = y - offset
+
+            # Bucket j holds rows above j thresholds, so x <= thresholds[j] for buckets 0..j
+            edges = np.asarray(thresholds, dtype=float)
+            bucket = np.searchsorted(edges, x, side='left')
+            bins = len(edges) + 1
+            cum_count = np.cumsum(np.bincount(bucket, minlength=bins))[:-1]
+            cum_sum = np.cumsum(np.bincount(bucket, weights=y, minlength=bins))
+            cum_sq = np.cumsum(np.bincount(bucket, weights=y * y, minlength=bins))
+
+            n_below = cum_count
+            n_above = n - n_below
+            testable = (n_below > 10) & (n_above > 10)
+            if not testable.any():
+                continue
 
-            for threshold in thresholds:
-                below = valid_data[valid_data[var] <= threshold][dependent_var]
-                above = valid_data[valid_data[var] > threshold][dependent_var]
+            sum_below, sq_below = cum_sum[:-1][testable], cum_sq[:-1][testable]
+            sum_above, sq_above = cum_sum[-1] - sum_below, cum_sq[-1] - sq_below
+            n_below, n_above = n_below[testable], n_above[testable]
+            mean_below, mean_above = sum_below / n_below, sum_above / n_above
+            var_below = np.maximum(sq_below - n_below * mean_below**2, 0.0) / (n_below - 1)
+            var_above = np.maximum(sq_above - n_above * mean_above**2, 0.0) / (n_above - 1)
 
-                if len(below) > 10 and len(above) > 10:
-                    # T-test for difference
-                    from scipy import stats
-                    t_stat, p_val = stats.ttest_ind(below, above)
+            t_stats, p_vals = _pooled_t_test(n_below, mean_below, var_below, n_above, mean_above, var_above)
 
-                    if p_val < self.significance_level:
-                        diff = above.mean() - below.mean()
+            for i, threshold in enumerate(np.asarray(thresholds)[testable].tolist()):
+                t_stat, p_val = float(t_stats[i]), float(p_vals[i])
+                if np.isnan(p_val) or p_val >= self.significance_level:
+                    continue
 
-                        interpretation = (
-                            f"Threshold effect at {threshold} for {self._humanize_variable(var)}: "
-                            f"ratings {'increase' if diff > 0 else 'decrease'} by {abs(diff):.2f} points "
-                            f"above this threshold (t={t_stat:.2f}, p={p_val:.4f})"
-                        )
+                diff = float(mean_above[i] - mean_below[i])
+                below_std = float(np.sqrt(var_below[i]))
+                below_mean = float(mean_below[i]) + offset
+                above_mean = float(mean_above[i]) + offset
 
-                        technical_note = f"Below: μ={below.mean():.2f}, Above: μ={above.mean():.2f}, t={t_stat:.2f}"
+                interpretation = (
+                    f"Threshold effect at {threshold} for {self._humanize_variable(var)}: "
+                    f"ratings {'increase' if diff > 0 else 'decrease'} by {abs(diff):.2f} points "
+                    f"above this threshold (t={t_stat:.2f}, p={p_val:.4f})"
+                )
 
-                        insight = Insight(
-                            category='threshold',
-                            priority='medium',
-                            variable=var,
-                            effect_size=diff,
-                            p_value=p_val,
-                            confidence_interval=(diff - 1.96 * below.std(), diff + 1.96 * below.std()),
-                            interpretation=interpretation,
-                            technical_note=technical_note,
-                        )
+                technical_note = f"Below: μ={below_mean:.2f}, Above: μ={above_mean:.2f}, t={t_stat:.2f}"
 
-                        insights.append(insight)
-                        break  # Only report one threshold per variable
+                insight = Insight(
+                    category='threshold',
+                    priority='medium',
+                    variable=var,
+                    effect_size=diff,
+                    p_value=p_val,
+                    confidence_interval=(diff - 1.96 * below_std, diff + 1.96 * below_std),
+                    interpretation=interpretation,
+                    technical_note=technical_note,
+                )
+
+                insights.append(insight)
+                break  # Only report one threshold per variable
 
         return insights
 
@@ -402,23 +534,26 @@ class InsightDiscovery:
         return insights
 
     def _find_temporal_patterns(self, data: pd.DataFrame, dependent_var: str) -> list[Insight]:
-        """Discover temporal patterns (seasonality, day-of-week effects)."""
+        """
+        Discover temporal patterns (seasonality, day-of-week effects).
+
+        Each comparison is one grouped aggregation of count, mean and variance;
+        the ANOVA and t-test are computed from those group statistics.
+        """
         insights = []
 
-        # Season effects
-        if 'visit_season' in data.columns and dependent_var in data.columns:
-            season_means = data.groupby('visit_season')[dependent_var].agg(['mean', 'count'])
+        if dependent_var not in data.columns:
+            return insights
 
-            if (season_means['count'] > 5).all():
-                best_season = season_means['mean'].idxmax()
-                worst_season = season_means['mean'].idxmin()
-                diff = season_means.loc[best_season, 'mean'] - season_means.loc[worst_season, 'mean']
+        # Season effects
+        if 'visit_season' in data.columns:
+            season_stats = data.groupby('visit_season')[dependent_var].agg(['mean', 'count', 'var'])
 
-                # ANOVA test
-                from scipy import stats
-                groups = [data[data['visit_season'] == season][dependent_var].dropna()
-                          for season in season_means.index]
-                f_stat, p_val = stats.f_oneway(*groups)
+            if len(season_stats) > 1 and (season_stats['count'] > 5).all():
+                best_season = season_stats['mean'].idxmax()
+                worst_season = season_stats['mean'].idxmin()
+                diff = season_stats.loc[best_season, 'mean'] - season_stats.loc[worst_season, 'mean']
+                f_stat, p_val = self._one_way_anova(season_stats)
 
                 if p_val < self.significance_level and diff > 0.3:
                     interpretation = (
@@ -426,7 +561,7 @@ class InsightDiscovery:
                         f"than {worst_season} (F={f_stat:.2f}, p={p_val:.4f})"
                     )
 
-                    technical_note = f"Best: {best_season} (μ={season_means.loc[best_season, 'mean']:.2f})"
+                    technical_note = f"Best: {best_season} (μ={season_stats.loc[best_season, 'mean']:.2f})"
 
                     insight = Insight(
                         category='temporal',
@@ -442,14 +577,23 @@ class InsightDiscovery:
                     insights.append(insight)
 
         # Weekend vs weekday
-        if 'is_weekend' in data.columns and dependent_var in data.columns:
-            weekend_data = data[data['is_weekend'] == 1][dependent_var].dropna()
-            weekday_data = data[data['is_weekend'] == 0][dependent_var].dropna()
-
-            if len(weekend_data) > 10 and len(weekday_data) > 10:
-                from scipy import stats
-                t_stat, p_val = stats.ttest_ind(weekend_data, weekday_data)
-                diff = weekend_data.mean() - weekday_data.mean()
+        if 'is_weekend' in data.columns:
+            is_weekend = data['is_weekend']
+            day_type = pd.Series(
+                np.select([is_weekend.eq(1), is_weekend.eq(0)], ['weekend', 'weekday'], default=''),
+                index=data.index,
+            )
+            day_stats = data[dependent_var].groupby(day_type).agg(['mean', 'count', 'var'])
+            day_stats = day_stats.reindex(['weekend', 'weekday'])
+
+            if (day_stats['count'] > 10).all():
+                weekend, weekday = day_stats.loc['weekend'], day_stats.loc['weekday']
+                t_stat, p_val = _pooled_t_test(
+                    weekend['count'], weekend['mean'], weekend['var'],
+                    weekday['count'], weekday['mean'], weekday['var'],
+                )
+                t_stat, p_val = float(t_stat), float(p_val)
+                diff = weekend['mean'] - weekday['mean']
 
                 if p_val < self.significance_level and abs(diff) > 0.3:
                     which_better = "weekend" if diff > 0 else "weekday"
@@ -459,7 +603,7 @@ class InsightDiscovery:
                         f"{abs(diff):.2f} points higher (t={t_stat:.2f}, p={p_val:.4f})"
                     )
 
-                    technical_note = f"Weekend: μ={weekend_data.mean():.2f}, Weekday: μ={weekday_data.mean():.2f}"
+                    technical_note = f"Weekend: μ={weekend['mean']:.2f}, Weekday: μ={weekday['mean']:.2f}"
 
                     insight = Insight(
                         category='temporal',
@@ -476,6 +620,25 @@ class InsightDiscovery:
 
         return insights
 
+    @staticmethod
+    def _one_way_anova(group_stats: pd.DataFrame) -> tuple[float, float]:
+        """One-way ANOVA from per-group ``mean``, ``count`` and ``var`` (matches ``scipy.stats.f_oneway``)."""
+        from scipy import stats  # pylint: disable=import-outside-toplevel
+
+        counts = group_stats['count'].to_numpy(dtype=float)
+        means = group_stats['mean'].to_numpy(dtype=float)
+        variances = group_stats['var'].fillna(0.0).to_numpy(dtype=float)
+
+        total = counts.sum()
+        grand_mean = (counts * means).sum() / total
+        between = (counts * (means - grand_mean) ** 2).sum()
+        within = ((counts - 1) * variances).sum()
+        df_between, df_within = len(counts) - 1, total - len(counts)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_stat = (between / df_between) / (within / df_within)
+        return float(f_stat), float(stats.f.sf(f_stat, df_between, df_within))
+
     def _humanize_variable(self, var_name: str) -> str:
         """Convert variable name to human-readable form."""
         # Remove common prefixes/suffixes
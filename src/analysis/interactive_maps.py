@@ -39,6 +39,7 @@ class InteractiveMapGenerator:
         center: Optional[tuple[float, float]] = None,
         zoom_start: int = 12,
         show_locations: bool = True,
+        client_side: Optional[bool] = None,
     ) -> Path:
         # pylint: disable=too-complex,too-many-locals
         # Complexity justified: creates multiple map layers with detailed popups
@@ -54,12 +55,16 @@ class InteractiveMapGenerator:
             center: Optional (lat, lon) tuple for map center
             zoom_start: Initial zoom level
             show_locations: Whether to show user location markers (default: True)
+            client_side: Write onsens to a GeoJSON data file rendered in the
+                browser instead of per-marker layers (default: only for large
+                datasets)
 
         Returns:
             Path to generated HTML map
         """
         import folium
         from folium.plugins import MarkerCluster, HeatMap
+        from src.lib.client_map import use_client_side
 
         logger.info(f"Creating comprehensive onsen map: {map_name}")
 
@@ -82,42 +87,32 @@ class InteractiveMapGenerator:
         )
 
         # Add different tile layers
-        folium.TileLayer('Stamen Terrain', name='Terrain').add_to(m)
-        folium.TileLayer('Stamen Toner', name='Toner').add_to(m)
+        folium.TileLayer('OpenTopoMap', name='Terrain').add_to(m)
+        folium.TileLayer('Esri.WorldGrayCanvas', name='Gray').add_to(m)
         folium.TileLayer('CartoDB positron', name='Light').add_to(m)
 
         # Add location markers (all in pink, no reference location)
         if show_locations:
             _add_location_markers(m, db_session, reference_location_id=None)
 
-        # Layer 1: Individual markers with detailed popups
-        marker_layer = folium.FeatureGroup(name='Onsen Details', show=True)
+        client_mode = use_client_side(len(map_data), client_side)
+        map_path = self.output_dir / map_name
 
-        for _, row in map_data.iterrows():
-            popup_html = self._create_rich_popup(row)
-
-            # Determine marker color based on rating
-            if 'personal_rating' in row and pd.notna(row['personal_rating']):
-                rating = row['personal_rating']
-                if rating >= 9:
-                    color = 'darkgreen'
-                elif rating >= 7.5:
-                    color = 'green'
-                elif rating >= 6:
-                    color = 'orange'
-                else:
-                    color = 'red'
-            else:
-                color = 'gray'
+        # Layer 1: Individual markers with detailed popups
+        if client_mode:
+            self._add_client_side_layer(m, map_data, map_path)
+        else:
+            marker_layer = folium.FeatureGroup(name='Onsen Details', show=True)
 
-            folium.Marker(
-                location=[row['latitude'], row['longitude']],
-                popup=folium.Popup(popup_html, max_width=400),
-                tooltip=self._create_tooltip(row),
-                icon=folium.Icon(color=color, icon='info-sign'),
-            ).add_to(marker_layer)
+            for _, row in map_data.iterrows():
+                folium.Marker(
+                    location=[row['latitude'], row['longitude']],
+                    popup=folium.Popup(self._create_rich_popup(row), max_width=400),
+                    tooltip=self._create_tooltip(row),
+                    icon=folium.Icon(color=self._rating_color(row), icon='info-sign'),
+                ).add_to(marker_layer)
 
-        marker_layer.add_to(m)
+            marker_layer.add_to(m)
 
         # Layer 2: Heat map by visit count
         if 'visit_count' in map_data.columns:
@@ -153,23 +148,24 @@ class InteractiveMapGenerator:
                 HeatMap(rating_data, radius=20, blur=30, max_zoom=13).add_to(rating_layer)
                 rating_layer.add_to(m)
 
-        # Layer 4: Clustered markers (for high density)
-        cluster_layer = folium.FeatureGroup(name='Clustered View', show=False)
-        marker_cluster = MarkerCluster().add_to(cluster_layer)
+        # Layer 4: Clustered markers (for high density); the client-side layer is already clustered
+        if not client_mode:
+            cluster_layer = folium.FeatureGroup(name='Clustered View', show=False)
+            marker_cluster = MarkerCluster().add_to(cluster_layer)
 
-        for _, row in map_data.iterrows():
-            tooltip = self._create_tooltip(row)
+            for _, row in map_data.iterrows():
+                tooltip = self._create_tooltip(row)
 
-            folium.Marker(
-                location=[row['latitude'], row['longitude']],
-                tooltip=tooltip,
-                popup=self._create_rich_popup(row),
-            ).add_to(marker_cluster)
+                folium.Marker(
+                    location=[row['latitude'], row['longitude']],
+                    tooltip=tooltip,
+                    popup=self._create_rich_popup(row),
+                ).add_to(marker_cluster)
 
-        cluster_layer.add_to(m)
+            cluster_layer.add_to(m)
 
         # Layer 5: Circle markers sized by visit count
-        if 'visit_count' in map_data.columns:
+        if 'visit_count' in map_data.columns and not client_mode:
             circle_layer = folium.FeatureGroup(name='Visit Count (Sized)', show=False)
 
             for _, row in map_data.iterrows():
@@ -197,12 +193,103 @@ class InteractiveMapGenerator:
         m.get_root().html.add_child(folium.Element(legend_html))
 
         # Save map
-        map_path = self.output_dir / map_name
         m.save(str(map_path))
 
         logger.info(f"Map saved to: {map_path}")
         return map_path
 
+    def _add_client_side_layer(self, folium_map, map_data: pd.DataFrame, map_path: Path) -> None:
+        # pylint: disable=import-outside-toplevel
+        """Write onsen details to a GeoJSON data file and render markers in the browser."""
+        from src.lib.client_map import ClientMarkerLayer, point_feature, write_map_data
+
+        features = [
+            point_feature(record['latitude'], record['longitude'], self._create_feature_properties(record))
+            for record in map_data.to_dict('records')
+        ]
+        data_src = write_map_data(features, str(map_path), data_var='onsenDetailData')
+
+        fields = [
+            ('region', '📍 Region'),
+            ('address', 'Address'),
+            ('personal_rating', '⭐ Personal Rating'),
+            ('avg_rating', '📊 Average Rating'),
+            ('cleanliness_rating', '🧹 Cleanliness'),
+            ('atmosphere_rating', '🎨 Atmosphere'),
+            ('view_rating', '🌄 View'),
+            ('sauna_rating', '🧖 Sauna'),
+            ('outdoor_bath_rating', '🏞️ Outdoor Bath'),
+            ('visits', '🔄 Visits'),
+            ('entry_fee_yen', '💰 Entry Fee'),
+            ('avg_entry_fee', 'Average fee'),
+            ('avg_stay_length', '⏱️ Avg Stay'),
+            ('heart_rate', '❤️ Avg Heart Rate'),
+            ('facilities', 'Facilities'),
+            ('spring_quality', 'Spring Quality'),
+            ('last_visit', 'Last visit'),
+        ]
+        ClientMarkerLayer(data_src, data_var='onsenDetailData', fields=fields).add_to(folium_map)
+
+    def _create_feature_properties(self, record: dict) -> dict:
+        """Format the popup details of one onsen as compact GeoJSON properties."""
+        def _present(key: str) -> bool:
+            return pd.notna(record.get(key))
+
+        props = {
+            'title': record.get('name', 'Unknown Onsen'),
+            'tooltip': self._create_tooltip(pd.Series(record)),
+            'color': self._rating_color(record),
+        }
+        for key in ('region', 'address', 'spring_quality', 'last_visit'):
+            if _present(key):
+                props[key] = str(record[key])
+        if _present('personal_rating'):
+            props['personal_rating'] = f"{record['personal_rating']:.1f}/10"
+        if _present('avg_rating'):
+            props['avg_rating'] = f"{record['avg_rating']:.2f}/10"
+        for key in ('cleanliness_rating', 'atmosphere_rating', 'view_rating',
+                    'sauna_rating', 'outdoor_bath_rating'):
+            if _present(key):
+                props[key] = f"{record[key]:.1f}/10"
+
+        visit_count = record.get('visit_count', record.get('onsen_visit_count'))
+        if pd.notna(visit_count) and visit_count > 0:
+            props['visits'] = f"{int(visit_count)} time(s)"
+        if _present('entry_fee_yen'):
+            props['entry_fee_yen'] = f"¥{int(record['entry_fee_yen'])}"
+        if _present('avg_entry_fee'):
+            props['avg_entry_fee'] = f"¥{int(record['avg_entry_fee'])}"
+        if _present('avg_stay_length'):
+            props['avg_stay_length'] = f"{int(record['avg_stay_length'])} min"
+        if _present('average_heart_rate'):
+            props['heart_rate'] = f"{record['average_heart_rate']:.0f} bpm"
+
+        facilities = [
+            label for key, label in (
+                ('had_sauna', '🧖 Sauna'),
+                ('had_outdoor_bath', '🏞️ Outdoor Bath'),
+                ('had_rest_area', '🛋️ Rest Area'),
+                ('had_food_service', '🍜 Food'),
+            ) if record.get(key)
+        ]
+        if facilities:
+            props['facilities'] = ' • '.join(facilities)
+
+        return props
+
+    def _rating_color(self, row) -> str:
+        """Marker color for an onsen based on its personal rating."""
+        rating = row.get('personal_rating')
+        if rating is None or pd.isna(rating):
+            return 'gray'
+        if rating >= 9:
+            return 'darkgreen'
+        if rating >= 7.5:
+            return 'green'
+        if rating >= 6:
+            return 'orange'
+        return 'red'
+
     def _create_rich_popup(self, row: pd.Series) -> str:
         # pylint: disable=too-complex
         # Complexity justified: builds comprehensive HTML popup with multiple optional sections
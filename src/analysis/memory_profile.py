@@ -0,0 +1,139 @@
+"""
+Resident memory tracking for analysis stages.
+
+While a stage runs, a background thread samples the process RSS (from
+``/proc/self/statm`` where available). The sampled peak is combined with the
+process high-water mark from ``getrusage``, so short spikes between samples
+are still attributed to the stage that raised the mark. Stages running as
+threads of the analysis process overlap, so their peaks do too. Work a stage
+hands to worker processes is measured there with ``run_measured`` and
+reported separately as the stage's ``worker_peak_rss_mb``.
+"""
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator
+from typing import Any, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+MB = 1024 * 1024
+_STATM_PATH = "/proc/self/statm"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, or None where it cannot be read cheaply."""
+    try:
+        with open(_STATM_PATH, encoding="ascii") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Highest resident set size this process has reached."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return round(value / MB, 1) if value is not None else None
+
+
+class MemoryTracker:
+    """Record the peak RSS of named stages."""
+
+    def __init__(self, interval: float = 0.01):
+        """
+        Initialize the tracker.
+
+        Args:
+            interval: Seconds between RSS samples while a stage runs
+        """
+        self.interval = interval
+        self.stages: dict[str, dict[str, Optional[float]]] = {}
+        self.worker_peaks: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_worker_peak(self, name: str, peak_rss_mb: Optional[float]) -> None:
+        """Record the peak RSS a worker process reached on behalf of stage ``name``."""
+        if peak_rss_mb is None:
+            return
+        with self._lock:
+            self.worker_peaks[name] = max(self.worker_peaks.get(name, 0.0), peak_rss_mb)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Track the peak RSS of the enclosed block under ``name``."""
+        start = current_rss_bytes()
+        high_water = peak_rss_bytes()
+        peak = start or 0
+        stop = threading.Event()
+
+        def _sample() -> None:
+            nonlocal peak
+            while not stop.wait(self.interval):
+                rss = current_rss_bytes() or 0
+                peak = max(peak, rss)
+
+        sampler = None
+        if start is not None:
+            sampler = threading.Thread(target=_sample, name=f"rss-{name}", daemon=True)
+            sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            if sampler is not None:
+                sampler.join()
+
+            end = current_rss_bytes()
+            stage_peak = max(peak, end or 0) or None
+            new_high_water = peak_rss_bytes()
+            if new_high_water is not None and high_water is not None and new_high_water > high_water:
+                # The process peak was raised while this stage ran
+                stage_peak = max(stage_peak or 0, new_high_water)
+
+            with self._lock:
+                self.stages[name] = {
+                    "peak_rss_mb": _mb(stage_peak),
+                    "start_rss_mb": _mb(start),
+                    "end_rss_mb": _mb(end),
+                }
+
+    def report(self) -> dict[str, Any]:
+        """Per-stage peaks plus the process-wide peak, in MiB."""
+        with self._lock:
+            stages = {name: dict(values) for name, values in self.stages.items()}
+            for name, peak in self.worker_peaks.items():
+                stages.setdefault(name, {})["worker_peak_rss_mb"] = peak
+        return {"stages": stages, "process_peak_rss_mb": _mb(peak_rss_bytes())}
+
+
+def run_measured(func: Callable[..., Any], *args: Any) -> tuple[Any, Optional[float]]:
+    """
+    Call ``func`` and return its result with the peak RSS reached meanwhile.
+
+    Meant to run inside a worker process, whose memory the parent's tracker
+    cannot see.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for ``func``
+
+    Returns:
+        The result and the peak RSS in MiB (None where it cannot be read)
+    """
+    tracker = MemoryTracker()
+    with tracker.stage("call"):
+        result = func(*args)
+    return result, tracker.stages["call"]["peak_rss_mb"]
@@ -5,12 +5,45 @@ Systematically explores different model specifications to find
 the most robust, interpretable, and well-fitting models.
 """
 
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Optional
+
 import pandas as pd
 import numpy as np
-from typing import Any
 
 from loguru import logger
 
+from src.analysis.econometrics import BatchOLS, EconometricAnalyzer, OLSScreenResult
+
+# Read-only design data shared by all specifications estimated in a worker
+_worker_design: Optional[pd.DataFrame] = None
+
+
+def _init_search_worker(matrix: np.ndarray, columns: list[str]) -> None:
+    """Receive the shared design matrix once per worker process."""
+    global _worker_design  # pylint: disable=global-statement
+    _worker_design = pd.DataFrame(matrix, columns=columns, copy=False)
+
+
+def _estimate_specification(
+    spec_name: str,
+    dependent_var: str,
+    indep_vars: list[str],
+    significance_level: float,
+) -> Any:
+    """Estimate one specification against the worker's shared design data."""
+    analyzer = EconometricAnalyzer()
+    analyzer.significance_level = significance_level
+    return analyzer.estimate_ols(
+        data=_worker_design,
+        dependent_var=dependent_var,
+        independent_vars=indep_vars,
+        model_name=spec_name,
+        robust_se=True,
+    )
+
 
 class ModelSearchEngine:
     """
@@ -34,6 +67,7 @@ class ModelSearchEngine:
         """
         self.analyzer = econometric_analyzer
         self.search_results: list[Any] = []
+        self.screening_results: list[OLSScreenResult] = []
 
     def search_models(
         self,
@@ -42,6 +76,9 @@ class ModelSearchEngine:
         max_models: int = 20,
         include_polynomials: bool = True,
         include_interactions: bool = True,
+        n_jobs: int = 1,
+        time_budget: Optional[float] = None,
+        screen_top_n: Optional[int] = None,
     ) -> list[Any]:
         """
         Automated model search.
@@ -52,6 +89,12 @@ class ModelSearchEngine:
             max_models: Maximum number of models to estimate
             include_polynomials: Test polynomial specifications
             include_interactions: Test interaction specifications
+            n_jobs: Worker processes used to estimate specifications
+            time_budget: Stop estimating new specifications after this many seconds
+            screen_top_n: Screen every specification with the batched OLS kernel
+                and run the full statsmodels diagnostics only for the best N.
+                By default, screening keeps the best ``max_models`` whenever more
+                specifications than that are generated.
 
         Returns:
             List of RegressionResult objects, sorted by quality
@@ -66,14 +109,106 @@ class ModelSearchEngine:
             include_interactions=include_interactions,
         )
 
+        if screen_top_n is None and len(specifications) > max_models:
+            screen_top_n = max_models
+        design = self._build_design_frame(data, dependent_var, specifications)
+
+        if screen_top_n is not None:
+            specifications = self._screen_specifications(
+                design, dependent_var, specifications, min(screen_top_n, max_models)
+            )
+
         # Estimate models
+        if n_jobs > 1 and len(specifications) > 1:
+            results = self._estimate_parallel(
+                design, dependent_var, specifications, n_jobs, time_budget
+            )
+        else:
+            results = self._estimate_sequential(
+                design, dependent_var, specifications, time_budget
+            )
+
+        # Rank models (results are in specification order, so ties stay deterministic)
+        ranked_results = self._rank_models(results)
+
+        self.search_results = ranked_results
+        logger.info(f"Search complete. Estimated {len(ranked_results)} models")
+
+        return ranked_results
+
+    def _build_design_frame(
+        self,
+        data: pd.DataFrame,
+        dependent_var: str,
+        specifications: list[tuple[str, list[str]]],
+    ) -> pd.DataFrame:
+        """
+        Extract every variable used by the specifications as float64 columns.
+
+        Non-numeric columns are left out, so specifications that reference
+        them fail exactly as they would when estimated on the raw data.
+        """
+        columns = [dependent_var]
+        for _, indep_vars in specifications:
+            for var in indep_vars:
+                if var not in columns:
+                    columns.append(var)
+
+        usable = [
+            col for col in columns
+            if col in data.columns
+            and (pd.api.types.is_numeric_dtype(data[col]) or pd.api.types.is_bool_dtype(data[col]))
+        ]
+        return data[usable].astype(np.float64)
+
+    def _screen_specifications(
+        self,
+        design: pd.DataFrame,
+        dependent_var: str,
+        specifications: list[tuple[str, list[str]]],
+        top_n: int,
+    ) -> list[tuple[str, list[str]]]:
+        """
+        Rank specifications with the batched OLS kernel and keep the best ``top_n``.
+
+        Screening prefers higher adjusted R², then specifications without
+        severe multicollinearity, then fewer variables. The kept
+        specifications retain their original order.
+        """
+        pool = [col for col in design.columns if col != dependent_var]
+        screened = BatchOLS(design, dependent_var, pool).fit_many(specifications)
+        screened.sort(
+            key=lambda r: (-r.adj_r_squared, r.max_vif >= 10, len(r.independent_vars))
+        )
+        self.screening_results = screened
+
+        keep = {r.model_name for r in screened[:top_n]}
+        logger.info(
+            f"Screened {len(screened)} specifications, "
+            f"running full diagnostics for {len(keep)}"
+        )
+        return [spec for spec in specifications if spec[0] in keep]
+
+    def _estimate_sequential(
+        self,
+        design: pd.DataFrame,
+        dependent_var: str,
+        specifications: list[tuple[str, list[str]]],
+        time_budget: Optional[float],
+    ) -> list[Any]:
+        """Estimate specifications one after another in this process."""
+        start = time.monotonic()
         results = []
-        for i, (spec_name, indep_vars) in enumerate(specifications[:max_models], 1):
+        for i, (spec_name, indep_vars) in enumerate(specifications, 1):
+            if time_budget is not None and time.monotonic() - start >= time_budget:
+                logger.info(f"Time budget reached after {i - 1} specifications")
+                break
+
             try:
-                logger.info(f"Estimating model {i}/{min(len(specifications), max_models)}: {spec_name}")
+                logger.info(f"Estimating model {i}/{len(specifications)}: {spec_name}")
 
                 result = self.analyzer.estimate_ols(
-                    data=data,
+                    data=design,
                     dependent_var=dependent_var,
                     independent_vars=indep_vars,
                     model_name=spec_name,
@@ -86,13 +221,73 @@ class ModelSearchEngine:
                 logger.warning(f"Failed to estimate {spec_name}: {e}")
                 continue
 
-        # Rank models
-        ranked_results = self._rank_models(results)
+        return results
 
-        self.search_results = ranked_results
-        logger.info(f"Search complete. Estimated {len(ranked_results)} models")
+    def _estimate_parallel(
+        self,
+        design: pd.DataFrame,
+        dependent_var: str,
+        specifications: list[tuple[str, list[str]]],
+        n_jobs: int,
+        time_budget: Optional[float],
+    ) -> list[Any]:
+        """
+        Estimate specifications across worker processes.
 
-        return ranked_results
+        The design matrix is sent to each worker once at start-up; tasks only
+        carry variable names. Results are returned in specification order.
+        """
+        start = time.monotonic()
+        estimated: dict[int, Any] = {}
+        matrix = design.to_numpy(dtype=np.float64)
+        columns = list(design.columns)
+
+        executor = ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(specifications)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_search_worker,
+            initargs=(matrix, columns),
+        )
+        try:
+            futures = {
+                executor.submit(
+                    _estimate_specification,
+                    spec_name,
+                    dependent_var,
+                    indep_vars,
+                    self.analyzer.significance_level,
+                ): (i, spec_name)
+                for i, (spec_name, indep_vars) in enumerate(specifications)
+            }
+
+            pending = set(futures)
+            while pending:
+                timeout = None
+                if time_budget is not None:
+                    timeout = max(0.0, time_budget - (time.monotonic() - start))
+
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.info(
+                        f"Time budget reached after {len(estimated)} specifications, "
+                        f"skipping {len(pending)}"
+                    )
+                    break
+
+                for future in done:
+                    i, spec_name = futures[future]
+                    try:
+                        estimated[i] = future.result()
+                        logger.info(f"Estimated model {i + 1}/{len(specifications)}: {spec_name}")
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        # Broad exception justified: one failing specification (or worker) must not end the search
+                        logger.warning(f"Failed to estimate {spec_name}: {e}")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        results = [estimated[i] for i in sorted(estimated)]
+        self.analyzer.models_estimated.extend(results)
+        return results
 
     def _generate_specifications(
         self,
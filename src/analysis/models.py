@@ -7,7 +7,10 @@ Note: Regression analysis is handled by src/analysis/econometrics.py
 from typing import Optional, Any
 from datetime import datetime
 from pathlib import Path
+import multiprocessing
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 import numpy as np
@@ -17,6 +20,51 @@ from src.types.analysis import ModelType, ModelConfig
 
 warnings.filterwarnings("ignore")
 
+SILHOUETTE_SAMPLE_SIZE = 2000
+"""Rows used to score each candidate cluster count; silhouette is O(n²)."""
+
+MINIBATCH_THRESHOLD = 10000
+"""Inputs with at least this many rows are clustered with MiniBatchKMeans."""
+
+
+def _kmeans_estimator(
+    k: int, n_rows: int, minibatch_threshold: int, init: Any = "k-means++"
+) -> Any:
+    """Build a KMeans or MiniBatchKMeans estimator for ``k`` clusters."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+
+    n_init = 1 if not isinstance(init, str) else (3 if n_rows >= minibatch_threshold else 10)
+    if n_rows >= minibatch_threshold:
+        return MiniBatchKMeans(
+            n_clusters=k, init=init, n_init=n_init, random_state=42, batch_size=4096
+        )
+    return KMeans(n_clusters=k, init=init, n_init=n_init, random_state=42)
+
+
+def _score_clustering(X: np.ndarray, labels: np.ndarray, sample_size: Optional[int]) -> float:
+    """Silhouette score on a fixed random sample of rows."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.metrics import silhouette_score
+
+    try:
+        if sample_size is not None and X.shape[0] > sample_size:
+            return float(silhouette_score(X, labels, sample_size=sample_size, random_state=42))
+        return float(silhouette_score(X, labels))
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Broad exception justified: silhouette score calculation may fail
+        return 0.0
+
+
+def _evaluate_cluster_count(
+    X: np.ndarray, k: int, sample_size: Optional[int], minibatch_threshold: int
+) -> tuple[int, float, float]:
+    """Fit and score one candidate k from scratch; runs in a worker process."""
+    start = time.perf_counter()
+    model = _kmeans_estimator(k, X.shape[0], minibatch_threshold).fit(X)
+    score = _score_clustering(X, model.labels_, sample_size)
+    return k, score, time.perf_counter() - start
+
 
 class ModelEngine:
     """
@@ -25,11 +73,13 @@ class ModelEngine:
     For regression analysis, use EconometricAnalyzer from src.analysis.econometrics
     """
 
-    def __init__(self, save_dir: Optional[str] = None):
+    def __init__(self, save_dir: Optional[str] = None, n_jobs: int = 1):
         self.save_dir = Path(save_dir) if save_dir else Path("output/models")
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.n_jobs = max(1, n_jobs)
         self.models: dict[str, Any] = {}
         self.scalers: dict[str, Any] = {}
+        self.cluster_searches: dict[str, dict[str, Any]] = {}
 
     def create_clustering_model(
         self, data: pd.DataFrame, config: ModelConfig, n_clusters: Optional[int] = None
@@ -43,6 +93,10 @@ class ModelEngine:
         from sklearn.preprocessing import StandardScaler
         from sklearn.metrics import silhouette_score
 
+        options = config.custom_config or {}
+        sample_size = options.get("silhouette_sample_size", SILHOUETTE_SAMPLE_SIZE)
+        minibatch_threshold = options.get("minibatch_threshold", MINIBATCH_THRESHOLD)
+
         # Prepare data
         X = data[config.feature_columns].dropna()
 
@@ -55,8 +109,17 @@ class ModelEngine:
         self.scalers[config.type.value] = scaler
 
         # Determine number of clusters for KMeans
+        cluster_search = None
         if config.type == ModelType.KMEANS and n_clusters is None:
-            n_clusters = self._find_optimal_clusters(X_scaled)
+            cluster_search = self._search_cluster_counts(
+                X_scaled,
+                max_clusters=options.get("max_clusters", 10),
+                sample_size=sample_size,
+                minibatch_threshold=minibatch_threshold,
+                warm_start=options.get("warm_start", False),
+                n_jobs=options.get("n_jobs", self.n_jobs),
+            )
+            n_clusters = cluster_search["selected_k"]
 
         # Update hyperparameters
         if config.hyperparameters is None:
@@ -66,7 +129,13 @@ class ModelEngine:
             config.hyperparameters["n_clusters"] = n_clusters
 
         # Create and fit the model
-        model = self._create_model_instance(config)
+        if config.type == ModelType.KMEANS and len(X_scaled) >= minibatch_threshold:
+            # pylint: disable=import-outside-toplevel
+            from sklearn.cluster import MiniBatchKMeans
+
+            model = MiniBatchKMeans(**config.hyperparameters)
+        else:
+            model = self._create_model_instance(config)
         model.fit(X_scaled)
 
         # Get cluster labels
@@ -75,7 +144,12 @@ class ModelEngine:
         # Calculate metrics
         metrics = {}
         try:
-            metrics["silhouette_score"] = silhouette_score(X_scaled, cluster_labels)
+            if sample_size is not None and len(X_scaled) > sample_size:
+                metrics["silhouette_score"] = silhouette_score(
+                    X_scaled, cluster_labels, sample_size=sample_size, random_state=42
+                )
+            else:
+                metrics["silhouette_score"] = silhouette_score(X_scaled, cluster_labels)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Broad exception justified: silhouette score calculation may fail for various reasons
             logger.warning(f"Could not calculate silhouette score: {e}")
@@ -83,6 +157,8 @@ class ModelEngine:
         # Store the model
         model_key = f"{config.type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.models[model_key] = model
+        if cluster_search is not None:
+            self.cluster_searches[model_key] = cluster_search
 
         # Create results
         results = {
@@ -96,6 +172,7 @@ class ModelEngine:
             ),
             "cluster_labels": cluster_labels,
             "metrics": metrics,
+            "cluster_search": cluster_search,
             "training_date": datetime.now().isoformat(),
             "data_shape": X.shape,
         }
@@ -196,30 +273,89 @@ class ModelEngine:
         raise ValueError(f"Unsupported model type: {config.type}")
 
     def _find_optimal_clusters(self, X: np.ndarray, max_clusters: int = 10) -> int:
-        # pylint: disable=import-outside-toplevel
-        # Lazy import for optional heavy dependency - improves startup time
-        """Find optimal number of clusters using elbow method."""
-        from sklearn.cluster import KMeans
-        from sklearn.metrics import silhouette_score
+        """Find optimal number of clusters using the silhouette score."""
+        return self._search_cluster_counts(X, max_clusters)["selected_k"]
 
-        silhouette_scores = []
+    def _search_cluster_counts(
+        self,
+        X: np.ndarray,
+        max_clusters: int = 10,
+        sample_size: Optional[int] = SILHOUETTE_SAMPLE_SIZE,
+        minibatch_threshold: int = MINIBATCH_THRESHOLD,
+        warm_start: bool = False,
+        n_jobs: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Score candidate cluster counts and pick the best by silhouette.
+
+        Args:
+            X: Scaled feature matrix
+            max_clusters: Largest k to try
+            sample_size: Rows used for each silhouette score (None for all rows)
+            minibatch_threshold: Use MiniBatchKMeans from this many rows upward
+            warm_start: Seed each k with the previous centers plus the farthest point
+            n_jobs: Evaluate k values in this many worker processes; warm
+                starts only apply to sequential searches
+
+        Returns:
+            Dictionary with the selected k, per-k scores and timings
+        """
+        start = time.perf_counter()
         K_range = range(2, min(max_clusters + 1, X.shape[0]))
-
-        for k in K_range:
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            kmeans.fit(X)
-
-            try:
-                score = silhouette_score(X, kmeans.labels_)
-                silhouette_scores.append(score)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # Broad exception justified: silhouette score calculation may fail
-                silhouette_scores.append(0)
+        scores: dict[int, float] = {}
+        timings: dict[int, float] = {}
+
+        if n_jobs > 1 and len(K_range) > 1:
+            warm_start = False
+            with ProcessPoolExecutor(
+                max_workers=min(n_jobs, len(K_range)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = [
+                    pool.submit(_evaluate_cluster_count, X, k, sample_size, minibatch_threshold)
+                    for k in K_range
+                ]
+                for future in futures:
+                    k, score, seconds = future.result()
+                    scores[k], timings[k] = score, seconds
+        else:
+            # pylint: disable=import-outside-toplevel
+            from sklearn.metrics import pairwise_distances_argmin_min
+
+            centers = None
+            for k in K_range:
+                k_start = time.perf_counter()
+                init: Any = "k-means++"
+                if warm_start and centers is not None:
+                    # Farthest point from the existing centers becomes the new center;
+                    # distances are computed in chunks, never as an n x k x d array
+                    _, nearest = pairwise_distances_argmin_min(X, centers)
+                    init = np.vstack([centers, X[nearest.argmax()]])
+                model = _kmeans_estimator(k, X.shape[0], minibatch_threshold, init).fit(X)
+                centers = model.cluster_centers_
+                scores[k] = _score_clustering(X, model.labels_, sample_size)
+                timings[k] = time.perf_counter() - k_start
 
         # Return k with highest silhouette score
-        if silhouette_scores:
-            return K_range[np.argmax(silhouette_scores)]
-        return 3  # Default fallback
+        selected_k = max(scores, key=lambda k: (scores[k], -k)) if scores else 3
+
+        search = {
+            "selected_k": selected_k,
+            "scores": scores,
+            "timings": timings,
+            "total_seconds": time.perf_counter() - start,
+            "algorithm": "MiniBatchKMeans" if X.shape[0] >= minibatch_threshold else "KMeans",
+            "silhouette_sample_size": (
+                sample_size if sample_size is not None and X.shape[0] > sample_size else None
+            ),
+            "warm_start": warm_start,
+            "n_jobs": n_jobs,
+        }
+        logger.info(
+            f"Selected k={selected_k} from {len(scores)} candidates "
+            f"in {search['total_seconds']:.2f}s"
+        )
+        return search
 
     def get_model_summary(self, model_key: str) -> Optional[dict[str, Any]]:
         """Get a summary of a trained model."""
@@ -239,6 +375,8 @@ class ModelEngine:
             summary["n_clusters"] = model.n_clusters
         if hasattr(model, "n_components"):
             summary["n_components"] = model.n_components
+        if model_key in self.cluster_searches:
+            summary["cluster_search"] = self.cluster_searches[model_key]
 
         return summary
 
@@ -250,6 +388,7 @@ class ModelEngine:
         """Delete a model."""
         if model_key in self.models:
             del self.models[model_key]
+            self.cluster_searches.pop(model_key, None)
 
             # Also remove associated scaler
             if model_key in self.scalers:
@@ -264,4 +403,5 @@ class ModelEngine:
         """Clear all models and associated data."""
         self.models.clear()
         self.scalers.clear()
+        self.cluster_searches.clear()
         logger.info("All models cleared")
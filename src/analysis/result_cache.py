@@ -0,0 +1,107 @@
+"""
+Persistent cache for analysis results.
+
+Results are keyed by the analysis request together with a fingerprint of the
+underlying tables (row counts, maximum ids and a hash of their rows), so a
+cached entry is only reused while the data it was computed from is unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.lib.cache import SqliteLRUStore, shared_instance
+from src.paths import PATHS
+
+DEFAULT_MAX_CACHE_SIZE_BYTES = 64 * 1024 * 1024
+FINGERPRINT_BATCH_SIZE = 5000
+
+
+def compute_data_fingerprint(session: Session, tables: Iterable[str]) -> str:
+    """
+    Fingerprint the state of the given tables without writing to the database.
+
+    Each table contributes its row count, its highest id and a hash of its
+    rows, streamed in id order in batches, so in-place edits (e.g. a changed
+    visit rating) invalidate cached results as well as inserts and deletes.
+    The tables carry no modification timestamps, so the contents are the only
+    reliable signal across runs.
+
+    Args:
+        session: Database session
+        tables: Names of the tables the analysis reads from
+
+    Returns:
+        Hex digest identifying the current state of the tables
+    """
+    digest = hashlib.sha256()
+    for table in sorted(set(tables)):
+        count, max_id = session.execute(
+            text(f"SELECT COUNT(*), MAX(id) FROM {table}")  # nosec - internal table names
+        ).one()
+        digest.update(f"{table}:{count}:{max_id}\0".encode("utf-8"))
+        result = session.execute(
+            text(f"SELECT * FROM {table} ORDER BY id")  # nosec - internal table names
+        )
+        while rows := result.fetchmany(FINGERPRINT_BATCH_SIZE):
+            digest.update(repr([tuple(row) for row in rows]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AnalysisResultCache:
+    """Size-bounded, on-disk store for pickled analysis result payloads."""
+
+    def __init__(
+        self,
+        db_path: str = PATHS.ANALYSIS_CACHE_DB,
+        max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES,
+    ):
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self._store = SqliteLRUStore(db_path, "analysis_results", max_size_bytes)
+
+    def get(self, request_key: str, fingerprint: str) -> Optional[dict[str, Any]]:
+        """
+        Fetch a cached payload for the request.
+
+        Entries computed from a different data fingerprint are stale and are
+        removed instead of being returned.
+        """
+        blob = self._store.get(request_key, fingerprint)
+        if blob is None:
+            return None
+
+        try:
+            return pickle.loads(blob)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Broad exception justified: unreadable entries are simply dropped
+            logger.warning(f"Discarding unreadable analysis cache entry: {e}")
+            self._store.delete(request_key)
+            return None
+
+    def set(self, request_key: str, fingerprint: str, payload: dict[str, Any]) -> None:
+        """Store a payload and evict least recently used entries over the size limit."""
+        if not self._store.set(request_key, fingerprint, pickle.dumps(payload)):
+            logger.debug("Analysis result too large to cache, skipping")
+
+    def clear(self) -> int:
+        """Remove all cached results and return the number of entries removed."""
+        return self._store.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and total payload size."""
+        return self._store.stats()
+
+
+@shared_instance
+def get_analysis_result_cache() -> AnalysisResultCache:
+    """Return the shared on-disk analysis result cache."""
+
+    return AnalysisResultCache()
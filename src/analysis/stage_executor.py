@@ -0,0 +1,119 @@
+"""
+Dependency-aware executor for analysis stages.
+
+Stages declare which other stages they depend on. Stages whose dependencies
+are satisfied run concurrently on a thread pool; with a single worker the
+stages run sequentially in dependency order.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from src.analysis.memory_profile import MemoryTracker
+
+
+@dataclass
+class AnalysisStage:
+    """A unit of work in an analysis run."""
+
+    name: str
+    func: Callable[[dict[str, Any]], Any]
+    """Called with the results of completed stages, keyed by stage name."""
+    depends_on: tuple[str, ...] = ()
+
+
+class StageExecutor:
+    """
+    Run analysis stages as a DAG, recording per-stage wall time and,
+    optionally, peak memory.
+    """
+
+    def __init__(self, max_workers: int = 1, memory: Optional[MemoryTracker] = None):
+        self.max_workers = max(1, max_workers)
+        self.memory = memory
+
+    def run(
+        self, stages: list[AnalysisStage]
+    ) -> tuple[dict[str, Any], dict[str, float]]:
+        """
+        Execute stages respecting their dependencies.
+
+        Args:
+            stages: Stages to run
+
+        Returns:
+            Tuple of (results by stage name, seconds spent per stage)
+
+        Raises:
+            ValueError: If a dependency is unknown or the stages form a cycle
+        """
+        order = self._topological_order(stages)
+        results: dict[str, Any] = {}
+        timings: dict[str, float] = {}
+
+        def _run_stage(stage: AnalysisStage) -> Any:
+            start = time.perf_counter()
+            tracked = self.memory.stage(stage.name) if self.memory is not None else nullcontext()
+            try:
+                with tracked:
+                    return stage.func(results)
+            finally:
+                timings[stage.name] = time.perf_counter() - start
+                logger.debug(f"Stage {stage.name} finished in {timings[stage.name]:.2f}s")
+
+        if self.max_workers == 1:
+            for stage in order:
+                results[stage.name] = _run_stage(stage)
+            return results, timings
+
+        pending = list(order)
+        running: dict[Future, AnalysisStage] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for stage in list(pending):
+                    if all(dep in results for dep in stage.depends_on):
+                        pending.remove(stage)
+                        running[executor.submit(_run_stage, stage)] = stage
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    results[stage.name] = future.result()
+
+        return results, timings
+
+    @staticmethod
+    def _topological_order(stages: list[AnalysisStage]) -> list[AnalysisStage]:
+        """Order stages so each appears after its dependencies, keeping input order otherwise."""
+        by_name = {stage.name: stage for stage in stages}
+        for stage in stages:
+            for dep in stage.depends_on:
+                if dep not in by_name:
+                    raise ValueError(
+                        f"Stage '{stage.name}' depends on unknown stage '{dep}'"
+                    )
+
+        ordered: list[AnalysisStage] = []
+        visited: set[str] = set()
+        visiting: set[str] = set()
+
+        def _visit(stage: AnalysisStage) -> None:
+            if stage.name in visited:
+                return
+            if stage.name in visiting:
+                raise ValueError(f"Cyclic dependency involving stage '{stage.name}'")
+            visiting.add(stage.name)
+            for dep in stage.depends_on:
+                _visit(by_name[dep])
+            visiting.remove(stage.name)
+            visited.add(stage.name)
+            ordered.append(stage)
+
+        for stage in stages:
+            _visit(stage)
+        return ordered
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from src.types.analysis import VisualizationType, VisualizationConfig
 from src.analysis.metrics import MetricsCalculator
 from src.lib.map_generator import _add_location_markers
+from src.lib.static_assets import write_plotly_html
 
 
 class VisualizationEngine:
@@ -687,10 +688,15 @@ class VisualizationEngine:
             else:
                 raise ValueError("Cannot infer columns for seasonal plot")
 
-        # Add seasonal columns
-        data_copy = data.copy()
-        data_copy["month"] = data_copy[config.x_column].dt.month
-        data_copy["year"] = data_copy[config.x_column].dt.year
+        # Seasonal columns next to the plotted values only
+        dates = data[config.x_column].dt
+        data_copy = pd.DataFrame(
+            {
+                config.y_column: data[config.y_column],
+                "month": dates.month,
+                "year": dates.year,
+            }
+        )
 
         if config.interactive:
             px, go, sp = self._get_plotly()
@@ -1061,8 +1067,8 @@ class VisualizationEngine:
                     filepath, bbox_inches="tight", dpi=300, format=file_format
                 )
             elif hasattr(visualization, "write_html"):
-                # Plotly figure
-                visualization.write_html(filepath.with_suffix(".html"))
+                # Plotly figure, referencing the shared plotly bundle
+                write_plotly_html(visualization, filepath.with_suffix(".html"))
             elif hasattr(visualization, "save"):
                 # Folium map
                 visualization.save(filepath.with_suffix(".html"))
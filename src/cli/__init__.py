@@ -1,4 +1,14 @@
-from .cmd_list import CLI_COMMANDS, get_argument_kwargs
+from typing import Any
 
+# Both names are resolved lazily by __getattr__ below
+__all__ = ["CLI_COMMANDS", "get_argument_kwargs"]  # pylint: disable=undefined-all-variable
 
-__all__ = ["CLI_COMMANDS", "get_argument_kwargs"]
+
+def __getattr__(name: str) -> Any:
+    # The command table is only needed when the parser manifest is rebuilt,
+    # so it is not imported with the package.
+    if name in __all__:
+        from . import cmd_list  # pylint: disable=import-outside-toplevel
+
+        return getattr(cmd_list, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
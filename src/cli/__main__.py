@@ -1,6 +1,22 @@
+import time
+
+_IMPORT_START = time.perf_counter()
+
+# pylint: disable=wrong-import-position
 import argparse
+import os
+import sys
+from typing import Any, Optional
+
 from src import config
-from .cmd_list import CLI_COMMANDS, CommandConfig, get_argument_kwargs
+from .lazy import lazy_command
+from .manifest import load_manifest
+from .startup_profile import (
+    PROBE_ENV,
+    print_startup_profile,
+    profile_startup,
+    report_probe,
+)
 
 
 def create_command_group_parser(
@@ -49,23 +65,22 @@ def get_command_group_mapping() -> dict[str, str]:
     }
 
 
-def add_subcommands_to_group(
+def add_subcommand(
     subparsers_obj: argparse._SubParsersAction,
-    command_name: str,
-    command_config: CommandConfig,
-    group_prefix: str,
+    subcommand: str,
+    spec: dict[str, Any],
 ) -> argparse.ArgumentParser:
-    """Add a subcommand to the appropriate group."""
-    subcommand = command_name.replace(group_prefix, "")
-    parser_command = subparsers_obj.add_parser(subcommand, help=command_config.help)
+    """Add a subcommand described by a parser manifest entry to its group."""
+    parser_command = subparsers_obj.add_parser(subcommand, help=spec["help"])
 
     # Add arguments to the command
-    for arg_name, arg_config in command_config.args.items():
-        kwargs = get_argument_kwargs(arg_config)
+    for arg in spec["args"]:
+        arg_name = arg["name"]
+        kwargs = dict(arg["kwargs"])
         default_dest = arg_name.replace("-", "_")
 
-        if arg_config.positional:
-            positional_name = arg_config.dest or default_dest
+        if arg["positional"]:
+            positional_name = arg["dest"] or default_dest
 
             # Preserve original hyphenated name in help output
             if arg_name != positional_name and "metavar" not in kwargs:
@@ -76,16 +91,32 @@ def add_subcommands_to_group(
 
         # Optional argument handling
         option_strings = [f"--{arg_name}"]
-        if hasattr(arg_config, "short") and arg_config.short:
-            option_strings.append(f"-{arg_config.short}")
+        if arg["short"]:
+            option_strings.append(f"-{arg['short']}")
 
-        kwargs.setdefault("dest", arg_config.dest or default_dest)
+        kwargs.setdefault("dest", arg["dest"] or default_dest)
         parser_command.add_argument(*option_strings, **kwargs)
 
-    parser_command.set_defaults(func=command_config.func)
+    parser_command.set_defaults(func=lazy_command(spec["module"], spec["func"]))
     return parser_command
 
 
+def find_command_group(argv: list[str], group_names: list[str]) -> Optional[str]:
+    """
+    The command group named on the command line, if any.
+
+    Global options are skipped (including the values of ``--env`` and
+    ``--database``); the first remaining word is the group.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("--env", "--database"):
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token if token in group_names else None
+    return None
+
+
 def show_command_group_help(
     command_group: str, group_parsers: dict[str, argparse.ArgumentParser]
 ) -> None:
@@ -94,10 +125,16 @@ def show_command_group_help(
         group_parsers[command_group].print_help()
 
 
-def main() -> None:
+def main(argv: Optional[list[str]] = None) -> None:
     """
     Main function for the CLI.
+
+    Subcommands are read from the cached parser manifest, and only the
+    invoked group's subparsers are built.
     """
+    main_start = time.perf_counter()
+    argv = sys.argv[1:] if argv is None else argv
+
     parser = argparse.ArgumentParser(description=f"{config.CLI_NAME}")
 
     # Add global database environment flags
@@ -116,48 +153,58 @@ def main() -> None:
         metavar="PATH",
         help="Explicit database file path (overrides --env)",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report start-up time of the given command against the budget, without running it",
+    )
 
     subparsers = parser.add_subparsers(dest="command_group", help="Command groups")
 
     # Get command group configuration
     group_config = get_command_group_config()
-    group_mapping = get_command_group_mapping()
+    invoked_group = find_command_group(argv, list(group_config))
+
+    manifest_start = time.perf_counter()
+    manifest = load_manifest(get_command_group_mapping()) if invoked_group else None
+    parser_start = time.perf_counter()
 
     # Create command groups and store parsers
     group_parsers = {}
-    group_subparsers = {}
 
     for group_name, help_text in group_config.items():
         group_parser, group_subparser = create_command_group_parser(
             subparsers, group_name, help_text
         )
         group_parsers[group_name] = group_parser
-        group_subparsers[group_name] = group_subparser
-
-    # Add subcommands to each group
-    for command_name, command_config in CLI_COMMANDS.items():
-        # Find which group this command belongs to
-        target_group = None
-        for prefix, group_name in group_mapping.items():
-            if command_name.startswith(prefix):
-                target_group = group_name
-                break
-
-        if target_group:
-            # Add to the appropriate group
-            add_subcommands_to_group(
-                group_subparsers[target_group],
-                command_name,
-                command_config,
-                f"{target_group}-",
-            )
-        else:
-            # System commands (no prefix)
-            add_subcommands_to_group(
-                group_subparsers["system"], command_name, command_config, ""
-            )
-
-    args = parser.parse_args()
+
+        # Subcommands are only needed for the group being invoked
+        if manifest is not None and group_name == invoked_group:
+            for subcommand, spec in manifest["groups"].get(group_name, {}).items():
+                add_subcommand(group_subparser, subcommand, spec)
+
+    args = parser.parse_args(argv)
+    parsed = time.perf_counter()
+
+    if args.profile_startup:
+        profile_argv = [token for token in argv if token != "--profile-startup"]
+        print_startup_profile(profile_startup(profile_argv))
+        return
+
+    if os.environ.get(PROBE_ENV):
+        handler = getattr(args, "func", None)
+        if handler is not None:
+            handler.load()
+        report_probe(
+            {
+                "cli_import": (main_start - _IMPORT_START) * 1000,
+                "manifest": (parser_start - manifest_start) * 1000,
+                "parser": (parsed - parser_start) * 1000,
+                "handler_import": (time.perf_counter() - parsed) * 1000,
+            },
+            f"{handler.module_path}.{handler.func_name}" if handler is not None else None,
+        )
+        return
 
     # Check if a command group was specified but no subcommand
     if hasattr(args, "command_group") and args.command_group:
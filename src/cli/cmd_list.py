@@ -7,10 +7,10 @@ Defines CLI commands using dataclasses for better structure and type safety.
 import argparse
 from collections.abc import Callable
 from dataclasses import dataclass
-from functools import lru_cache
-from importlib import import_module
 from typing import Any, Optional
 
+from .lazy import lazy_command
+
 
 @dataclass
 class ArgumentConfig:
@@ -37,35 +37,6 @@ class CommandConfig:
     args: dict[str, ArgumentConfig]
 
 
-# Lazy loading helpers -----------------------------------------------------
-
-
-def _load_command_callable(module_path: str, func_name: str) -> Callable[[argparse.Namespace], None]:
-    """Import ``module_path`` and return ``func_name`` from it."""
-
-    module = import_module(module_path)
-    function = getattr(module, func_name)
-    if not callable(function):  # pragma: no cover - defensive programming
-        raise TypeError(f"{module_path}.{func_name} is not callable")
-    return function
-
-
-def lazy_command(module_path: str, func_name: str) -> Callable[[argparse.Namespace], None]:
-    """Create a lazily imported CLI command handler."""
-
-    @lru_cache(maxsize=None)
-    def _load() -> Callable[[argparse.Namespace], None]:
-        return _load_command_callable(module_path, func_name)
-
-    def _command(args: argparse.Namespace) -> None:
-        return _load()(args)
-
-    _command.__name__ = func_name
-    _command.__qualname__ = func_name
-    _command.__doc__ = f"Lazy loader for {module_path}.{func_name}"
-    return _command
-
-
 # Define all CLI commands with new grouped structure
 CLI_COMMANDS = {
     # Location commands
@@ -92,13 +63,23 @@ CLI_COMMANDS = {
     ),
     "location-list": CommandConfig(
         func=lazy_command("src.cli.commands.location.list", "list_locations"),
-        help="List all locations in the database.",
+        help="List locations in the database, one page at a time.",
         args={
             "limit": ArgumentConfig(
                 type=int,
                 required=False,
                 help="Limit number of results",
             ),
+            "offset": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Skip this many results first",
+            ),
+            "after": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Continue after the location with this ID (printed at the end of a page)",
+            ),
         },
     ),
     "location-delete": CommandConfig(
@@ -207,13 +188,23 @@ CLI_COMMANDS = {
     ),
     "visit-list": CommandConfig(
         func=lazy_command("src.cli.commands.visit.list", "list_visits"),
-        help="List all visits in the database.",
+        help="List visits in the database, most recent first.",
         args={
             "limit": ArgumentConfig(
                 type=int,
                 required=False,
                 help="Limit number of results",
             ),
+            "offset": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Skip this many results first",
+            ),
+            "after": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Continue after the visit with this ID (printed at the end of a page)",
+            ),
         },
     ),
     "visit-delete": CommandConfig(
@@ -268,7 +259,7 @@ CLI_COMMANDS = {
     ),
     "onsen-print-summary": CommandConfig(
         func=lazy_command("src.cli.commands.onsen.print_summary", "print_summary"),
-        help="Print a summary for an onsen by ID or ban number.",
+        help="Print a summary for an onsen by ID or ban number, or a paged table of onsens.",
         args={
             "onsen-id": ArgumentConfig(type=int, required=False, help="Onsen ID"),
             "ban-number": ArgumentConfig(
@@ -277,6 +268,21 @@ CLI_COMMANDS = {
             "name": ArgumentConfig(
                 type=str, required=False, help="Onsen name (exact match)"
             ),
+            "limit": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Without an identifier: list this many onsens as a table",
+            ),
+            "offset": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Skip this many results first",
+            ),
+            "after": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Continue after the onsen with this ID (printed at the end of a page)",
+            ),
         },
     ),
     "onsen-map": CommandConfig(
@@ -303,6 +309,10 @@ CLI_COMMANDS = {
                 action="store_true",
                 help="Do not show user location markers on map (default: show locations)",
             ),
+            "client-side": ArgumentConfig(
+                action="store_true",
+                help="Write onsens to a GeoJSON data file rendered in the browser (default: only for large catalogues)",
+            ),
         },
     ),
     "onsen-recommend": CommandConfig(
@@ -372,6 +382,30 @@ CLI_COMMANDS = {
                 action="store_true",
                 help="Only scrape individual onsen pages, skip fetching the mapping (requires existing mapping file)",
             ),
+            "engine": ArgumentConfig(
+                type=str,
+                default="http",
+                help="Page fetcher: 'http' (plain requests + HTML parser) or 'selenium' (pool of headless browsers)",
+            ),
+            "workers": ArgumentConfig(
+                type=int,
+                default=4,
+                help="Number of concurrent page fetches (default: 4)",
+            ),
+            "delay": ArgumentConfig(
+                type=float,
+                default=1.0,
+                help="Minimum seconds between requests, shared by all workers (default: 1.0)",
+            ),
+            "max-age-days": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Also re-scrape entries scraped more than this many days ago",
+            ),
+            "force": ArgumentConfig(
+                action="store_true",
+                help="Re-scrape every onsen in the mapping",
+            ),
         },
     ),
     "onsen-identify": CommandConfig(
@@ -492,6 +526,53 @@ CLI_COMMANDS = {
                 short="a",
                 help="Backup directly to the latest artifact path (artifacts/db/onsen_latest.db)",
             ),
+            "snapshot": ArgumentConfig(
+                action="store_true",
+                help="Store an incremental, deduplicated snapshot (in --backup-folder or artifacts/db/backups/snapshots)",
+            ),
+            "no-compress": ArgumentConfig(
+                action="store_true",
+                help="Store snapshot chunks uncompressed",
+            ),
+            "keep": ArgumentConfig(
+                type=int,
+                required=False,
+                help="After a snapshot, keep only this many most recent snapshots",
+            ),
+        },
+    ),
+    "database-restore": CommandConfig(
+        func=lazy_command("src.cli.commands.database.restore", "restore_db"),
+        help="Restore the database (or --output file) from an incremental snapshot.",
+        args={
+            "snapshot-id": ArgumentConfig(
+                type=str,
+                required=False,
+                help="Snapshot to restore (default: latest)",
+            ),
+            "snapshot-dir": ArgumentConfig(
+                type=str,
+                required=False,
+                help="Snapshot store directory (default: artifacts/db/backups/snapshots)",
+            ),
+            "output": ArgumentConfig(
+                type=str,
+                required=False,
+                help="Write the snapshot to this file instead of replacing the current database",
+            ),
+            "list": ArgumentConfig(
+                action="store_true",
+                help="List available snapshots",
+            ),
+            "force": ArgumentConfig(
+                action="store_true",
+                help="Replace the current database without confirmation",
+            ),
+            "no-interactive": ArgumentConfig(
+                action="store_true",
+                short="ni",
+                help="Run in non-interactive mode (default: False)",
+            ),
         },
     ),
     "database-insert-mock-visits": CommandConfig(
@@ -610,7 +691,24 @@ CLI_COMMANDS = {
             ),
             "hr-coverage": ArgumentConfig(
                 type=float,
-                help="Heart rate coverage 0.0-1.0 (for integrated scenario)",
+                help="Heart rate coverage 0.0-1.0 (for integrated scenario; with --vectorized, fraction of visits with an onsen monitoring activity)",
+            ),
+            "vectorized": ArgumentConfig(
+                action="store_true",
+                help="Draw whole columns with NumPy and bulk insert them (for millions of visits; comprehensive, econometric, tourist, local_regular)",
+            ),
+            "seed": ArgumentConfig(
+                type=int,
+                help="Random seed for reproducible --vectorized data",
+            ),
+            "batch-size": ArgumentConfig(
+                type=int,
+                default=10000,
+                help="Rows per bulk insert batch with --vectorized (default: 10000)",
+            ),
+            "with-exercise": ArgumentConfig(
+                action="store_true",
+                help="With --vectorized, also generate pre-visit workout activities",
             ),
             "quiet": ArgumentConfig(
                 action="store_true",
@@ -727,6 +825,22 @@ CLI_COMMANDS = {
             ),
         },
     ),
+    "system-cleanup-outputs": CommandConfig(
+        func=lazy_command("src.cli.commands.system.cleanup_outputs", "cleanup_outputs"),
+        help="Remove old timestamped dashboards and maps, and unused shared assets.",
+        args={
+            "keep-recent": ArgumentConfig(
+                type=int,
+                required=False,
+                default=5,
+                help="Number of recent files to keep per output type (default: 5)",
+            ),
+            "dry-run": ArgumentConfig(
+                action="store_true",
+                help="List the files that would be removed without deleting them",
+            ),
+        },
+    ),
     "update-artifacts": CommandConfig(
         func=lazy_command("src.cli.commands.system.update_artifacts", "update_artifacts"),
         help="Update database artifacts in the artifacts/db folder for presentation purposes.",
@@ -756,6 +870,10 @@ CLI_COMMANDS = {
             "validate-only": ArgumentConfig(
                 action="store_true", help="Only validate data without importing"
             ),
+            "include-workouts": ArgumentConfig(
+                action="store_true",
+                help="Also import workouts (with heart rate) from an Apple Health export as activities",
+            ),
         },
     ),
     "weight-add": CommandConfig(
@@ -844,6 +962,16 @@ CLI_COMMANDS = {
                 action="store_true",
                 help="Show all-time statistics",
             ),
+            "date-range": ArgumentConfig(
+                type=str,
+                required=False,
+                help="Date range in format 'YYYY-MM-DD,YYYY-MM-DD' (inclusive)",
+            ),
+            "granularity": ArgumentConfig(
+                type=str,
+                required=False,
+                help="Also break the period down by day, week, month or year",
+            ),
         },
     ),
     "weight-export": CommandConfig(
@@ -930,6 +1058,14 @@ CLI_COMMANDS = {
                 required=False,
                 help="JSON string of custom metrics",
             ),
+            "model-options": ArgumentConfig(
+                type=str,
+                required=False,
+                help=(
+                    "JSON string of clustering options (max_clusters, "
+                    "silhouette_sample_size, minibatch_threshold, warm_start, n_jobs)"
+                ),
+            ),
             "output-format": ArgumentConfig(
                 type=str,
                 required=False,
@@ -951,6 +1087,13 @@ CLI_COMMANDS = {
                 default=0.95,
                 help="Confidence level for statistical tests",
             ),
+            "jobs": ArgumentConfig(
+                type=int,
+                required=False,
+                default=1,
+                short="j",
+                help="Number of parallel workers for analysis stages (default: 1)",
+            ),
             "output-dir": ArgumentConfig(
                 type=str,
                 required=False,
@@ -984,6 +1127,18 @@ CLI_COMMANDS = {
                 required=False,
                 help="JSON string of custom configuration overrides",
             ),
+            "jobs": ArgumentConfig(
+                type=int,
+                required=False,
+                default=1,
+                short="j",
+                help="Number of parallel workers for analysis stages (default: 1)",
+            ),
+            "screen-top-n": ArgumentConfig(
+                type=int,
+                required=False,
+                help="Econometric scenarios: fully estimate only the best N specifications after batched OLS screening",
+            ),
             "output-dir": ArgumentConfig(
                 type=str,
                 required=False,
@@ -1040,6 +1195,10 @@ CLI_COMMANDS = {
                 action="store_true",
                 help="Clean up old shared directories (models, visualizations)",
             ),
+            "cleanup-outputs": ArgumentConfig(
+                action="store_true",
+                help="Remove old timestamped dashboards and maps, and unused shared assets",
+            ),
         },
     ),
     "analysis-export": CommandConfig(
@@ -1098,6 +1257,17 @@ CLI_COMMANDS = {
                 required=False,
                 help="Output filename (default: auto-generated with timestamp)",
             ),
+            "jobs": ArgumentConfig(
+                type=int,
+                required=False,
+                default=1,
+                short="j",
+                help="Number of worker processes for graph generation (default: 1)",
+            ),
+            "no-cache": ArgumentConfig(
+                action="store_true",
+                help="Regenerate every graph instead of reusing cached figures",
+            ),
         },
     ),
     "analysis-graph-list-categories": CommandConfig(
@@ -1302,18 +1472,28 @@ CLI_COMMANDS = {
     ),
     "strava-download": CommandConfig(
         func=lazy_command("src.cli.commands.strava.download", "cmd_strava_download"),
-        help="Download specific Strava activity by ID.",
+        help="Download Strava activities by ID (or all of them).",
         args={
             "activity-id": ArgumentConfig(
                 type=int,
-                required=True,
-                help="Strava activity ID to download",
+                required=False,
+                help="Strava activity ID(s) to download",
                 positional=True,
+                nargs="*",
+            ),
+            "all": ArgumentConfig(
+                action="store_true",
+                help="Download every activity of the athlete",
             ),
             "format": ArgumentConfig(
                 type=str,
                 required=False,
-                help="Output format: gpx, json, hr_csv, all (default: all)",
+                help="Output format: gpx, tcx, fit, json, hr_csv, all (default: all)",
+            ),
+            "workers": ArgumentConfig(
+                type=int,
+                default=4,
+                help="Parallel downloads when exporting several activities (default: 4)",
             ),
         },
     ),
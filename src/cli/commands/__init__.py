@@ -1,42 +1,67 @@
-from .analysis import (
-    run_analysis,
-    run_scenario_analysis,
-    list_scenarios,
-    list_analysis_options,
-    show_analysis_summary,
-    clear_analysis_cache,
-    export_analysis_results,
-)
-from .location import add_location, list_locations, delete_location, modify_location
-from .visit import add_visit, list_visits, delete_visit, modify_visit
-from .onsen import add_onsen, print_summary, recommend_onsen, scrape_onsen_data
-from .system import calculate_milestones, clear_cache
-from .database import init_db, fill_db, backup_db
-
-
-__all__ = [
-    "add_location",
-    "list_locations",
-    "delete_location",
-    "modify_location",
-    "add_visit",
-    "list_visits",
-    "delete_visit",
-    "modify_visit",
-    "add_onsen",
-    "print_summary",
-    "recommend_onsen",
-    "scrape_onsen_data",
-    "calculate_milestones",
-    "clear_cache",
-    "init_db",
-    "fill_db",
-    "backup_db",
-    "run_analysis",
-    "run_scenario_analysis",
-    "list_scenarios",
-    "list_analysis_options",
-    "show_analysis_summary",
-    "clear_analysis_cache",
-    "export_analysis_results",
-]
+"""
+CLI command handlers, grouped by subpackage.
+
+The handlers are re-exported lazily: importing one command (as the CLI does
+for the command being run) must not import every other command group and
+their dependencies (pandas, scipy, matplotlib, selenium, ...).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analysis import (
+        clear_analysis_cache,
+        export_analysis_results,
+        list_analysis_options,
+        list_scenarios,
+        run_analysis,
+        run_scenario_analysis,
+        show_analysis_summary,
+    )
+    from .database import backup_db, fill_db, init_db
+    from .location import add_location, delete_location, list_locations, modify_location
+    from .onsen import add_onsen, print_summary, recommend_onsen, scrape_onsen_data
+    from .system import calculate_milestones, clear_cache
+    from .visit import add_visit, delete_visit, list_visits, modify_visit
+
+_EXPORTS = {
+    "run_analysis": "analysis",
+    "run_scenario_analysis": "analysis",
+    "list_scenarios": "analysis",
+    "list_analysis_options": "analysis",
+    "show_analysis_summary": "analysis",
+    "clear_analysis_cache": "analysis",
+    "export_analysis_results": "analysis",
+    "add_location": "location",
+    "list_locations": "location",
+    "delete_location": "location",
+    "modify_location": "location",
+    "add_visit": "visit",
+    "list_visits": "visit",
+    "delete_visit": "visit",
+    "modify_visit": "visit",
+    "add_onsen": "onsen",
+    "print_summary": "onsen",
+    "recommend_onsen": "onsen",
+    "scrape_onsen_data": "onsen",
+    "calculate_milestones": "system",
+    "clear_cache": "system",
+    "init_db": "database",
+    "fill_db": "database",
+    "backup_db": "database",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
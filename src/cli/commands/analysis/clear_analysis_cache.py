@@ -10,18 +10,25 @@ from loguru import logger
 
 from src.config import get_database_config
 from src.db.conn import get_db
-from src.analysis.engine import AnalysisEngine
 
 
 def clear_analysis_cache(args: argparse.Namespace) -> None:
     """Clear the analysis cache and optionally clean up old directories."""
+    config = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    )
+
     try:
         with get_db(url=config.url) as session:
-            engine = AnalysisEngine(session, args.output_dir)
+            from src.analysis.engine import AnalysisEngine  # pylint: disable=import-outside-toplevel
+            from src.analysis.feature_store import get_feature_store  # pylint: disable=import-outside-toplevel
+
+            engine = AnalysisEngine(session, args.output_dir, feature_store=get_feature_store())
 
-            # Clear the in-memory cache
-            engine.clear_cache()
-            print("Analysis cache cleared successfully.")
+            # Clear the in-memory and persisted result caches
+            removed = engine.clear_cache()
+            print(f"Analysis cache cleared successfully ({removed} stored results removed).")
 
             # Clean up old analysis directories if requested
             if args.cleanup_old_analyses:
@@ -33,6 +40,16 @@ def clear_analysis_cache(args: argparse.Namespace) -> None:
                 print("\nCleaning up old shared directories...")
                 engine.cleanup_shared_directories()
 
+            # Remove stale generated outputs once old analyses no longer hold their assets
+            if getattr(args, "cleanup_outputs", False):
+                from src.lib.static_assets import cleanup_generated_outputs  # pylint: disable=import-outside-toplevel
+
+                print("\nCleaning up stale generated outputs...")
+                removed_outputs = cleanup_generated_outputs(
+                    keep_recent=args.keep_recent, reference_dirs=[engine.base_output_dir]
+                )
+                print(f"Removed {len(removed_outputs)} stale generated file(s).")
+
             print("Cleanup completed successfully.")
 
     except Exception as e:
@@ -10,13 +10,14 @@ from loguru import logger
 
 from src.config import get_database_config
 from src.db.conn import get_db
-from src.analysis.engine import AnalysisEngine
 
 
 def export_analysis_results(args: argparse.Namespace) -> None:
     """Export analysis results."""
     try:
         with get_db(url=config.url) as session:
+            from src.analysis.engine import AnalysisEngine  # pylint: disable=import-outside-toplevel
+
             engine = AnalysisEngine(session, args.output_dir)
 
             # Get analysis summary to find available analyses
@@ -79,7 +79,11 @@ def generate_graphs(args: argparse.Namespace) -> int:
     # Build dashboard
     try:
         with get_db(url=db_config.url) as session:
-            builder = DashboardBuilder(session)
+            builder = DashboardBuilder(
+                session,
+                jobs=getattr(args, "jobs", 1) or 1,
+                use_figure_cache=not getattr(args, "no_cache", False),
+            )
             output_path = builder.build(
                 dashboard_config, auto_open=not getattr(args, "no_open", False)
             )
@@ -11,7 +11,6 @@ from loguru import logger
 
 from src.config import get_database_config
 from src.db.conn import get_db
-from src.analysis.engine import AnalysisEngine
 from src.types.analysis import (
     AnalysisType,
     DataCategory,
@@ -36,10 +35,19 @@ def run_analysis(args: argparse.Namespace) -> None:
         print("Error: analysis_type is required. Use --help for more information.")
         return
 
+    config = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    )
+
     try:
         with get_db(url=config.url) as session:
             # Initialize analysis engine
-            engine = AnalysisEngine(session, args.output_dir)
+            from src.analysis.engine import AnalysisEngine  # pylint: disable=import-outside-toplevel
+
+            engine = AnalysisEngine(
+                session, args.output_dir, jobs=getattr(args, "jobs", 1) or 1
+            )
 
             # Parse data categories
             data_categories = []
@@ -100,6 +108,15 @@ def run_analysis(args: argparse.Namespace) -> None:
                     logger.error("Invalid JSON in custom_metrics")
                     return
 
+            # Parse model options
+            model_options = None
+            if getattr(args, "model_options", None):
+                try:
+                    model_options = json.loads(args.model_options)
+                except json.JSONDecodeError:
+                    logger.error("Invalid JSON in model_options")
+                    return
+
             # Parse analysis type
             try:
                 analysis_type = AnalysisType(args.analysis_type)
@@ -121,6 +138,7 @@ def run_analysis(args: argparse.Namespace) -> None:
                 time_range=args.time_range,
                 spatial_bounds=args.spatial_bounds,
                 custom_metrics=custom_metrics,
+                model_options=model_options,
                 output_format=args.output_format,
                 include_raw_data=args.include_raw_data,
                 include_statistical_tests=args.include_statistical_tests,
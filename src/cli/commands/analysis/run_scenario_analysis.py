@@ -11,7 +11,6 @@ from loguru import logger
 
 from src.config import get_database_config
 from src.db.conn import get_db
-from src.analysis.engine import AnalysisEngine
 from src.types.analysis import AnalysisScenario, ANALYSIS_SCENARIOS
 
 
@@ -29,10 +28,23 @@ def run_scenario_analysis(args: argparse.Namespace) -> None:
         print("Error: scenario is required. Use --help for more information.")
         return
 
+    config = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    )
+
     try:
         with get_db(url=config.url) as session:
             # Initialize analysis engine
-            engine = AnalysisEngine(session, args.output_dir)
+            from src.analysis.engine import AnalysisEngine  # pylint: disable=import-outside-toplevel
+            from src.analysis.feature_store import get_feature_store  # pylint: disable=import-outside-toplevel
+
+            engine = AnalysisEngine(
+                session,
+                args.output_dir,
+                jobs=getattr(args, "jobs", 1) or 1,
+                feature_store=get_feature_store(),
+            )
 
             # Parse scenario
             try:
@@ -60,6 +72,7 @@ def run_scenario_analysis(args: argparse.Namespace) -> None:
                     data_categories=scenario_config.data_categories,
                     max_models=20,
                     analysis_name=scenario_config.description,
+                    screen_top_n=getattr(args, "screen_top_n", None),
                 )
 
                 if result['status'] == 'error':
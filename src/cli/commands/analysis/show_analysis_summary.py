@@ -10,13 +10,14 @@ from loguru import logger
 
 from src.config import get_database_config
 from src.db.conn import get_db
-from src.analysis.engine import AnalysisEngine
 
 
 def show_analysis_summary(args: argparse.Namespace) -> None:
     """Show summary of all analyses performed."""
     try:
         with get_db(url=config.url) as session:
+            from src.analysis.engine import AnalysisEngine  # pylint: disable=import-outside-toplevel
+
             engine = AnalysisEngine(session, args.output_dir)
             summary = engine.get_analysis_summary()
 
@@ -25,6 +26,12 @@ def show_analysis_summary(args: argparse.Namespace) -> None:
             print(f"Total Analyses: {summary['total_analyses']}")
             print(f"Base Output Directory: {summary['base_output_directory']}")
             print(f"Cache Size: {summary['cache_size']}")
+            if "persistent_cache" in summary:
+                stored = summary["persistent_cache"]
+                print(
+                    f"Stored Results: {stored['entries']} "
+                    f"({stored['size_bytes']} bytes)"
+                )
 
             if summary["analysis_directories"]:
                 print(
@@ -1,6 +1,7 @@
 from .init_db import init_db
 from .fill_db import fill_db
 from .backup import backup_db
+from .restore import restore_db
 from .mock_data import insert_mock_visits
 from .drop_visits import drop_all_visits, drop_visits_by_criteria
 from .generate_realistic_data import generate_realistic_data, list_user_profiles, show_scenario_info
@@ -9,6 +10,7 @@ __all__ = [
     "init_db",
     "fill_db",
     "backup_db",
+    "restore_db",
     "insert_mock_visits",
     "drop_all_visits",
     "drop_visits_by_criteria",
@@ -6,14 +6,67 @@ Backup the current database to a specified location.
 
 import argparse
 import os
-import shutil
 from datetime import datetime
 from loguru import logger
+from src.lib.db_snapshot import SnapshotStore, consistent_copy
 from src.lib.utils import open_folder_dialog
-from src.config import get_database_path
+from src.config import get_database_config
 from src.paths import PATHS
 
 
+def _backup_to_file(database_path: str, backup_path: str) -> bool:
+    """Copy the database to ``backup_path`` with the online backup API."""
+    try:
+        consistent_copy(database_path, backup_path)
+        logger.info(f"Database backed up successfully to: {backup_path}")
+
+        # Show backup size
+        backup_size = os.path.getsize(backup_path)
+        backup_size_mb = backup_size / (1024 * 1024)
+        logger.info(f"Backup size: {backup_size_mb:.2f} MB")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to backup database: {e}")
+        return False
+
+
+def _backup_to_latest_artifact(database_path: str) -> None:
+    """Copy the database to the latest artifact path."""
+    backup_path = PATHS.ONSEN_LATEST_ARTIFACT
+
+    # Create artifacts directory if it doesn't exist
+    os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+
+    if _backup_to_file(database_path, backup_path):
+        logger.info("Latest artifact has been updated!")
+
+
+def _backup_to_snapshot(database_path: str, args: argparse.Namespace) -> None:
+    """Store an incremental, deduplicated snapshot of the database."""
+    store_dir = args.backup_folder or PATHS.DB_SNAPSHOTS_DIR
+    store = SnapshotStore(store_dir, compress=not args.no_compress)
+
+    try:
+        snapshot = store.create(database_path)
+    except Exception as e:
+        logger.error(f"Failed to snapshot database: {e}")
+        return
+
+    logger.info(
+        f"Snapshot {snapshot.snapshot_id} stored in {store.root} "
+        f"({snapshot.size_bytes / (1024 * 1024):.2f} MB database, "
+        f"{snapshot.new_bytes / (1024 * 1024):.2f} MB new data)"
+    )
+
+    if args.keep:
+        removed, removed_chunks = store.prune(args.keep)
+        if removed:
+            logger.info(
+                f"Pruned {len(removed)} old snapshots and {removed_chunks} unreferenced chunks"
+            )
+
+
 def backup_db(args: argparse.Namespace) -> None:
     """
     Backup the current database to the specified folder.
@@ -24,9 +77,17 @@ def backup_db(args: argparse.Namespace) -> None:
     - Type 'artifact' to backup to the latest artifact path (artifacts/db/onsen_latest.db)
 
     Use --to-latest-artifact (-a) to skip the prompt and backup directly to the artifact.
+    Use --snapshot to store an incremental snapshot instead of a full copy; only
+    changed pages are written. Restore snapshots with `database restore`.
+
+    All copies use SQLite's online backup API, so they are consistent even while
+    another process is writing to the database.
     """
     # Get database configuration
-    database_path = get_database_path()
+    database_path = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    ).path
     if not database_path:
         logger.error("Cannot backup in-memory database (test environment)")
         return
@@ -36,31 +97,13 @@ def backup_db(args: argparse.Namespace) -> None:
         )
         return
 
+    if getattr(args, "snapshot", False):
+        _backup_to_snapshot(database_path, args)
+        return
+
     # Check if user wants to backup to latest artifact path
     if args.to_latest_artifact:
-        backup_path = PATHS.ONSEN_LATEST_ARTIFACT
-        backup_dir = os.path.dirname(backup_path)
-
-        # Create artifacts directory if it doesn't exist
-        os.makedirs(backup_dir, exist_ok=True)
-
-        try:
-            # Copy the database file directly to the artifact path
-            shutil.copy2(database_path, backup_path)
-            logger.info(
-                f"Database backed up successfully to latest artifact: {backup_path}"
-            )
-
-            # Show backup size
-            backup_size = os.path.getsize(backup_path)
-            backup_size_mb = backup_size / (1024 * 1024)
-            logger.info(f"Backup size: {backup_size_mb:.2f} MB")
-            logger.info("Latest artifact has been updated!")
-
-        except Exception as e:
-            logger.error(f"Failed to backup database to latest artifact: {e}")
-            return
-
+        _backup_to_latest_artifact(database_path)
         return
 
     backup_folder = args.backup_folder
@@ -81,30 +124,7 @@ def backup_db(args: argparse.Namespace) -> None:
                 logger.info("No folder selected or dialog cancelled.")
                 return
         elif user_input.lower() in ["artifact", "artifacts", "latest"]:
-            # Backup to latest artifact path
-            backup_path = PATHS.ONSEN_LATEST_ARTIFACT
-            backup_dir = os.path.dirname(backup_path)
-
-            # Create artifacts directory if it doesn't exist
-            os.makedirs(backup_dir, exist_ok=True)
-
-            try:
-                # Copy the database file directly to the artifact path
-                shutil.copy2(database_path, backup_path)
-                logger.info(
-                    f"Database backed up successfully to latest artifact: {backup_path}"
-                )
-
-                # Show backup size
-                backup_size = os.path.getsize(backup_path)
-                backup_size_mb = backup_size / (1024 * 1024)
-                logger.info(f"Backup size: {backup_size_mb:.2f} MB")
-                logger.info("Latest artifact has been updated!")
-
-            except Exception as e:
-                logger.error(f"Failed to backup database to latest artifact: {e}")
-                return
-
+            _backup_to_latest_artifact(database_path)
             return
         else:
             backup_folder = user_input
@@ -129,16 +149,4 @@ def backup_db(args: argparse.Namespace) -> None:
     backup_filename = f"{database_name}.backup_{timestamp}"
     backup_path = os.path.join(backup_folder, backup_filename)
 
-    try:
-        # Copy the database file
-        shutil.copy2(database_path, backup_path)
-        logger.info(f"Database backed up successfully to: {backup_path}")
-
-        # Show backup size
-        backup_size = os.path.getsize(backup_path)
-        backup_size_mb = backup_size / (1024 * 1024)
-        logger.info(f"Backup size: {backup_size_mb:.2f} MB")
-
-    except Exception as e:
-        logger.error(f"Failed to backup database: {e}")
-        return
+    _backup_to_file(database_path, backup_path)
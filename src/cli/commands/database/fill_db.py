@@ -93,8 +93,17 @@ def interactive_file_selection() -> str:
 def fill_db(args: argparse.Namespace) -> None:
     """
     Fill the database with onsen data from JSON files.
+
+    Re-running it with a newer scrape only writes the onsens that changed.
     """
-    database_path = config.url.replace("sqlite:///", "")
+    config = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    )
+    database_path = config.path
+    if not database_path:
+        logger.error("Cannot fill in-memory database (test environment)")
+        return
     if not os.path.exists(database_path):
         logger.error(
             f"Database file {database_path} does not exist! Run `database init` first to create it."
@@ -131,5 +140,6 @@ def fill_db(args: argparse.Namespace) -> None:
     with get_db(url=database_url) as db:
         summary = import_onsen_data(db, json_path)
         logger.info(
-            f"Import finished. Inserted={summary['inserted']}, Updated={summary['updated']}, Skipped={summary['skipped']}"
+            f"Import finished. Inserted={summary['inserted']}, Updated={summary['updated']}, "
+            f"Unchanged={summary['unchanged']}, Skipped={summary['skipped']}"
         )
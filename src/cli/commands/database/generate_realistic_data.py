@@ -11,26 +11,99 @@ NOTE: This command is blocked from production database access for safety.
 """
 
 import argparse
+import time
 from loguru import logger
+from sqlalchemy import func
 
 from src.db.conn import get_db
-from src.db.models import OnsenVisit, Onsen
+from src.db.models import Activity, OnsenVisit, Onsen
 from src.config import get_database_config
-from src.testing.mocks.scenario_builder import (
-    create_analysis_ready_dataset,
-    create_econometric_test_dataset,
-    create_tourist_scenario,
-    create_local_regular_scenario,
-)
-from src.testing.mocks.user_profiles import ALL_PROFILES
+
+
+def _generate_vectorized(db, args: argparse.Namespace, onsen_ids: list[int]) -> None:
+    """Generate a scenario column-wise and bulk insert it in one transaction."""
+    # pylint: disable=import-outside-toplevel
+    from src.db.columnar import insert_columns
+    from src.testing.mocks.scenario_builder import (
+        VECTORIZED_SCENARIOS,
+        VectorizedDataGenerator,
+        scenario_config,
+    )
+
+    scenario = args.scenario
+    if scenario not in VECTORIZED_SCENARIOS:
+        logger.error(
+            f"Scenario '{scenario}' is not supported with --vectorized. "
+            f"Available: {', '.join(VECTORIZED_SCENARIOS)}"
+        )
+        return
+
+    config = scenario_config(
+        scenario,
+        onsen_ids,
+        num_visits=args.num_visits or 100,
+        days=args.days or 90,
+        months=args.months or 12,
+        trip_days=args.trip_days or 7,
+        visits_per_day=args.visits_per_day or 3,
+    )
+    generator = VectorizedDataGenerator(config, seed=args.seed)
+    logger.info(f"Generating scenario '{scenario}' (vectorized, seed={generator.seed})")
+
+    first_visit_id = (db.query(func.max(OnsenVisit.id)).scalar() or 0) + 1
+    batch_size = args.batch_size or 10000
+    visit_count = activity_count = 0
+    rating_sum = 0
+    started = time.perf_counter()
+
+    chunks = generator.iter_chunks(
+        first_visit_id=first_visit_id,
+        heart_rate_coverage=args.hr_coverage or 0.0,
+        include_exercise=args.with_exercise,
+    )
+    for visits, activities in chunks:
+        visit_count += insert_columns(db, OnsenVisit, visits, batch_size=batch_size)
+        activity_count += insert_columns(db, Activity, activities, batch_size=batch_size)
+        rating_sum += int(visits['personal_rating'].sum())
+        logger.info(f"Inserted {visit_count} visits, {activity_count} activities")
+    db.commit()
+
+    elapsed = time.perf_counter() - started
+    logger.info("\n" + "="*50)
+    logger.info("DATA GENERATION COMPLETE")
+    logger.info("="*50)
+    logger.info(f"Scenario: {scenario} (seed {generator.seed})")
+    logger.info(f"Total visits: {visit_count}")
+    logger.info(f"Total activities: {activity_count}")
+    if visit_count:
+        logger.info(f"Average rating: {rating_sum / visit_count:.1f}/10")
+    logger.info(f"Time: {elapsed:.1f}s ({visit_count / max(elapsed, 1e-9):,.0f} visits/s)")
+
+    if not args.quiet:
+        print(f"\n✅ Successfully generated {visit_count} visits")
+        if activity_count:
+            print(f"   + {activity_count} activities")
 
 
 def generate_realistic_data(args: argparse.Namespace) -> None:
     """
     Generate realistic mock data based on specified scenario.
 
+    With --vectorized, the scenario is drawn a column at a time with NumPy
+    (reproducible with --seed) and bulk inserted, which scales to millions of
+    visits and activities for load testing.
+
     NOTE: This command is blocked from production database access for safety.
     """
+    # NumPy-backed generators are only imported by the commands that use them
+    # pylint: disable=import-outside-toplevel
+    from src.testing.mocks.scenario_builder import (
+        create_analysis_ready_dataset,
+        create_econometric_test_dataset,
+        create_tourist_scenario,
+        create_local_regular_scenario,
+    )
+
     # Get database configuration - BLOCK PRODUCTION ACCESS
     config = get_database_config(
         env_override=getattr(args, 'env', None),
@@ -51,6 +124,10 @@ def generate_realistic_data(args: argparse.Namespace) -> None:
         onsen_ids = [onsen.id for onsen in db.query(Onsen).all()]
         logger.info(f"Found {onsen_count} onsens in database")
 
+        if getattr(args, 'vectorized', False):
+            _generate_vectorized(db, args, onsen_ids)
+            return
+
         # Generate data based on scenario
         scenario = args.scenario
         num_visits = args.num_visits or 100
@@ -245,8 +322,6 @@ def generate_realistic_data(args: argparse.Namespace) -> None:
 
         if not args.quiet:
             print(f"\n✅ Successfully generated {len(db_visits)} visits")
-            if hr_data:
-                print(f"   + {len(hr_data)} heart rate sessions")
 
             print(f"\n📊 Ready to run analysis:")
             print(f"   onsendo analysis scenario overview")
@@ -264,6 +339,10 @@ def generate_realistic_data(args: argparse.Namespace) -> None:
 
 def list_user_profiles(args: argparse.Namespace = None) -> None:
     """Display available user profiles."""
+    from src.testing.mocks.user_profiles import (  # pylint: disable=import-outside-toplevel
+        ALL_PROFILES,
+    )
+
     print("\n" + "="*60)
     print("AVAILABLE USER PROFILES")
     print("="*60)
@@ -0,0 +1,87 @@
+"""
+restore.py
+
+Restore the database from an incremental snapshot.
+"""
+
+import argparse
+import os
+from loguru import logger
+from src.lib.db_snapshot import SnapshotStore
+from src.config import get_database_config
+from src.paths import PATHS
+
+
+def _list_snapshots(store: SnapshotStore) -> None:
+    snapshots = store.snapshots()
+    if not snapshots:
+        print(f"No snapshots found in {store.root}")
+        return
+
+    print(f"\nSnapshots in {store.root}:")
+    for snapshot in snapshots:
+        print(
+            f"  {snapshot.snapshot_id}  {snapshot.created_at}  "
+            f"{snapshot.size_bytes / (1024 * 1024):8.2f} MB  "
+            f"(+{snapshot.new_bytes / (1024 * 1024):.2f} MB new)"
+        )
+
+
+def restore_db(args: argparse.Namespace) -> None:
+    """
+    Restore a database snapshot created with `database backup --snapshot`.
+
+    Restores the latest snapshot unless --snapshot-id is given. Without --output,
+    the current database is replaced; a snapshot of its current state is taken
+    first so the restore itself can be undone.
+    """
+    store_dir = args.snapshot_dir or PATHS.DB_SNAPSHOTS_DIR
+    if not os.path.isdir(store_dir):
+        logger.error(f"Snapshot directory {store_dir} does not exist")
+        return
+    store = SnapshotStore(store_dir)
+
+    if args.list:
+        _list_snapshots(store)
+        return
+
+    try:
+        snapshot = store.get(args.snapshot_id)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return
+
+    target = args.output
+    if not target:
+        target = get_database_config(
+            env_override=getattr(args, "env", None),
+            path_override=getattr(args, "database", None),
+        ).path
+        if not target:
+            logger.error("Cannot restore into in-memory database (test environment)")
+            return
+
+        if not args.force:
+            if args.no_interactive:
+                logger.error(
+                    "Cannot replace the current database without confirmation in non-interactive mode. Use --force to skip confirmation."
+                )
+                return
+            confirm = input(
+                f"Replace {target} with snapshot {snapshot.snapshot_id} ({snapshot.created_at})? (yes/no): "
+            ).strip()
+            if confirm.lower() not in ["yes", "y"]:
+                logger.info("Restore cancelled.")
+                return
+
+        if os.path.exists(target):
+            safety = store.create(target, label="pre-restore")
+            logger.info(f"Saved current database as snapshot {safety.snapshot_id}")
+
+    try:
+        store.restore(target, snapshot.snapshot_id)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"Failed to restore snapshot: {e}")
+        return
+
+    logger.info(f"Database restored from snapshot {snapshot.snapshot_id} to: {target}")
@@ -3,39 +3,59 @@ List locations command.
 """
 
 import argparse
+
+from loguru import logger
+from sqlalchemy import select
+
 from src.db.conn import get_db
 from src.db.models import Location
+from src.db.pagination import iter_keyset
 from src.config import get_database_config
 
 
 def list_locations(args: argparse.Namespace) -> None:
-    """List all locations in the database."""
+    """List locations in the database by name, one page at a time."""
     # Get database configuration
     config = get_database_config(
         env_override=getattr(args, 'env', None),
         path_override=getattr(args, 'database', None)
     )
+    limit = getattr(args, 'limit', None)
 
     with get_db(url=config.url) as db:
-        query = db.query(Location).order_by(Location.name)
-
-        # Apply limit if specified
-        if hasattr(args, 'limit') and args.limit is not None:
-            query = query.limit(args.limit)
-
-        locations = query.all()
+        statement = select(Location.id, Location.name, Location.latitude, Location.longitude, Location.description)
+        rows = iter_keyset(
+            db,
+            statement,
+            key=Location.name,
+            id_column=Location.id,
+            limit=limit,
+            offset=getattr(args, 'offset', None) or 0,
+            after=getattr(args, 'after', None),
+        )
+
+        shown = 0
+        last_id = None
+        try:
+            for location in rows:
+                if not shown:
+                    print("-" * 80)
+                print(f"ID: {location.id}")
+                print(f"Name: {location.name}")
+                print(f"Coordinates: {location.latitude}, {location.longitude}")
+                if location.description:
+                    print(f"Description: {location.description}")
+                print("-" * 80)
+                shown += 1
+                last_id = location.id
+        except ValueError as e:
+            logger.error(str(e))
+            return
 
-        if not locations:
+        if not shown:
             print("No locations found in the database.")
             return
 
-        print(f"Found {len(locations)} location(s):")
-        print("-" * 80)
-
-        for location in locations:
-            print(f"ID: {location.id}")
-            print(f"Name: {location.name}")
-            print(f"Coordinates: {location.latitude}, {location.longitude}")
-            if location.description:
-                print(f"Description: {location.description}")
-            print("-" * 80)
+        print(f"Showed {shown} location(s).")
+        if limit is not None and shown == limit:
+            print(f"Next page: --after {last_id}")
@@ -1,11 +1,24 @@
+from typing import Any
+
 from .add import add_onsen
 from .print_summary import print_summary
 from .recommend import recommend_onsen
-from .scrape_data import scrape_onsen_data
 
+# scrape_onsen_data is resolved lazily by __getattr__ below
 __all__ = [
     "add_onsen",
     "print_summary",
     "recommend_onsen",
-    "scrape_onsen_data",
+    "scrape_onsen_data",  # pylint: disable=undefined-all-variable
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The scraper pulls in selenium; only import it when it is used
+    if name == "scrape_onsen_data":
+        from .scrape_data import (  # pylint: disable=import-outside-toplevel
+            scrape_onsen_data,
+        )
+
+        return scrape_onsen_data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
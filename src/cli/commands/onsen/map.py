@@ -53,7 +53,10 @@ def map_onsens(args: argparse.Namespace) -> None:
         try:
             # Generate the map with visit status and locations
             show_locations = not getattr(args, "no_show_locations", False)
-            map_path = generate_all_onsens_map(onsens, db, show_locations=show_locations)
+            client_side = True if getattr(args, "client_side", False) else None
+            map_path = generate_all_onsens_map(
+                onsens, db, show_locations=show_locations, client_side=client_side
+            )
 
             print("=" * 60)
             print("Interactive Onsen Map Generated!")
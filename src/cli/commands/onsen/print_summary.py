@@ -9,10 +9,13 @@ from datetime import datetime
 from typing import Optional
 
 from loguru import logger
+from sqlalchemy import select
 
 from src.config import get_database_config
 from src.db.conn import get_db
 from src.db.models import Onsen, OnsenVisit
+from src.db.pagination import iter_keyset
+from src.lib.onsen_filter import ONSEN_SUMMARY_COLUMNS, iter_onsen_summary_table
 from src.lib.utils import generate_google_maps_link
 
 
@@ -25,11 +28,52 @@ def _format_datetime(dt: Optional[datetime]) -> str:
         return str(dt)
 
 
+def _print_summary_table(args: argparse.Namespace) -> None:
+    """Stream a page of the onsen summary table, ordered by id."""
+    config = get_database_config(
+        env_override=getattr(args, "env", None),
+        path_override=getattr(args, "database", None),
+    )
+    limit = getattr(args, "limit", None)
+
+    with get_db(url=config.url) as db:
+        rows = iter_keyset(
+            db,
+            select(*ONSEN_SUMMARY_COLUMNS),
+            key=Onsen.id,
+            id_column=Onsen.id,
+            limit=limit,
+            offset=getattr(args, "offset", None) or 0,
+            after=getattr(args, "after", None),
+        )
+
+        shown = 0
+        last_id = None
+
+        def track(onsens):
+            nonlocal shown, last_id
+            for onsen in onsens:
+                shown += 1
+                last_id = onsen.id
+                yield onsen
+
+        try:
+            for line in iter_onsen_summary_table(track(rows)):
+                print(line)
+        except ValueError as e:
+            logger.error(str(e))
+            return
+
+        if limit is not None and shown == limit:
+            print(f"Next page: --after {last_id}")
+
+
 def print_summary(args: argparse.Namespace) -> None:
     """
     Print a human-readable summary for an onsen.
 
     One (and only one) of --onsen_id, --ban_number, or --name should be provided.
+    Without one, --limit/--offset/--after print a page of the onsen summary table.
     """
     onsen_id: Optional[int] = getattr(args, "onsen_id", None)
     ban_number: Optional[str] = getattr(args, "ban_number", None)
@@ -37,6 +81,9 @@ def print_summary(args: argparse.Namespace) -> None:
 
     provided = [v for v in [onsen_id, ban_number, name] if v]
     if not provided:
+        if any(getattr(args, option, None) is not None for option in ("limit", "offset", "after")):
+            _print_summary_table(args)
+            return
         logger.error("You must provide one of --onsen-id, --ban-number, or --name")
         return
 
@@ -78,8 +125,17 @@ def print_summary(args: argparse.Namespace) -> None:
             logger.error(f"Onsen not found for {identifier}")
             return
 
-        # Fetch visits and some simple aggregates
-        visits = db.query(OnsenVisit).filter(OnsenVisit.onsen_id == onsen.id).all()
+        # Fetch the visit columns used by the aggregates
+        visits = (
+            db.query(
+                OnsenVisit.visit_time,
+                OnsenVisit.personal_rating,
+                OnsenVisit.cleanliness_rating,
+                OnsenVisit.atmosphere_rating,
+            )
+            .filter(OnsenVisit.onsen_id == onsen.id)
+            .all()
+        )
         visit_count = len(visits)
         last_visit_time: Optional[datetime] = None
         if visit_count:
@@ -8,7 +8,6 @@ from datetime import datetime
 from pathlib import Path
 from src.db.conn import get_db
 from src.lib.recommendation import OnsenRecommendationEngine
-from src.lib.map_generator import generate_recommendation_map
 from src.lib.apple_reminders import is_reminders_available
 from src.lib.datetime_input import get_datetime_input
 from src.config import get_database_config
@@ -108,6 +107,11 @@ def recommend_onsen(args: argparse.Namespace) -> None:
             should_generate_map = args.generate_map
 
         if should_generate_map:
+            # folium is only needed when a map is generated
+            from src.lib.map_generator import (  # pylint: disable=import-outside-toplevel
+                generate_recommendation_map,
+            )
+
             try:
                 show_locations = not getattr(args, "no_show_locations", False)
                 map_path = generate_recommendation_map(
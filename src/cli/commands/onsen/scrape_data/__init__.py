@@ -5,7 +5,7 @@ Main entry point for the scrape_onsen_data command.
 import argparse
 import json
 import os
-import time
+from datetime import timedelta
 from typing import Any
 
 from loguru import logger
@@ -14,9 +14,24 @@ from src.paths import PATHS
 from .scraper import (
     setup_selenium_driver,
     extract_all_onsen_mapping,
-    scrape_onsen_page_with_selenium,
 )
 from .data_mapper import map_scraped_data_to_onsen_model, get_mapping_summary
+from .engine import (
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_WORKERS,
+    DriverPool,
+    HttpPageFetcher,
+    RateLimiter,
+    ScrapeJournal,
+    ScrapeStats,
+    SeleniumPageFetcher,
+    journal_path,
+    scrape_onsens,
+    select_onsens_to_scrape,
+    write_json_atomic,
+)
+
+SCRAPE_ENGINES = ("http", "selenium")
 
 
 def setup_logging() -> None:
@@ -47,17 +62,27 @@ def ensure_output_directory() -> None:
 
 
 def load_existing_data() -> dict[str, Any]:
-    """Load existing scraped data if it exists."""
+    """
+    Load existing scraped data if it exists.
+
+    Entries checkpointed by an interrupted run are merged in, so scraping
+    resumes where it stopped.
+    """
+    data: dict[str, Any] = {}
     if os.path.exists(PATHS.SCRAPED_ONSEN_DATA_FILE):
         with open(PATHS.SCRAPED_ONSEN_DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+            data = json.load(f)
+
+    checkpointed = ScrapeJournal(journal_path(PATHS.SCRAPED_ONSEN_DATA_FILE)).load()
+    if checkpointed:
+        logger.info(f"Resuming: {len(checkpointed)} onsens recovered from checkpoint")
+        data.update(checkpointed)
+    return data
 
 
 def save_data(data: dict[str, Any], filepath: str) -> None:
     """Save data to JSON file."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json_atomic(data, filepath)
 
 
 def process_scraped_onsen_data(raw_data: dict[str, Any]) -> dict[str, Any]:
@@ -90,6 +115,69 @@ def process_scraped_onsen_data(raw_data: dict[str, Any]) -> dict[str, Any]:
     return processed_data
 
 
+def scrape_individual_onsens(
+    args: argparse.Namespace,
+    onsen_mapping: dict[str, str],
+    existing_data: dict[str, Any],
+) -> ScrapeStats:
+    """
+    Scrape the onsens that are new, failed, changed or stale.
+
+    Pages are fetched by a pool of workers behind a shared rate limiter. Each
+    finished onsen is checkpointed to a journal next to the output file; the
+    journal is folded into the output JSON once all pages are done.
+
+    Args:
+        args: Command line arguments (engine, workers, delay, max_age_days, force)
+        onsen_mapping: Onsen ID -> ban number
+        existing_data: Current scraped data, updated in place
+
+    Returns:
+        Scrape counts
+    """
+    max_age_days = getattr(args, "max_age_days", None)
+    to_scrape = select_onsens_to_scrape(
+        onsen_mapping,
+        existing_data,
+        max_age=timedelta(days=max_age_days) if max_age_days is not None else None,
+        force=bool(getattr(args, "force", False)),
+    )
+    skipped = len(onsen_mapping) - len(to_scrape)
+    logger.info(f"{len(to_scrape)} onsens to scrape, {skipped} up to date")
+    for onsen_id, reason in to_scrape.items():
+        logger.debug(f"Onsen ID {onsen_id} (Ban: {onsen_mapping[onsen_id]}): {reason}")
+
+    workers = getattr(args, "workers", None) or DEFAULT_WORKERS
+    delay = getattr(args, "delay", None)
+    limiter = RateLimiter(DEFAULT_MIN_INTERVAL if delay is None else delay)
+    journal = ScrapeJournal(journal_path(PATHS.SCRAPED_ONSEN_DATA_FILE))
+
+    pool = None
+    if getattr(args, "engine", "http") == "selenium":
+        pool = DriverPool(workers)
+        fetcher: Any = SeleniumPageFetcher(limiter, pool)
+    else:
+        fetcher = HttpPageFetcher(limiter)
+
+    try:
+        stats = scrape_onsens(
+            list(to_scrape),
+            existing_data,
+            fetcher,
+            journal,
+            process_scraped_onsen_data,
+            workers=workers,
+        )
+    finally:
+        if pool is not None:
+            pool.close()
+
+    save_data(existing_data, PATHS.SCRAPED_ONSEN_DATA_FILE)
+    journal.clear()
+    stats.skipped = skipped
+    return stats
+
+
 def scrape_onsen_data(args: argparse.Namespace) -> None:
     """
     Scrape onsen data from the web.
@@ -98,6 +186,11 @@ def scrape_onsen_data(args: argparse.Namespace) -> None:
         args: Command line arguments containing:
             - fetch_mapping_only: If True, only fetch the onsen mapping
             - scrape_individual_only: If True, only scrape individual onsens (requires existing mapping)
+            - engine: "http" (default) or "selenium"
+            - workers: Number of concurrent page fetches
+            - delay: Minimum seconds between requests across all workers
+            - max_age_days: Re-scrape entries older than this many days
+            - force: Re-scrape every onsen in the mapping
     """
     setup_logging()
     ensure_output_directory()
@@ -114,6 +207,10 @@ def scrape_onsen_data(args: argparse.Namespace) -> None:
         )
         return
 
+    if getattr(args, "engine", "http") not in SCRAPE_ENGINES:
+        logger.error(f"Unknown --engine {args.engine!r}; expected one of {', '.join(SCRAPE_ENGINES)}")
+        return
+
     # Load existing data
     existing_data = load_existing_data()
     logger.info(f"Loaded {len(existing_data)} existing onsen records")
@@ -150,32 +247,11 @@ def scrape_onsen_data(args: argparse.Namespace) -> None:
     # Step 2: Scrape individual onsens (if requested)
     if run_individual:
         logger.info("Step 2: Scraping individual onsen pages...")
-        scraped_count = 0
-        skipped_count = 0
-
-        for onsen_id, ban_number in onsen_mapping.items():
-            if onsen_id in existing_data:
-                logger.debug(f"Skipping onsen ID {onsen_id} (already scraped)")
-                skipped_count += 1
-                continue
-
-            logger.info(f"Scraping new onsen ID: {onsen_id} (Ban: {ban_number})")
-            raw_onsen_data = scrape_onsen_page_with_selenium(onsen_id)
-
-            # Process the data to include mapped fields
-            processed_onsen_data = process_scraped_onsen_data(raw_onsen_data)
-
-            existing_data[onsen_id] = processed_onsen_data
-            scraped_count += 1
-
-            # Save progress after each onsen
-            save_data(existing_data, PATHS.SCRAPED_ONSEN_DATA_FILE)
-
-            # Add delay to be respectful to the server
-            time.sleep(1)
+        stats = scrape_individual_onsens(args, onsen_mapping, existing_data)
 
         logger.info(
-            f"Individual scraping completed. Scraped: {scraped_count}, Skipped: {skipped_count}"
+            f"Individual scraping completed. Scraped: {stats.scraped}, "
+            f"Unchanged: {stats.unchanged}, Failed: {stats.failed}, Skipped: {stats.skipped}"
         )
         logger.info(f"Total onsens in database: {len(existing_data)}")
         logger.info(f"Data saved to: {PATHS.SCRAPED_ONSEN_DATA_FILE}")
@@ -0,0 +1,438 @@
+"""
+Parallel, incremental scraping of onsen detail pages.
+
+Pages are fetched by a small pool of workers that share a politeness
+limiter, so the server never sees more than one request per interval no
+matter how many workers run. Two fetchers are available:
+
+- ``HttpPageFetcher`` downloads the page with ``requests`` and parses it with
+  ``html_parser``. Detail pages are rendered on the server, so this is the
+  default: it needs no browser and sends conditional requests, letting the
+  server answer ``304 Not Modified`` for pages that did not change.
+- ``SeleniumPageFetcher`` renders pages with headless Chrome drivers taken
+  from a ``DriverPool`` of long-lived drivers (one per worker).
+
+Every finished onsen is appended to a journal next to the output file, so an
+interrupted run resumes where it stopped; the journal is folded into the
+output JSON when the run completes (or when the next run starts).
+"""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, Optional
+
+from loguru import logger
+
+from src.const import CONST
+from .html_parser import extract_detailed_onsen_data_from_html
+
+DEFAULT_WORKERS = 4
+DEFAULT_MIN_INTERVAL = 1.0
+REQUEST_TIMEOUT = 30
+USER_AGENT = "onsendo-scraper/1.0"
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter spacing requests at least ``min_interval`` seconds apart.
+
+    Slots are handed out in order under a lock, then waited for outside it,
+    so workers queue up behind each other instead of bursting.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.min_interval = max(0.0, min_interval)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class DriverPool:
+    """
+    Bounded pool of long-lived Selenium drivers.
+
+    Drivers are created on first use (up to ``size``) and reused for every
+    later page, instead of starting a browser per page. All drivers are quit
+    by ``close()``.
+    """
+
+    def __init__(self, size: int, factory: Optional[Callable[[], Any]] = None):
+        if factory is None:
+            from .scraper import (  # pylint: disable=import-outside-toplevel
+                setup_selenium_driver,
+            )
+
+            factory = setup_selenium_driver
+        self.size = size
+        self._factory = factory
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._created: list[Any] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """Borrow a driver, creating one if the pool is not yet full."""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = len(self._created) < self.size
+                if create:
+                    driver = self._factory()
+                    self._created.append(driver)
+            if not create:
+                driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every driver the pool created."""
+        with self._lock:
+            drivers, self._created = self._created, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.debug(f"Error quitting driver: {e}")
+
+
+@dataclass
+class PageResult:
+    """Outcome of fetching one detail page."""
+
+    url: str
+    raw_html: str = ""
+    extracted_data: dict[str, Any] = field(default_factory=dict)
+    not_modified: bool = False
+    validators: dict[str, str] = field(default_factory=dict)
+
+
+class HttpPageFetcher:
+    """Fetches detail pages over plain HTTP, one ``requests`` session per thread."""
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        url_template: str = CONST.ONSEN_DETAIL_URL_TEMPLATE,
+        timeout: float = REQUEST_TIMEOUT,
+    ):
+        self.limiter = limiter
+        self.url_template = url_template
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> Any:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests  # pylint: disable=import-outside-toplevel
+
+            session = requests.Session()
+            session.headers["User-Agent"] = USER_AGENT
+            self._local.session = session
+        return session
+
+    def fetch(self, onsen_id: str, previous: Optional[dict[str, Any]] = None) -> PageResult:
+        """
+        Fetch a page, sending the validators stored with ``previous``.
+
+        Returns a ``not_modified`` result when the server answers 304.
+        """
+        url = self.url_template.format(onsen_id=onsen_id)
+        headers = {}
+        stored = (previous or {}).get("http_validators") or {}
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+
+        self.limiter.wait()
+        response = self._session().get(url, headers=headers, timeout=self.timeout)
+        validators = {
+            key: response.headers[header]
+            for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+            if response.headers.get(header)
+        }
+        if response.status_code == 304:
+            return PageResult(url=url, not_modified=True, validators=validators or stored)
+        response.raise_for_status()
+
+        # The pages declare UTF-8 in a meta tag, not in the Content-Type header
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = "utf-8"
+        html = response.text
+        return PageResult(
+            url=url,
+            raw_html=html,
+            extracted_data=extract_detailed_onsen_data_from_html(html),
+            validators=validators,
+        )
+
+
+class SeleniumPageFetcher:
+    """Renders detail pages with drivers borrowed from a ``DriverPool``."""
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        pool: DriverPool,
+        url_template: str = CONST.ONSEN_DETAIL_URL_TEMPLATE,
+    ):
+        self.limiter = limiter
+        self.pool = pool
+        self.url_template = url_template
+
+    def fetch(self, onsen_id: str, previous: Optional[dict[str, Any]] = None) -> PageResult:
+        """Fetch and extract a page; ``previous`` is unused (no conditional requests)."""
+        # pylint: disable=import-outside-toplevel
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        from .scraper import extract_detailed_onsen_data
+
+        del previous
+        url = self.url_template.format(onsen_id=onsen_id)
+        with self.pool.driver() as driver:
+            self.limiter.wait()
+            driver.get(url)
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            return PageResult(
+                url=url,
+                raw_html=driver.page_source,
+                extracted_data=extract_detailed_onsen_data(driver),
+            )
+
+
+class ScrapeJournal:
+    """
+    Append-only checkpoint of scraped entries (JSON lines).
+
+    Each line holds one finished onsen and is flushed as soon as it is
+    written, so at most the pages in flight are lost if a run is killed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, onsen_id: str, entry: dict[str, Any]) -> None:
+        line = json.dumps({"onsen_id": onsen_id, "entry": entry}, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Entries recorded so far; a torn last line (from a crash) is ignored."""
+        entries: dict[str, dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring incomplete checkpoint line in {self.path}")
+                    continue
+                entries[record["onsen_id"]] = record["entry"]
+        return entries
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def journal_path(output_path: str) -> str:
+    """Checkpoint journal that belongs to ``output_path``."""
+    return f"{output_path}.partial.jsonl"
+
+
+def write_json_atomic(data: dict[str, Any], filepath: str) -> None:
+    """Write JSON through a temporary file so readers never see a partial file."""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, filepath)
+
+
+def content_hash(raw_html: str) -> str:
+    return hashlib.sha256(raw_html.encode("utf-8")).hexdigest()
+
+
+def _scraped_at(entry: dict[str, Any]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(entry["scraped_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def stale_reason(
+    entry: Optional[dict[str, Any]],
+    ban_number: str,
+    max_age: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+) -> Optional[str]:
+    """
+    Why an onsen needs (re-)scraping, or ``None`` if its entry is current.
+
+    Entries are re-scraped when they are missing, failed last time, list a
+    different ban number than the mapping, or (with ``max_age``) were scraped
+    longer ago than ``max_age`` or before scrape times were recorded.
+    """
+    if entry is None:
+        return "new"
+    if "error" in entry:
+        return "error"
+    scraped_ban = (entry.get("extracted_data") or {}).get("ban_number")
+    if str(scraped_ban) != str(ban_number):
+        return "changed"
+    if max_age is not None:
+        scraped_at = _scraped_at(entry)
+        if scraped_at is None or scraped_at < (now or datetime.now()) - max_age:
+            return "stale"
+    return None
+
+
+def select_onsens_to_scrape(
+    onsen_mapping: dict[str, str],
+    existing_data: dict[str, Any],
+    max_age: Optional[timedelta] = None,
+    force: bool = False,
+    now: Optional[datetime] = None,
+) -> dict[str, str]:
+    """Map each onsen ID that needs scraping to the reason (mapping order kept)."""
+    if force:
+        return {onsen_id: "forced" for onsen_id in onsen_mapping}
+    selected = {}
+    for onsen_id, ban_number in onsen_mapping.items():
+        reason = stale_reason(existing_data.get(onsen_id), ban_number, max_age, now)
+        if reason:
+            selected[onsen_id] = reason
+    return selected
+
+
+@dataclass
+class ScrapeStats:
+    scraped: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def _build_entry(
+    onsen_id: str,
+    result: PageResult,
+    previous: Optional[dict[str, Any]],
+    process: Callable[[dict[str, Any]], dict[str, Any]],
+) -> tuple[dict[str, Any], bool]:
+    """Entry to store for a fetched page, and whether the page was unchanged."""
+    now = datetime.now().isoformat(timespec="seconds")
+    unchanged = previous is not None and "error" not in previous and (
+        result.not_modified
+        or previous.get("content_hash") == content_hash(result.raw_html)
+    )
+    if unchanged:
+        entry = dict(previous)
+    else:
+        entry = process(
+            {
+                "onsen_id": onsen_id,
+                "url": result.url,
+                "raw_html": result.raw_html,
+                "extracted_data": result.extracted_data,
+            }
+        )
+        entry["content_hash"] = content_hash(result.raw_html)
+    entry["scraped_at"] = now
+    if result.validators:
+        entry["http_validators"] = result.validators
+    return entry, unchanged
+
+
+def scrape_onsens(
+    onsen_ids: list[str],
+    existing_data: dict[str, Any],
+    fetcher: Any,
+    journal: ScrapeJournal,
+    process: Callable[[dict[str, Any]], dict[str, Any]],
+    workers: int = DEFAULT_WORKERS,
+) -> ScrapeStats:
+    """
+    Scrape ``onsen_ids`` with a pool of workers, checkpointing each result.
+
+    ``existing_data`` is updated in place with every finished entry. A page
+    whose content did not change keeps its processed entry and only has its
+    scrape time refreshed. Failures are recorded as error entries (so they
+    are retried next run) without overwriting a previously good entry.
+
+    Args:
+        onsen_ids: Onsen IDs to scrape
+        existing_data: Current scraped data, keyed by onsen ID
+        fetcher: ``HttpPageFetcher`` or ``SeleniumPageFetcher``
+        journal: Checkpoint journal receiving each finished entry
+        process: Turns a raw scrape result into a stored entry
+        workers: Number of concurrent workers
+
+    Returns:
+        Counts of scraped, unchanged and failed onsens
+    """
+    stats = ScrapeStats()
+
+    def work(onsen_id: str) -> tuple[str, dict[str, Any], Optional[bool]]:
+        previous = existing_data.get(onsen_id)
+        try:
+            result = fetcher.fetch(onsen_id, previous)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Broad exception needed for network, browser and parsing errors
+            logger.error(f"Error scraping onsen ID {onsen_id}: {e}")
+            url = fetcher.url_template.format(onsen_id=onsen_id)
+            return onsen_id, {"onsen_id": onsen_id, "url": url, "error": str(e), "extracted_data": {}}, None
+        entry, unchanged = _build_entry(onsen_id, result, previous, process)
+        return onsen_id, entry, unchanged
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(work, onsen_id) for onsen_id in onsen_ids]
+        for done, future in enumerate(as_completed(futures), start=1):
+            onsen_id, entry, unchanged = future.result()
+            if unchanged is None:
+                stats.failed += 1
+                previous = existing_data.get(onsen_id)
+                if previous is not None and "error" not in previous:
+                    continue
+            elif unchanged:
+                stats.unchanged += 1
+            else:
+                stats.scraped += 1
+            existing_data[onsen_id] = entry
+            journal.append(onsen_id, entry)
+            logger.info(
+                f"[{done}/{len(onsen_ids)}] onsen ID {onsen_id}: "
+                f"{'failed' if unchanged is None else 'unchanged' if unchanged else 'scraped'}"
+            )
+    return stats
@@ -0,0 +1,112 @@
+"""
+Static HTML parsing of onsen detail pages.
+
+Detail pages are rendered on the server; their scripts only drive the back
+and stamp buttons. The page source can therefore be parsed without a
+browser, producing the same ``extracted_data`` as
+``scraper.extract_detailed_onsen_data`` does through Selenium.
+"""
+
+import re
+from typing import Any, Optional
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from loguru import logger
+
+from src.const import CONST
+
+# Selenium collapses ASCII whitespace and non-breaking spaces but keeps ideographic spaces
+_WHITESPACE = re.compile(r"[ \t\r\n\f\xa0]+")
+_BAN_AND_NAME = re.compile(r"^(\d+)番\s+(.+)$")
+_COORDINATES = re.compile(r"&q=([\d.-]+),([\d.-]+)")
+
+
+def _text(element: Optional[Tag]) -> str:
+    """Visible text of an element with whitespace collapsed, like Selenium's ``.text``."""
+    if element is None:
+        return ""
+    return _WHITESPACE.sub(" ", element.get_text(" ")).strip()
+
+
+def _body_div(body: Tag, position: int) -> Optional[Tag]:
+    """The ``/html/body/div[position]`` element (1-based), if present."""
+    divs = body.find_all("div", recursive=False)
+    return divs[position - 1] if len(divs) >= position else None
+
+
+def _parse_ban_and_name(text: str) -> tuple[str, str]:
+    match = _BAN_AND_NAME.match(text)
+    if match:
+        return match.group(1), match.group(2).strip()
+    number_match = re.match(r"^(\d+)", text)
+    if number_match:
+        return number_match.group(1), re.sub(r"^\d+番\s*", "", text)
+    return "", text
+
+
+def _parse_map(container: Optional[Tag]) -> dict[str, Any]:
+    iframe = container.find("iframe", recursive=False) if container else None
+    src = iframe.get("src", "") if iframe else ""
+    if not src:
+        return {"map_url": "", "latitude": None, "longitude": None}
+
+    coord_match = _COORDINATES.search(src)
+    return {
+        "map_url": src,
+        "latitude": float(coord_match.group(1)) if coord_match else None,
+        "longitude": float(coord_match.group(2)) if coord_match else None,
+    }
+
+
+def _parse_table(container: Optional[Tag]) -> dict[str, str]:
+    table = container.find("table", recursive=False) if container else None
+    if table is None:
+        return {}
+
+    table_data = {}
+    for row in table.find_all("tr"):
+        cells = row.find_all("td", recursive=False)
+        if len(cells) < 2:
+            continue
+        key, value = _text(cells[0]), _text(cells[1])
+        if key and value:
+            table_data[key.replace(":", "").strip()] = value
+    return table_data
+
+
+def extract_detailed_onsen_data_from_html(html: str) -> dict[str, Any]:
+    """
+    Extract detailed onsen data from the source of a detail page.
+
+    Mirrors the XPath selectors used by the Selenium extractor: region in
+    ``body/div[2]``, "N番 name" in ``body/div[3]``, the deleted marker image
+    and map iframe in ``body/div[4]`` and the information table in
+    ``body/div[5]``.
+
+    Args:
+        html: Page source of an onsen detail page
+
+    Returns:
+        Dict containing extracted onsen data
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    body = soup.body
+    if body is None:
+        logger.debug("Detail page has no body")
+        return {}
+
+    extracted_data: dict[str, Any] = {"region": _text(_body_div(body, 2))}
+
+    ban_number, name = _parse_ban_and_name(_text(_body_div(body, 3)))
+    extracted_data["ban_number"] = ban_number
+    extracted_data["name"] = name
+
+    media = _body_div(body, 4)
+    first_div = media.find("div", recursive=False) if media else None
+    img = first_div.find("img", recursive=False) if first_div else None
+    extracted_data["deleted"] = bool(img) and CONST.DELETED_IMAGE_SUBSTRING in img.get("src", "")
+
+    extracted_data.update(_parse_map(media))
+    extracted_data.update(_parse_table(_body_div(body, 5)))
+    return extracted_data
@@ -11,23 +11,37 @@ from loguru import logger
 from src.lib.strava_client import StravaClient
 from src.lib.strava_converter import StravaFileExporter
 from src.paths import PATHS
-from src.types.strava import StravaSettings
+from src.types.strava import ActivityFilter, StravaSettings
+
+ACTIVITY_PAGE_SIZE = 200  # Strava's maximum
+FORMAT_LABELS = {
+    "gpx": "GPX",
+    "tcx": "TCX",
+    "fit": "FIT",
+    "json": "JSON",
+    "hr_csv": "HR CSV",
+}
 
 
 def cmd_strava_download(args):
     """
-    Download specific Strava activity by ID.
+    Download Strava activities by ID.
 
-    Downloads activity in specified format(s). For importing activities,
+    Downloads activities in specified format(s). Several IDs (or --all) are
+    exported in parallel by a pool of workers. For importing activities,
     use 'strava sync' instead.
 
     Usage:
         poetry run onsendo strava download 12345678
         poetry run onsendo strava download 12345678 --format gpx
+        poetry run onsendo strava download 12345678 23456789 --format fit
+        poetry run onsendo strava download --all --workers 8
 
     Arguments:
-        activity_id: Strava activity ID
-        --format FORMAT: Output format (gpx, json, hr_csv, all) [default: all]
+        activity_id: Strava activity ID(s)
+        --all: Download every activity of the athlete
+        --format FORMAT: Output format (gpx, tcx, fit, json, hr_csv, all) [default: all]
+        --workers N: Parallel downloads for several activities [default: 4]
 
     Examples:
         # Download activity in all formats
@@ -38,8 +52,33 @@ def cmd_strava_download(args):
 
         # Download heart rate CSV
         poetry run onsendo strava download 12345678 --format hr_csv
+
+        # Export the full history as FIT files
+        poetry run onsendo strava download --all --format fit
     """
-    activity_id = args.activity_id
+    activity_ids = list(getattr(args, "activity_id", None) or [])
+    download_all = getattr(args, "all", False)
+    workers = getattr(args, "workers", None) or StravaFileExporter.DEFAULT_WORKERS
+
+    if not activity_ids and not download_all:
+        print("Error: Provide at least one activity ID or --all")
+        return
+    if workers < 1:
+        print("Error: --workers must be at least 1")
+        return
+
+    # Determine requested formats
+    format_arg = args.format if hasattr(args, "format") and args.format else "all"
+    if format_arg == "all":
+        requested_formats = list(StravaFileExporter.ALL_FORMATS)
+    elif format_arg in StravaFileExporter.ALL_FORMATS:
+        requested_formats = [format_arg]
+    else:
+        print(
+            f"Error: Invalid format '{format_arg}'. "
+            f"Valid options: {', '.join(StravaFileExporter.ALL_FORMATS)}, all"
+        )
+        return
 
     # Load settings
     try:
@@ -64,6 +103,40 @@ def cmd_strava_download(args):
         print(f"Error initializing Strava client: {e}")
         return
 
+    output_dir = Path(PATHS.STRAVA_ACTIVITY_DIR.value)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if download_all:
+        print("Listing all activities...")
+        try:
+            activity_ids = _list_all_activity_ids(client)
+        except Exception as e:
+            logger.exception("Failed to list activities")
+            print(f"Error listing activities: {e}")
+            return
+
+    if len(activity_ids) == 1:
+        _download_one(client, activity_ids[0], output_dir, requested_formats)
+    else:
+        _download_many(client, activity_ids, output_dir, requested_formats, workers)
+
+
+def _list_all_activity_ids(client: StravaClient) -> list[int]:
+    """Page through the athlete's activities, newest first."""
+    activity_ids = []
+    page = 1
+    while True:
+        activities = client.list_activities(
+            ActivityFilter(page=page, page_size=ACTIVITY_PAGE_SIZE)
+        )
+        activity_ids.extend(activity.id for activity in activities)
+        if len(activities) < ACTIVITY_PAGE_SIZE:
+            return activity_ids
+        page += 1
+
+
+def _download_one(client, activity_id, output_dir, requested_formats):
+    """Download a single activity, reporting each step."""
     # Fetch activity and streams first
     print(f"Fetching activity {activity_id}...")
     try:
@@ -78,13 +151,6 @@ def cmd_strava_download(args):
     print(f"Type: {activity.activity_type}")
     print(f"Date: {activity.start_date_local.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Determine requested formats
-    format_arg = args.format if hasattr(args, "format") and args.format else "all"
-    if format_arg == "all":
-        requested_formats = ["gpx", "json", "hr_csv"]
-    else:
-        requested_formats = [format_arg]
-
     # Smart format selection based on available data
     exportable_formats, skipped_formats = StravaFileExporter.recommend_formats(
         streams, requested_formats
@@ -96,61 +162,85 @@ def cmd_strava_download(args):
         for fmt, reason in skipped_formats:
             print(f"  ⊘ Skipping {fmt.upper()}: {reason}")
 
-    # Prepare output directory and filename
-    output_dir = PATHS.STRAVA_ACTIVITY_DIR.value
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-    safe_name = "".join(
-        c if c.isalnum() or c in (" ", "_", "-") else "_" for c in activity.name
-    )
-    safe_name = safe_name.strip()[:50]
-    timestamp = activity.start_date_local.strftime("%Y%m%d_%H%M%S")
-    base_filename = f"{timestamp}_{safe_name}_{activity_id}"
-
-    file_paths = {}
-
     # Export in recommended formats
     try:
-        if "gpx" in exportable_formats:
-            gpx_path = Path(output_dir) / f"{base_filename}.gpx"
-            StravaFileExporter.export_to_gpx(activity, streams, gpx_path)
-            file_paths["gpx"] = str(gpx_path)
-            print(f"  ✓ GPX: {gpx_path}")
-
-        if "json" in exportable_formats:
-            json_path = Path(output_dir) / f"{base_filename}.json"
-            StravaFileExporter.export_to_json(activity, streams, json_path)
-            file_paths["json"] = str(json_path)
-            print(f"  ✓ JSON: {json_path}")
-
-        if "hr_csv" in exportable_formats:
-            csv_path = Path(output_dir) / f"{base_filename}_hr.csv"
-            StravaFileExporter.export_hr_to_csv(
-                activity, streams["heartrate"], streams.get("time"), csv_path
-            )
-            file_paths["hr_csv"] = str(csv_path)
-            print(f"  ✓ HR CSV: {csv_path}")
-
+        file_paths, _ = StravaFileExporter.export_activity(
+            activity, streams, output_dir, exportable_formats
+        )
     except Exception as e:
         logger.exception("Failed to export files")
         print(f"\nError exporting files: {e}")
         return
 
+    for fmt, path in file_paths.items():
+        print(f"  ✓ {FORMAT_LABELS[fmt]}: {path}")
+
     print("\n✓ Download complete")
     print("\nTo import activities into the database, use: poetry run onsendo strava sync")
 
 
+def _download_many(client, activity_ids, output_dir, requested_formats, workers):
+    """Download several activities in parallel, one progress line per activity."""
+    total = len(activity_ids)
+    print(f"Downloading {total} activities with {workers} workers...")
+    done = 0
+
+    # Large batches can exhaust the 15-minute window; wait for it rather than fail
+    client.wait_for_rate_limit = True
+
+    def fetch(activity_id):
+        return client.get_activity(activity_id), client.get_activity_streams(activity_id)
+
+    def report(activity_id, paths, error):
+        nonlocal done
+        done += 1
+        if error:
+            print(f"  [{done}/{total}] ✗ {activity_id}: {error}")
+        else:
+            formats = ", ".join(FORMAT_LABELS[fmt] for fmt in paths)
+            print(f"  [{done}/{total}] ✓ {activity_id}: {formats}")
+
+    result = StravaFileExporter.export_batch(
+        activity_ids,
+        fetch,
+        output_dir,
+        requested_formats,
+        workers=workers,
+        on_result=report,
+    )
+
+    files = sum(len(paths) for paths in result.exported.values())
+    print(f"\n✓ Exported {files} files for {len(result.exported)} activities to {output_dir}")
+    if result.skipped:
+        print(f"  ⊘ {len(result.skipped)} activities skipped some formats (missing streams)")
+    if result.failed:
+        print(f"  ✗ {len(result.failed)} activities failed")
+    print("\nTo import activities into the database, use: poetry run onsendo strava sync")
+
+
 def configure_args(parser):
     """Configure argument parser for download command."""
     parser.add_argument(
         "activity_id",
         type=int,
-        help="Strava activity ID to download",
+        nargs="*",
+        help="Strava activity ID(s) to download",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Download every activity",
     )
     parser.add_argument(
         "--format",
         type=str,
-        choices=["gpx", "json", "hr_csv", "all"],
+        choices=[*StravaFileExporter.ALL_FORMATS, "all"],
         default="all",
         help="Output format (default: all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=StravaFileExporter.DEFAULT_WORKERS,
+        help="Parallel downloads when exporting several activities (default: 4)",
+    )
@@ -1,9 +1,11 @@
 from .calculate_milestones import calculate_milestones
+from .cleanup_outputs import cleanup_outputs
 from .clear_cache import clear_cache
 from .update_artifacts import update_artifacts
 
 __all__ = [
     "calculate_milestones",
+    "cleanup_outputs",
     "clear_cache",
     "update_artifacts",
 ]
@@ -0,0 +1,20 @@
+"""CLI command to remove stale generated dashboards and maps."""
+
+import argparse
+
+from src.lib.static_assets import cleanup_generated_outputs
+
+
+def cleanup_outputs(args: argparse.Namespace) -> None:
+    """Remove old timestamped graph and map outputs and unused shared assets."""
+    keep_recent = args.keep_recent if args.keep_recent is not None else 5
+    removed = cleanup_generated_outputs(keep_recent=keep_recent, dry_run=args.dry_run)
+
+    if not removed:
+        print("No stale generated outputs found.")
+        return
+
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"{verb} {len(removed)} stale file(s):")
+    for path in removed:
+        print(f"  {path}")
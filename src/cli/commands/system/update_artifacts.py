@@ -7,7 +7,6 @@ These are static files for presentation to users of this project.
 
 import argparse
 import os
-import shutil
 import tempfile
 from pathlib import Path
 from loguru import logger
@@ -15,6 +14,7 @@ from src.db.conn import get_db
 from src.lib.cli_display import show_database_banner
 from src.db.import_data import import_onsen_data
 from src.config import get_database_config
+from src.lib.db_snapshot import consistent_copy
 from src.paths import PATHS
 from src.const import CONST
 
@@ -32,8 +32,9 @@ class ArtifactGenerator:
         if not current_db_path or not os.path.exists(current_db_path):
             return ""
 
-        backup_path = tempfile.mktemp(suffix=".db")
-        shutil.copy2(current_db_path, backup_path)
+        fd, backup_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        consistent_copy(current_db_path, backup_path)
         logger.info(f"Backed up current database to: {backup_path}")
         return backup_path
 
@@ -47,7 +48,7 @@ class ArtifactGenerator:
             logger.warning("Cannot restore database: no valid database path")
             return
 
-        shutil.copy2(backup_path, current_db_path)
+        consistent_copy(backup_path, current_db_path)
         os.unlink(backup_path)
         logger.info("Restored current database from backup")
 
@@ -239,8 +240,8 @@ class ArtifactGenerator:
             artifact_path.unlink()
 
         if current_db_path and os.path.exists(current_db_path):
-            # Copy current database state
-            shutil.copy2(current_db_path, str(artifact_path))
+            # Copy a consistent snapshot of the current database state
+            consistent_copy(current_db_path, str(artifact_path))
             logger.info(
                 f"Generated artifact: {artifact_path} (copy of current database)"
             )
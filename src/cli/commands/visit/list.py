@@ -3,51 +3,82 @@ List visits command.
 """
 
 import argparse
+
+from loguru import logger
+from sqlalchemy import select
+
 from src.db.conn import get_db
 from src.db.models import OnsenVisit, Onsen
+from src.db.pagination import iter_keyset
 from src.config import get_database_config
 
+# Only the displayed columns are read
+VISIT_LIST_COLUMNS = (
+    OnsenVisit.id,
+    OnsenVisit.visit_time,
+    OnsenVisit.entry_fee_yen,
+    OnsenVisit.stay_length_minutes,
+    OnsenVisit.personal_rating,
+    OnsenVisit.weather,
+    OnsenVisit.travel_mode,
+    OnsenVisit.notes,
+    Onsen.id.label("onsen_id"),
+    Onsen.name.label("onsen_name"),
+)
+
 
 def list_visits(args: argparse.Namespace) -> None:
-    """List all visits in the database."""
+    """List visits in the database, most recent first, one page at a time."""
     # Get database configuration
     config = get_database_config(
         env_override=getattr(args, 'env', None),
         path_override=getattr(args, 'database', None)
     )
+    limit = getattr(args, 'limit', None)
 
     with get_db(url=config.url) as db:
         # Get visits with onsen information
-        query = (
-            db.query(OnsenVisit, Onsen)
-            .join(Onsen)
-            .order_by(OnsenVisit.visit_time.desc())
+        statement = select(*VISIT_LIST_COLUMNS).join(Onsen, OnsenVisit.onsen_id == Onsen.id)
+        rows = iter_keyset(
+            db,
+            statement,
+            key=OnsenVisit.visit_time,
+            id_column=OnsenVisit.id,
+            descending=True,
+            limit=limit,
+            offset=getattr(args, 'offset', None) or 0,
+            after=getattr(args, 'after', None),
         )
 
-        # Apply limit if specified
-        if hasattr(args, 'limit') and args.limit is not None:
-            query = query.limit(args.limit)
-
-        visits = query.all()
+        shown = 0
+        last_id = None
+        try:
+            for visit in rows:
+                if not shown:
+                    print("-" * 100)
+                print(f"Visit ID: {visit.id}")
+                print(f"Onsen: {visit.onsen_name} (ID: {visit.onsen_id})")
+                print(f"Visit time: {visit.visit_time}")
+                print(f"Entry fee: {visit.entry_fee_yen} yen")
+                print(f"Stay length: {visit.stay_length_minutes} minutes")
+                print(f"Personal rating: {visit.personal_rating}/10")
+                if visit.weather:
+                    print(f"Weather: {visit.weather}")
+                if visit.travel_mode:
+                    print(f"Travel mode: {visit.travel_mode}")
+                if visit.notes:
+                    print(f"Notes: {visit.notes}")
+                print("-" * 100)
+                shown += 1
+                last_id = visit.id
+        except ValueError as e:
+            logger.error(str(e))
+            return
 
-        if not visits:
+        if not shown:
             print("No visits found in the database.")
             return
 
-        print(f"Found {len(visits)} visit(s):")
-        print("-" * 100)
-
-        for visit, onsen in visits:
-            print(f"Visit ID: {visit.id}")
-            print(f"Onsen: {onsen.name} (ID: {onsen.id})")
-            print(f"Visit time: {visit.visit_time}")
-            print(f"Entry fee: {visit.entry_fee_yen} yen")
-            print(f"Stay length: {visit.stay_length_minutes} minutes")
-            print(f"Personal rating: {visit.personal_rating}/10")
-            if visit.weather:
-                print(f"Weather: {visit.weather}")
-            if visit.travel_mode:
-                print(f"Travel mode: {visit.travel_mode}")
-            if visit.notes:
-                print(f"Notes: {visit.notes}")
-            print("-" * 100)
+        print(f"Showed {shown} visit(s).")
+        if limit is not None and shown == limit:
+            print(f"Next page: --after {last_id}")
@@ -4,17 +4,46 @@ Import weight data from files.
 # pylint: disable=bad-builtin
 
 import argparse
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
 
 from src.lib.weight_manager import (
     WeightDataImporter,
     WeightDataValidator,
     WeightDataManager,
+    WeightMeasurement,
 )
 from src.db.conn import get_db
 from src.config import get_database_config
 from src.lib.cli_display import show_database_banner
 
 
+PREVIEW_COUNT = 5
+
+
+@dataclass
+class MeasurementReview:
+    """Count, preview and validation results gathered while streaming measurements."""
+
+    count: int = 0
+    preview: list[WeightMeasurement] = field(default_factory=list)
+    invalid: int = 0
+    errors: list[tuple[int, list[str]]] = field(default_factory=list)
+
+    def add(self, measurement: WeightMeasurement) -> None:
+        """Record one measurement without keeping it beyond the preview."""
+        self.count += 1
+        if len(self.preview) < PREVIEW_COUNT:
+            self.preview.append(measurement)
+        is_valid, errors = WeightDataValidator.validate_measurement(measurement)
+        if not is_valid:
+            self.invalid += 1
+            if len(self.errors) < PREVIEW_COUNT:
+                self.errors.append((self.count, errors))
+
+
 def import_weight_data(args: argparse.Namespace) -> int:
     """Import weight data from a file."""
     # Get database configuration
@@ -34,13 +63,19 @@ def import_weight_data(args: argparse.Namespace) -> int:
 
         print(f"📁 Importing weight data from: {file_path}")
 
-        # Import the data
-        measurements = WeightDataImporter.import_from_file(file_path, format_hint)
+        # Read the file once to count, preview and validate; measurements are
+        # streamed, so large Apple Health exports are never held in memory
+        include_workouts = getattr(args, "include_workouts", False)
+        file_format = format_hint or WeightDataImporter.detect_format(file_path)
+        if include_workouts and file_format != "apple_health":
+            print("❌ --include-workouts is only supported for Apple Health exports")
+            return 1
+        review, activities = _review_file(file_path, file_format, include_workouts)
 
-        print(f"✅ Successfully imported {len(measurements)} measurement(s)")
+        print(f"✅ Successfully imported {review.count} measurement(s)")
 
         # Show first few measurements
-        for idx, measurement in enumerate(measurements[:5], 1):
+        for idx, measurement in enumerate(review.preview, 1):
             print(f"\n   Measurement {idx}:")
             print(f"   ⚖️  Weight: {measurement.weight_kg} kg")
             print(f"   🕐 Time: {measurement.measurement_time}")
@@ -50,27 +85,21 @@ def import_weight_data(args: argparse.Namespace) -> int:
                 status = "Yes" if measurement.hydrated_before else "No"
                 print(f"   💧 Hydrated before: {status}")
 
-        if len(measurements) > 5:
-            print(f"\n   ... and {len(measurements) - 5} more measurement(s)")
+        if review.count > PREVIEW_COUNT:
+            print(f"\n   ... and {review.count - PREVIEW_COUNT} more measurement(s)")
 
-        # Validate all measurements
+        # Validation results
         print("\n🔍 Validating data quality...")
-        validation_errors = []
 
-        for idx, measurement in enumerate(measurements, 1):
-            is_valid, errors = WeightDataValidator.validate_measurement(measurement)
-            if not is_valid:
-                validation_errors.append((idx, errors))
-
-        if validation_errors:
-            print(f"❌ Validation failed for {len(validation_errors)} measurement(s):")
-            for idx, errors in validation_errors[:5]:
+        if review.invalid:
+            print(f"❌ Validation failed for {review.invalid} measurement(s):")
+            for idx, errors in review.errors:
                 print(f"\n   Measurement {idx}:")
                 for error in errors:
                     print(f"   ⚠️  {error}")
 
-            if len(validation_errors) > 5:
-                print(f"\n   ... and {len(validation_errors) - 5} more validation errors")
+            if review.invalid > PREVIEW_COUNT:
+                print(f"\n   ... and {review.invalid - PREVIEW_COUNT} more validation errors")
 
             if not validate_only:
                 response = input(
@@ -86,28 +115,32 @@ def import_weight_data(args: argparse.Namespace) -> int:
             print("✅ Validation complete (import not performed)")
             return 0
 
-        # Store in database
-        print(f"\n💾 Storing {len(measurements)} measurement(s) in database...")
-
-        # Add notes if provided
-        if notes:
-            for measurement in measurements:
-                if not measurement.notes:
-                    measurement.notes = notes
+        # Store in database, streaming the file again into batched inserts
+        print(f"\n💾 Storing {review.count} measurement(s) in database...")
 
         with get_db(url=config.url) as db:
-            manager = WeightDataManager(db)
-            records = manager.store_measurements_bulk(measurements)
-
-            # Access attributes while session is still open
-            first_id = records[0].id
-            last_id = records[-1].id
-            file_hash = records[0].data_hash
-
-        print(
-            f"✅ Successfully stored {len(records)} measurement(s) "
-            f"(IDs: {first_id}-{last_id})"
-        )
+            file_hash = None
+            if review.count:
+                manager = WeightDataManager(db)
+                stored = manager.store_measurements_stream(
+                    _with_notes(
+                        WeightDataImporter.iter_from_file(file_path, format_hint), notes
+                    )
+                )
+                skipped = review.count - stored
+
+                if stored:
+                    file_hash = manager.file_hash(file_path)
+                    print(f"✅ Successfully stored {stored} measurement(s)")
+                if skipped:
+                    print(f"⏭️  Skipped {skipped} measurement(s) already in the database")
+
+            if activities:
+                stored_activities = store_new_activities(db, activities)
+                print(
+                    f"✅ Stored {stored_activities} new workout(s) as activities "
+                    f"({len(activities) - stored_activities} already imported)"
+                )
 
         if file_hash:
             print(f"🔗 File hash: {file_hash[:16]}...")
@@ -123,3 +156,58 @@ def import_weight_data(args: argparse.Namespace) -> int:
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
+
+
+def _review_file(
+    file_path: str, file_format: Optional[str], include_workouts: bool
+) -> tuple[MeasurementReview, list]:
+    """Stream the file once, reviewing its measurements and collecting workouts."""
+    review = MeasurementReview()
+    if file_format != "apple_health":
+        for measurement in WeightDataImporter.import_from_file(file_path, file_format):
+            review.add(measurement)
+        return review, []
+
+    if not Path(file_path).exists():
+        raise FileNotFoundError(file_path)
+    from src.lib.apple_health import (  # pylint: disable=import-outside-toplevel
+        read_export,
+    )
+
+    export = read_export(file_path, include_workouts=include_workouts, on_measurement=review.add)
+    if include_workouts:
+        print(
+            f"🏃 Found {len(export.activities)} workout(s) and "
+            f"{export.heart_rate_samples} heart-rate sample(s)"
+        )
+        if not review.count and not export.activities:
+            raise ValueError(f"No BodyMass records or workouts found in {file_path}")
+    elif not review.count:
+        raise ValueError(f"No BodyMass records found in {file_path}")
+    return review, export.activities
+
+
+def _with_notes(
+    measurements: Iterable[WeightMeasurement], notes: Optional[str]
+) -> Iterator[WeightMeasurement]:
+    """Fill in the import notes on measurements that have none."""
+    for measurement in measurements:
+        if notes and not measurement.notes:
+            measurement.notes = notes
+        yield measurement
+
+
+def store_new_activities(db, activities) -> int:
+    """Store workouts as activities, skipping ones imported before."""
+    from src.lib.activity_manager import (  # pylint: disable=import-outside-toplevel
+        ActivityManager,
+    )
+
+    manager = ActivityManager(db)
+    stored = 0
+    for activity in activities:
+        if manager.get_by_strava_id(activity.strava_id):
+            continue
+        manager.store_activity(activity)
+        stored += 1
+    return stored
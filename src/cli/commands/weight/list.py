@@ -21,6 +21,9 @@ def list_weight_measurements(args: argparse.Namespace) -> int:
     )
 
     try:
+        # The limit is applied in the query rather than after loading every row
+        limit = getattr(args, "limit", None) or None
+
         with get_db(url=config.url) as db:
             manager = WeightDataManager(db)
 
@@ -38,22 +41,18 @@ def list_weight_measurements(args: argparse.Namespace) -> int:
                 start_date = datetime.strptime(start_str.strip(), "%Y-%m-%d")
                 end_date = datetime.strptime(end_str.strip(), "%Y-%m-%d")
 
-                measurements = manager.get_by_date_range(start_date, end_date)
+                measurements = manager.get_by_date_range(start_date, end_date, limit=limit)
                 print(
                     f"📊 Weight measurements from {start_str} to {end_str}:"
                 )
             else:
-                measurements = manager.get_all()
+                measurements = manager.get_all(limit=limit)
                 print("📊 All weight measurements:")
 
             if not measurements:
                 print("   No measurements found")
                 return 0
 
-            # Apply limit if specified
-            if hasattr(args, "limit") and args.limit:
-                measurements = measurements[: args.limit]
-
             # Determine output format
             output_format = "table"
             if hasattr(args, "format") and args.format:
@@ -23,6 +23,8 @@ def show_weight_stats(args: argparse.Namespace) -> int:
         month = args.month if hasattr(args, "month") else None
         year = args.year if hasattr(args, "year") else datetime.now().year
         all_time = args.all_time if hasattr(args, "all_time") else False
+        date_range = getattr(args, "date_range", None)
+        granularity = getattr(args, "granularity", None)
 
         with get_db(url=config.url) as db:
             manager = WeightDataManager(db)
@@ -43,13 +45,25 @@ def show_weight_stats(args: argparse.Namespace) -> int:
                 week_start = month_start
                 week_end = month_end
                 period_name = f"{month_start.strftime('%B %Y')}"
+            elif date_range:
+                date_parts = date_range.split(",")
+                if len(date_parts) != 2:
+                    print("❌ Invalid date range format. Use: YYYY-MM-DD,YYYY-MM-DD")
+                    return 1
+                start_str, end_str = (part.strip() for part in date_parts)
+                week_start = datetime.strptime(start_str, "%Y-%m-%d")
+                # Include the whole end day
+                week_end = datetime.strptime(end_str, "%Y-%m-%d") + timedelta(
+                    days=1, microseconds=-1
+                )
+                period_name = f"{start_str} to {end_str}"
             elif all_time:
                 # All time stats
                 week_start = None
                 week_end = None
                 period_name = "All Time"
             else:
-                print("❌ Please specify either --week, --month, or --all-time")
+                print("❌ Please specify either --week, --month, --date-range, or --all-time")
                 return 1
 
             # Get summary
@@ -94,6 +108,9 @@ def show_weight_stats(args: argparse.Namespace) -> int:
                     percentage = (count / summary.total_measurements) * 100
                     print(f"   • {source}: {count} ({percentage:.1f}%)")
 
+            if granularity:
+                print_period_breakdown(db, week_start, week_end, granularity)
+
             # Trend analysis
             print(f"\n📈 Trend Analysis:")
             print("=" * 60)
@@ -162,3 +179,34 @@ def show_weight_stats(args: argparse.Namespace) -> int:
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
+
+
+def print_period_breakdown(db, start_date, end_date, granularity: str) -> None:
+    """Print per-period statistics, with rolling means for daily breakdowns."""
+    # pylint: disable=import-outside-toplevel
+    from tabulate import tabulate
+
+    from src.lib.weight_stats import WeightStatisticsEngine
+
+    engine = WeightStatisticsEngine(db)
+    frame = engine.resample(start_date, end_date, granularity)
+    headers = ["Period", "Count", "Mean", "Min", "Max", "Change"]
+    rows = [
+        [
+            row.period.strftime("%Y-%m-%d"),
+            row.count,
+            f"{row.mean_kg:.1f}",
+            f"{row.min_kg:.1f}",
+            f"{row.max_kg:.1f}",
+            f"{row.last_kg - row.first_kg:+.1f}",
+        ]
+        for row in frame.itertuples(index=False)
+    ]
+    if granularity == "day":
+        rolling = engine.rolling_means(start_date, end_date)
+        headers += ["7-Day Avg", "30-Day Avg"]
+        for row, means in zip(rows, rolling.itertuples(index=False)):
+            row += [f"{means.rolling_7d_kg:.1f}", f"{means.rolling_30d_kg:.1f}"]
+
+    print(f"\n📅 By {granularity}:")
+    print(tabulate(rows, headers=headers, tablefmt="simple", disable_numparse=True))
@@ -0,0 +1,48 @@
+"""
+lazy.py
+
+Lazily imported CLI command handlers.
+
+Kept apart from ``cmd_list`` so the CLI entry point can create handlers from
+the cached parser manifest without importing the full command table.
+"""
+
+import argparse
+from collections.abc import Callable
+from functools import lru_cache
+from importlib import import_module
+
+
+def _load_command_callable(module_path: str, func_name: str) -> Callable[[argparse.Namespace], None]:
+    """Import ``module_path`` and return ``func_name`` from it."""
+
+    module = import_module(module_path)
+    function = getattr(module, func_name)
+    if not callable(function):  # pragma: no cover - defensive programming
+        raise TypeError(f"{module_path}.{func_name} is not callable")
+    return function
+
+
+def lazy_command(module_path: str, func_name: str) -> Callable[[argparse.Namespace], None]:
+    """
+    Create a lazily imported CLI command handler.
+
+    The handler module is imported on first call. ``module_path``,
+    ``func_name`` and ``load`` (which imports the handler without running
+    it) are exposed as attributes of the returned function.
+    """
+
+    @lru_cache(maxsize=None)
+    def _load() -> Callable[[argparse.Namespace], None]:
+        return _load_command_callable(module_path, func_name)
+
+    def _command(args: argparse.Namespace) -> None:
+        return _load()(args)
+
+    _command.__name__ = func_name
+    _command.__qualname__ = func_name
+    _command.__doc__ = f"Lazy loader for {module_path}.{func_name}"
+    _command.module_path = module_path  # type: ignore[attr-defined]
+    _command.func_name = func_name  # type: ignore[attr-defined]
+    _command.load = _load  # type: ignore[attr-defined]
+    return _command
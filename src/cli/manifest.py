@@ -0,0 +1,138 @@
+"""
+manifest.py
+
+Precomputed parser manifest for the CLI.
+
+Importing the command table (``cmd_list``) and adding every subcommand to
+argparse dominates start-up for commands that do little work. The manifest
+is a JSON snapshot of the table, grouped by command group and cached next to
+the bytecode in ``__pycache__``. It is rebuilt whenever ``cmd_list.py``
+changes, and the entry point only builds subparsers for the group that is
+being invoked.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+MANIFEST_VERSION = 1
+
+_CMD_LIST_PATH = os.path.join(os.path.dirname(__file__), "cmd_list.py")
+DEFAULT_MANIFEST_PATH = os.path.join(
+    os.path.dirname(__file__), "__pycache__", "cli_manifest.json"
+)
+
+# Argument types that can be stored in the manifest by name
+_TYPES = {"str": str, "int": int, "float": float}
+
+
+def command_group(command_name: str, group_mapping: dict[str, str]) -> tuple[str, str]:
+    """
+    Split a command table key into its group and subcommand name.
+
+    Commands without a known prefix belong to the ``system`` group.
+    """
+    for prefix, group_name in group_mapping.items():
+        if command_name.startswith(prefix):
+            return group_name, command_name[len(prefix):]
+    return "system", command_name
+
+
+def _source_key(group_mapping: dict[str, str]) -> list[Any]:
+    """Identifies the command table and grouping a manifest was built from."""
+    stat = os.stat(_CMD_LIST_PATH)
+    return [MANIFEST_VERSION, stat.st_mtime_ns, stat.st_size, sorted(group_mapping.items())]
+
+
+def build_manifest(group_mapping: dict[str, str]) -> dict[str, Any]:
+    """
+    Build the manifest from ``cmd_list.CLI_COMMANDS``.
+
+    Returns:
+        ``{"source": key, "groups": {group: {subcommand: spec}}}``, where each
+        spec holds the help text, the handler's module and function name and
+        the argparse keyword arguments of every argument (with real types).
+    """
+    from .cmd_list import (  # pylint: disable=import-outside-toplevel
+        CLI_COMMANDS,
+        get_argument_kwargs,
+    )
+
+    groups: dict[str, dict[str, Any]] = {}
+    for command_name, command_config in CLI_COMMANDS.items():
+        group_name, subcommand = command_group(command_name, group_mapping)
+        groups.setdefault(group_name, {})[subcommand] = {
+            "help": command_config.help,
+            "module": command_config.func.module_path,
+            "func": command_config.func.func_name,
+            "args": [
+                {
+                    "name": arg_name,
+                    "positional": arg_config.positional,
+                    "short": arg_config.short,
+                    "dest": arg_config.dest,
+                    "kwargs": get_argument_kwargs(arg_config),
+                }
+                for arg_name, arg_config in command_config.args.items()
+            ],
+        }
+    return {"source": _source_key(group_mapping), "groups": groups}
+
+
+def _encode_types(manifest: dict[str, Any]) -> dict[str, Any]:
+    """Copy of the manifest with argument types replaced by their names."""
+    names = {value: name for name, value in _TYPES.items()}
+    return json.loads(json.dumps(manifest, default=lambda value: names[value]))
+
+
+def _decode_types(manifest: dict[str, Any]) -> dict[str, Any]:
+    for commands in manifest["groups"].values():
+        for spec in commands.values():
+            for arg in spec["args"]:
+                if "type" in arg["kwargs"]:
+                    arg["kwargs"]["type"] = _TYPES[arg["kwargs"]["type"]]
+    return manifest
+
+
+def _write_manifest(manifest: dict[str, Any], path: str) -> None:
+    try:
+        encoded = _encode_types(manifest)
+    except (KeyError, TypeError, ValueError):
+        # A custom argument type or default cannot be stored: skip caching
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(encoded, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Read-only installs simply run without a cached manifest
+        pass
+
+
+def load_manifest(
+    group_mapping: dict[str, str], path: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Load the cached manifest, rebuilding it if ``cmd_list.py`` changed.
+
+    Args:
+        group_mapping: Command prefix -> group name
+        path: Cache file (defaults to ``__pycache__/cli_manifest.json``)
+
+    Returns:
+        The manifest, with argument types resolved
+    """
+    path = path or DEFAULT_MANIFEST_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("source") == json.loads(json.dumps(_source_key(group_mapping))):
+            return _decode_types(cached)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    manifest = build_manifest(group_mapping)
+    _write_manifest(manifest, path)
+    return manifest
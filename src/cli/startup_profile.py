@@ -0,0 +1,167 @@
+"""
+startup_profile.py
+
+Start-up profiling mode for the CLI (``onsendo --profile-startup ...``).
+
+The command line is re-run in child processes that stop right after the
+command's handler has been imported, so nothing is executed. One child
+reports the time spent in each start-up phase; a second runs under
+``python -X importtime`` to attribute import time to top-level packages.
+The total is compared against ``STARTUP_BUDGET_MS``.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+STARTUP_BUDGET_MS = 300.0
+"""Target time from interpreter start until the command's handler is ready."""
+
+PROBE_ENV = "ONSENDO_STARTUP_PROBE"
+"""Set in child processes: stop after importing the handler and report."""
+
+PROBE_MARKER = "ONSENDO_STARTUP_PROBE "
+
+HEAVY_PACKAGES = (
+    "folium",
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "plotly",
+    "scipy",
+    "seaborn",
+    "selenium",
+    "sklearn",
+    "statsmodels",
+)
+"""Packages that should only be imported by commands that use them."""
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+@dataclass
+class StartupProfile:
+    """Timings of one CLI start-up, in milliseconds."""
+
+    argv: list[str]
+    total_ms: float
+    phases: dict[str, float]
+    handler: Optional[str]
+    heavy_packages: list[str]
+    package_imports_ms: dict[str, float] = field(default_factory=dict)
+    budget_ms: float = STARTUP_BUDGET_MS
+
+    @property
+    def within_budget(self) -> bool:
+        return self.total_ms <= self.budget_ms
+
+
+def report_probe(phases: dict[str, float], handler: Optional[str]) -> None:
+    """Print the probe result (called by the child process, then it exits)."""
+    loaded = {name.partition(".")[0] for name in sys.modules}
+    payload = {
+        "phases": phases,
+        "handler": handler,
+        "heavy_packages": sorted(loaded.intersection(HEAVY_PACKAGES)),
+    }
+    print(PROBE_MARKER + json.dumps(payload))
+
+
+def _run_probe(argv: list[str], python_flags: list[str]) -> tuple[float, dict, str]:
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    env = dict(os.environ, **{PROBE_ENV: "1"})
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *python_flags, "-m", "src.cli", *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for line in result.stdout.splitlines():
+        if line.startswith(PROBE_MARKER):
+            return elapsed_ms, json.loads(line[len(PROBE_MARKER):]), result.stderr
+    raise RuntimeError(
+        f"Start-up probe did not report (exit code {result.returncode}):\n{result.stderr.strip()}"
+    )
+
+
+def package_import_times(importtime_output: str, project_package: str = "src") -> dict[str, float]:
+    """
+    Cumulative import time (ms) per top-level package from ``-X importtime`` output.
+
+    Project modules are looked through: each import is attributed to the
+    outermost package that is not part of ``project_package``, keyed with the
+    project module that imported it, so ``sqlalchemy`` pulled in by
+    ``src.db.models`` is reported as ``sqlalchemy (via src.db.models)``.
+    """
+    # importtime prints children before their parent, indented one level deeper
+    pending: list[tuple[int, str, float, list]] = []
+    for line in importtime_output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        level = (len(match.group(3)) - 1) // 2
+        children = []
+        while pending and pending[-1][0] > level:
+            children.insert(0, pending.pop())
+        pending.append((level, match.group(4), int(match.group(2)) / 1000, children))
+
+    totals: dict[str, float] = {}
+    stack = [(node, None) for node in pending]
+    while stack:
+        (_, name, cumulative_ms, children), importer = stack.pop()
+        package = name.partition(".")[0]
+        if package == project_package:
+            stack.extend((child, name) for child in children)
+            continue
+        key = f"{package} (via {importer})" if importer else package
+        totals[key] = totals.get(key, 0.0) + cumulative_ms
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def profile_startup(argv: list[str], runs: int = 3) -> StartupProfile:
+    """
+    Measure how long the CLI takes to get ready to run ``argv``.
+
+    Args:
+        argv: Command line without ``--profile-startup``
+        runs: Timing runs; the fastest is reported (to filter out noise)
+
+    Returns:
+        The start-up profile
+    """
+    timings = [_run_probe(argv, [])[:2] for _ in range(max(1, runs))]
+    elapsed_ms, payload = min(timings, key=lambda timing: timing[0])
+
+    _, _, importtime = _run_probe(argv, ["-X", "importtime"])
+    return StartupProfile(
+        argv=argv,
+        total_ms=elapsed_ms,
+        phases=payload["phases"],
+        handler=payload["handler"],
+        heavy_packages=payload["heavy_packages"],
+        package_imports_ms=package_import_times(importtime),
+    )
+
+
+def print_startup_profile(profile: StartupProfile, top: int = 10) -> None:
+    """Print a start-up profile."""
+    status = "within budget" if profile.within_budget else "OVER BUDGET"
+    print(f"Start-up profile: onsendo {' '.join(profile.argv)}")
+    print(f"Handler: {profile.handler or '(none)'}")
+    print(f"Total: {profile.total_ms:.0f} ms ({status}, budget {profile.budget_ms:.0f} ms)")
+    print("Phases (in process):")
+    for phase, ms in profile.phases.items():
+        print(f"  {phase:<20} {ms:8.1f} ms")
+    print("Slowest package imports (-X importtime, inflated by tracing):")
+    for package, ms in list(profile.package_imports_ms.items())[:top]:
+        print(f"  {ms:8.1f} ms  {package}")
+    if profile.heavy_packages:
+        print(f"Heavy packages loaded: {', '.join(profile.heavy_packages)}")
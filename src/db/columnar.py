@@ -0,0 +1,248 @@
+"""
+Columnar reads from the database into typed DataFrames.
+
+Rows are fetched with Core ``select`` statements over only the requested
+columns, so no ORM objects are built, and each column is converted to a
+typed array in a single pass using the SQLAlchemy column type:
+
+- Float columns become ``float64`` (NULL -> NaN)
+- Integer columns become ``int64``, or ``float64`` when they contain NULLs
+- Boolean columns become ``bool``, or ``object`` when they contain NULLs
+- DateTime/Date columns become ``datetime64[ns]`` (NULL -> NaT)
+- everything else stays ``object``
+
+The nullable fallbacks match what ``pd.DataFrame`` infers from Python rows,
+so callers see the same dtypes as before without NA-aware extension types.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, select
+from sqlalchemy.orm import Session
+
+FLOAT = "float64"
+INTEGER = "int64"
+BOOLEAN = "bool"
+DATETIME = "datetime64[ns]"
+OBJECT = "object"
+
+
+def column_dtypes(model: Any) -> dict[str, str]:
+    """
+    Map each column of a model's table to the dtype it is read into.
+
+    Args:
+        model: Declarative model class (e.g. ``OnsenVisit``)
+
+    Returns:
+        Column name -> dtype name
+    """
+    dtypes = {}
+    for column in model.__table__.columns:
+        if isinstance(column.type, Boolean):
+            dtypes[column.name] = BOOLEAN
+        elif isinstance(column.type, Integer):
+            dtypes[column.name] = INTEGER
+        elif isinstance(column.type, Float):
+            dtypes[column.name] = FLOAT
+        elif isinstance(column.type, (DateTime, Date)):
+            dtypes[column.name] = DATETIME
+        else:
+            dtypes[column.name] = OBJECT
+    return dtypes
+
+
+def _typed_array(values: Sequence[Any], dtype: Optional[str]) -> Any:
+    if dtype == FLOAT:
+        try:
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy()
+    if dtype == INTEGER:
+        if any(value is None for value in values):
+            return np.array(values, dtype=np.float64)
+        return np.array(values, dtype=np.int64)
+    if dtype == BOOLEAN:
+        if any(value is None for value in values):
+            return np.array(values, dtype=object)
+        return np.array(values, dtype=bool)
+    if dtype == DATETIME:
+        return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").to_numpy()
+    if dtype == OBJECT:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    # Unknown columns (e.g. aggregates) get the same inference as row-wise construction
+    return pd.Series(values, dtype=None if values else object).to_numpy()
+
+
+def frame_from_rows(
+    rows: Sequence[Sequence[Any]],
+    columns: Sequence[str],
+    dtypes: Optional[dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame column by column from fetched row tuples.
+
+    Columns without a known dtype get pandas' usual type inference.
+
+    Args:
+        rows: Result rows, in ``columns`` order
+        columns: Column labels
+        dtypes: Optional column name -> dtype (see ``column_dtypes``)
+
+    Returns:
+        DataFrame with one typed array per column
+    """
+    dtypes = dtypes or {}
+    if rows:
+        values_by_column = list(zip(*rows))
+    else:
+        values_by_column = [() for _ in columns]
+
+    data = {
+        name: _typed_array(values, dtypes.get(name))
+        for name, values in zip(columns, values_by_column)
+    }
+    return pd.DataFrame(data, columns=list(columns), copy=False)
+
+
+def result_to_frame(result: Any, dtypes: Optional[dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Read an executed SQLAlchemy result into a DataFrame.
+
+    Args:
+        result: Result of ``session.execute``
+        dtypes: Optional column name -> dtype for the result labels
+
+    Returns:
+        DataFrame with one typed array per result column
+    """
+    columns = list(result.keys())
+    return frame_from_rows(result.fetchall(), columns, dtypes)
+
+
+def fetch_columns(
+    session: Session,
+    model: Any,
+    columns: Optional[Iterable[str]] = None,
+    where: Iterable[Any] = (),
+    order_by: Optional[Any] = None,
+) -> pd.DataFrame:
+    """
+    Fetch selected columns of a model's table into a typed DataFrame.
+
+    Args:
+        session: Database session
+        model: Declarative model class
+        columns: Column names to read (default: every column)
+        where: SQLAlchemy filter clauses, combined with AND
+        order_by: Optional ordering clause
+
+    Returns:
+        DataFrame with the requested columns, in the requested order
+
+    Raises:
+        ValueError: If a requested column does not exist on the table
+    """
+    table = model.__table__
+    names = list(dict.fromkeys(columns)) if columns is not None else list(table.columns.keys())
+    unknown = [name for name in names if name not in table.columns]
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {', '.join(unknown)}")
+
+    statement = select(*(table.columns[name] for name in names))
+    for clause in where:
+        statement = statement.where(clause)
+    if order_by is not None:
+        statement = statement.order_by(order_by)
+
+    result = session.execute(statement)
+    return frame_from_rows(result.fetchall(), names, column_dtypes(model))
+
+
+
+def _driver_values(values: Any) -> list[Any]:
+    """Convert a column array to values the SQLite driver stores directly."""
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.datetime64):
+        # Same text format SQLAlchemy's SQLite DateTime type writes and parses
+        text = np.char.replace(np.datetime_as_string(array, unit="us"), "T", " ").astype(object)
+        text[np.isnat(array)] = None
+        return text.tolist()
+    if np.issubdtype(array.dtype, np.floating):
+        nulls = np.isnan(array)
+        if nulls.any():
+            converted = array.astype(object)
+            converted[nulls] = None
+            return converted.tolist()
+    return array.tolist()
+
+
+def insert_columns(
+    session: Session,
+    model: Any,
+    columns: dict[str, Any],
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Bulk insert column arrays into a model's table.
+
+    Each batch is sent as one driver-level ``executemany`` of plain tuples,
+    skipping per-row ORM and bind-parameter processing, which dominate the
+    cost of large inserts. Python-side column defaults of the model (e.g.
+    ``created_at``) are evaluated once per batch. The caller commits.
+
+    Args:
+        session: Database session (SQLite)
+        model: Declarative model class
+        columns: Column name -> equal-length array (NaN, NaT and None become NULL)
+        batch_size: Rows per ``executemany``
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        ValueError: If a column does not exist or the arrays differ in length
+    """
+    table = model.__table__
+    unknown = [name for name in columns if name not in table.columns]
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {', '.join(unknown)}")
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+    total = lengths.pop() if lengths else 0
+
+    defaults = [
+        column
+        for column in table.columns
+        if column.name not in columns and column.default is not None and not column.primary_key
+    ]
+    names = list(columns) + [column.name for column in defaults]
+
+    connection = session.connection()
+    preparer = connection.dialect.identifier_preparer
+    statement = (
+        f"INSERT INTO {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(name) for name in names)}) "
+        f"VALUES ({', '.join('?' * len(names))})"
+    )
+
+    for start in range(0, total, batch_size):
+        stop = min(start + batch_size, total)
+        values_by_column = [_driver_values(columns[name][start:stop]) for name in columns]
+        for column in defaults:
+            value = column.default.arg(None) if column.default.is_callable else column.default.arg
+            if isinstance(value, datetime):
+                value = value.isoformat(sep=" ", timespec="microseconds")
+            values_by_column.append([value] * (stop - start))
+        connection.exec_driver_sql(statement, list(zip(*values_by_column)))
+
+    return total
@@ -1,12 +1,170 @@
 import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any
 
 from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 from src.db.models import Onsen
+from src.lib.cache import CacheNamespace, clear_recommendation_cache
 
+READ_CHUNK_SIZE = 64 * 1024
+"""Characters read from the JSON file at a time while streaming."""
 
-def import_onsen_data(db: Session, json_path: str) -> dict[str, int]:  # pylint: disable=too-complex
+UPSERT_BATCH_SIZE = 500
+"""Rows per ``INSERT ... ON CONFLICT DO UPDATE`` executemany."""
+
+# Columns present in the Onsen model and supported by mapped_data
+ONSEN_FIELDS = [
+    "ban_number",
+    "name",
+    "region",
+    "latitude",
+    "longitude",
+    "description",
+    "business_form",
+    "address",
+    "phone",
+    "admission_fee",
+    "usage_time",
+    "closed_days",
+    "private_bath",
+    "spring_quality",
+    "nearest_bus_stop",
+    "nearest_station",
+    "parking",
+    "remarks",
+]
+
+LOCATION_FIELDS = ("latitude", "longitude")
+
+
+def iter_json_object(json_path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Yield the key/value pairs of a top-level JSON object one at a time.
+
+    Only the entry being decoded is held in memory, so large scraped files
+    (which embed the raw HTML of every page) never have to be loaded whole.
+
+    Args:
+        json_path: Path to a JSON file whose top level is an object
+        chunk_size: Characters read from the file at a time
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON object
+    """
+    decoder = json.JSONDecoder()
+    with open(json_path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+
+        def read_more() -> bool:
+            nonlocal buffer, pos
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def peek() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not read_more():
+                    raise ValueError(f"Unexpected end of JSON in {json_path}")
+
+        def expect(allowed: str) -> str:
+            nonlocal pos
+            char = peek()
+            if char not in allowed:
+                raise ValueError(f"Expected one of {allowed!r} in {json_path}, found {char!r}")
+            pos += 1
+            return char
+
+        def decode_value() -> Any:
+            nonlocal pos
+            peek()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Value may be cut off at the end of the buffer
+                    if not read_more():
+                        raise
+                    continue
+                # A number at the very end of the buffer may continue in the next chunk
+                if end == len(buffer) and read_more():
+                    continue
+                pos = end
+                return value
+
+        expect("{")
+        if peek() == "}":
+            return
+        while True:
+            key = decode_value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected a string key in {json_path}, found {key!r}")
+            expect(":")
+            yield key, decode_value()
+            if expect(",}") == "}":
+                return
+
+
+@dataclass
+class OnsenChanges:
+    """Rows an import wrote, grouped for dependent refreshes."""
+
+    inserted: list[int] = field(default_factory=list)
+    updated: list[int] = field(default_factory=list)
+    moved: list[int] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def _upsert(db: Session, rows: list[dict[str, Any]], conflict_column: str) -> None:
+    """Insert rows, updating every field of rows that conflict on ``conflict_column``."""
+    if not rows:
+        return
+    statement = insert(Onsen)
+    update_columns = ["id", *ONSEN_FIELDS]
+    statement = statement.on_conflict_do_update(
+        index_elements=[conflict_column],
+        set_={column: statement.excluded[column] for column in update_columns if column != conflict_column},
+    )
+    db.execute(statement, rows)
+
+
+def _refresh_dependents(changes: OnsenChanges) -> None:
+    """
+    Invalidate derived data that depends on the rows that changed.
+
+    Distance milestones are computed over every onsen location, and cached
+    distances are keyed by location, so both are dropped only when an onsen
+    was added or moved. Parsed schedules are not persisted: recommendation
+    engines re-parse an onsen's usage time when its raw text differs from
+    what they cached.
+    """
+    if changes.inserted or changes.moved:
+        clear_recommendation_cache(CacheNamespace.MILESTONES)
+        clear_recommendation_cache(CacheNamespace.DISTANCE)
+        logger.info(
+            f"Cleared distance caches: {len(changes.inserted)} onsens added, "
+            f"{len(changes.moved)} moved"
+        )
+
+
+def import_onsen_data(  # pylint: disable=too-complex
+    db: Session,
+    json_path: str,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> dict[str, int]:
     """
     Import onsens from a scraped JSON file and upsert into the database.
 
@@ -26,100 +184,106 @@ def import_onsen_data(db: Session, json_path: str) -> dict[str, int]:  # pylint:
     }
     ```
 
-    Returns a summary dict with counts for inserted and updated rows.
+    The file is streamed entry by entry and diffed against the existing rows,
+    which are read by ``ban_number`` in a single query. Only new and changed
+    onsens are written, with batched ``INSERT ... ON CONFLICT DO UPDATE``
+    statements, in one transaction: a malformed file imports nothing.
+    Dependent caches are refreshed only when locations changed.
+
+    Returns a summary dict with counts for inserted, updated, unchanged and
+    skipped rows.
     """
-    try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        # Broad exception needed for file I/O and JSON parsing errors
-        logger.error(f"Failed to read JSON from {json_path}: {exc}")
-        return {"inserted": 0, "updated": 0, "skipped": 0}
+    existing = {
+        row.ban_number: row
+        for row in db.execute(select(Onsen.id, *(getattr(Onsen, f) for f in ONSEN_FIELDS)))
+    }
+    existing_ids = {row.id: row.ban_number for row in existing.values()}
 
-    inserted = 0
-    updated = 0
+    changes = OnsenChanges()
     skipped = 0
+    # Rows are written in file order: a batch holds consecutive rows matched
+    # on the same column and is flushed before a row matched on the other one
+    pending: list[dict[str, Any]] = []
+    pending_column = "ban_number"
 
-    # Columns present in the Onsen model and supported by mapped_data
-    onsen_fields = [
-        "ban_number",
-        "name",
-        "region",
-        "latitude",
-        "longitude",
-        "description",
-        "business_form",
-        "address",
-        "phone",
-        "admission_fee",
-        "usage_time",
-        "closed_days",
-        "private_bath",
-        "spring_quality",
-        "nearest_bus_stop",
-        "nearest_station",
-        "parking",
-        "remarks",
-    ]
-
-    for onsen_id_str, payload in data.items():
-        try:
-            onsen_id = int(onsen_id_str)
-        except Exception:  # pylint: disable=broad-exception-caught
-            # Broad exception needed for type conversion errors
-            logger.warning(f"Skipping entry with non-integer key: {onsen_id_str}")
-            skipped += 1
-            continue
-
-        mapped: dict[str, Any] = payload.get("mapped_data") or {}
-
-        # Basic validation of required fields
-        if (
-            not mapped.get("ban_number")
-            or not mapped.get("name")
-            or not mapped.get("region")
-        ):
-            logger.warning(
-                f"Skipping onsen_id={onsen_id}: missing required fields in mapped_data"
-            )
-            skipped += 1
-            continue
-
-        # Build values for the Onsen model
-        values: dict[str, Any] = {field: mapped.get(field) for field in onsen_fields}
-
-        existing = db.query(Onsen).filter(Onsen.id == onsen_id).first()
-        if existing:
-            for key, val in values.items():
-                setattr(existing, key, val)
-            updated += 1
-        else:
-            # Try to find by unique ban_number if id not found
-            existing_by_ban = (
-                db.query(Onsen).filter(Onsen.ban_number == values["ban_number"]).first()
-            )
-            if existing_by_ban:
-                # Update fields and attempt to set the id to the scraped id
-                for key, val in values.items():
-                    setattr(existing_by_ban, key, val)
-                try:
-                    existing_by_ban.id = onsen_id
-                    updated += 1
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    # Broad exception needed for database constraint errors
-                    logger.warning(
-                        f"Could not update primary key for ban={values['ban_number']} to id={onsen_id}: {exc}"
-                    )
-                    updated += 1
+    try:
+        for onsen_id_str, payload in iter_json_object(json_path):
+            try:
+                onsen_id = int(onsen_id_str)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Broad exception needed for type conversion errors
+                logger.warning(f"Skipping entry with non-integer key: {onsen_id_str}")
+                skipped += 1
+                continue
+
+            mapped: dict[str, Any] = (payload or {}).get("mapped_data") or {}
+
+            # Basic validation of required fields
+            if (
+                not mapped.get("ban_number")
+                or not mapped.get("name")
+                or not mapped.get("region")
+            ):
+                logger.warning(
+                    f"Skipping onsen_id={onsen_id}: missing required fields in mapped_data"
+                )
+                skipped += 1
+                continue
+
+            # Build values for the Onsen model
+            values: dict[str, Any] = {"id": onsen_id}
+            values.update({f: mapped.get(f) for f in ONSEN_FIELDS})
+
+            current = existing.get(values["ban_number"])
+            if current is None and onsen_id in existing_ids:
+                # Same id under a different ban number: update that row in place
+                current = existing[existing_ids[onsen_id]]
+                conflict_column = "id"
+            else:
+                conflict_column = "ban_number"
+
+            if current is None:
+                changes.inserted.append(onsen_id)
+            elif current.id == onsen_id and all(getattr(current, f) == values[f] for f in ONSEN_FIELDS):
+                changes.unchanged += 1
+                continue
             else:
-                new_onsen = Onsen(id=onsen_id, **values)
-                db.add(new_onsen)
-                inserted += 1
+                changes.updated.append(onsen_id)
+                if any(getattr(current, f) != values[f] for f in LOCATION_FIELDS):
+                    changes.moved.append(onsen_id)
 
-    db.commit()
+            if pending and (conflict_column != pending_column or len(pending) >= batch_size):
+                _upsert(db, pending, pending_column)
+                pending.clear()
+            pending_column = conflict_column
+            pending.append(values)
 
-    summary = {"inserted": inserted, "updated": updated, "skipped": skipped}
+            # Later duplicates in the file are diffed against this entry
+            if current is not None and current.ban_number != values["ban_number"]:
+                existing.pop(current.ban_number, None)
+            existing[values["ban_number"]] = SimpleNamespace(**values)
+            existing_ids[onsen_id] = values["ban_number"]
+
+        _upsert(db, pending, pending_column)
+        db.commit()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        # Broad exception needed for file I/O, JSON parsing and database errors
+        db.rollback()
+        logger.error(f"Failed to import JSON from {json_path}: {exc}")
+        return {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+    _refresh_dependents(changes)
+
+    inserted = len(changes.inserted)
+    updated = len(changes.updated)
+    summary = {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": changes.unchanged,
+        "skipped": skipped,
+    }
     logger.info(
-        f"Onsen import from JSON complete. Inserted: {inserted}, Updated: {updated}, Skipped: {skipped}"
+        f"Onsen import from JSON complete. Inserted: {inserted}, Updated: {updated}, "
+        f"Unchanged: {changes.unchanged}, Skipped: {skipped}"
     )
     return summary
@@ -0,0 +1,108 @@
+"""
+Keyset-paginated streaming of query rows.
+
+Listing commands select only the columns they display with a Core ``select``
+and read it through :func:`iter_keyset`. Rows are fetched in batches ordered
+by a sort key with the row id as tie-breaker; each batch continues strictly
+after the last row of the previous one (``WHERE (key, id) > (last key, last
+id)``), so every batch is an index range scan and rows are yielded as soon
+as they arrive, without loading the whole table.
+
+NULL sort keys are ordered after all non-NULL keys in both directions.
+
+No pandas or numpy is imported here, so the listing commands stay cheap to
+start.
+"""
+
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+DEFAULT_BATCH_SIZE = 200
+
+
+def _after_condition(
+    key: ColumnElement,
+    id_column: ColumnElement,
+    last_key: Any,
+    last_id: Any,
+    descending: bool,
+) -> ColumnElement:
+    """Rows that sort strictly after ``(last_key, last_id)``."""
+    if last_key is None:
+        # Already among the trailing NULL keys
+        return and_(key.is_(None), id_column < last_id if descending else id_column > last_id)
+
+    key_after = key < last_key if descending else key > last_key
+    id_after = id_column < last_id if descending else id_column > last_id
+    return or_(key.is_(None), key_after, and_(key == last_key, id_after))
+
+
+def iter_keyset(
+    session: Session,
+    statement: Select,
+    key: ColumnElement,
+    id_column: ColumnElement,
+    *,
+    descending: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    after: Optional[Any] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Row]:
+    """
+    Stream the rows of a statement in keyset-paginated batches.
+
+    Args:
+        session: Database session
+        statement: ``select`` of the columns to return; must include ``key`` and ``id_column``
+        key: Column to sort by
+        id_column: Unique id column, used to break ties in ``key`` and as the cursor
+        descending: Sort from the highest key down
+        limit: Maximum number of rows to return (default: all)
+        offset: Number of rows to skip first
+        after: Id of the row to continue after (e.g. the last one shown by a previous page)
+        batch_size: Rows fetched per query
+
+    Yields:
+        Result rows, in order
+
+    Raises:
+        ValueError: If ``after`` does not identify a row
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    last: Optional[tuple[Any, Any]] = None
+    if after is not None:
+        cursor = session.execute(select(key).where(id_column == after)).first()
+        if cursor is None:
+            raise ValueError(f"No row with id {after} to continue after")
+        last = (cursor[0], after)
+
+    direction = (lambda column: column.desc()) if descending else (lambda column: column.asc())
+    ordered = statement.order_by(key.is_(None), direction(key), direction(id_column))
+
+    remaining = limit
+    skip = offset
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        page = ordered
+        if last is not None:
+            page = page.where(_after_condition(key, id_column, last[0], last[1], descending))
+        if skip:
+            page = page.offset(skip)
+            skip = 0
+
+        rows = session.execute(page.limit(size)).all()
+        yield from rows
+
+        if len(rows) < size:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        mapping = rows[-1]._mapping
+        last = (mapping[key], mapping[id_column])
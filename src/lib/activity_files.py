@@ -0,0 +1,459 @@
+"""
+Streaming writers for activity files (GPX, TCX and FIT).
+
+Each writer consumes an iterator of ``TrackPoint``s and writes every point to
+the file as it arrives, so no document tree or per-point object list is
+built: memory does not grow with the length of the activity, and the work is
+dominated by the file writes.
+
+FIT files are encoded directly (definition and data messages plus the CRC),
+following the FIT protocol's activity file layout: file_id, a start event,
+records, a stop event, one lap, one session and the activity message.
+"""
+
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, NamedTuple, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+
+class TrackPoint(NamedTuple):
+    """One sample of an activity; fields without data are None."""
+
+    time: datetime
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    altitude_m: Optional[float] = None
+    heart_rate: Optional[float] = None
+    distance_m: Optional[float] = None
+    speed_mps: Optional[float] = None
+    cadence: Optional[float] = None
+
+
+@dataclass
+class ActivityTotals:
+    """Activity-level values written to TCX laps and FIT lap/session messages."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    start_time: datetime
+    elapsed_time_s: float
+    moving_time_s: float
+    sport: str = "other"  # running, cycling, swimming, walking, hiking, training, other
+    distance_m: Optional[float] = None
+    calories: Optional[int] = None
+    avg_heart_rate: Optional[float] = None
+    max_heart_rate: Optional[float] = None
+
+
+@contextmanager
+def atomic_output(path: Path, mode: str = "w") -> Iterator[IO]:
+    """
+    Open a temporary file next to ``path`` and move it into place on success.
+
+    A failed or interrupted export never leaves a truncated file behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    binary = "b" in mode
+    try:
+        with open(
+            tmp_path,
+            mode,
+            encoding=None if binary else "utf-8",
+            newline=None if binary else "",
+        ) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def to_naive_utc(time: datetime) -> datetime:
+    """
+    Convert a timezone-aware time to naive UTC; naive times are taken as UTC already.
+
+    The writers expect naive UTC times: they append ``Z`` to ISO timestamps
+    and subtract the naive FIT epoch.
+    """
+    if time.tzinfo is None:
+        return time
+    return time.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _iso(time: datetime) -> str:
+    return time.isoformat() + "Z"
+
+
+# GPX
+
+
+def write_gpx(
+    f: IO[str],
+    name: str,
+    activity_type: str,
+    start_time: datetime,
+    points: Iterable[TrackPoint],
+) -> int:
+    """
+    Write a GPX 1.1 track, one point at a time.
+
+    Points without a position are skipped; heart rate goes in a per-point
+    ``<extensions><hr>`` element.
+
+    Returns:
+        Number of track points written
+    """
+    f.write(
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        '<gpx version="1.1" creator="Onsendo Strava Integration" '
+        'xmlns="http://www.topografix.com/GPX/1/1" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://www.topografix.com/GPX/1/1 '
+        'http://www.topografix.com/GPX/1/1/gpx.xsd">\n'
+        "  <metadata>\n"
+        f"    <name>{escape(name)}</name>\n"
+        f"    <time>{_iso(start_time)}</time>\n"
+        "  </metadata>\n"
+        "  <trk>\n"
+        f"    <name>{escape(name)}</name>\n"
+        f"    <type>{escape(activity_type)}</type>\n"
+        "    <trkseg>\n"
+    )
+    write = f.write
+    count = 0
+    for point in points:
+        if point.lat is None or point.lon is None:
+            continue
+        parts = [f'      <trkpt lat="{point.lat}" lon="{point.lon}">\n']
+        if point.altitude_m is not None:
+            parts.append(f"        <ele>{point.altitude_m}</ele>\n")
+        parts.append(f"        <time>{_iso(point.time)}</time>\n")
+        if point.heart_rate is not None:
+            parts.append(
+                "        <extensions>\n"
+                f"          <hr>{int(point.heart_rate)}</hr>\n"
+                "        </extensions>\n"
+            )
+        parts.append("      </trkpt>\n")
+        write("".join(parts))
+        count += 1
+    f.write("    </trkseg>\n  </trk>\n</gpx>\n")
+    return count
+
+
+# TCX
+
+_TCX_SPORTS = {"running": "Running", "cycling": "Biking"}
+
+
+def write_tcx(f: IO[str], totals: ActivityTotals, points: Iterable[TrackPoint]) -> int:
+    """
+    Write a Garmin Training Center (TCX v2) activity with a single lap.
+
+    Unlike GPX, TCX keeps points without a position, so indoor activities
+    keep their heart rate, distance and cadence.
+
+    Returns:
+        Number of track points written
+    """
+    lap = [
+        f"        <TotalTimeSeconds>{float(totals.elapsed_time_s)}</TotalTimeSeconds>\n",
+        f"        <DistanceMeters>{float(totals.distance_m or 0.0)}</DistanceMeters>\n",
+        f"        <Calories>{int(totals.calories or 0)}</Calories>\n",
+    ]
+    if totals.avg_heart_rate:
+        lap.append(
+            "        <AverageHeartRateBpm><Value>"
+            f"{int(round(totals.avg_heart_rate))}</Value></AverageHeartRateBpm>\n"
+        )
+    if totals.max_heart_rate:
+        lap.append(
+            "        <MaximumHeartRateBpm><Value>"
+            f"{int(round(totals.max_heart_rate))}</Value></MaximumHeartRateBpm>\n"
+        )
+    lap.append("        <Intensity>Active</Intensity>\n        <TriggerMethod>Manual</TriggerMethod>\n")
+
+    f.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2 '
+        'http://www.garmin.com/xmlschemas/TrainingCenterDatabasev2.xsd">\n'
+        "  <Activities>\n"
+        f"    <Activity Sport={quoteattr(_TCX_SPORTS.get(totals.sport, 'Other'))}>\n"
+        f"      <Id>{_iso(totals.start_time)}</Id>\n"
+        f'      <Lap StartTime="{_iso(totals.start_time)}">\n'
+        + "".join(lap)
+        + "        <Track>\n"
+    )
+    write = f.write
+    count = 0
+    for point in points:
+        parts = ["          <Trackpoint>\n", f"            <Time>{_iso(point.time)}</Time>\n"]
+        if point.lat is not None and point.lon is not None:
+            parts.append(
+                "            <Position>"
+                f"<LatitudeDegrees>{point.lat}</LatitudeDegrees>"
+                f"<LongitudeDegrees>{point.lon}</LongitudeDegrees>"
+                "</Position>\n"
+            )
+        if point.altitude_m is not None:
+            parts.append(f"            <AltitudeMeters>{point.altitude_m}</AltitudeMeters>\n")
+        if point.distance_m is not None:
+            parts.append(f"            <DistanceMeters>{point.distance_m}</DistanceMeters>\n")
+        if point.heart_rate:
+            parts.append(
+                f"            <HeartRateBpm><Value>{int(point.heart_rate)}</Value></HeartRateBpm>\n"
+            )
+        if point.cadence is not None:
+            parts.append(f"            <Cadence>{min(int(point.cadence), 254)}</Cadence>\n")
+        parts.append("          </Trackpoint>\n")
+        write("".join(parts))
+        count += 1
+    f.write(
+        "        </Track>\n      </Lap>\n"
+        "      <Creator xsi:type=\"Device_t\"><Name>Onsendo Strava Integration</Name>"
+        "<UnitId>0</UnitId><ProductID>0</ProductID>"
+        "<Version><VersionMajor>1</VersionMajor><VersionMinor>0</VersionMinor></Version>"
+        "</Creator>\n"
+        "    </Activity>\n  </Activities>\n</TrainingCenterDatabase>\n"
+    )
+    return count
+
+
+# FIT
+
+FIT_EPOCH = datetime(1989, 12, 31)
+FIT_HEADER_SIZE = 14
+FIT_PROTOCOL_VERSION = 0x20  # 2.0
+FIT_PROFILE_VERSION = 2132  # 21.32
+
+# Base type: (type byte, struct format, invalid value)
+_ENUM = (0x00, "B", 0xFF)
+_UINT8 = (0x02, "B", 0xFF)
+_UINT16 = (0x84, "H", 0xFFFF)
+_SINT32 = (0x85, "i", 0x7FFFFFFF)
+_UINT32 = (0x86, "I", 0xFFFFFFFF)
+_UINT32Z = (0x8C, "I", 0x00000000)
+
+# Global message numbers
+_FILE_ID, _SESSION, _LAP, _RECORD, _EVENT, _ACTIVITY = 0, 18, 19, 20, 21, 34
+
+_FIT_SPORTS = {
+    "running": (1, 0),
+    "cycling": (2, 0),
+    "swimming": (5, 0),
+    "training": (10, 0),
+    "walking": (11, 0),
+    "hiking": (17, 0),
+    "yoga": (10, 43),
+    "other": (0, 0),
+}
+
+_SEMICIRCLES_PER_DEGREE = 2**31 / 180
+
+
+def _crc_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def fit_crc(data: bytes, crc: int = 0) -> int:
+    """FIT CRC-16 (the CRC-16/ARC polynomial) of ``data``, continuing from ``crc``."""
+    table = _CRC_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def fit_timestamp(time: datetime) -> int:
+    """Seconds since the FIT epoch (1989-12-31 00:00 UTC)."""
+    return int((time - FIT_EPOCH).total_seconds())
+
+
+def _scaled(value: Optional[float], scale: float, offset: float, invalid: int, limit: int) -> int:
+    if value is None:
+        return invalid
+    scaled = int(round((value + offset) * scale))
+    return scaled if 0 <= scaled < limit else invalid
+
+
+class _FitMessages:
+    """Writes FIT definition and data messages, one local type per message."""
+
+    def __init__(self, f: IO[bytes]):
+        self.f = f
+        self._structs: dict[int, struct.Struct] = {}
+
+    def define(self, local_type: int, global_number: int, fields: list[tuple[int, tuple]]) -> None:
+        header = struct.pack("<BBBHB", 0x40 | local_type, 0, 0, global_number, len(fields))
+        definitions = b"".join(
+            struct.pack("<BBB", number, struct.calcsize(base[1]), base[0]) for number, base in fields
+        )
+        self.f.write(header + definitions)
+        self._structs[local_type] = struct.Struct(
+            "<B" + "".join(base[1] for _, base in fields)
+        )
+
+    def write(self, local_type: int, *values: int) -> None:
+        self.f.write(self._structs[local_type].pack(local_type, *values))
+
+    def packer(self, local_type: int):
+        """``struct.pack`` for a defined local type, for writing data messages in a loop."""
+        return self._structs[local_type].pack
+
+
+def write_fit(f: IO[bytes], totals: ActivityTotals, points: Iterable[TrackPoint]) -> int:
+    """
+    Write a FIT activity file, one record message per point.
+
+    ``f`` must be opened for binary reading and writing (``w+b``): the header
+    holds the data size and the trailing CRC covers the whole file, so both
+    are filled in after the records by re-reading the file in chunks.
+
+    Returns:
+        Number of record messages written
+    """
+    f.write(b"\x00" * FIT_HEADER_SIZE)
+    messages = _FitMessages(f)
+    start = fit_timestamp(totals.start_time)
+    end = fit_timestamp(totals.start_time + timedelta(seconds=totals.elapsed_time_s))
+    sport, sub_sport = _FIT_SPORTS.get(totals.sport, _FIT_SPORTS["other"])
+
+    # file_id: type=activity, manufacturer=development
+    messages.define(
+        0,
+        _FILE_ID,
+        [(0, _ENUM), (1, _UINT16), (2, _UINT16), (3, _UINT32Z), (4, _UINT32)],
+    )
+    messages.write(0, 4, 255, 0, 1, start)
+
+    # event: timer start / stop all
+    messages.define(1, _EVENT, [(253, _UINT32), (0, _ENUM), (1, _ENUM)])
+    messages.write(1, start, 0, 0)
+
+    messages.define(
+        2,
+        _RECORD,
+        [
+            (253, _UINT32),
+            (0, _SINT32),
+            (1, _SINT32),
+            (2, _UINT16),
+            (3, _UINT8),
+            (4, _UINT8),
+            (5, _UINT32),
+            (6, _UINT16),
+        ],
+    )
+    pack = messages.packer(2)
+    write = f.write
+    count = 0
+    for point in points:
+        has_position = point.lat is not None and point.lon is not None
+        write(
+            pack(
+                2,
+                fit_timestamp(point.time),
+                int(round(point.lat * _SEMICIRCLES_PER_DEGREE)) if has_position else 0x7FFFFFFF,
+                int(round(point.lon * _SEMICIRCLES_PER_DEGREE)) if has_position else 0x7FFFFFFF,
+                _scaled(point.altitude_m, 5, 500, 0xFFFF, 0xFFFF),
+                _scaled(point.heart_rate, 1, 0, 0xFF, 0xFF),
+                _scaled(point.cadence, 1, 0, 0xFF, 0xFF),
+                _scaled(point.distance_m, 100, 0, 0xFFFFFFFF, 0xFFFFFFFF),
+                _scaled(point.speed_mps, 1000, 0, 0xFFFF, 0xFFFF),
+            )
+        )
+        count += 1
+
+    messages.write(1, end, 0, 4)
+
+    elapsed = _scaled(totals.elapsed_time_s, 1000, 0, 0xFFFFFFFF, 0xFFFFFFFF)
+    timer = _scaled(totals.moving_time_s, 1000, 0, 0xFFFFFFFF, 0xFFFFFFFF)
+    distance = _scaled(totals.distance_m, 100, 0, 0xFFFFFFFF, 0xFFFFFFFF)
+
+    # lap: event=lap, event_type=stop
+    messages.define(
+        3,
+        _LAP,
+        [(253, _UINT32), (2, _UINT32), (7, _UINT32), (8, _UINT32), (9, _UINT32), (0, _ENUM), (1, _ENUM)],
+    )
+    messages.write(3, end, start, elapsed, timer, distance, 9, 1)
+
+    # session: event=session, event_type=stop
+    messages.define(
+        4,
+        _SESSION,
+        [
+            (253, _UINT32),
+            (2, _UINT32),
+            (7, _UINT32),
+            (8, _UINT32),
+            (9, _UINT32),
+            (11, _UINT16),
+            (16, _UINT8),
+            (17, _UINT8),
+            (5, _ENUM),
+            (6, _ENUM),
+            (25, _UINT16),
+            (26, _UINT16),
+            (0, _ENUM),
+            (1, _ENUM),
+        ],
+    )
+    messages.write(
+        4,
+        end,
+        start,
+        elapsed,
+        timer,
+        distance,
+        _scaled(totals.calories, 1, 0, 0xFFFF, 0xFFFF),
+        _scaled(totals.avg_heart_rate, 1, 0, 0xFF, 0xFF),
+        _scaled(totals.max_heart_rate, 1, 0, 0xFF, 0xFF),
+        sport,
+        sub_sport,
+        0,
+        1,
+        8,
+        1,
+    )
+
+    # activity: type=manual, event=activity, event_type=stop
+    messages.define(
+        5,
+        _ACTIVITY,
+        [(253, _UINT32), (0, _UINT32), (1, _UINT16), (2, _ENUM), (3, _ENUM), (4, _ENUM)],
+    )
+    messages.write(5, end, timer, 1, 0, 26, 1)
+
+    data_size = f.tell() - FIT_HEADER_SIZE
+    header = struct.pack(
+        "<BBHI4s", FIT_HEADER_SIZE, FIT_PROTOCOL_VERSION, FIT_PROFILE_VERSION, data_size, b".FIT"
+    )
+    header += struct.pack("<H", fit_crc(header))
+    f.seek(0)
+    f.write(header)
+    f.flush()
+
+    f.seek(0)
+    crc = 0
+    for chunk in iter(lambda: f.read(1 << 16), b""):
+        crc = fit_crc(chunk, crc)
+    f.write(struct.pack("<H", crc))
+    return count
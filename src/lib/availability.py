@@ -0,0 +1,404 @@
+"""
+Vectorized onsen availability.
+
+``AvailabilityIndex`` flattens the parsed opening hours and closed-day rules
+of a whole catalogue into NumPy arrays, one row per time window or closed-day
+rule:
+
+- windows: start/end minute, next-day flag, weekday bitmask, month bitmask,
+  holiday flag, and the owning onsen
+- closed-day rules: weekday / day-of-month / ordinal-week bitmasks,
+  month-day table and holiday flags
+
+"Is each onsen open at T (for at least N more hours)?" then takes a few
+array operations over all rows; rows are stored grouped by onsen and folded
+into per-onsen results with a cumulative sum over each group. Passing many
+times at once (e.g. every half hour of a day) gives an open-now heatmap in
+one call.
+
+The results match ``UsageTimeParsed.is_open`` (with unknown windows counted
+as closed), ``ClosedDaysParsed.is_closed_on`` and the minimum-hours check of
+``OnsenRecommendationEngine`` exactly. Holidays come from the configured
+holiday service.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
+
+from src.lib.parsers.closed_days import (
+    AbsoluteDatesRule,
+    ClosedDaysParsed,
+    MonthlyOrdinalWeekdayRule,
+    MonthlySpecificDaysRule,
+    WeeklyClosedRule,
+)
+from src.lib.parsers.usage_time import UsageTimeParsed, is_holiday
+
+MINUTES_PER_DAY = 24 * 60
+
+# Closed-day rule kinds
+_WEEKLY, _MONTHLY_DAYS, _ORDINAL_WEEKDAY, _ABSOLUTE = range(4)
+
+
+def _mask(values) -> int:
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+def _month_day_slots(rule: AbsoluteDatesRule) -> np.ndarray:
+    """Boolean [13, 32] table of the (month, day) pairs a rule closes on."""
+    slots = np.zeros((13, 32), dtype=bool)
+    for month, day in rule.dates_mmdd:
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            slots[month, day] = True
+    month_days = [(month, day) for month in range(1, 13) for day in range(1, 32)]
+    for start_month, start_day, end_month, end_day in rule.ranges:
+        start, end = (start_month, start_day), (end_month, end_day)
+        for month_day in month_days:
+            inside = (
+                start <= month_day <= end
+                if start <= end
+                else month_day >= start or month_day <= end
+            )
+            if inside:
+                slots[month_day] = True
+    return slots
+
+
+@dataclass
+class _DayFeatures:
+    """Calendar features of a vector of dates (and of the day before each)."""
+
+    weekday: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    week_of_month: np.ndarray
+    holiday: np.ndarray
+    prev_weekday: np.ndarray
+    prev_day: np.ndarray
+    prev_week_of_month: np.ndarray
+    prev_holiday: np.ndarray
+    month_day_slot: np.ndarray
+
+    @classmethod
+    def for_dates(cls, days: Sequence[date]) -> "_DayFeatures":
+        previous = [day - timedelta(days=1) for day in days]
+        holidays = {
+            day: is_holiday(datetime(day.year, day.month, day.day))
+            for day in set(days) | set(previous)
+        }
+
+        def column(values):
+            return np.array(values, dtype=np.int64)
+
+        return cls(
+            weekday=column([day.weekday() for day in days]),
+            month=column([day.month for day in days]),
+            day=column([day.day for day in days]),
+            week_of_month=column([(day.day - 1) // 7 + 1 for day in days]),
+            holiday=np.array([holidays[day] for day in days], dtype=bool),
+            prev_weekday=column([day.weekday() for day in previous]),
+            prev_day=column([day.day for day in previous]),
+            prev_week_of_month=column([(day.day - 1) // 7 + 1 for day in previous]),
+            prev_holiday=np.array([holidays[day] for day in previous], dtype=bool),
+            month_day_slot=column([day.month * 32 + day.day for day in days]),
+        )
+
+
+def _bit(masks: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """[times, rows] test of bit ``positions[t]`` in ``masks[r]``."""
+    return (masks[None, :] >> positions[:, None]) & 1 == 1
+
+
+class AvailabilityIndex:
+    """Opening hours and closed days of many onsens as NumPy arrays."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        onsen_ids: Sequence[int],
+        usage: Sequence[Optional[UsageTimeParsed]],
+        closed: Sequence[Optional[ClosedDaysParsed]],
+    ):
+        """
+        Build the index from parsed opening hours and closed days.
+
+        Args:
+            onsen_ids: Onsen IDs, one per row of the results
+            usage: Parsed usage time per onsen (None when the onsen has no
+                usage time, which is not checked)
+            closed: Parsed closed days per onsen (None when not recorded)
+
+        Raises:
+            ValueError: If the sequences have different lengths
+        """
+        if not len(onsen_ids) == len(usage) == len(closed):
+            raise ValueError("onsen_ids, usage and closed must have the same length")
+        self.onsen_ids = list(onsen_ids)
+        count = len(self.onsen_ids)
+
+        # Onsens whose usage time is checked at all, and those marked closed
+        self.usage_checked = np.array([parsed is not None for parsed in usage], dtype=bool)
+        self.always_closed = np.array(
+            [parsed is not None and parsed.is_closed for parsed in usage], dtype=bool
+        )
+
+        self._build_windows(usage, count)
+        self._build_closed_rules(closed, count)
+
+    def _build_windows(self, usage: Sequence[Optional[UsageTimeParsed]], count: int) -> None:
+        rows = [
+            (position, window)
+            for position, parsed in enumerate(usage)
+            if parsed is not None
+            for window in parsed.windows
+        ]
+        windows = [window for _, window in rows]
+        self.window_onsen = np.array([position for position, _ in rows], dtype=np.int64)
+        self.window_start = np.array(
+            [w.start_time.hour * 60 + w.start_time.minute for w in windows], dtype=np.int64
+        )
+        self.window_has_end = np.array([w.end_time is not None for w in windows], dtype=bool)
+        self.window_end = np.array(
+            [w.end_time.hour * 60 + w.end_time.minute if w.end_time else 0 for w in windows],
+            dtype=np.int64,
+        )
+        self.window_next_day = np.array([w.end_next_day for w in windows], dtype=bool)
+        self.window_any_day = np.array([w.days_of_week is None for w in windows], dtype=bool)
+        self.window_weekdays = np.array([_mask(w.days_of_week or ()) for w in windows], dtype=np.int64)
+        self.window_holidays = np.array([w.includes_holidays for w in windows], dtype=bool)
+        self.window_months = np.array(
+            [
+                _mask(m for m in range(1, 13) if any(r.includes(m) for r in w.month_ranges))
+                if w.month_ranges
+                else 0b1111111111110
+                for w in windows
+            ],
+            dtype=np.int64,
+        )
+        self.window_groups = self._groups(self.window_onsen, count)
+
+    def _build_closed_rules(self, closed: Sequence[Optional[ClosedDaysParsed]], count: int) -> None:
+        kinds, onsens, weekdays, days, ordinals, flags, slots = [], [], [], [], [], [], []
+        for position, parsed in enumerate(closed):
+            if parsed is None:
+                continue
+            for rule in parsed.rules:
+                if isinstance(rule, WeeklyClosedRule):
+                    kind, weekday_mask, day_mask, ordinal_mask = _WEEKLY, _mask(rule.weekdays), 0, 0
+                    flag = (rule.closes_on_holidays_too, rule.shift_to_next_day_if_holiday, rule.exclude_holidays)
+                elif isinstance(rule, MonthlySpecificDaysRule):
+                    kind, weekday_mask, day_mask, ordinal_mask = _MONTHLY_DAYS, 0, _mask(rule.days), 0
+                    flag = (False, rule.shift_to_next_day_if_holiday, False)
+                elif isinstance(rule, MonthlyOrdinalWeekdayRule):
+                    kind, day_mask = _ORDINAL_WEEKDAY, 0
+                    weekday_mask, ordinal_mask = _mask([rule.weekday]), _mask(rule.ordinals)
+                    flag = (False, rule.shift_to_next_day_if_holiday, False)
+                elif isinstance(rule, AbsoluteDatesRule):
+                    kind, weekday_mask, day_mask, ordinal_mask = _ABSOLUTE, 0, 0, 0
+                    flag = (False, False, False)
+                else:
+                    raise TypeError(f"Unsupported closed-day rule: {type(rule).__name__}")
+                kinds.append(kind)
+                onsens.append(position)
+                weekdays.append(weekday_mask)
+                days.append(day_mask)
+                ordinals.append(ordinal_mask)
+                flags.append(flag)
+                slots.append(
+                    _month_day_slots(rule).ravel()
+                    if kind == _ABSOLUTE
+                    else np.zeros(13 * 32, dtype=bool)
+                )
+
+        self.rule_kind = np.array(kinds, dtype=np.int64)
+        self.rule_onsen = np.array(onsens, dtype=np.int64)
+        self.rule_weekdays = np.array(weekdays, dtype=np.int64)
+        self.rule_days = np.array(days, dtype=np.int64)
+        self.rule_ordinals = np.array(ordinals, dtype=np.int64)
+        flag_array = np.array(flags, dtype=bool).reshape(-1, 3)
+        self.rule_holidays_too = flag_array[:, 0]
+        self.rule_shift = flag_array[:, 1]
+        self.rule_exclude_holidays = flag_array[:, 2]
+        self.rule_slots = np.array(slots, dtype=bool).reshape(-1, 13 * 32)
+        self.rule_groups = self._groups(self.rule_onsen, count)
+
+    @staticmethod
+    def _groups(owners: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Start and end row of each onsen's rows (rows are built in onsen order)."""
+        positions = np.arange(count)
+        return (
+            np.searchsorted(owners, positions, side="left"),
+            np.searchsorted(owners, positions, side="right"),
+        )
+
+    @classmethod
+    def from_onsens(
+        cls,
+        onsens: Sequence,
+        usage_parser: Callable[[Any], Optional[UsageTimeParsed]],
+        closed_parser: Callable[[Any], Optional[ClosedDaysParsed]],
+    ) -> "AvailabilityIndex":
+        """
+        Build the index for onsen records.
+
+        Args:
+            onsens: Onsen records (``id``, ``usage_time`` and ``closed_days``)
+            usage_parser: Callable returning the parsed usage time of an onsen
+                (or None when it has none)
+            closed_parser: Callable returning the parsed closed days of an
+                onsen (or None when it has none)
+        """
+        return cls(
+            [onsen.id for onsen in onsens],
+            [usage_parser(onsen) for onsen in onsens],
+            [closed_parser(onsen) for onsen in onsens],
+        )
+
+    def __len__(self) -> int:
+        return len(self.onsen_ids)
+
+    @staticmethod
+    def _reduce(rows: np.ndarray, groups: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """Fold a [times, rows] boolean matrix into [times, onsens] (any row true)."""
+        starts, ends = groups
+        counts = np.zeros((rows.shape[0], rows.shape[1] + 1), dtype=np.int32)
+        np.cumsum(rows, axis=1, dtype=np.int32, out=counts[:, 1:])
+        return counts[:, ends] > counts[:, starts]
+
+    def _windows_apply(self, features: _DayFeatures) -> np.ndarray:
+        """[times, windows]: whether each window applies on each date (``TimeWindow.applies_on``)."""
+        holiday = features.holiday[:, None]
+        includes_holidays = self.window_holidays[None, :]
+        on_weekday = _bit(self.window_weekdays, features.weekday)
+        day_applies = np.where(
+            self.window_any_day[None, :],
+            ~includes_holidays | holiday,
+            np.where(holiday, includes_holidays, on_weekday),
+        )
+        return day_applies & _bit(self.window_months, features.month)
+
+    def _closed(self, features: _DayFeatures) -> np.ndarray:
+        """[times, onsens]: whether closed-day rules close each onsen on each date."""
+        kind = self.rule_kind[None, :]
+        shift = self.rule_shift[None, :]
+        holiday = features.holiday[:, None]
+        prev_holiday = features.prev_holiday[:, None]
+
+        weekly_today = _bit(self.rule_weekdays, features.weekday)
+        weekly_yesterday = _bit(self.rule_weekdays, features.prev_weekday)
+        weekly = (
+            (shift & weekly_yesterday & prev_holiday)
+            | (weekly_today & ~((shift | self.rule_exclude_holidays[None, :]) & holiday))
+            | (~weekly_today & self.rule_holidays_too[None, :] & holiday)
+        )
+
+        days_today = _bit(self.rule_days, features.day)
+        days_yesterday = _bit(self.rule_days, features.prev_day)
+        monthly_days = (shift & days_yesterday & prev_holiday) | (days_today & ~(shift & holiday))
+
+        designated_today = _bit(self.rule_weekdays, features.weekday) & _bit(
+            self.rule_ordinals, features.week_of_month
+        )
+        designated_yesterday = _bit(self.rule_weekdays, features.prev_weekday) & _bit(
+            self.rule_ordinals, features.prev_week_of_month
+        )
+        ordinal = (shift & designated_yesterday & prev_holiday) | (
+            designated_today & ~(shift & holiday)
+        )
+
+        absolute = self.rule_slots.T[features.month_day_slot]
+
+        rule_closed = np.select(
+            [kind == _WEEKLY, kind == _MONTHLY_DAYS, kind == _ORDINAL_WEEKDAY, kind == _ABSOLUTE],
+            [weekly, monthly_days, ordinal, absolute],
+            default=False,
+        )
+        return self._reduce(rule_closed, self.rule_groups)
+
+    def availability(
+        self, times: Sequence[datetime], min_hours_after: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Availability of every onsen at every time.
+
+        An onsen is available when its usage time (if any) says it is open
+        at the time, with at least ``min_hours_after`` hours left in a window
+        that applies that day, and no closed-day rule closes it that day.
+
+        Args:
+            times: Times to check
+            min_hours_after: Minimum hours the onsen should stay open (None to disable)
+
+        Returns:
+            Boolean array of shape [len(times), len(self)]
+        """
+        times = list(times)
+        features = _DayFeatures.for_dates([time.date() for time in times])
+        minute = np.array([time.hour * 60 + time.minute for time in times], dtype=np.int64)[:, None]
+
+        applies = self._windows_apply(features)
+        start, end = self.window_start[None, :], self.window_end[None, :]
+        crosses = self.window_next_day[None, :] | (end < start)
+        contains = (
+            applies
+            & self.window_has_end[None, :]
+            & np.where(crosses, (minute >= start) | (minute < end), (start <= minute) & (minute < end))
+        )
+        open_now = self._reduce(contains, self.window_groups)
+
+        if min_hours_after is not None:
+            seconds = np.array(
+                [
+                    time.hour * 3600 + time.minute * 60 + time.second + time.microsecond / 1e6
+                    for time in times
+                ]
+            )[:, None]
+            window_end_seconds = (end + MINUTES_PER_DAY * self.window_next_day[None, :]) * 60
+            long_enough = applies & (
+                ~self.window_has_end[None, :]
+                | (window_end_seconds >= seconds + min_hours_after * 3600)
+            )
+            open_now &= self._reduce(long_enough, self.window_groups)
+
+        usage_ok = ~self.usage_checked[None, :] | (open_now & ~self.always_closed[None, :])
+        return usage_ok & ~self._closed(features)
+
+    def available_at(
+        self, target_time: datetime, min_hours_after: Optional[float] = None
+    ) -> np.ndarray:
+        """Boolean availability per onsen at a single time (see ``availability``)."""
+        return self.availability([target_time], min_hours_after)[0]
+
+    def open_heatmap(
+        self,
+        day: date,
+        step_minutes: int = 30,
+        min_hours_after: Optional[float] = None,
+    ) -> tuple[list[datetime], np.ndarray]:
+        """
+        Availability of every onsen across a day.
+
+        Args:
+            day: Day to evaluate
+            step_minutes: Minutes between time slots
+            min_hours_after: Minimum hours the onsen should stay open (None to disable)
+
+        Returns:
+            Tuple of (slot start times, boolean array [slots, onsens])
+
+        Raises:
+            ValueError: If step_minutes does not divide the day into slots
+        """
+        if step_minutes < 1 or MINUTES_PER_DAY % step_minutes:
+            raise ValueError("step_minutes must be a positive divisor of 1440")
+        start = datetime(day.year, day.month, day.day)
+        times = [start + timedelta(minutes=m) for m in range(0, MINUTES_PER_DAY, step_minutes)]
+        return times, self.availability(times, min_hours_after)
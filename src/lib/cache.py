@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import pickle
 import sqlite3
 import time
+from collections.abc import Callable
 from enum import Enum
-from threading import RLock
-from typing import Any, Optional
+from threading import Lock, RLock
+from typing import Any, Optional, TypeVar
+
+from loguru import logger
 
 from src.paths import PATHS
 
+T = TypeVar("T")
+
 
 class CacheNamespace(str, Enum):
     """Namespaces used for persisted caches."""
@@ -132,16 +138,180 @@ class SqliteCache:
             connection.commit()
 
 
-_recommendation_cache: Optional[SqliteCache] = None
+class SqliteLRUStore:
+    """
+    SQLite-backed, size-bounded blob store with least-recently-used eviction.
+
+    Each entry carries a fingerprint of the inputs it was computed from;
+    reading it with a different fingerprint drops the entry as stale.
+    Callers own serialisation and store raw bytes.
+    """
+
+    COLUMNS = ("cache_key", "fingerprint", "payload", "size_bytes", "created_at", "accessed_at")
+
+    def __init__(self, db_path: str, table: str, max_size_bytes: int):
+        self.db_path = db_path
+        self.table = table
+        self.max_size_bytes = max_size_bytes
+        self._lock = RLock()
+        _ensure_directory(os.path.dirname(db_path))
+        self._initialise()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _initialise(self) -> None:
+        with self._connect() as connection:
+            columns = tuple(
+                row[1] for row in connection.execute(f"PRAGMA table_info({self.table})")
+            )
+            if columns and columns != self.COLUMNS:
+                # Entries written with an older layout are only a cache; start afresh
+                connection.execute(f"DROP TABLE {self.table}")
+            connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    cache_key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{self.table}_accessed
+                    ON {self.table} (accessed_at)
+                """
+            )
+            connection.commit()
+
+    def get(self, cache_key: str, fingerprint: str) -> Optional[bytes]:
+        """Fetch a payload, dropping the entry if its fingerprint changed."""
+
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                f"SELECT fingerprint, payload FROM {self.table} WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row[0] != fingerprint:
+                connection.execute(
+                    f"DELETE FROM {self.table} WHERE cache_key = ?", (cache_key,)
+                )
+                connection.commit()
+                logger.debug(f"Invalidated stale {self.table} entry {cache_key}")
+                return None
+
+            connection.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key),
+            )
+            connection.commit()
+            return row[1]
+
+    def set(self, cache_key: str, fingerprint: str, payload: bytes) -> bool:
+        """
+        Store a payload and evict least recently used entries over the size limit.
+
+        Returns:
+            False if the payload alone exceeds the size limit and was not stored
+        """
+
+        if len(payload) > self.max_size_bytes:
+            return False
+
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                f"""
+                INSERT INTO {self.table}(
+                    cache_key, fingerprint, payload, size_bytes, created_at, accessed_at
+                )
+                VALUES(?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    payload = excluded.payload,
+                    size_bytes = excluded.size_bytes,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (cache_key, fingerprint, payload, len(payload), now, now),
+            )
+            self._evict(connection)
+            connection.commit()
+        return True
+
+    def delete(self, cache_key: str) -> None:
+        """Remove a single entry."""
+
+        with self._lock, self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.table} WHERE cache_key = ?", (cache_key,))
+            connection.commit()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total = connection.execute(
+            f"SELECT COALESCE(SUM(size_bytes), 0) FROM {self.table}"
+        ).fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        rows = connection.execute(
+            f"SELECT cache_key, size_bytes FROM {self.table} ORDER BY accessed_at ASC"
+        ).fetchall()
+        for cache_key, size_bytes in rows:
+            if total <= self.max_size_bytes:
+                break
+            connection.execute(f"DELETE FROM {self.table} WHERE cache_key = ?", (cache_key,))
+            total -= size_bytes
+            logger.debug(f"Evicted {self.table} entry {cache_key}")
+
+    def clear(self) -> int:
+        """Remove all entries, reclaim their space and return how many were removed."""
+
+        with self._lock, self._connect() as connection:
+            removed = connection.execute(f"DELETE FROM {self.table}").rowcount
+            connection.commit()
+        with self._connect() as connection:
+            connection.execute("VACUUM")
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and total payload size."""
+
+        with self._lock, self._connect() as connection:
+            count, size = connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {self.table}"
+            ).fetchone()
+        return {"entries": count, "size_bytes": size}
+
+
+def shared_instance(factory: Callable[[], T]) -> Callable[[], T]:
+    """Wrap a zero-argument factory so it builds one shared object on first call."""
+
+    instance: Optional[T] = None
+    lock = Lock()
+
+    @functools.wraps(factory)
+    def get() -> T:
+        nonlocal instance
+        with lock:
+            if instance is None:
+                instance = factory()
+            return instance
+
+    return get
 
 
+@shared_instance
 def get_recommendation_cache() -> SqliteCache:
     """Return the shared cache used by the recommendation engine."""
 
-    global _recommendation_cache
-    if _recommendation_cache is None:
-        _recommendation_cache = SqliteCache(PATHS.RECOMMENDATION_CACHE_DB)
-    return _recommendation_cache
+    return SqliteCache(PATHS.RECOMMENDATION_CACHE_DB)
 
 
 def clear_recommendation_cache(namespace: Optional[CacheNamespace] = None) -> None:
@@ -0,0 +1,166 @@
+"""
+Client-side GeoJSON marker layer for large onsen catalogues.
+
+Instead of one ``folium.Marker`` with inline popup HTML per onsen, the catalogue
+is written once to a compact GeoJSON data file next to the map. The map loads
+that file through a ``<script>`` tag (so it also works from ``file://`` URLs),
+draws the points as canvas circle markers inside a Leaflet.markercluster group
+with chunked loading, and builds popup HTML only when a marker is clicked.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.plugins import MarkerCluster
+from jinja2 import Template
+
+CLIENT_SIDE_MARKER_THRESHOLD = 1000
+"""Catalogues larger than this are rendered client-side when no mode is given."""
+
+DATA_FILE_SUFFIX = ".data.js"
+
+
+def use_client_side(n_points: int, client_side: Optional[bool]) -> bool:
+    """Resolve the map mode; ``None`` selects client-side rendering for large catalogues."""
+    if client_side is None:
+        return n_points > CLIENT_SIDE_MARKER_THRESHOLD
+    return client_side
+
+
+def point_feature(latitude: float, longitude: float, properties: dict[str, Any]) -> dict:
+    """
+    Build a GeoJSON point feature, dropping empty properties to keep the file small.
+    """
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [round(float(longitude), 6), round(float(latitude), 6)],
+        },
+        "properties": {
+            key: value for key, value in properties.items() if value not in (None, "")
+        },
+    }
+
+
+def write_map_data(features: list[dict], html_path: str, data_var: str) -> str:
+    """
+    Write features as a GeoJSON FeatureCollection next to the map HTML.
+
+    Args:
+        features: GeoJSON point features
+        html_path: Path of the map HTML file the data belongs to
+        data_var: Global JavaScript variable the collection is assigned to
+
+    Returns:
+        File name of the data file, relative to the map HTML
+    """
+    stem = os.path.splitext(os.path.basename(html_path))[0]
+    data_name = f"{stem}{DATA_FILE_SUFFIX}"
+    collection = {"type": "FeatureCollection", "features": features}
+
+    with open(
+        os.path.join(os.path.dirname(html_path), data_name), "w", encoding="utf-8"
+    ) as f:
+        f.write(f"window[{json.dumps(data_var)}] = ")
+        json.dump(collection, f, ensure_ascii=False, separators=(",", ":"))
+        f.write(";\n")
+
+    return data_name
+
+
+class ClientMarkerLayer(JSCSSMixin, MacroElement):
+    """
+    Clustered canvas marker layer fed from a GeoJSON data file.
+
+    Feature properties drive rendering: ``title`` heads the popup, ``tooltip``
+    is shown on hover (defaulting to the title), ``color`` fills the marker and ``link`` adds a link at
+    the bottom of the popup. ``fields`` lists ``(property, label)`` pairs shown
+    in the popup body when present on a feature.
+    """
+
+    _template = Template(
+        """
+        {% macro header(this, kwargs) %}
+            <script src="{{ this.data_src }}"></script>
+        {% endmacro %}
+
+        {% macro script(this, kwargs) %}
+            (function() {
+                var data = window[{{ this.data_var|tojson }}]
+                    || {type: "FeatureCollection", features: []};
+                var fields = {{ this.fields|tojson }};
+                var linkText = {{ this.link_text|tojson }};
+                var renderer = L.canvas({padding: 0.5});
+
+                function esc(value) {
+                    return String(value).replace(/[&<>"']/g, function(c) {
+                        return {"&": "&amp;", "<": "&lt;", ">": "&gt;",
+                                '"': "&quot;", "'": "&#39;"}[c];
+                    });
+                }
+
+                function popup(props) {
+                    var html = ['<div style="font-family: Arial, sans-serif; width: 300px;">',
+                        '<h3 style="margin-top: 0; color: #2c3e50;">' + esc(props.title || "") + '</h3>',
+                        '<hr style="margin: 10px 0;">'];
+                    fields.forEach(function(field) {
+                        if (props[field[0]] !== undefined) {
+                            html.push('<p style="margin: 5px 0;"><b>' + esc(field[1]) + ':</b> '
+                                + esc(props[field[0]]) + '</p>');
+                        }
+                    });
+                    if (props.link) {
+                        html.push('<hr style="margin: 10px 0;"><p style="margin: 5px 0;">'
+                            + '<a href="' + esc(props.link) + '" target="_blank" style="color: #3498db;">'
+                            + esc(linkText) + '</a></p>');
+                    }
+                    html.push('</div>');
+                    return html.join("");
+                }
+
+                var markers = L.geoJSON(data, {
+                    pointToLayer: function(feature, latlng) {
+                        var color = feature.properties.color || "#3388ff";
+                        return L.circleMarker(latlng, {
+                            renderer: renderer, radius: 7, weight: 1,
+                            color: color, fillColor: color, fillOpacity: 0.85
+                        });
+                    },
+                    onEachFeature: function(feature, marker) {
+                        var tooltip = feature.properties.tooltip || feature.properties.title;
+                        if (tooltip) {
+                            marker.bindTooltip(esc(tooltip));
+                        }
+                        marker.bindPopup(function() { return popup(feature.properties); },
+                                         {maxWidth: 400});
+                    }
+                });
+
+                var cluster = L.markerClusterGroup({chunkedLoading: true});
+                cluster.addLayer(markers);
+                cluster.addTo({{ this._parent.get_name() }});
+            })();
+        {% endmacro %}
+        """
+    )
+
+    default_js = MarkerCluster.default_js
+    default_css = MarkerCluster.default_css
+
+    def __init__(
+        self,
+        data_src: str,
+        data_var: str,
+        fields: list[tuple[str, str]],
+        link_text: str = "Open in Google Maps",
+    ):
+        super().__init__()
+        self._name = "ClientMarkerLayer"
+        self.data_src = data_src
+        self.data_var = data_var
+        self.fields = [list(field) for field in fields]
+        self.link_text = link_text
@@ -3,17 +3,27 @@ Cloud Backup Module - Google Drive Integration
 
 Provides robust, incremental backup functionality to Google Drive with:
 - OAuth2 authentication
-- Resumable uploads for large files
+- Resumable uploads for large files, resumed across process restarts
 - File hash verification
 - Incremental sync (only upload changed files)
 - Folder structure mirroring
 - Automatic retry with exponential backoff
+- Parallel uploads
+
+Sync state is kept in a local JSON file (``sync_state.json`` next to the
+token): a manifest of synced files (size, mtime, sha256, remote id), the
+Drive folder ids of mirrored paths, and unfinished resumable upload
+sessions. Files whose size and mtime match the manifest are skipped without
+hashing or any Drive request.
 """
 
 import os
 import json
 import hashlib
-from typing import Optional, Any
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, Any
 from datetime import datetime
 from loguru import logger
 
@@ -39,6 +49,8 @@ DEFAULT_CONFIG = {
     'token_file': 'local/gdrive/token.json',
     'backup_folder_name': 'onsendo_backups',
     'chunk_size': 5 * 1024 * 1024,  # 5MB chunks for resumable upload
+    'max_workers': 4,  # parallel uploads in sync_directory
+    'state_save_interval': 50,  # completed uploads between sync manifest writes
 }
 
 
@@ -57,6 +69,65 @@ class UploadError(CloudBackupError):
     pass
 
 
+class SyncState:
+    """
+    Local record of synced files, Drive folder ids and open upload sessions.
+
+    - files: local path -> {size, mtime_ns, sha256, remote_id, remote_path}
+    - folders: "<parent id or root>:<name>" -> Drive folder id
+    - sessions: local path -> {uri, size, mtime_ns, sha256, parent_id}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        data: dict[str, Any] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable sync state {path}: {e}")
+
+        self.files: dict[str, dict[str, Any]] = data.get('files', {})
+        self.folders: dict[str, str] = data.get('folders', {})
+        self.sessions: dict[str, dict[str, Any]] = data.get('sessions', {})
+
+    def save(self) -> None:
+        """Write the state atomically."""
+        with self._lock:
+            payload = json.dumps(
+                {'files': self.files, 'folders': self.folders, 'sessions': self.sessions},
+                indent=2,
+            )
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+
+    def clear_folders(self) -> None:
+        with self._lock:
+            self.folders.clear()
+
+    def record_file(self, local_path: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self.files[local_path] = entry
+
+    def set_session(self, local_path: str, session: dict[str, Any]) -> None:
+        with self._lock:
+            self.sessions[local_path] = session
+        self.save()
+
+    def pop_session(self, local_path: str) -> None:
+        with self._lock:
+            removed = self.sessions.pop(local_path, None)
+        if removed:
+            self.save()
+
+
 class GoogleDriveBackup:
     """
     Google Drive backup manager with robust error handling and incremental sync.
@@ -68,13 +139,18 @@ class GoogleDriveBackup:
     - Folder structure mirroring
     - Metadata tracking
     - Dry-run mode for testing
+    - Local sync manifest and folder-id cache
+    - Parallel, resumable directory sync
     """
 
     def __init__(
         self,
         credentials_file: Optional[str] = None,
         token_file: Optional[str] = None,
-        backup_folder_name: Optional[str] = None
+        backup_folder_name: Optional[str] = None,
+        sync_state_file: Optional[str] = None,
+        service: Optional[Any] = None,
+        chunk_size: Optional[int] = None,
     ):
         """
         Initialize Google Drive backup manager.
@@ -83,6 +159,10 @@ class GoogleDriveBackup:
             credentials_file: Path to OAuth2 credentials JSON
             token_file: Path to store/load access token
             backup_folder_name: Name of root backup folder in Drive
+            sync_state_file: Path of the local sync state (default: next to the token)
+            service: Already-authenticated Drive service (e.g. a test double);
+                skips ``authenticate()``
+            chunk_size: Resumable upload chunk size in bytes (multiple of 256 KiB)
         """
         if not GOOGLE_AVAILABLE:
             raise ImportError(
@@ -93,12 +173,21 @@ class GoogleDriveBackup:
         self.credentials_file = credentials_file or DEFAULT_CONFIG['credentials_file']
         self.token_file = token_file or DEFAULT_CONFIG['token_file']
         self.backup_folder_name = backup_folder_name or DEFAULT_CONFIG['backup_folder_name']
+        self.chunk_size = chunk_size or DEFAULT_CONFIG['chunk_size']
 
         # Ensure local gdrive directory exists
         os.makedirs(os.path.dirname(self.token_file), exist_ok=True)
 
-        self.service = None
-        self._folder_cache: dict[str, str] = {}  # path -> folder_id mapping
+        self.sync_state = SyncState(
+            sync_state_file
+            or os.path.join(os.path.dirname(self.token_file), 'sync_state.json')
+        )
+
+        self.service = service
+        # Drive clients are not thread-safe; worker threads build their own
+        self._service_factory: Optional[Callable[[], Any]] = None
+        self._thread_local = threading.local()
+        self._folder_cache = self.sync_state.folders  # "<parent>:<name>" -> folder_id
 
     def authenticate(self, force_reauth: bool = False) -> None:
         """
@@ -157,10 +246,29 @@ class GoogleDriveBackup:
         # Build service
         try:
             self.service = build('drive', 'v3', credentials=creds)
+            self._service_factory = lambda: build('drive', 'v3', credentials=creds)
             logger.info("Successfully authenticated with Google Drive")
         except Exception as e:
             raise AuthenticationError(f"Failed to build Drive service: {e}") from e
 
+    def _drive(self) -> Any:
+        """Return the Drive service for the calling thread."""
+        if self._service_factory is None:
+            return self.service
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = self._service_factory()
+            self._thread_local.service = service
+        return service
+
+    def _resolve_folder_path(self, remote_folder_path: str) -> str:
+        """Return the folder id of a path below the backup root, creating folders as needed."""
+        parent_id = self._get_or_create_folder(self.backup_folder_name)
+        for folder_name in remote_folder_path.split('/'):
+            if folder_name:
+                parent_id = self._get_or_create_folder(folder_name, parent_id)
+        return parent_id
+
     def _get_or_create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
         """
         Get folder ID or create folder if it doesn't exist.
@@ -221,7 +329,7 @@ class GoogleDriveBackup:
         """Calculate SHA-256 hash of file."""
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(1024 * 1024), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
@@ -252,7 +360,7 @@ class GoogleDriveBackup:
         query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
 
         try:
-            results = self.service.files().list(
+            results = self._drive().files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id,name,properties)'
@@ -317,12 +425,7 @@ class GoogleDriveBackup:
         logger.info(f"Preparing to upload: {file_name} ({file_size} bytes, hash: {file_hash[:8]}...)")
 
         # Create folder structure
-        parent_id = self._get_or_create_folder(self.backup_folder_name)
-
-        if remote_folder_path:
-            for folder_name in remote_folder_path.split('/'):
-                if folder_name:
-                    parent_id = self._get_or_create_folder(folder_name, parent_id)
+        parent_id = self._resolve_folder_path(remote_folder_path)
 
         # Check if file already exists
         if skip_if_exists:
@@ -335,6 +438,69 @@ class GoogleDriveBackup:
             logger.info(f"[DRY RUN] Would upload {file_name} to folder {parent_id}")
             return None
 
+        return self._upload_media(local_path, parent_id, file_hash)
+
+    def _upload_media(self, local_path: str, parent_id: str, file_hash: str) -> str:
+        """
+        Upload a file with a resumable session, resuming a saved session if possible.
+
+        The session URI is saved in the sync state after the first chunk, so an
+        upload interrupted by a crash or restart continues where it stopped.
+
+        Returns:
+            Drive file ID
+
+        Raises:
+            UploadError: If upload fails
+        """
+        file_name = os.path.basename(local_path)
+        stat = os.stat(local_path)
+        session_key = os.path.abspath(local_path)
+        session_info = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_hash,
+            'parent_id': parent_id,
+        }
+
+        saved = self.sync_state.sessions.get(session_key)
+        if saved and any(saved.get(key) != value for key, value in session_info.items()):
+            # The file or its destination changed since the session started
+            self.sync_state.pop_session(session_key)
+            saved = None
+
+        try:
+            try:
+                response = self._run_upload(
+                    local_path, parent_id, file_hash, session_key, session_info, saved
+                )
+            except HttpError as e:
+                if not saved or e.resp.status not in (404, 410):
+                    raise
+                logger.warning(f"Upload session for {file_name} expired, restarting upload")
+                self.sync_state.pop_session(session_key)
+                response = self._run_upload(
+                    local_path, parent_id, file_hash, session_key, session_info, None
+                )
+        except HttpError as e:
+            raise UploadError(f"Failed to upload {file_name}: {e}") from e
+
+        file_id = response['id']
+        logger.info(f"Successfully uploaded {file_name} (ID: {file_id})")
+        return file_id
+
+    def _run_upload(
+        self,
+        local_path: str,
+        parent_id: str,
+        file_hash: str,
+        session_key: str,
+        session_info: dict[str, Any],
+        saved_session: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Drive a resumable upload request to completion."""
+        file_name = os.path.basename(local_path)
+
         # Upload file with hash in properties
         file_metadata = {
             'name': file_name,
@@ -346,32 +512,61 @@ class GoogleDriveBackup:
             }
         }
 
-        try:
-            media = MediaFileUpload(
-                local_path,
-                resumable=True,
-                chunksize=DEFAULT_CONFIG['chunk_size']
-            )
+        media = MediaFileUpload(local_path, resumable=True, chunksize=self.chunk_size)
+        request = self._drive().files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id,name,size'
+        )
 
-            request = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id,name,size'
-            )
+        response = None
+        if saved_session:
+            logger.info(f"Resuming upload of {file_name}")
+            response = self._resume_session(request, saved_session['uri'], media.size())
+
+        while response is None:
+            status, response = request.next_chunk()
+            if response is None and request.resumable_uri and (
+                not saved_session or saved_session['uri'] != request.resumable_uri
+            ):
+                saved_session = {**session_info, 'uri': request.resumable_uri}
+                self.sync_state.set_session(session_key, saved_session)
+            if status:
+                progress = int(status.progress() * 100)
+                logger.debug(f"Upload progress {file_name}: {progress}%")
+
+        self.sync_state.pop_session(session_key)
+        return response
+
+    @staticmethod
+    def _resume_session(request: Any, uri: str, size: int) -> Optional[dict[str, Any]]:
+        """
+        Point a new upload request at a saved session and continue where it stopped.
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.debug(f"Upload progress: {progress}%")
+        Asks the server how many bytes the session already holds (an empty PUT
+        with ``Content-Range: bytes */size``, as the resumable upload protocol
+        specifies) and sets the request's progress to match.
 
-            file_id = response['id']
-            logger.info(f"Successfully uploaded {file_name} (ID: {file_id})")
-            return file_id
+        Returns:
+            The file resource if the server had already received the whole file,
+            otherwise None
 
-        except HttpError as e:
-            raise UploadError(f"Failed to upload {file_name}: {e}") from e
+        Raises:
+            HttpError: If the session is gone (404/410) or the query fails
+        """
+        request.resumable_uri = uri
+        resp, content = request.http.request(
+            uri, 'PUT', headers={'Content-Range': f'bytes */{size}', 'content-length': '0'}
+        )
+        if resp.status in (200, 201):
+            return json.loads(content)
+        if resp.status != 308:
+            raise HttpError(resp, content, uri=uri)
+
+        # "Range: bytes=0-N" lists the bytes received; no header means none
+        received = resp.get('range')
+        request.resumable_progress = int(received.rsplit('-', 1)[1]) + 1 if received else 0
+        return None
 
     def sync_directory(
         self,
@@ -379,21 +574,30 @@ class GoogleDriveBackup:
         remote_folder_path: str = "",
         dry_run: bool = False,
         skip_if_exists: bool = True,
-        recursive: bool = True
+        recursive: bool = True,
+        max_workers: Optional[int] = None
     ) -> dict[str, Any]:
         """
         Sync entire directory to Google Drive.
 
+        Files whose size and mtime match the local sync manifest are skipped
+        without hashing or Drive requests. Remaining files are hashed and
+        uploaded by a bounded pool of worker threads.
+
         Args:
             local_dir: Local directory path
             remote_folder_path: Remote folder path (relative to backup root)
             dry_run: If True, only simulate sync
             skip_if_exists: If True, skip files that already exist
             recursive: If True, sync subdirectories
+            max_workers: Number of parallel uploads (default: DEFAULT_CONFIG['max_workers'])
 
         Returns:
             Dictionary with sync statistics
         """
+        if not self.service:
+            raise CloudBackupError("Not authenticated. Call authenticate() first.")
+
         if not os.path.isdir(local_dir):
             raise UploadError(f"Directory not found: {local_dir}")
 
@@ -406,6 +610,7 @@ class GoogleDriveBackup:
 
         logger.info(f"Syncing directory: {local_dir}")
 
+        pending: list[tuple[str, str, os.stat_result]] = []
         for root, dirs, files in os.walk(local_dir):
             if not recursive:
                 dirs.clear()
@@ -415,36 +620,167 @@ class GoogleDriveBackup:
             if rel_path == '.':
                 remote_path = remote_folder_path
             else:
+                rel_path = rel_path.replace(os.sep, '/')
                 remote_path = f"{remote_folder_path}/{rel_path}" if remote_folder_path else rel_path
 
             for file_name in files:
-                local_file = os.path.join(root, file_name)
-
+                local_file = os.path.abspath(os.path.join(root, file_name))
                 try:
-                    result = self.upload_file(
-                        local_file,
-                        remote_path,
-                        dry_run=dry_run,
-                        skip_if_exists=skip_if_exists
-                    )
+                    stat = os.stat(local_file)
+                except OSError as e:
+                    logger.error(f"Failed to read {local_file}: {e}")
+                    stats['failed'] += 1
+                    continue
 
-                    if result:
-                        stats['uploaded'] += 1
-                        stats['total_size'] += os.path.getsize(local_file)
-                    else:
-                        stats['skipped'] += 1
+                if skip_if_exists and self._is_unchanged(local_file, stat, remote_path):
+                    stats['skipped'] += 1
+                    continue
+                pending.append((local_file, remote_path, stat))
 
-                except Exception as e:
-                    logger.error(f"Failed to upload {local_file}: {e}")
-                    stats['failed'] += 1
+        unchanged = stats['skipped']
+
+        # Resolve folders once per remote path (cached across runs)
+        parents: dict[str, Optional[str]] = {}
+        for remote_path in dict.fromkeys(path for _, path, _ in pending):
+            try:
+                parents[remote_path] = self._resolve_folder_path(remote_path)
+            except Exception as e:
+                logger.error(f"Failed to resolve remote folder '{remote_path}': {e}")
+                parents[remote_path] = None
+
+        workers = max(1, max_workers or DEFAULT_CONFIG['max_workers'])
+        if self._upload_pending(pending, parents, stats, workers, dry_run, skip_if_exists):
+            # A cached folder may have been deleted remotely; resolve again next run
+            self.sync_state.clear_folders()
+
+        if not dry_run:
+            self.sync_state.save()
 
         logger.info(
             f"Sync complete: {stats['uploaded']} uploaded, "
-            f"{stats['skipped']} skipped, {stats['failed']} failed"
+            f"{stats['skipped']} skipped ({unchanged} unchanged since last sync), "
+            f"{stats['failed']} failed"
         )
 
         return stats
 
+    def _upload_pending(
+        self,
+        pending: list[tuple[str, str, os.stat_result]],
+        parents: dict[str, Optional[str]],
+        stats: dict[str, Any],
+        workers: int,
+        dry_run: bool,
+        skip_if_exists: bool,
+    ) -> bool:
+        """
+        Sync the pending files on a pool of worker threads, updating ``stats``.
+
+        The manifest is saved every ``state_save_interval`` uploads rather
+        than after each file, so an interrupted sync keeps most of its
+        progress without rewriting the whole manifest per file.
+
+        Returns:
+            Whether any upload failed
+        """
+        save_interval = DEFAULT_CONFIG['state_save_interval']
+        unsaved = 0
+        failed = False
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for local_file, remote_path, stat in pending:
+                if parents[remote_path] is None:
+                    stats['failed'] += 1
+                    continue
+                future = executor.submit(
+                    self._sync_file, local_file, remote_path, parents[remote_path],
+                    stat, dry_run, skip_if_exists,
+                )
+                futures[future] = (local_file, stat)
+
+            for future in as_completed(futures):
+                local_file, stat = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload {local_file}: {e}")
+                    stats['failed'] += 1
+                    failed = True
+                    continue
+
+                if not result:
+                    stats['skipped'] += 1
+                    continue
+
+                stats['uploaded'] += 1
+                stats['total_size'] += stat.st_size
+                unsaved += 1
+                if unsaved >= save_interval:
+                    self.sync_state.save()
+                    unsaved = 0
+        return failed
+
+    def _is_unchanged(self, local_file: str, stat: os.stat_result, remote_path: str) -> bool:
+        """Whether the manifest records this exact file as already synced."""
+        entry = self.sync_state.files.get(local_file)
+        return bool(
+            entry
+            and entry['size'] == stat.st_size
+            and entry['mtime_ns'] == stat.st_mtime_ns
+            and entry['remote_path'] == remote_path
+        )
+
+    def _sync_file(
+        self,
+        local_file: str,
+        remote_path: str,
+        parent_id: str,
+        stat: os.stat_result,
+        dry_run: bool,
+        skip_if_exists: bool,
+    ) -> Optional[str]:
+        """
+        Hash, check and upload one file (runs in a worker thread).
+
+        Returns:
+            File ID if uploaded, None if skipped
+        """
+        file_name = os.path.basename(local_file)
+        file_hash = self._calculate_file_hash(local_file)
+        entry = self.sync_state.files.get(local_file)
+
+        def record(remote_id: str) -> None:
+            if not dry_run:
+                self.sync_state.record_file(local_file, {
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha256': file_hash,
+                    'remote_id': remote_id,
+                    'remote_path': remote_path,
+                })
+
+        if skip_if_exists:
+            if entry and entry['sha256'] == file_hash and entry['remote_path'] == remote_path:
+                # Touched but not modified
+                record(entry['remote_id'])
+                return None
+
+            if not entry:
+                # Not synced from here before; it may already be in Drive
+                existing_file_id = self._file_exists_in_drive(file_name, parent_id, file_hash)
+                if existing_file_id:
+                    logger.info(f"Skipping {file_name} - already exists with matching hash")
+                    record(existing_file_id)
+                    return None
+
+        if dry_run:
+            logger.info(f"[DRY RUN] Would upload {file_name} to folder {parent_id}")
+            return None
+
+        file_id = self._upload_media(local_file, parent_id, file_hash)
+        record(file_id)
+        return file_id
+
     def list_backups(self) -> list[dict[str, Any]]:
         """
         List all backups in the Drive folder.
@@ -0,0 +1,284 @@
+"""
+Consistent, deduplicated SQLite database snapshots.
+
+Copies of a live database are taken with SQLite's online backup API, which
+produces a consistent image even while another connection is writing, and
+(unlike ``VACUUM INTO``) keeps the page layout of the source. Keeping the
+layout is what makes snapshots incremental: the image is split into
+fixed-size chunks aligned to SQLite pages, and every chunk is stored once
+under its SHA-256 digest. A snapshot is a small JSON manifest listing its
+chunk digests, so repeated backups of a slowly growing database only write
+the pages that changed.
+
+Store layout::
+
+    <root>/chunks/<ab>/<digest>[.zz]   chunk content (``.zz``: zlib-compressed)
+    <root>/snapshots/<id>.json         manifest of one snapshot
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+CHUNK_SIZE = 64 * 1024
+"""Chunk size in bytes; a multiple of every valid SQLite page size."""
+
+COMPRESSED_SUFFIX = ".zz"
+
+
+def consistent_copy(source_path: str | Path, dest_path: str | Path) -> None:
+    """
+    Copy a SQLite database with the online backup API.
+
+    The destination may be a live database; it is overwritten page by page
+    inside a transaction, so open connections see either the old or the new
+    content.
+
+    Args:
+        source_path: Database to copy
+        dest_path: Destination database file (created if missing)
+    """
+    source = sqlite3.connect(f"file:{Path(source_path).as_posix()}?mode=ro", uri=True)
+    try:
+        dest = sqlite3.connect(str(dest_path))
+        try:
+            source.backup(dest)
+        finally:
+            dest.close()
+    finally:
+        source.close()
+
+
+@dataclass
+class Snapshot:
+    """Manifest of one stored database snapshot."""
+
+    snapshot_id: str
+    created_at: str
+    source: str
+    size_bytes: int
+    sha256: str
+    chunk_size: int
+    chunks: list[str] = field(repr=False)
+    new_chunks: int = 0
+    new_bytes: int = 0
+    label: Optional[str] = None
+
+
+class SnapshotStore:
+    """Content-addressed store of SQLite database snapshots."""
+
+    def __init__(self, root: str | Path, compress: bool = True):
+        """
+        Args:
+            root: Store directory (created if missing)
+            compress: Store new chunks zlib-compressed
+        """
+        self.root = Path(root)
+        self.compress = compress
+        self.chunks_dir = self.root / "chunks"
+        self.snapshots_dir = self.root / "snapshots"
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def _existing_chunk(self, digest: str) -> Optional[Path]:
+        path = self._chunk_path(digest)
+        for candidate in (path, path.with_name(path.name + COMPRESSED_SUFFIX)):
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _write_chunk(self, digest: str, data: bytes) -> int:
+        """Store a chunk unless it already exists; return bytes written."""
+        if self._existing_chunk(digest):
+            return 0
+
+        path = self._chunk_path(digest)
+        payload = data
+        if self.compress:
+            compressed = zlib.compress(data, 6)
+            # Incompressible chunks are cheaper to keep raw
+            if len(compressed) < len(data):
+                payload = compressed
+                path = path.with_name(path.name + COMPRESSED_SUFFIX)
+
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return len(payload)
+
+    def _read_chunk(self, digest: str) -> bytes:
+        path = self._existing_chunk(digest)
+        if path is None:
+            raise FileNotFoundError(f"Missing snapshot chunk {digest}")
+        data = path.read_bytes()
+        if path.name.endswith(COMPRESSED_SUFFIX):
+            data = zlib.decompress(data)
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt snapshot chunk {digest}")
+        return data
+
+    def create(self, db_path: str | Path, label: Optional[str] = None) -> Snapshot:
+        """
+        Take a consistent snapshot of a database and store its new chunks.
+
+        Args:
+            db_path: SQLite database to snapshot
+            label: Optional free-text label stored in the manifest
+
+        Returns:
+            The stored snapshot manifest
+        """
+        created = datetime.now()
+        snapshot_id = created.strftime("%Y%m%d_%H%M%S_%f")
+
+        fd, image_path = tempfile.mkstemp(dir=self.root, suffix=".db.tmp")
+        os.close(fd)
+        try:
+            consistent_copy(db_path, image_path)
+
+            chunks = []
+            new_chunks = new_bytes = size = 0
+            file_hash = hashlib.sha256()
+            with open(image_path, "rb") as f:
+                while block := f.read(CHUNK_SIZE):
+                    digest = hashlib.sha256(block).hexdigest()
+                    written = self._write_chunk(digest, block)
+                    if written:
+                        new_chunks += 1
+                        new_bytes += written
+                    chunks.append(digest)
+                    file_hash.update(block)
+                    size += len(block)
+        finally:
+            os.unlink(image_path)
+
+        snapshot = Snapshot(
+            snapshot_id=snapshot_id,
+            created_at=created.isoformat(timespec="seconds"),
+            source=str(Path(db_path).resolve()),
+            size_bytes=size,
+            sha256=file_hash.hexdigest(),
+            chunk_size=CHUNK_SIZE,
+            chunks=chunks,
+            new_chunks=new_chunks,
+            new_bytes=new_bytes,
+            label=label,
+        )
+        manifest = self.snapshots_dir / f"{snapshot_id}.json"
+        manifest.write_text(json.dumps(asdict(snapshot), indent=2), encoding="utf-8")
+
+        logger.info(
+            f"Snapshot {snapshot_id}: {len(chunks)} chunks, {new_chunks} new "
+            f"({new_bytes / 1024:.1f} KiB written)"
+        )
+        return snapshot
+
+    def snapshots(self) -> list[Snapshot]:
+        """Return all snapshots, oldest first."""
+        return [
+            Snapshot(**json.loads(path.read_text(encoding="utf-8")))
+            for path in sorted(self.snapshots_dir.glob("*.json"))
+        ]
+
+    def get(self, snapshot_id: Optional[str] = None) -> Snapshot:
+        """
+        Load a snapshot manifest.
+
+        Args:
+            snapshot_id: Snapshot to load (default: the latest)
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+        """
+        if snapshot_id is None:
+            snapshots = sorted(self.snapshots_dir.glob("*.json"))
+            if not snapshots:
+                raise FileNotFoundError(f"No snapshots in {self.root}")
+            path = snapshots[-1]
+        else:
+            path = self.snapshots_dir / f"{snapshot_id}.json"
+            if not path.exists():
+                raise FileNotFoundError(f"Snapshot {snapshot_id} not found in {self.root}")
+        return Snapshot(**json.loads(path.read_text(encoding="utf-8")))
+
+    def restore(self, dest_path: str | Path, snapshot_id: Optional[str] = None) -> Snapshot:
+        """
+        Reassemble a snapshot into a database file.
+
+        The image is rebuilt and verified in a temporary file, then copied
+        into place with the online backup API so an existing destination
+        database is replaced safely.
+
+        Args:
+            dest_path: Database file to write
+            snapshot_id: Snapshot to restore (default: the latest)
+
+        Returns:
+            The restored snapshot manifest
+
+        Raises:
+            ValueError: If the reassembled image does not match the manifest
+        """
+        snapshot = self.get(snapshot_id)
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, image_path = tempfile.mkstemp(dir=self.root, suffix=".db.tmp")
+        try:
+            file_hash = hashlib.sha256()
+            with os.fdopen(fd, "wb") as f:
+                for digest in snapshot.chunks:
+                    block = self._read_chunk(digest)
+                    file_hash.update(block)
+                    f.write(block)
+            if file_hash.hexdigest() != snapshot.sha256:
+                raise ValueError(f"Snapshot {snapshot.snapshot_id} failed verification")
+
+            consistent_copy(image_path, dest_path)
+        finally:
+            os.unlink(image_path)
+
+        logger.info(f"Restored snapshot {snapshot.snapshot_id} to {dest_path}")
+        return snapshot
+
+    def prune(self, keep_recent: int) -> tuple[list[str], int]:
+        """
+        Delete all but the most recent snapshots and their unreferenced chunks.
+
+        Args:
+            keep_recent: Number of snapshots to keep
+
+        Returns:
+            Tuple of (removed snapshot ids, number of chunks removed)
+        """
+        manifests = sorted(self.snapshots_dir.glob("*.json"))
+        removed = manifests[: max(0, len(manifests) - keep_recent)]
+        for path in removed:
+            path.unlink()
+
+        referenced = set()
+        for snapshot in self.snapshots():
+            referenced.update(snapshot.chunks)
+
+        removed_chunks = 0
+        for path in self.chunks_dir.glob("*/*"):
+            if path.name.removesuffix(COMPRESSED_SUFFIX) not in referenced:
+                path.unlink()
+                removed_chunks += 1
+
+        return [path.stem for path in removed], removed_chunks
@@ -111,6 +111,20 @@ class GraphDefinition:  # pylint: disable=too-many-instance-attributes
                     f"{self.graph_type.value} requires field_y to be specified"
                 )
 
+    def referenced_fields(self) -> Optional[list[str]]:
+        """Return the data columns this graph reads, or None if it reads every column.
+
+        Radar graphs accept "*" for all numeric columns or a comma-separated list.
+        """
+        if self.field == "*":
+            return None
+
+        fields = [f.strip() for f in self.field.split(",")]
+        fields.extend(f for f in (self.field_y, self.color_field) if f)
+        fields.extend(self.filters.keys())
+        fields.extend(self.deduplicate_by or [])
+        return list(dict.fromkeys(fields))
+
 
 @dataclass
 class DashboardConfig:
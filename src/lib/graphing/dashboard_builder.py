@@ -3,8 +3,11 @@
 This module orchestrates data fetching, graph generation, and dashboard assembly.
 """
 
+import multiprocessing
 import os
+import time
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -14,10 +17,123 @@ from loguru import logger
 from sqlalchemy.orm import Session
 
 from src.lib.graphing.base import DashboardConfig, DataSource, GraphDefinition
+from src.lib.graphing.figure_cache import (
+    FigureCache,
+    graph_cache_key,
+    graph_data_fingerprint,
+)
 from src.lib.graphing.graph_generator import GraphGenerator
+from src.lib.static_assets import write_plotly_html
 from src.paths import PATHS
 
 
+# Visit columns available to dashboards; graphs may reference any of these
+VISIT_COLUMNS = [
+    "id",
+    "onsen_id",
+    "visit_time",
+    "entry_fee_yen",
+    "payment_method",
+    "weather",
+    "visited_with",
+    "travel_mode",
+    "crowd_level",
+    "main_bath_type",
+    "water_color",
+    "temperature_outside_celsius",
+    "main_bath_temperature",
+    "outdoor_bath_temperature",
+    "sauna_temperature",
+    "stay_length_minutes",
+    "travel_time_minutes",
+    "sauna_duration_minutes",
+    "energy_level_change",
+    "hydration_level",
+    "accessibility_rating",
+    "cleanliness_rating",
+    "navigability_rating",
+    "view_rating",
+    "smell_intensity_rating",
+    "changing_room_cleanliness_rating",
+    "locker_availability_rating",
+    "rest_area_rating",
+    "food_quality_rating",
+    "sauna_rating",
+    "outdoor_bath_rating",
+    "atmosphere_rating",
+    "personal_rating",
+    "local_interaction_quality_rating",
+    "pre_visit_mood",
+    "post_visit_mood",
+    "had_sauna",
+    "sauna_visited",
+    "had_outdoor_bath",
+    "outdoor_bath_visited",
+    "multi_onsen_day",
+    "interacted_with_locals",
+]
+
+# Source columns of the fields added by DashboardBuilder._prepare_visit_data
+DERIVED_VISIT_FIELDS = {
+    "visit_hour": ("visit_time",),
+    "day_of_week": ("visit_time",),
+    "month": ("visit_time",),
+    "visit_date": ("visit_time",),
+    "visits_per_day": ("visit_time",),
+    "sauna_usage_status": ("had_sauna", "sauna_visited"),
+    "outdoor_bath_usage_status": ("had_outdoor_bath", "outdoor_bath_visited"),
+}
+
+
+def visit_columns_for(graph_defs: list[GraphDefinition]) -> list[str]:
+    """Resolve the visit columns needed to render the given graphs.
+
+    Derived fields are mapped back to their source columns. ``id`` and
+    ``visit_time`` are always included for the dashboard summary.
+
+    Args:
+        graph_defs: Graph definitions to render
+
+    Returns:
+        Visit column names, in ``VISIT_COLUMNS`` order
+    """
+    needed = {"id", "visit_time"}
+    for graph_def in graph_defs:
+        fields = graph_def.referenced_fields()
+        if fields is None:
+            return list(VISIT_COLUMNS)
+        for field in fields:
+            needed.update(DERIVED_VISIT_FIELDS.get(field, (field,)))
+    return [column for column in VISIT_COLUMNS if column in needed]
+
+
+# Per-process state for worker processes; the prepared data is sent once per worker
+_worker_data: Optional[pd.DataFrame] = None
+_worker_generator: Optional[GraphGenerator] = None
+
+
+def _init_graph_worker(data: pd.DataFrame) -> None:
+    """Install the shared, read-only dashboard data in a worker process."""
+    global _worker_data, _worker_generator  # pylint: disable=global-statement
+    _worker_data = data
+    _worker_generator = GraphGenerator()
+
+
+def _generate_figure_json(graph_def: GraphDefinition) -> tuple[Optional[str], float, Optional[str]]:
+    """Generate one graph in a worker process.
+
+    Returns:
+        Tuple of (figure JSON or None, seconds taken, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        fig = _worker_generator.generate(graph_def, _worker_data)
+        figure_json = fig.to_json() if fig is not None else None
+        return figure_json, time.perf_counter() - start, None
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return None, time.perf_counter() - start, str(e)
+
+
 class DashboardBuilder:
     """Builds interactive HTML dashboards from multiple graphs.
 
@@ -28,14 +144,26 @@ class DashboardBuilder:
     - File saving and browser opening
     """
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        jobs: int = 1,
+        figure_cache: Optional[FigureCache] = None,
+        use_figure_cache: bool = True,
+    ):
         """Initialize the dashboard builder.
 
         Args:
             session: SQLAlchemy database session
+            jobs: Number of worker processes used to generate graphs
+            figure_cache: Cache of generated figures (default: shared on-disk cache)
+            use_figure_cache: Reuse figures whose definition and data are unchanged
         """
         self.session = session
         self.generator = GraphGenerator()
+        self.jobs = max(1, jobs)
+        self.use_figure_cache = use_figure_cache
+        self._figure_cache = figure_cache
         self._plotly = None
         self._make_subplots = None
 
@@ -60,8 +188,11 @@ class DashboardBuilder:
         """
         self._ensure_plotly()
 
-        # Fetch data for the data source
-        data = self._fetch_data(config.data_source)
+        # Fetch only the columns the requested graphs use
+        columns = None
+        if config.data_source == DataSource.VISIT:
+            columns = visit_columns_for(config.graph_definitions)
+        data = self._fetch_data(config.data_source, columns)
         if data is None or data.empty:
             logger.error(f"No data available for {config.data_source.value}")
             return None
@@ -81,19 +212,14 @@ class DashboardBuilder:
 
         logger.info(f"Generating {len(valid_graphs)} graphs...")
 
-        # Generate all graphs
-        figures = []
-        titles = []
-        for graph_def in valid_graphs:
-            try:
-                fig = self.generator.generate(graph_def, data)
-                if fig is not None:
-                    figures.append(fig)
-                    titles.append(graph_def.title)
-                    logger.debug(f"Generated: {graph_def.title}")
-            except Exception as e:
-                logger.warning(f"Failed to generate '{graph_def.title}': {e}")
-                continue
+        # Generate all graphs, keeping definition order
+        generated = self._generate_figures(valid_graphs, data)
+        figures = [fig for fig in generated if fig is not None]
+        titles = [
+            graph_def.title
+            for graph_def, fig in zip(valid_graphs, generated)
+            if fig is not None
+        ]
 
         if not figures:
             logger.error("No graphs were successfully generated")
@@ -117,18 +243,130 @@ class DashboardBuilder:
 
         return output_path
 
-    def _fetch_data(self, data_source: DataSource) -> Optional[pd.DataFrame]:
+    def _get_figure_cache(self) -> Optional[FigureCache]:
+        """Return the figure cache, creating the shared on-disk cache on first use."""
+        if not self.use_figure_cache:
+            return None
+        if self._figure_cache is None:
+            try:
+                self._figure_cache = FigureCache()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Figure cache unavailable: {e}")
+                self.use_figure_cache = False
+                return None
+        return self._figure_cache
+
+    def _generate_figures(
+        self, graph_defs: list[GraphDefinition], data: pd.DataFrame
+    ) -> list:
+        """Generate figures for graph definitions, reusing cached ones.
+
+        Args:
+            graph_defs: Graphs to generate
+            data: Prepared data
+
+        Returns:
+            Figures in the same order as graph_defs (None where generation failed)
+        """
+        # pylint: disable=import-outside-toplevel
+        import plotly.io as pio
+
+        cache = self._get_figure_cache()
+        figures: list = [None] * len(graph_defs)
+        cache_keys: dict[int, tuple[str, str]] = {}
+        pending: list[int] = []
+
+        for idx, graph_def in enumerate(graph_defs):
+            if cache is not None:
+                key = graph_cache_key(graph_def)
+                fingerprint = graph_data_fingerprint(graph_def, data)
+                cache_keys[idx] = (key, fingerprint)
+                cached = cache.get(key, fingerprint)
+                if cached is not None:
+                    figures[idx] = pio.from_json(cached)
+                    logger.debug(f"Reused cached graph: {graph_def.title}")
+                    continue
+            pending.append(idx)
+
+        if len(pending) < len(graph_defs):
+            logger.info(
+                f"Reused {len(graph_defs) - len(pending)} cached graphs, "
+                f"generating {len(pending)}"
+            )
+
+        start = time.perf_counter()
+        for idx, fig, figure_json, seconds, error in self._run_generation(
+            [graph_defs[idx] for idx in pending], pending, data
+        ):
+            title = graph_defs[idx].title
+            if error is not None:
+                logger.warning(f"Failed to generate '{title}': {error}")
+                continue
+            if fig is None and figure_json is not None:
+                fig = pio.from_json(figure_json)
+            if fig is None:
+                continue
+
+            logger.debug(f"Generated: {title} ({seconds:.2f}s)")
+            figures[idx] = fig
+            if cache is not None:
+                cache.set(*cache_keys[idx], figure_json or fig.to_json())
+
+        if pending:
+            logger.info(
+                f"Generated {len(pending)} graphs in {time.perf_counter() - start:.2f}s "
+                f"using {min(self.jobs, len(pending))} worker(s)"
+            )
+        return figures
+
+    def _run_generation(
+        self,
+        graph_defs: list[GraphDefinition],
+        indices: list[int],
+        data: pd.DataFrame,
+    ) -> list[tuple]:
+        """Generate figures sequentially or in a worker pool.
+
+        Worker processes return figure JSON rather than figure objects.
+
+        Returns:
+            List of (index, figure or None, figure JSON or None, seconds, error or None)
+        """
+        if self.jobs > 1 and len(graph_defs) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(graph_defs)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_graph_worker,
+                initargs=(data,),
+            ) as pool:
+                results = list(pool.map(_generate_figure_json, graph_defs))
+            return [(idx, None, *result) for idx, result in zip(indices, results)]
+
+        results = []
+        for idx, graph_def in zip(indices, graph_defs):
+            start = time.perf_counter()
+            try:
+                fig = self.generator.generate(graph_def, data)
+                results.append((idx, fig, None, time.perf_counter() - start, None))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results.append((idx, None, None, time.perf_counter() - start, str(e)))
+        return results
+
+    def _fetch_data(
+        self, data_source: DataSource, columns: Optional[list[str]] = None
+    ) -> Optional[pd.DataFrame]:
         """Fetch data from database based on data source.
 
         Args:
             data_source: Source of data to fetch
+            columns: Source columns to load (default: all)
 
         Returns:
             DataFrame with fetched data, or None if failed
         """
         try:
             if data_source == DataSource.VISIT:
-                return self._fetch_visit_data()
+                return self._fetch_visit_data(columns)
             elif data_source == DataSource.WEIGHT:
                 return self._fetch_weight_data()
             elif data_source == DataSource.EXERCISE:
@@ -140,67 +378,24 @@ class DashboardBuilder:
             logger.error(f"Error fetching data for {data_source.value}: {e}")
             return None
 
-    def _fetch_visit_data(self) -> pd.DataFrame:
-        """Fetch onsen visit data from database."""
+    def _fetch_visit_data(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Fetch onsen visit data from database.
+
+        Only the requested columns are read, straight into typed arrays.
+
+        Args:
+            columns: Visit columns to load (default: all dashboard columns)
+        """
         # pylint: disable=import-outside-toplevel
+        from src.db.columnar import fetch_columns
         from src.db.models import OnsenVisit
 
-        query = self.session.query(OnsenVisit)
-        visits = query.all()
-
-        if not visits:
-            return pd.DataFrame()
-
-        # Convert to DataFrame
-        data = []
-        for visit in visits:
-            row = {
-                "id": visit.id,
-                "onsen_id": visit.onsen_id,
-                "visit_time": visit.visit_time,
-                "entry_fee_yen": visit.entry_fee_yen,
-                "payment_method": visit.payment_method,
-                "weather": visit.weather,
-                "visited_with": visit.visited_with,
-                "travel_mode": visit.travel_mode,
-                "crowd_level": visit.crowd_level,
-                "main_bath_type": visit.main_bath_type,
-                "water_color": visit.water_color,
-                "temperature_outside_celsius": visit.temperature_outside_celsius,
-                "main_bath_temperature": visit.main_bath_temperature,
-                "outdoor_bath_temperature": visit.outdoor_bath_temperature,
-                "sauna_temperature": visit.sauna_temperature,
-                "stay_length_minutes": visit.stay_length_minutes,
-                "travel_time_minutes": visit.travel_time_minutes,
-                "sauna_duration_minutes": visit.sauna_duration_minutes,
-                "energy_level_change": visit.energy_level_change,
-                "hydration_level": visit.hydration_level,
-                "accessibility_rating": visit.accessibility_rating,
-                "cleanliness_rating": visit.cleanliness_rating,
-                "navigability_rating": visit.navigability_rating,
-                "view_rating": visit.view_rating,
-                "smell_intensity_rating": visit.smell_intensity_rating,
-                "changing_room_cleanliness_rating": visit.changing_room_cleanliness_rating,
-                "locker_availability_rating": visit.locker_availability_rating,
-                "rest_area_rating": visit.rest_area_rating,
-                "food_quality_rating": visit.food_quality_rating,
-                "sauna_rating": visit.sauna_rating,
-                "outdoor_bath_rating": visit.outdoor_bath_rating,
-                "atmosphere_rating": visit.atmosphere_rating,
-                "personal_rating": visit.personal_rating,
-                "local_interaction_quality_rating": visit.local_interaction_quality_rating,
-                "pre_visit_mood": visit.pre_visit_mood,
-                "post_visit_mood": visit.post_visit_mood,
-                "had_sauna": visit.had_sauna,
-                "sauna_visited": visit.sauna_visited,
-                "had_outdoor_bath": visit.had_outdoor_bath,
-                "outdoor_bath_visited": visit.outdoor_bath_visited,
-                "multi_onsen_day": visit.multi_onsen_day,
-                "interacted_with_locals": visit.interacted_with_locals,
-            }
-            data.append(row)
-
-        return pd.DataFrame(data)
+        return fetch_columns(
+            self.session,
+            OnsenVisit,
+            columns if columns is not None else VISIT_COLUMNS,
+            order_by=OnsenVisit.id,
+        )
 
     def _fetch_weight_data(self) -> pd.DataFrame:
         """Fetch weight measurement data (placeholder for future)."""
@@ -512,8 +707,8 @@ class DashboardBuilder:
 
             output_path = os.path.join(PATHS.GRAPHS_DIR, filename)
 
-            # Save to HTML
-            dashboard.write_html(output_path)
+            # Save to HTML, referencing the shared plotly bundle
+            write_plotly_html(dashboard, output_path)
 
             return output_path
 
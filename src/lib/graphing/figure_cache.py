@@ -0,0 +1,93 @@
+"""Persistent cache of generated graph figures.
+
+Figures are stored as Plotly JSON keyed by the graph definition and a hash of
+the generator code, so editing the graph code invalidates them. Each entry
+records a fingerprint of the data columns the graph reads, so after new data
+arrives only graphs whose columns changed are regenerated.
+"""
+
+import dataclasses
+import hashlib
+import json
+import zlib
+from enum import Enum
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from src.lib.cache import SqliteLRUStore
+from src.lib.graphing.base import GraphDefinition
+from src.paths import PATHS
+
+DEFAULT_MAX_CACHE_SIZE_BYTES = 64 * 1024 * 1024
+
+# Modules whose code shapes the generated figures
+GENERATOR_SOURCES = ("base.py", "graph_generator.py")
+
+
+@cache
+def graph_generator_version() -> str:
+    """Hash the graph generator source and the Plotly version."""
+    digest = hashlib.sha256()
+    for name in GENERATOR_SOURCES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    try:
+        digest.update(metadata.version("plotly").encode("utf-8"))
+    except metadata.PackageNotFoundError:
+        pass
+    return digest.hexdigest()[:16]
+
+
+def graph_cache_key(graph_def: GraphDefinition) -> str:
+    """Hash every attribute of a graph definition and the generator version."""
+    payload = json.dumps(
+        dataclasses.asdict(graph_def),
+        sort_keys=True,
+        default=lambda v: v.value if isinstance(v, Enum) else str(v),
+    )
+    payload = f"{graph_generator_version()}:{payload}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def graph_data_fingerprint(graph_def: GraphDefinition, data: pd.DataFrame) -> str:
+    """Hash the names, dtypes and values of the columns a graph reads."""
+    fields = graph_def.referenced_fields()
+    columns = sorted(data.columns if fields is None else [f for f in fields if f in data.columns])
+
+    digest = hashlib.sha256()
+    for column in columns:
+        series = data[column]
+        digest.update(f"{column}:{series.dtype}:".encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Size-bounded, on-disk store for compressed figure JSON."""
+
+    def __init__(
+        self,
+        db_path: str = PATHS.GRAPH_CACHE_DB,
+        max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES,
+    ):
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self._store = SqliteLRUStore(db_path, "graph_figures", max_size_bytes)
+
+    def get(self, graph_key: str, fingerprint: str) -> Optional[str]:
+        """Return cached figure JSON, dropping the entry if its data changed."""
+        blob = self._store.get(graph_key, fingerprint)
+        if blob is None:
+            return None
+        return zlib.decompress(blob).decode("utf-8")
+
+    def set(self, graph_key: str, fingerprint: str, figure_json: str) -> None:
+        """Store figure JSON and evict least recently used entries over the size limit."""
+        self._store.set(graph_key, fingerprint, zlib.compress(figure_json.encode("utf-8")))
+
+    def clear(self) -> int:
+        """Remove all cached figures and return the number of entries removed."""
+        return self._store.clear()
@@ -0,0 +1,276 @@
+"""
+Japanese national holidays computed from the rules of the Public Holiday Act.
+
+The holidays for every supported year (``FIRST_YEAR`` to ``LAST_YEAR``) are
+computed once per process and stored as a sorted array of date ordinals plus
+a bitset over the whole range. Checking a date is then a single bit lookup,
+and arrays of dates are checked in one vectorized numpy operation, so
+opening-hours and closed-day checks never touch the network or the file
+cache.
+
+Covered rules: fixed-date and Happy Monday holidays with the years they
+moved, the equinox days (from the standard astronomical approximation), the
+Olympic moves in 2020 and 2021, one-off holidays for imperial ceremonies,
+substitute holidays (振替休日, from 1973-04-12) and citizens' holidays
+sandwiched between two national holidays (国民の休日, from 1985-12-27).
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Optional
+
+FIRST_YEAR = 1949
+LAST_YEAR = 2150
+
+SUBSTITUTE_HOLIDAY_START = date(1973, 4, 12)
+CITIZENS_HOLIDAY_START = date(1985, 12, 27)
+# From 2007 a substitute holiday moves past consecutive holidays and
+# citizens' holidays may fall on a Sunday
+HOLIDAY_ACT_2007 = date(2007, 1, 1)
+
+# Days of the proleptic Gregorian calendar before 1970-01-01 (numpy's epoch)
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+MONDAY, SUNDAY = 0, 6
+
+SPECIAL_HOLIDAYS = {
+    date(1959, 4, 10): "皇太子・明仁親王の結婚の儀",
+    date(1989, 2, 24): "昭和天皇の大喪の礼",
+    date(1990, 11, 12): "即位礼正殿の儀",
+    date(1993, 6, 9): "皇太子・徳仁親王の結婚の儀",
+    date(2019, 5, 1): "天皇の即位の日",
+    date(2019, 10, 22): "即位礼正殿の儀",
+}
+
+# Marine Day, Sports Day and Mountain Day moved around the Tokyo Olympics
+OLYMPIC_HOLIDAYS = {
+    2020: {"海の日": date(2020, 7, 23), "スポーツの日": date(2020, 7, 24), "山の日": date(2020, 8, 10)},
+    2021: {"海の日": date(2021, 7, 22), "スポーツの日": date(2021, 7, 23), "山の日": date(2021, 8, 8)},
+}
+
+
+def _nth_monday(year: int, month: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(MONDAY - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def vernal_equinox_day(year: int) -> int:
+    """Day of March of the Vernal Equinox Day (valid 1900-2150)."""
+    if year <= 1979:
+        return int(20.8357 + 0.242194 * (year - 1980) - int((year - 1983) / 4))
+    if year <= 2099:
+        return int(20.8431 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+    return int(21.8510 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+
+
+def autumnal_equinox_day(year: int) -> int:
+    """Day of September of the Autumnal Equinox Day (valid 1900-2150)."""
+    if year <= 1979:
+        return int(23.2588 + 0.242194 * (year - 1980) - int((year - 1983) / 4))
+    if year <= 2099:
+        return int(23.2488 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+    return int(24.2488 + 0.242194 * (year - 1980) - int((year - 1980) / 4))
+
+
+def _national_holidays(year: int) -> dict[date, str]:
+    # pylint: disable=too-many-branches
+    holidays = {date(year, 1, 1): "元日"}
+
+    if year <= 1999:
+        holidays[date(year, 1, 15)] = "成人の日"
+    else:
+        holidays[_nth_monday(year, 1, 2)] = "成人の日"
+
+    if year >= 1967:
+        holidays[date(year, 2, 11)] = "建国記念の日"
+
+    if year <= 1988:
+        holidays[date(year, 4, 29)] = "天皇誕生日"
+    elif year <= 2018:
+        holidays[date(year, 12, 23)] = "天皇誕生日"
+    elif year >= 2020:
+        holidays[date(year, 2, 23)] = "天皇誕生日"
+
+    holidays[date(year, 3, vernal_equinox_day(year))] = "春分の日"
+
+    if 1989 <= year <= 2006:
+        holidays[date(year, 4, 29)] = "みどりの日"
+    elif year >= 2007:
+        holidays[date(year, 4, 29)] = "昭和の日"
+        holidays[date(year, 5, 4)] = "みどりの日"
+
+    holidays[date(year, 5, 3)] = "憲法記念日"
+    holidays[date(year, 5, 5)] = "こどもの日"
+
+    olympic = OLYMPIC_HOLIDAYS.get(year, {})
+    if olympic:
+        holidays.update({day: name for name, day in olympic.items()})
+    else:
+        if 1996 <= year <= 2002:
+            holidays[date(year, 7, 20)] = "海の日"
+        elif year >= 2003:
+            holidays[_nth_monday(year, 7, 3)] = "海の日"
+
+        if year >= 2016:
+            holidays[date(year, 8, 11)] = "山の日"
+
+        if 1966 <= year <= 1999:
+            holidays[date(year, 10, 10)] = "体育の日"
+        elif 2000 <= year <= 2019:
+            holidays[_nth_monday(year, 10, 2)] = "体育の日"
+        elif year >= 2022:
+            holidays[_nth_monday(year, 10, 2)] = "スポーツの日"
+
+    if 1966 <= year <= 2002:
+        holidays[date(year, 9, 15)] = "敬老の日"
+    elif year >= 2003:
+        holidays[_nth_monday(year, 9, 3)] = "敬老の日"
+
+    holidays[date(year, 9, autumnal_equinox_day(year))] = "秋分の日"
+    holidays[date(year, 11, 3)] = "文化の日"
+    holidays[date(year, 11, 23)] = "勤労感謝の日"
+
+    holidays.update({day: name for day, name in SPECIAL_HOLIDAYS.items() if day.year == year})
+    return holidays
+
+
+def compute_holidays(year: int) -> dict[date, str]:
+    """
+    Compute the Japanese public holidays of a year from the holiday rules.
+
+    Substitute and citizens' holidays are named "休日", as in the Cabinet
+    Office calendar.
+
+    Args:
+        year: Calendar year (rules are reliable from 1949 to 2150)
+
+    Returns:
+        Holiday names keyed by date, in date order
+    """
+    national = _national_holidays(year)
+    holidays = dict(national)
+
+    for day in national:
+        if day.weekday() != SUNDAY or day < SUBSTITUTE_HOLIDAY_START:
+            continue
+        substitute = day + timedelta(days=1)
+        if day >= HOLIDAY_ACT_2007:
+            while substitute in national:
+                substitute += timedelta(days=1)
+        if substitute not in national:
+            holidays[substitute] = "休日"
+
+    for day in national:
+        between = day + timedelta(days=1)
+        if (
+            between >= CITIZENS_HOLIDAY_START
+            and between not in holidays
+            and between + timedelta(days=1) in national
+            and (between >= HOLIDAY_ACT_2007 or between.weekday() != SUNDAY)
+        ):
+            holidays[between] = "休日"
+
+    return dict(sorted(holidays.items()))
+
+
+class HolidayTable:
+    """Holidays of a year range as sorted ordinals with a bitset for O(1) lookups."""
+
+    def __init__(self, ordinals: array, first_year: int, last_year: int):
+        """
+        Initialize the table.
+
+        Args:
+            ordinals: Sorted ``date.toordinal()`` values of the holidays
+            first_year: First year covered
+            last_year: Last year covered (inclusive)
+        """
+        self.ordinals = ordinals
+        self.first_year = first_year
+        self.last_year = last_year
+        self.first_ordinal = date(first_year, 1, 1).toordinal()
+        self.day_count = date(last_year, 12, 31).toordinal() - self.first_ordinal + 1
+
+        bits = bytearray((self.day_count + 7) // 8)
+        for ordinal in ordinals:
+            offset = ordinal - self.first_ordinal
+            bits[offset >> 3] |= 1 << (offset & 7)
+        self.bits = bytes(bits)
+        self._years: dict[int, frozenset[date]] = {}
+
+    @classmethod
+    def build(cls, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR) -> "HolidayTable":
+        """Compute the holidays of every year in the range."""
+        ordinals = array(
+            "i",
+            (
+                day.toordinal()
+                for year in range(first_year, last_year + 1)
+                for day in compute_holidays(year)
+            ),
+        )
+        return cls(ordinals, first_year, last_year)
+
+    def covers(self, year: int) -> bool:
+        """Whether the table has the holidays of ``year``."""
+        return self.first_year <= year <= self.last_year
+
+    def contains(self, day: date) -> bool:
+        """Whether ``day`` is a holiday (False outside the covered years)."""
+        offset = day.toordinal() - self.first_ordinal
+        if offset < 0 or offset >= self.day_count:
+            return False
+        return bool(self.bits[offset >> 3] & (1 << (offset & 7)))
+
+    def holidays_in_year(self, year: int) -> frozenset[date]:
+        """Holidays of a year (empty outside the covered years)."""
+        holidays = self._years.get(year)
+        if holidays is None:
+            start = bisect_left(self.ordinals, date(year, 1, 1).toordinal())
+            end = bisect_left(self.ordinals, date(year + 1, 1, 1).toordinal())
+            holidays = frozenset(date.fromordinal(ordinal) for ordinal in self.ordinals[start:end])
+            self._years[year] = holidays
+        return holidays
+
+    def contains_many(self, dates: Any):
+        """
+        Vectorized holiday membership.
+
+        Args:
+            dates: Sequence or array of dates or datetimes (including numpy
+                ``datetime64`` arrays and pandas Series / DatetimeIndex)
+
+        Returns:
+            Boolean numpy array; NaT and dates outside the covered years are False
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        days = np.asarray(dates, dtype="datetime64[D]")
+        offsets = days.astype("int64") + (_UNIX_EPOCH_ORDINAL - self.first_ordinal)
+        valid = ~np.isnat(days) & (offsets >= 0) & (offsets < self.day_count)
+        result = np.zeros(days.shape, dtype=bool)
+        valid_offsets = offsets[valid]
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        result[valid] = (bits[valid_offsets >> 3] >> (valid_offsets & 7).astype(np.uint8)) & 1 == 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+
+@lru_cache(maxsize=1)
+def get_holiday_table() -> HolidayTable:
+    """The process-wide holiday table for ``FIRST_YEAR``-``LAST_YEAR``."""
+    return HolidayTable.build()
+
+
+def is_japanese_holiday(day: date) -> bool:
+    """Whether ``day`` (a date or datetime) is a Japanese public holiday."""
+    return get_holiday_table().contains(day)
+
+
+def holiday_mask(dates: Any, table: Optional[HolidayTable] = None):
+    """Boolean numpy array marking which of ``dates`` are Japanese public holidays."""
+    return (table or get_holiday_table()).contains_many(dates)
@@ -10,6 +10,12 @@ from sqlalchemy.orm import Session
 from src.db.models import Onsen, Location, OnsenVisit
 from src.paths import PATHS
 from src.lib.utils import generate_google_maps_link
+from src.lib.client_map import (
+    ClientMarkerLayer,
+    point_feature,
+    use_client_side,
+    write_map_data,
+)
 from src.lib.apple_reminders import (
     generate_reminder_script,
     is_reminders_available,
@@ -580,67 +586,19 @@ def generate_recommendation_map(
     return output_path
 
 
-def generate_all_onsens_map(
+def _add_onsen_markers(
+    folium_map: folium.Map,
     onsens: list[Onsen],
-    db_session: Session,
-    output_filename: str | None = None,
-    show_locations: bool = True,
-) -> str:
+    visited_onsen_ids: set[int],
+) -> None:
     """
-    Generate an interactive HTML map showing all onsens in the database.
+    Add one marker with a full details popup per onsen.
 
     Args:
-        onsens: List of all onsens to display
-        db_session: Database session to query visit status and locations
-        output_filename: Optional filename for the map (default: timestamped)
-        show_locations: Whether to show location markers on map (default: True)
-
-    Returns:
-        Absolute path to the generated HTML file
+        folium_map: The folium Map object to add markers to
+        onsens: Onsens to display; ones without coordinates are skipped
+        visited_onsen_ids: IDs of onsens with at least one visit
     """
-    # Ensure maps directory exists
-    os.makedirs(PATHS.MAPS_DIR, exist_ok=True)
-
-    # Generate filename if not provided
-    if output_filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"all_onsens_map_{timestamp}.html"
-
-    output_path = os.path.join(PATHS.MAPS_DIR, output_filename)
-
-    # Get visited onsen IDs
-    visited_onsen_ids = set()
-    try:
-        visited_rows = db_session.query(OnsenVisit.onsen_id).distinct().all()
-        visited_onsen_ids = {
-            row[0] if isinstance(row, tuple) else row.onsen_id for row in visited_rows
-        }
-    except Exception:
-        # If there's an error querying visits, just continue without visit info
-        pass
-
-    # Calculate center point from all onsens with coordinates
-    onsens_with_coords = [o for o in onsens if o.latitude and o.longitude]
-    if onsens_with_coords:
-        avg_lat = sum(o.latitude for o in onsens_with_coords) / len(onsens_with_coords)
-        avg_lon = sum(o.longitude for o in onsens_with_coords) / len(onsens_with_coords)
-    else:
-        # Default to Beppu center
-        avg_lat = 33.2794
-        avg_lon = 131.5006
-
-    # Create the map
-    m = folium.Map(
-        location=[avg_lat, avg_lon],
-        zoom_start=12,
-        tiles="OpenStreetMap",
-    )
-
-    # Add location markers (all in pink, no reference location)
-    if show_locations:
-        _add_location_markers(m, db_session, reference_location_id=None)
-
-    # Add onsen markers
     for i, onsen in enumerate(onsens, 1):
         if onsen.latitude is None or onsen.longitude is None:
             continue
@@ -714,7 +672,137 @@ def generate_all_onsens_map(
             popup=popup,
             tooltip=tooltip_text,
             icon=folium.Icon(color=color, icon=icon, prefix="fa"),
-        ).add_to(m)
+        ).add_to(folium_map)
+
+
+def _add_client_side_onsens(
+    folium_map: folium.Map,
+    onsens: list[Onsen],
+    visited_onsen_ids: set[int],
+    output_path: str,
+) -> None:
+    """
+    Write onsens to a GeoJSON data file and render them in the browser.
+
+    Popup details are built from the data file when a marker is clicked, so
+    the map HTML stays the same size regardless of the catalogue size.
+
+    Args:
+        folium_map: The folium Map object to add the layer to
+        onsens: Onsens to display; ones without coordinates are skipped
+        visited_onsen_ids: IDs of onsens with at least one visit
+        output_path: Path the map HTML will be saved to
+    """
+    features = []
+    for i, onsen in enumerate(onsens, 1):
+        if onsen.latitude is None or onsen.longitude is None:
+            continue
+
+        visited = onsen.id in visited_onsen_ids
+        features.append(point_feature(onsen.latitude, onsen.longitude, {
+            "title": f"{i}. {onsen.name}",
+            "color": "green" if visited else "#3388ff",
+            "id": onsen.id,
+            "ban": onsen.ban_number or "N/A",
+            "address": onsen.address or "N/A",
+            "hours": onsen.usage_time,
+            "closed": onsen.closed_days,
+            "fee": onsen.admission_fee,
+            "spring": onsen.spring_quality,
+            "parking": onsen.parking,
+            "remarks": onsen.remarks,
+            "visited": "Yes" if visited else "No",
+            "link": generate_google_maps_link(onsen),
+        }))
+
+    data_src = write_map_data(features, output_path, data_var="onsenMapData")
+    ClientMarkerLayer(
+        data_src,
+        data_var="onsenMapData",
+        fields=[
+            ("id", "ID"),
+            ("ban", "Ban Number"),
+            ("address", "Address"),
+            ("hours", "Hours"),
+            ("closed", "Closed Days"),
+            ("fee", "Admission Fee"),
+            ("spring", "Spring Quality"),
+            ("parking", "Parking"),
+            ("remarks", "Remarks"),
+            ("visited", "Visited"),
+        ],
+    ).add_to(folium_map)
+
+
+def generate_all_onsens_map(
+    onsens: list[Onsen],
+    db_session: Session,
+    output_filename: str | None = None,
+    show_locations: bool = True,
+    client_side: bool | None = None,
+) -> str:
+    """
+    Generate an interactive HTML map showing all onsens in the database.
+
+    Args:
+        onsens: List of all onsens to display
+        db_session: Database session to query visit status and locations
+        output_filename: Optional filename for the map (default: timestamped)
+        show_locations: Whether to show location markers on map (default: True)
+        client_side: Write the onsens to a GeoJSON data file rendered in the
+            browser instead of one marker per onsen (default: only for large
+            catalogues)
+
+    Returns:
+        Absolute path to the generated HTML file
+    """
+    # Ensure maps directory exists
+    os.makedirs(PATHS.MAPS_DIR, exist_ok=True)
+
+    # Generate filename if not provided
+    if output_filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_filename = f"all_onsens_map_{timestamp}.html"
+
+    output_path = os.path.join(PATHS.MAPS_DIR, output_filename)
+
+    # Get visited onsen IDs
+    visited_onsen_ids = set()
+    try:
+        visited_rows = db_session.query(OnsenVisit.onsen_id).distinct().all()
+        visited_onsen_ids = {
+            row[0] if isinstance(row, tuple) else row.onsen_id for row in visited_rows
+        }
+    except Exception:
+        # If there's an error querying visits, just continue without visit info
+        pass
+
+    # Calculate center point from all onsens with coordinates
+    onsens_with_coords = [o for o in onsens if o.latitude and o.longitude]
+    if onsens_with_coords:
+        avg_lat = sum(o.latitude for o in onsens_with_coords) / len(onsens_with_coords)
+        avg_lon = sum(o.longitude for o in onsens_with_coords) / len(onsens_with_coords)
+    else:
+        # Default to Beppu center
+        avg_lat = 33.2794
+        avg_lon = 131.5006
+
+    # Create the map
+    m = folium.Map(
+        location=[avg_lat, avg_lon],
+        zoom_start=12,
+        tiles="OpenStreetMap",
+    )
+
+    # Add location markers (all in pink, no reference location)
+    if show_locations:
+        _add_location_markers(m, db_session, reference_location_id=None)
+
+    # Add onsen markers
+    if use_client_side(len(onsens_with_coords), client_side):
+        _add_client_side_onsens(m, onsens, visited_onsen_ids, output_path)
+    else:
+        _add_onsen_markers(m, onsens, visited_onsen_ids)
 
     # Add legend with visit status
     visited_count = len([o for o in onsens_with_coords if o.id in visited_onsen_ids])
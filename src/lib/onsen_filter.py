@@ -1,11 +1,24 @@
 """Onsen filtering utilities for keyword-based searches."""
 
-from typing import Optional
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
 
 from sqlalchemy.orm import Session
 
 from src.db.models import Onsen
 
+# Columns shown by the summary table (plus the id used as a paging cursor)
+ONSEN_SUMMARY_COLUMNS = (
+    Onsen.id,
+    Onsen.ban_number,
+    Onsen.name,
+    Onsen.region,
+    Onsen.latitude,
+    Onsen.longitude,
+    Onsen.admission_fee,
+    Onsen.usage_time,
+)
+
 
 def filter_onsens_by_keyword(
     db: Session,
@@ -97,8 +110,24 @@ def format_onsen_summary_table(onsens: list[Onsen]) -> str:
     Returns:
         Formatted string table with onsen details
     """
-    if not onsens:
-        return "No onsens found."
+    return "\n".join(iter_onsen_summary_table(onsens))
+
+
+def iter_onsen_summary_table(onsens: Iterable[Any]) -> Iterator[str]:
+    """
+    Yield the lines of the onsen summary table as the onsens arrive.
+
+    Args:
+        onsens: Onsen objects, or rows with the ``ONSEN_SUMMARY_COLUMNS`` attributes
+
+    Yields:
+        Table lines, or a single "No onsens found." line
+    """
+    onsens = iter(onsens)
+    first = next(onsens, None)
+    if first is None:
+        yield "No onsens found."
+        return
 
     # Build header
     header = (
@@ -107,19 +136,21 @@ def format_onsen_summary_table(onsens: list[Onsen]) -> str:
     )
     separator = "-" * len(header)
 
-    # Build rows
-    rows = []
-    for onsen in onsens:
-        ban = onsen.ban_number or "N/A"
-        name = (onsen.name[:37] + "...") if len(onsen.name) > 40 else onsen.name
-        region = (onsen.region[:12] + "...") if onsen.region and len(onsen.region) > 15 else (onsen.region or "N/A")
-        coords = f"{onsen.latitude:.4f}, {onsen.longitude:.4f}" if onsen.latitude and onsen.longitude else "N/A"
-        fee = (onsen.admission_fee[:12] + "...") if onsen.admission_fee and len(onsen.admission_fee) > 15 else (onsen.admission_fee or "N/A")
-        hours = (onsen.usage_time[:17] + "...") if onsen.usage_time and len(onsen.usage_time) > 20 else (onsen.usage_time or "N/A")
-
-        row = f"{ban:<6} {name:<40} {region:<15} {coords:<25} {fee:<15} {hours:<20}"
-        rows.append(row)
-
-    # Combine
-    table = "\n".join([separator, header, separator] + rows + [separator])
-    return table
+    yield separator
+    yield header
+    yield separator
+    for onsen in chain([first], onsens):
+        yield format_onsen_summary_row(onsen)
+    yield separator
+
+
+def format_onsen_summary_row(onsen: Any) -> str:
+    """Format one onsen (object or row with the ``ONSEN_SUMMARY_COLUMNS`` attributes) as a table row."""
+    ban = onsen.ban_number or "N/A"
+    name = (onsen.name[:37] + "...") if len(onsen.name) > 40 else onsen.name
+    region = (onsen.region[:12] + "...") if onsen.region and len(onsen.region) > 15 else (onsen.region or "N/A")
+    coords = f"{onsen.latitude:.4f}, {onsen.longitude:.4f}" if onsen.latitude and onsen.longitude else "N/A"
+    fee = (onsen.admission_fee[:12] + "...") if onsen.admission_fee and len(onsen.admission_fee) > 15 else (onsen.admission_fee or "N/A")
+    hours = (onsen.usage_time[:17] + "...") if onsen.usage_time and len(onsen.usage_time) > 20 else (onsen.usage_time or "N/A")
+
+    return f"{ban:<6} {name:<40} {region:<15} {coords:<25} {fee:<15} {hours:<20}"
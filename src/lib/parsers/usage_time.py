@@ -8,8 +8,6 @@ import os
 import re
 from typing import Optional
 
-import requests
-
 from src.const import CONST
 from src.paths import PATHS
 
@@ -27,6 +25,38 @@ class HolidayService(ABC):
         """Return a set of holiday dates for the given year."""
         pass
 
+    def is_holiday(self, day: date) -> bool:
+        """Return whether the given date is a holiday."""
+        return day in self.get_holidays(day.year)
+
+
+class PrecomputedJapanHolidayService(HolidayService):
+    """Japanese holidays from the rule-based table in ``src.lib.japan_holidays``.
+
+    No network access or file cache: lookups are O(1) bit tests. Years outside
+    the table's range have no holidays unless a fallback service is given.
+    """
+
+    def __init__(self, fallback: Optional[HolidayService] = None):
+        from src.lib.japan_holidays import (  # pylint: disable=import-outside-toplevel
+            get_holiday_table,
+        )
+
+        self.table = get_holiday_table()
+        self.fallback = fallback
+
+    def get_holidays(self, year: int) -> set[date]:
+        """Return the holidays of the given year from the table."""
+        if not self.table.covers(year) and self.fallback is not None:
+            return self.fallback.get_holidays(year)
+        return set(self.table.holidays_in_year(year))
+
+    def is_holiday(self, day: date) -> bool:
+        """Return whether the given date is a holiday."""
+        if not self.table.covers(day.year) and self.fallback is not None:
+            return self.fallback.is_holiday(day)
+        return self.table.contains(day)
+
 
 class JapanHolidayService(HolidayService):
     """Service to fetch Japanese holidays from the internet."""
@@ -37,6 +67,8 @@ class JapanHolidayService(HolidayService):
     def get_holidays(self, year: int) -> set[date]:
         """Fetch Japanese holidays for the given year from the internet."""
         try:
+            import requests  # pylint: disable=import-outside-toplevel
+
             url = f"{self.base_url}/{year}/date.json"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
@@ -131,6 +163,8 @@ class CachedJapanHolidayService(HolidayService):
 
         # Not in cache - fetch from API
         try:
+            import requests  # pylint: disable=import-outside-toplevel
+
             url = f"{self.base_url}/{year}/date.json"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
@@ -187,7 +221,7 @@ def get_holiday_service() -> HolidayService:
     """Get the global holiday service instance."""
     global _holiday_service  # pylint: disable=global-statement
     if _holiday_service is None:
-        _holiday_service = CachedJapanHolidayService()
+        _holiday_service = PrecomputedJapanHolidayService()
     return _holiday_service
 
 
@@ -199,9 +233,7 @@ def set_holiday_service(service: HolidayService) -> None:
 
 def is_holiday(dt: datetime) -> bool:
     """Check if the given datetime is a holiday."""
-    holiday_service = get_holiday_service()
-    holidays = holiday_service.get_holidays(dt.year)
-    return dt.date() in holidays
+    return get_holiday_service().is_holiday(dt.date())
 
 
 # -------------------------------
@@ -30,6 +30,7 @@ class OnsenRecommendationEngine:
         self._stay_restriction_cache: dict[int, tuple[Optional[str], Any]] = {}
         self._visited_onsen_ids: Optional[set[int]] = None
         self._visit_cache_supported: bool = True
+        self._availability_index: Optional[tuple[tuple, Any]] = None
 
         # Calculate distance milestones if location is provided
         if location:
@@ -47,19 +48,45 @@ class OnsenRecommendationEngine:
         Args:
             target_time: The time to check availability for
             min_hours_after: Minimum hours the onsen should be open after target_time (None to disable)
+            onsens: Onsens to check (defaults to the whole catalogue)
 
         Returns:
             List of available onsens
         """
         # Get all onsens if not provided
         onsens = onsens if onsens is not None else self.db_session.query(Onsen).all()
-        available_onsens = []
+        if not onsens:
+            return []
 
-        for onsen in onsens:
-            if self._is_onsen_available(onsen, target_time, min_hours_after):
-                available_onsens.append(onsen)
+        available = self.get_availability_index(onsens).available_at(
+            target_time, min_hours_after
+        )
+        return [onsen for onsen, is_available in zip(onsens, available) if is_available]
+
+    def get_availability_index(self, onsens: list[Onsen]):
+        """
+        Vectorized availability index for a list of onsens.
+
+        The index is reused while the same onsens (with the same usage times
+        and closed days) are requested, e.g. when checking many target times.
+
+        Args:
+            onsens: Onsens to index
+
+        Returns:
+            AvailabilityIndex with one row per onsen, in order
+        """
+        from src.lib.availability import (  # pylint: disable=import-outside-toplevel
+            AvailabilityIndex,
+        )
 
-        return available_onsens
+        key = tuple((onsen.id, onsen.usage_time, onsen.closed_days) for onsen in onsens)
+        if self._availability_index is None or self._availability_index[0] != key:
+            index = AvailabilityIndex.from_onsens(
+                onsens, self._get_usage_time_parsed, self._get_closed_days_parsed
+            )
+            self._availability_index = (key, index)
+        return self._availability_index[1]
 
     def _is_onsen_available(
         self, onsen: Onsen, target_time: datetime, min_hours_after: Optional[int] = None
@@ -0,0 +1,176 @@
+"""
+Shared static assets and housekeeping for generated HTML output.
+
+Plotly embeds its ~4.6 MB JavaScript bundle in every HTML file by default.
+Instead, the bundle is written once per plotly version into a shared assets
+directory and generated files reference it with a relative ``<script src>``.
+
+Generated dashboards and maps are named ``<prefix>_<YYYYmmdd_HHMMSS>.<ext>``;
+``cleanup_generated_outputs`` keeps the most recent files of each prefix and
+removes the rest, along with bundles no remaining HTML file references. Any
+HTML under the output root (including analysis runs) keeps a bundle alive.
+"""
+
+import os
+import re
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from src.paths import PATHS
+
+PLOTLY_BUNDLE_PATTERN = re.compile(r"plotly-[\w.+-]+\.min\.js")
+TIMESTAMPED_OUTPUT_PATTERN = re.compile(
+    r"^(?P<prefix>.+)_(?P<timestamp>\d{8}_\d{6})(?P<suffix>\..+)$"
+)
+
+
+def _assets_path(assets_dir: Optional[str | Path]) -> Path:
+    return Path(assets_dir) if assets_dir else Path(PATHS.STATIC_ASSETS_DIR)
+
+
+def ensure_plotly_bundle(assets_dir: Optional[str | Path] = None) -> Path:
+    """
+    Write the plotly.js bundle for the installed plotly version, if missing.
+
+    Args:
+        assets_dir: Shared assets directory (default: PATHS.STATIC_ASSETS_DIR)
+
+    Returns:
+        Path to the bundle
+    """
+    # pylint: disable=import-outside-toplevel
+    import plotly
+    from plotly.offline import get_plotlyjs
+
+    directory = _assets_path(assets_dir)
+    bundle = directory / f"plotly-{plotly.__version__}.min.js"
+    if bundle.exists():
+        return bundle
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so concurrent writers never expose a partial bundle
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+    # mkstemp creates owner-only files; the bundle must be readable by whoever serves the HTML
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, bundle)
+    logger.info(f"Wrote shared plotly bundle: {bundle}")
+    return bundle
+
+
+def write_plotly_html(
+    figure: Any, output_path: str | Path, assets_dir: Optional[str | Path] = None
+) -> None:
+    """
+    Save a plotly figure as HTML that references the shared plotly bundle.
+
+    Args:
+        figure: Plotly figure
+        output_path: Destination HTML file
+        assets_dir: Shared assets directory (default: PATHS.STATIC_ASSETS_DIR)
+    """
+    output_path = Path(output_path)
+    bundle = ensure_plotly_bundle(assets_dir)
+    script_src = Path(
+        os.path.relpath(bundle.resolve(), output_path.resolve().parent)
+    ).as_posix()
+    figure.write_html(output_path, include_plotlyjs=script_src)
+
+
+def find_stale_outputs(
+    directories: Iterable[str | Path], keep_recent: int = 5
+) -> list[Path]:
+    """
+    List timestamped outputs beyond the ``keep_recent`` newest of each prefix.
+
+    Args:
+        directories: Directories to scan (not recursive)
+        keep_recent: Number of files to keep per prefix and extension
+
+    Returns:
+        Paths of stale files
+    """
+    groups: dict[tuple[Path, str, str], list[tuple[str, Path]]] = defaultdict(list)
+    for directory in directories:
+        directory = Path(directory)
+        if not directory.is_dir():
+            continue
+        for path in directory.iterdir():
+            match = TIMESTAMPED_OUTPUT_PATTERN.match(path.name)
+            if match and path.is_file():
+                key = (directory, match["prefix"], match["suffix"])
+                groups[key].append((match["timestamp"], path))
+
+    stale = []
+    for files in groups.values():
+        files.sort(reverse=True)
+        stale.extend(path for _, path in files[keep_recent:])
+    return sorted(stale)
+
+
+def cleanup_generated_outputs(
+    directories: Optional[Iterable[str | Path]] = None,
+    keep_recent: int = 5,
+    dry_run: bool = False,
+    assets_dir: Optional[str | Path] = None,
+    reference_dirs: Iterable[str | Path] = (),
+) -> list[Path]:
+    """
+    Remove stale timestamped outputs and plotly bundles nothing references.
+
+    Bundles are only removed when no HTML file left under ``directories``,
+    the output root containing the assets directory or ``reference_dirs``
+    (searched recursively) refers to them.
+
+    Args:
+        directories: Directories to clean (default: graphs and maps output)
+        keep_recent: Number of files to keep per prefix and extension
+        dry_run: Only report what would be removed
+        assets_dir: Shared assets directory (default: PATHS.STATIC_ASSETS_DIR)
+        reference_dirs: Further directories whose HTML may use the bundles
+            (e.g. an analysis output directory outside the output root)
+
+    Returns:
+        Paths that were (or, for a dry run, would be) removed
+    """
+    # pylint: disable=import-outside-toplevel
+    import plotly
+
+    if directories is None:
+        directories = [PATHS.GRAPHS_DIR, PATHS.MAPS_DIR]
+    directories = [Path(d) for d in directories]
+
+    stale = find_stale_outputs(directories, keep_recent)
+    stale_set = set(stale)
+
+    # Bundles for older plotly versions can go once no remaining HTML uses them
+    assets = _assets_path(assets_dir)
+    roots = {*directories, assets.parent, *(Path(d) for d in reference_dirs)}
+    referenced = set()
+    for html in {html for root in roots if root.is_dir() for html in root.rglob("*.html")}:
+        if html not in stale_set:
+            referenced.update(
+                PLOTLY_BUNDLE_PATTERN.findall(html.read_text(encoding="utf-8", errors="ignore"))
+            )
+
+    current = f"plotly-{plotly.__version__}.min.js"
+    if assets.is_dir():
+        stale.extend(
+            bundle
+            for bundle in sorted(assets.glob("plotly-*.min.js"))
+            if bundle.name != current and bundle.name not in referenced
+        )
+
+    if not dry_run:
+        for path in stale:
+            path.unlink(missing_ok=True)
+            logger.debug(f"Removed stale output: {path}")
+        logger.info(f"Removed {len(stale)} stale generated files")
+
+    return stale
@@ -12,7 +12,7 @@ import webbrowser
 from datetime import datetime, timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from threading import Thread
+from threading import Lock, Thread
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
@@ -113,13 +113,20 @@ class StravaClient:
     # Required OAuth2 scopes
     REQUIRED_SCOPES = "read,activity:read_all,profile:read_all"
 
-    def __init__(self, credentials: StravaCredentials, token_path: str):
+    def __init__(
+        self,
+        credentials: StravaCredentials,
+        token_path: str,
+        wait_for_rate_limit: bool = False,
+    ):
         """
         Initialize Strava client with credentials and token storage.
 
         Args:
             credentials: Strava OAuth2 credentials
             token_path: Path to store/load access token
+            wait_for_rate_limit: Sleep until the 15-minute rate limit window
+                resets instead of raising (for unattended batch downloads)
         """
         credentials.validate()
 
@@ -127,6 +134,11 @@ class StravaClient:
         self.token_path = Path(token_path)
         self.token: Optional[StravaToken] = None
         self.rate_limit = StravaRateLimitStatus()
+        self.wait_for_rate_limit = wait_for_rate_limit
+
+        # The client is shared by download worker threads
+        self._rate_limit_lock = Lock()
+        self._token_lock = Lock()
 
         # Try to load existing token
         self._load_token()
@@ -377,6 +389,63 @@ class StravaClient:
         except requests.exceptions.RequestException as e:
             raise StravaAuthenticationError(f"Token refresh failed: {e}")
 
+    def _refresh_token_once(self, stale_access_token: str) -> None:
+        """
+        Refresh the token unless another thread already replaced it.
+
+        Args:
+            stale_access_token: Access token the caller found expired or rejected
+        """
+        with self._token_lock:
+            if self.token and self.token.access_token != stale_access_token:
+                return
+            self._refresh_token()
+
+    def _reserve_request_slot(self) -> None:
+        """
+        Count one request against the rate limits.
+
+        With ``wait_for_rate_limit`` set, a caller that finds the 15-minute
+        window exhausted sleeps until it resets. The daily limit is never
+        waited out.
+
+        Raises:
+            StravaRateLimitError: If a rate limit is exceeded and not waited out
+        """
+        while True:
+            with self._rate_limit_lock:
+                if not self.rate_limit.is_limit_exceeded():
+                    self.rate_limit.increment()
+                    return
+                if self.rate_limit.requests_daily >= self.rate_limit.LIMIT_DAILY:
+                    raise StravaRateLimitError(
+                        f"Daily rate limit exceeded. "
+                        f"Status: {self.rate_limit.get_status_dict()}"
+                    )
+                if not self.wait_for_rate_limit:
+                    raise StravaRateLimitError(
+                        f"Rate limit exceeded. Reset in {self.rate_limit.seconds_until_reset()} seconds. "
+                        f"Status: {self.rate_limit.get_status_dict()}"
+                    )
+                wait_seconds = max(
+                    1, (self.rate_limit.reset_15min - datetime.now()).total_seconds()
+                )
+
+            logger.warning(
+                f"Strava rate limit reached, waiting {wait_seconds:.0f}s for the window to reset"
+            )
+            time.sleep(wait_seconds)
+
+    def _block_until(self, retry_after: int) -> None:
+        """Mark the 15-minute window as used up for ``retry_after`` seconds."""
+        with self._rate_limit_lock:
+            self.rate_limit.is_limit_exceeded()  # roll over expired windows first
+            self.rate_limit.requests_15min = self.rate_limit.LIMIT_15MIN
+            self.rate_limit.reset_15min = max(
+                self.rate_limit.reset_15min,
+                datetime.now() + timedelta(seconds=retry_after),
+            )
+
     def _make_request(
         self,
         method: str,
@@ -387,9 +456,11 @@ class StravaClient:
         """
         Make authenticated API request with rate limiting.
 
+        Safe to call from several threads at once.
+
         Handles:
-        - Token refresh if expired
-        - Rate limit checking
+        - Token refresh if expired (one refresh shared by all threads)
+        - Rate limiting, optionally waiting for the 15-minute window to reset
         - Error responses
         - Retries with exponential backoff
 
@@ -414,25 +485,21 @@ class StravaClient:
 
         # Refresh token if needed
         if self.token.is_expired:
-            self._refresh_token()
-
-        # Check rate limits
-        if self.rate_limit.is_limit_exceeded():
-            wait_seconds = self.rate_limit.seconds_until_reset()
-            raise StravaRateLimitError(
-                f"Rate limit exceeded. Reset in {wait_seconds} seconds. "
-                f"Status: {self.rate_limit.get_status_dict()}"
-            )
+            self._refresh_token_once(self.token.access_token)
 
         # Build URL
         url = f"{self.BASE_URL}{endpoint}"
 
-        # Add authorization header
-        headers = {"Authorization": f"Bearer {self.token.access_token}"}
-
         # Make request with retries
         max_retries = 3
         for attempt in range(max_retries):
+            # Wait for rate limit capacity
+            self._reserve_request_slot()
+
+            # Add authorization header
+            access_token = self.token.access_token
+            headers = {"Authorization": f"Bearer {access_token}"}
+
             try:
                 response = requests.request(
                     method=method,
@@ -443,12 +510,15 @@ class StravaClient:
                     timeout=30,
                 )
 
-                # Increment rate limit counter
-                self.rate_limit.increment()
-
                 # Handle rate limit response
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 900))
+                    self._block_until(retry_after)
+                    if self.wait_for_rate_limit and attempt < max_retries - 1:
+                        logger.warning(
+                            f"Received 429, waiting {retry_after}s before retrying"
+                        )
+                        continue
                     raise StravaRateLimitError(
                         f"Rate limit exceeded. Retry after {retry_after} seconds."
                     )
@@ -458,7 +528,7 @@ class StravaClient:
                     # Try to refresh token
                     if attempt < max_retries - 1:
                         logger.warning("Received 401, attempting token refresh")
-                        self._refresh_token()
+                        self._refresh_token_once(access_token)
                         continue
                     else:
                         raise StravaAuthenticationError(
@@ -2,18 +2,31 @@
 Strava data conversion utilities.
 
 This module provides converters for transforming Strava API data into
-Onsendo-compatible Activity format and standard file formats (GPX, JSON, CSV).
+Onsendo-compatible Activity format and standard file formats (GPX, TCX, FIT,
+JSON, CSV).
 """
 
+import csv
 import hashlib
 import json
-import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Mapping, Optional
+from typing import Optional
 
 from loguru import logger
 
+from src.lib.activity_files import (
+    ActivityTotals,
+    TrackPoint,
+    atomic_output,
+    to_naive_utc,
+    write_fit,
+    write_gpx,
+    write_tcx,
+)
 from src.lib.activity_manager import ActivityData
 from src.lib.route_data_analyzer import should_classify_as_onsen_monitoring
 from src.types.exercise import DataSource, ExerciseType, IndoorOutdoor
@@ -312,9 +325,30 @@ class StravaToActivityConverter:
         return elevation_gain
 
 
+@dataclass
+class BatchExportResult:
+    """Outcome of exporting several activities."""
+
+    exported: dict[int, dict[str, Path]] = field(default_factory=dict)
+    skipped: dict[int, list[tuple[str, str]]] = field(default_factory=dict)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
 class StravaFileExporter:
     """Exports Strava activities to standard file formats."""
 
+    ALL_FORMATS = ["gpx", "tcx", "fit", "json", "hr_csv"]
+    FILE_SUFFIXES = {
+        "gpx": ".gpx",
+        "tcx": ".tcx",
+        "fit": ".fit",
+        "json": ".json",
+        "hr_csv": "_hr.csv",
+    }
+    DEFAULT_WORKERS = 4
+    # Stream values serialized per json.dumps call
+    JSON_CHUNK_SIZE = 4096
+
     @staticmethod
     def has_gpx_support(streams: Mapping[str, StravaStream]) -> bool:
         """Check whether provided streams contain enough data for GPX export."""
@@ -338,6 +372,7 @@ class StravaFileExporter:
 
         Automatically selects appropriate formats based on stream availability:
         - GPX requires GPS data (latlng + time streams)
+        - TCX and FIT require a time stream
         - JSON always works (exports all available data)
         - HR CSV requires heart rate data
 
@@ -372,6 +407,11 @@ class StravaFileExporter:
                     exportable.append("gpx")
                 else:
                     skipped.append(("gpx", "No GPS data available"))
+            elif fmt in ("tcx", "fit"):
+                if streams.get("time"):
+                    exportable.append(fmt)
+                else:
+                    skipped.append((fmt, "No time stream available"))
             elif fmt == "json":
                 exportable.append("json")  # JSON always works
             elif fmt == "hr_csv":
@@ -388,8 +428,104 @@ class StravaFileExporter:
 
         return exportable, skipped
 
+    @staticmethod
+    def output_basename(activity: StravaActivityDetail) -> str:
+        """
+        File name (without suffix) for an activity's exports.
+
+        Example:
+            >>> StravaFileExporter.output_basename(activity)
+            '20251103_180000_Morning Run_12345678'
+        """
+        safe_name = "".join(
+            c if c.isalnum() or c in (" ", "_", "-") else "_" for c in activity.name
+        )
+        safe_name = safe_name.strip()[:50]
+        timestamp = activity.start_date_local.strftime("%Y%m%d_%H%M%S")
+        return f"{timestamp}_{safe_name}_{activity.id}"
+
+    @staticmethod
+    def iter_track_points(
+        start_time: datetime, streams: Mapping[str, StravaStream]
+    ) -> Iterator[TrackPoint]:
+        """
+        Yield one track point per sample, combining the streams by index.
+
+        Samples without a time offset are timed one second apart, and values
+        missing from a stream (or an empty latlng pair) are None.
+
+        Args:
+            start_time: Time of the first sample
+            streams: Stream data
+        """
+        empty: list = []
+        time_stream = streams.get("time")
+        offsets = time_stream.data if time_stream else empty
+        columns = {
+            name: streams[name].data if streams.get(name) else empty
+            for name in ("latlng", "altitude", "heartrate", "distance", "velocity_smooth", "cadence")
+        }
+        latlng = columns["latlng"]
+        altitude = columns["altitude"]
+        heart_rate = columns["heartrate"]
+        distance = columns["distance"]
+        speed = columns["velocity_smooth"]
+        cadence = columns["cadence"]
+        length = max(len(offsets), *(len(data) for data in columns.values()))
+
+        def value(data: list, i: int):
+            return data[i] if i < len(data) else None
+
+        for i in range(length):
+            offset = offsets[i] if i < len(offsets) else i
+            position = latlng[i] if i < len(latlng) else None
+            has_position = bool(position) and len(position) >= 2
+            yield TrackPoint(
+                time=start_time + timedelta(seconds=offset),
+                lat=position[0] if has_position else None,
+                lon=position[1] if has_position else None,
+                altitude_m=value(altitude, i),
+                heart_rate=value(heart_rate, i),
+                distance_m=value(distance, i),
+                speed_mps=value(speed, i),
+                cadence=value(cadence, i),
+            )
+
+    @staticmethod
+    def start_time_utc(activity: StravaActivityDetail) -> datetime:
+        """Activity start as naive UTC, the form the GPX/TCX/FIT writers expect."""
+        return to_naive_utc(activity.start_date)
+
     @classmethod
-    def export_to_gpx(  # pylint: disable=too-many-locals
+    def activity_totals(cls, activity: StravaActivityDetail) -> ActivityTotals:
+        """Lap/session totals for TCX and FIT exports."""
+        exercise_type = StravaActivityTypeMapper.map_type(activity.activity_type)
+        if exercise_type == ExerciseType.GYM:
+            sport = "training"
+        elif exercise_type in (
+            ExerciseType.RUNNING,
+            ExerciseType.CYCLING,
+            ExerciseType.SWIMMING,
+            ExerciseType.WALKING,
+            ExerciseType.HIKING,
+            ExerciseType.YOGA,
+        ):
+            sport = exercise_type.value
+        else:
+            sport = "other"
+        return ActivityTotals(
+            start_time=cls.start_time_utc(activity),
+            elapsed_time_s=activity.elapsed_time_s,
+            moving_time_s=activity.moving_time_s,
+            sport=sport,
+            distance_m=activity.distance_m,
+            calories=activity.calories,
+            avg_heart_rate=activity.average_heartrate,
+            max_heart_rate=activity.max_heartrate,
+        )
+
+    @classmethod
+    def export_to_gpx(
         cls,
         activity: StravaActivityDetail,
         streams: dict[str, StravaStream],
@@ -398,6 +534,9 @@ class StravaFileExporter:
         """
         Export activity with GPS route to GPX format.
 
+        Track points are written as they are generated from the streams, so
+        memory use does not depend on the length of the activity.
+
         Args:
             activity: Strava activity detail
             streams: Stream data (must include time, latlng)
@@ -422,85 +561,88 @@ class StravaFileExporter:
                 "GPX export requires 'time' and 'latlng' streams"
             )
 
-        time_stream = streams["time"]
-        latlng_stream = streams["latlng"]
-        altitude_stream = streams.get("altitude")
-        hr_stream = streams.get("heartrate")
-
-        # Create GPX XML structure
-        gpx = ET.Element(
-            "gpx",
-            {
-                "version": "1.1",
-                "creator": "Onsendo Strava Integration",
-                "xmlns": "http://www.topografix.com/GPX/1/1",
-                "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-                "xsi:schemaLocation": "http://www.topografix.com/GPX/1/1 "
-                "http://www.topografix.com/GPX/1/1/gpx.xsd",
-            },
+        # Heart rate only on points that also have a position
+        start_time = cls.start_time_utc(activity)
+        points = cls.iter_track_points(
+            start_time,
+            {name: streams[name] for name in ("time", "latlng", "altitude", "heartrate") if name in streams},
         )
+        try:
+            with atomic_output(output_path) as f:
+                write_gpx(f, activity.name, activity.activity_type, start_time, points)
+            logger.info(f"Exported GPX file: {output_path}")
+        except Exception as e:
+            raise StravaFileError(f"Failed to write GPX file: {e}") from e
 
-        # Metadata
-        metadata = ET.SubElement(gpx, "metadata")
-        name_elem = ET.SubElement(metadata, "name")
-        name_elem.text = activity.name
-        time_elem = ET.SubElement(metadata, "time")
-        time_elem.text = activity.start_date.isoformat() + "Z"
-
-        # Track
-        trk = ET.SubElement(gpx, "trk")
-        trk_name = ET.SubElement(trk, "name")
-        trk_name.text = activity.name
-        trk_type = ET.SubElement(trk, "type")
-        trk_type.text = activity.activity_type
-
-        # Track segment
-        trkseg = ET.SubElement(trk, "trkseg")
-
-        # Add track points
-        for i, time_offset in enumerate(time_stream.data):
-            if i >= len(latlng_stream.data):
-                break
-
-            latlng = latlng_stream.data[i]
-            if not latlng or len(latlng) < 2:
-                continue
-
-            lat, lon = latlng[0], latlng[1]
-            trkpt = ET.SubElement(
-                trkseg,
-                "trkpt",
-                {
-                    "lat": str(lat),
-                    "lon": str(lon),
-                },
-            )
+    @classmethod
+    def export_to_tcx(
+        cls,
+        activity: StravaActivityDetail,
+        streams: dict[str, StravaStream],
+        output_path: Path,
+    ) -> None:
+        """
+        Export activity to Garmin TCX format.
 
-            # Elevation
-            if altitude_stream and i < len(altitude_stream.data):
-                ele = ET.SubElement(trkpt, "ele")
-                ele.text = str(altitude_stream.data[i])
+        Args:
+            activity: Strava activity detail
+            streams: Stream data (must include time)
+            output_path: Path to save TCX file
 
-            # Timestamp
-            timestamp = activity.start_date + timedelta(seconds=time_offset)
-            time_pt = ET.SubElement(trkpt, "time")
-            time_pt.text = timestamp.isoformat() + "Z"
+        Raises:
+            StravaConversionError: If the time stream is missing
+            StravaFileError: If file cannot be written
+        """
+        from src.types.strava import StravaConversionError, StravaFileError
 
-            # Heart rate (GPX extension)
-            if hr_stream and i < len(hr_stream.data):
-                extensions = ET.SubElement(trkpt, "extensions")
-                hr = ET.SubElement(extensions, "hr")
-                hr.text = str(int(hr_stream.data[i]))
+        if not streams.get("time"):
+            raise StravaConversionError("TCX export requires a 'time' stream")
 
-        # Write to file
         try:
-            tree = ET.ElementTree(gpx)
-            ET.indent(tree, space="  ")  # Pretty-print
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
-            logger.info(f"Exported GPX file: {output_path}")
+            with atomic_output(output_path) as f:
+                write_tcx(
+                    f,
+                    cls.activity_totals(activity),
+                    cls.iter_track_points(cls.start_time_utc(activity), streams),
+                )
+            logger.info(f"Exported TCX file: {output_path}")
         except Exception as e:
-            raise StravaFileError(f"Failed to write GPX file: {e}") from e
+            raise StravaFileError(f"Failed to write TCX file: {e}") from e
+
+    @classmethod
+    def export_to_fit(
+        cls,
+        activity: StravaActivityDetail,
+        streams: dict[str, StravaStream],
+        output_path: Path,
+    ) -> None:
+        """
+        Export activity to a binary FIT activity file.
+
+        Args:
+            activity: Strava activity detail
+            streams: Stream data (must include time)
+            output_path: Path to save FIT file
+
+        Raises:
+            StravaConversionError: If the time stream is missing
+            StravaFileError: If file cannot be written
+        """
+        from src.types.strava import StravaConversionError, StravaFileError
+
+        if not streams.get("time"):
+            raise StravaConversionError("FIT export requires a 'time' stream")
+
+        try:
+            with atomic_output(output_path, "w+b") as f:
+                write_fit(
+                    f,
+                    cls.activity_totals(activity),
+                    cls.iter_track_points(cls.start_time_utc(activity), streams),
+                )
+            logger.info(f"Exported FIT file: {output_path}")
+        except Exception as e:
+            raise StravaFileError(f"Failed to write FIT file: {e}") from e
 
     @classmethod
     def export_to_json(
@@ -512,6 +654,9 @@ class StravaFileExporter:
         """
         Export full activity + streams to JSON format.
 
+        Activity fields are indented; each stream's data array is written in
+        compact chunks straight to the file.
+
         Args:
             activity: Strava activity detail
             streams: Optional stream data
@@ -557,25 +702,36 @@ class StravaFileExporter:
             "gear_id": activity.gear_id,
         }
 
-        # Add streams if available
-        if streams:
-            data["streams"] = {}
-            for stream_type, stream in streams.items():
-                data["streams"][stream_type] = {
-                    "data": stream.data,
-                    "original_size": stream.original_size,
-                    "resolution": stream.resolution,
-                }
-
         # Write to file
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            with atomic_output(output_path) as f:
+                header = json.dumps(data, indent=2, default=str)
+                if streams:
+                    # Reopen the object after the last field to append the streams
+                    f.write(header[: -len("\n}")])
+                    f.write(',\n  "streams": {')
+                    for i, (stream_type, stream) in enumerate(streams.items()):
+                        f.write(f'{"," if i else ""}\n    {json.dumps(stream_type)}: {{\n      "data": ')
+                        cls._write_json_array(f, stream.data)
+                        f.write(
+                            f',\n      "original_size": {json.dumps(stream.original_size)}'
+                            f',\n      "resolution": {json.dumps(stream.resolution)}\n    }}'
+                        )
+                    f.write("\n  }\n}")
+                else:
+                    f.write(header)
             logger.info(f"Exported JSON file: {output_path}")
         except Exception as e:
             raise StravaFileError(f"Failed to write JSON file: {e}") from e
 
+    @classmethod
+    def _write_json_array(cls, f, values: list) -> None:
+        f.write("[")
+        for start in range(0, len(values), cls.JSON_CHUNK_SIZE):
+            chunk = json.dumps(values[start : start + cls.JSON_CHUNK_SIZE], default=str)
+            f.write((", " if start else "") + chunk[1:-1])
+        f.write("]")
+
     @classmethod
     def export_hr_to_csv(
         cls,
@@ -612,33 +768,124 @@ class StravaFileExporter:
         if not hr_stream or not hr_stream.data:
             raise StravaConversionError("Heart rate stream is empty")
 
-        # Build CSV rows
-        rows = []
-        for i, hr_value in enumerate(hr_stream.data):
-            # Calculate timestamp
-            if time_stream and i < len(time_stream.data):
-                time_offset = time_stream.data[i]
-                timestamp = activity.start_date_local + timedelta(seconds=time_offset)
-            else:
-                # Estimate based on index
-                timestamp = activity.start_date_local + timedelta(seconds=i)
-
-            rows.append(
-                {
-                    "timestamp": timestamp.isoformat(),
-                    "heart_rate": int(hr_value),
-                }
-            )
+        streams = {"heartrate": hr_stream}
+        if time_stream:
+            streams["time"] = time_stream
+        # Only as many rows as heart rate samples; missing offsets are estimated by index
+        points = cls.iter_track_points(activity.start_date_local, streams)
 
         # Write to file
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8", newline="") as f:
-                import csv
-
-                writer = csv.DictWriter(f, fieldnames=["timestamp", "heart_rate"])
-                writer.writeheader()
-                writer.writerows(rows)
+            with atomic_output(output_path) as f:
+                writer = csv.writer(f)
+                writer.writerow(["timestamp", "heart_rate"])
+                writer.writerows(
+                    (point.time.isoformat(), int(point.heart_rate))
+                    for point in points
+                    if point.heart_rate is not None
+                )
             logger.info(f"Exported HR CSV file: {output_path}")
         except Exception as e:
             raise StravaFileError(f"Failed to write CSV file: {e}") from e
+
+    @classmethod
+    def export_activity(
+        cls,
+        activity: StravaActivityDetail,
+        streams: dict[str, StravaStream],
+        output_dir: Path,
+        requested_formats: list[str],
+    ) -> tuple[dict[str, Path], list[tuple[str, str]]]:
+        """
+        Export one activity in every requested format its streams support.
+
+        Args:
+            activity: Strava activity detail
+            streams: Stream data
+            output_dir: Directory for the exported files
+            requested_formats: Formats to export (see ``ALL_FORMATS``)
+
+        Returns:
+            Tuple of (paths by format, skipped formats with reasons)
+
+        Raises:
+            StravaConversionError: If a format cannot be converted
+            StravaFileError: If a file cannot be written
+        """
+        exportable, skipped = cls.recommend_formats(streams, requested_formats)
+        base_path = Path(output_dir) / cls.output_basename(activity)
+        paths = {}
+        for fmt in exportable:
+            path = base_path.with_name(base_path.name + cls.FILE_SUFFIXES[fmt])
+            if fmt == "gpx":
+                cls.export_to_gpx(activity, streams, path)
+            elif fmt == "tcx":
+                cls.export_to_tcx(activity, streams, path)
+            elif fmt == "fit":
+                cls.export_to_fit(activity, streams, path)
+            elif fmt == "json":
+                cls.export_to_json(activity, streams, path)
+            elif fmt == "hr_csv":
+                cls.export_hr_to_csv(activity, streams["heartrate"], streams.get("time"), path)
+            paths[fmt] = path
+        return paths, skipped
+
+    @classmethod
+    def export_batch(
+        cls,
+        activity_ids: Iterable[int],
+        fetch: Callable[[int], tuple[StravaActivityDetail, dict[str, StravaStream]]],
+        output_dir: Path,
+        requested_formats: list[str],
+        workers: int = DEFAULT_WORKERS,
+        on_result: Optional[Callable[[int, Optional[dict[str, Path]], Optional[str]], None]] = None,
+    ) -> BatchExportResult:
+        """
+        Fetch and export many activities with a pool of worker threads.
+
+        Fetching is network-bound and the writers stream to disk, so threads
+        overlap the waits. A failing activity is recorded and the rest carry on.
+
+        Args:
+            activity_ids: Strava activity IDs
+            fetch: Returns (activity, streams) for an ID. It is called from
+                several threads at once; a shared ``StravaClient`` is safe, and
+                with ``wait_for_rate_limit`` set it waits out the rate limit
+            output_dir: Directory for the exported files
+            requested_formats: Formats to export (see ``ALL_FORMATS``)
+            workers: Number of worker threads
+            on_result: Optional callback ``(activity_id, paths, error)`` run in
+                the calling thread as each activity finishes
+
+        Returns:
+            BatchExportResult with exported paths, skipped formats and failures
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        def export_one(activity_id: int):
+            activity, streams = fetch(activity_id)
+            return cls.export_activity(activity, streams, output_dir, requested_formats)
+
+        result = BatchExportResult()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(export_one, activity_id): activity_id for activity_id in activity_ids}
+            for future in as_completed(futures):
+                activity_id = futures[future]
+                try:
+                    paths, skipped = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Failed to export activity {activity_id}: {e}")
+                    result.failed[activity_id] = str(e)
+                    if on_result:
+                        on_result(activity_id, None, str(e))
+                    continue
+                result.exported[activity_id] = paths
+                if skipped:
+                    result.skipped[activity_id] = skipped
+                if on_result:
+                    on_result(activity_id, paths, None)
+        return result
@@ -9,7 +9,6 @@ import os
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-import requests
 from loguru import logger
 
 
@@ -79,6 +78,8 @@ class WeatherService:
             f"at {dt_jst.strftime('%Y-%m-%d %H:%M')} JST"
         )
 
+        import requests  # pylint: disable=import-outside-toplevel
+
         attempt = 0
         last_error = None
 
@@ -126,6 +127,8 @@ class WeatherService:
             requests.exceptions.RequestException: On network/API errors.
             KeyError, ValueError, TypeError: On response parsing errors.
         """
+        import requests  # pylint: disable=import-outside-toplevel
+
         endpoint = f"{self.API_BASE_URL}/history.json"
 
         params = {
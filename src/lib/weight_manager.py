@@ -8,19 +8,21 @@ Architecture follows the exercise and heart rate management patterns for consist
 """
 
 import hashlib
+import os
 import json
 import csv
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from dataclasses import dataclass, field
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 from loguru import logger
 
 from src.db.models import WeightMeasurement as WeightMeasurementModel
 
+BULK_INSERT_BATCH_SIZE = 1000
+
 
 @dataclass
 class WeightMeasurement:
@@ -310,49 +312,52 @@ class WeightDataImporter:
         return measurements
 
     @classmethod
-    def _import_apple_health(cls, file_path: str) -> list[WeightMeasurement]:
+    def iter_apple_health(cls, file_path: str) -> Iterator[WeightMeasurement]:
         """
-        Import from Apple Health XML export.
+        Stream BodyMass records from an Apple Health XML export.
 
-        Looks for BodyMass records in the Health export XML.
+        The export is read incrementally, so memory does not grow with its
+        size (see ``src.lib.apple_health``).
         """
-        measurements = []
-
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        # Find all BodyMass records
-        for record in root.findall(".//Record[@type='HKQuantityTypeIdentifierBodyMass']"):
-            # Parse timestamp
-            creation_date = record.get("creationDate")
-            if not creation_date:
-                logger.warning(f"Skipping record without creationDate")
-                continue
+        from src.lib.apple_health import (  # pylint: disable=import-outside-toplevel
+            iter_export,
+        )
 
-            timestamp = cls._parse_timestamp(creation_date)
+        yield from iter_export(file_path, kinds=("weight",))
 
-            # Parse weight (usually in kg, but check unit)
-            weight_str = record.get("value")
-            unit = record.get("unit", "kg")
+    @classmethod
+    def iter_from_file(
+        cls, file_path: str, format_hint: Optional[str] = None
+    ) -> Iterator[WeightMeasurement]:
+        """
+        Yield measurements from a file without collecting them first.
 
-            if not weight_str:
-                logger.warning(f"Skipping record without value")
-                continue
+        Apple Health exports are parsed incrementally; CSV and JSON files are
+        small and are read with ``import_from_file``.
 
-            weight_kg = float(weight_str)
+        Args:
+            file_path: Path to the file to import
+            format_hint: Optional format override (csv, json, apple_health)
 
-            # Convert if necessary (Apple Health uses kg by default)
-            if unit.lower() == "lb":
-                weight_kg = weight_kg * 0.453592  # Convert lbs to kg
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If format is unsupported or data is invalid
+        """
+        if (format_hint or cls.detect_format(file_path)) == "apple_health":
+            if not Path(file_path).exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+            yield from cls.iter_apple_health(file_path)
+        else:
+            yield from cls.import_from_file(file_path, format_hint)
 
-            measurement = WeightMeasurement(
-                measurement_time=timestamp,
-                weight_kg=weight_kg,
-                data_source="apple_health",
-                source_file=file_path,
-            )
+    @classmethod
+    def _import_apple_health(cls, file_path: str) -> list[WeightMeasurement]:
+        """
+        Import from Apple Health XML export.
 
-            measurements.append(measurement)
+        Looks for BodyMass records in the Health export XML.
+        """
+        measurements = list(cls.iter_apple_health(file_path))
 
         if not measurements:
             raise ValueError(f"No BodyMass records found in {file_path}")
@@ -407,6 +412,7 @@ class WeightDataManager:
         if db_session is None:
             raise ValueError("db_session is required")
         self.db_session = db_session
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
 
     def store_measurement(
         self, measurement: WeightMeasurement
@@ -426,7 +432,7 @@ class WeightDataManager:
         # Calculate file hash if from file
         file_hash = None
         if measurement.source_file:
-            file_hash = self._calculate_file_hash(measurement.source_file)
+            file_hash = self.file_hash(measurement.source_file)
 
         # Create database record
         db_record = WeightMeasurementModel(
@@ -451,55 +457,142 @@ class WeightDataManager:
         return db_record
 
     def store_measurements_bulk(
-        self, measurements: list[WeightMeasurement]
+        self, measurements: list[WeightMeasurement], batch_size: int = BULK_INSERT_BATCH_SIZE
     ) -> list[WeightMeasurementModel]:
         """
         Store multiple weight measurements in bulk.
 
+        Measurements already in the database (same time, weight and data
+        source) are skipped, as are repeats within ``measurements``, so a file
+        can be imported again safely. Existing rows are found with a single
+        query over the time range being imported. Each source file is hashed
+        once, and the rows are written with batched ``INSERT ... RETURNING``
+        statements in one transaction.
+
         Args:
             measurements: List of WeightMeasurement objects to store
+            batch_size: Rows per INSERT statement
 
         Returns:
-            List of stored database models
-        """
-        db_records = []
+            List of stored database models (without the skipped duplicates)
+        """
+        new_measurements = self._without_duplicates(measurements)
+        file_hashes = {
+            path: self.file_hash(path)
+            for path in {m.source_file for m in new_measurements if m.source_file}
+        }
+        rows = [
+            {
+                "measurement_time": m.measurement_time,
+                "weight_kg": m.weight_kg,
+                "measurement_conditions": m.measurement_conditions,
+                "hydrated_before": m.hydrated_before,
+                "data_source": m.data_source,
+                "data_file_path": m.source_file,
+                "data_hash": file_hashes.get(m.source_file),
+                "notes": m.notes,
+            }
+            for m in new_measurements
+        ]
 
-        for measurement in measurements:
-            # Calculate file hash if from file
-            file_hash = None
-            if measurement.source_file:
-                file_hash = self._calculate_file_hash(measurement.source_file)
-
-            db_record = WeightMeasurementModel(
-                measurement_time=measurement.measurement_time,
-                weight_kg=measurement.weight_kg,
-                measurement_conditions=measurement.measurement_conditions,
-                hydrated_before=measurement.hydrated_before,
-                data_source=measurement.data_source,
-                data_file_path=measurement.source_file,
-                data_hash=file_hash,
-                notes=measurement.notes,
-            )
+        statement = insert(WeightMeasurementModel).returning(
+            WeightMeasurementModel, sort_by_parameter_order=True
+        )
+        db_records: list[WeightMeasurementModel] = []
+        try:
+            for start in range(0, len(rows), batch_size):
+                db_records.extend(
+                    self.db_session.scalars(statement, rows[start : start + batch_size])
+                )
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
 
-            db_records.append(db_record)
+        skipped = len(measurements) - len(db_records)
+        logger.info(
+            f"Stored {len(db_records)} weight measurements in bulk"
+            + (f" ({skipped} duplicates skipped)" if skipped else "")
+        )
 
-        self.db_session.add_all(db_records)
-        self.db_session.commit()
+        return db_records
 
-        logger.info(f"Stored {len(db_records)} weight measurements in bulk")
+    def _without_duplicates(
+        self, measurements: list[WeightMeasurement]
+    ) -> list[WeightMeasurement]:
+        """Drop measurements that are already stored or repeated in the list."""
+        if not measurements:
+            return []
+        times = [m.measurement_time for m in measurements]
+        existing = set(
+            self.db_session.execute(
+                select(
+                    WeightMeasurementModel.measurement_time,
+                    WeightMeasurementModel.weight_kg,
+                    WeightMeasurementModel.data_source,
+                ).where(
+                    WeightMeasurementModel.measurement_time.between(min(times), max(times)),
+                    WeightMeasurementModel.data_source.in_(
+                        {m.data_source for m in measurements}
+                    ),
+                )
+            ).tuples()
+        )
 
-        return db_records
+        unique = []
+        for measurement in measurements:
+            key = (measurement.measurement_time, measurement.weight_kg, measurement.data_source)
+            if key not in existing:
+                existing.add(key)
+                unique.append(measurement)
+        return unique
+
+    def file_hash(self, file_path: str) -> str:
+        """Hash of a source file, computed once per manager unless the file changes."""
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        if key not in self._file_hashes:
+            self._file_hashes[key] = self._calculate_file_hash(file_path)
+        return self._file_hashes[key]
+
+    def store_measurements_stream(
+        self, measurements: Iterable[WeightMeasurement], batch_size: int = BULK_INSERT_BATCH_SIZE
+    ) -> int:
+        """
+        Store measurements from an iterable (e.g. a streaming importer) in batches.
+
+        Args:
+            measurements: Measurements to store; consumed lazily
+            batch_size: Measurements inserted per batch
+
+        Returns:
+            Number of measurements stored
+        """
+        stored = 0
+        batch: list[WeightMeasurement] = []
+        for measurement in measurements:
+            batch.append(measurement)
+            if len(batch) >= batch_size:
+                stored += len(self.store_measurements_bulk(batch))
+                batch = []
+        if batch:
+            stored += len(self.store_measurements_bulk(batch))
+        return stored
 
-    def get_all(self) -> list[WeightMeasurementModel]:
+    def get_all(self, limit: Optional[int] = None) -> list[WeightMeasurementModel]:
         """
         Get all weight measurements.
 
+        Args:
+            limit: Optional maximum number of measurements (most recent first)
+
         Returns:
             List of all weight measurements, ordered by measurement_time descending
         """
         return (
             self.db_session.query(WeightMeasurementModel)
             .order_by(WeightMeasurementModel.measurement_time.desc())
+            .limit(limit)
             .all()
         )
 
@@ -520,7 +613,7 @@ class WeightDataManager:
         )
 
     def get_by_date_range(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = None
     ) -> list[WeightMeasurementModel]:
         """
         Get measurements within a date range.
@@ -528,6 +621,7 @@ class WeightDataManager:
         Args:
             start_date: Start of the date range (inclusive)
             end_date: End of the date range (inclusive)
+            limit: Optional maximum number of measurements (earliest first)
 
         Returns:
             List of measurements in the date range, ordered by measurement_time
@@ -537,6 +631,7 @@ class WeightDataManager:
             .filter(WeightMeasurementModel.measurement_time >= start_date)
             .filter(WeightMeasurementModel.measurement_time <= end_date)
             .order_by(WeightMeasurementModel.measurement_time)
+            .limit(limit)
             .all()
         )
 
@@ -575,69 +670,12 @@ class WeightDataManager:
         Returns:
             WeightSummary with aggregated statistics, or None if no data
         """
-        query = self.db_session.query(WeightMeasurementModel)
-
-        # Apply date filters if provided
-        if start_date:
-            query = query.filter(WeightMeasurementModel.measurement_time >= start_date)
-        if end_date:
-            query = query.filter(WeightMeasurementModel.measurement_time <= end_date)
-
-        measurements = query.order_by(WeightMeasurementModel.measurement_time).all()
-
-        if not measurements:
-            return None
-
-        # Calculate basic stats
-        weights = [m.weight_kg for m in measurements]
-        total_count = len(weights)
-        avg_weight = sum(weights) / total_count
-        min_weight = min(weights)
-        max_weight = max(weights)
-        weight_change = weights[-1] - weights[0]  # Last - First
-
-        # Count by source
-        sources = {}
-        for m in measurements:
-            sources[m.data_source] = sources.get(m.data_source, 0) + 1
-
-        # Calculate moving averages
-        moving_avg_7day = None
-        moving_avg_30day = None
-
-        if total_count >= 7:
-            recent_7 = weights[-7:]
-            moving_avg_7day = sum(recent_7) / len(recent_7)
-
-        if total_count >= 30:
-            recent_30 = weights[-30:]
-            moving_avg_30day = sum(recent_30) / len(recent_30)
-
-        # Determine trend (based on recent vs earlier measurements)
-        trend = "stable"
-        if total_count >= 7:
-            recent_avg = sum(weights[-7:]) / 7
-            older_avg = sum(weights[: min(7, total_count - 7)]) / min(7, total_count - 7)
-
-            change_pct = ((recent_avg - older_avg) / older_avg) * 100
-
-            if change_pct > 1.0:  # >1% increase
-                trend = "gaining"
-            elif change_pct < -1.0:  # >1% decrease
-                trend = "losing"
-
-        return WeightSummary(
-            total_measurements=total_count,
-            avg_weight_kg=round(avg_weight, 1),
-            min_weight_kg=round(min_weight, 1),
-            max_weight_kg=round(max_weight, 1),
-            weight_change_kg=round(weight_change, 1),
-            measurements_by_source=sources,
-            moving_avg_7day=round(moving_avg_7day, 1) if moving_avg_7day else None,
-            moving_avg_30day=round(moving_avg_30day, 1) if moving_avg_30day else None,
-            trend=trend,
+        from src.lib.weight_stats import (  # pylint: disable=import-outside-toplevel
+            WeightStatisticsEngine,
         )
 
+        return WeightStatisticsEngine(self.db_session).summary(start_date, end_date)
+
     @staticmethod
     def _calculate_file_hash(file_path: str) -> str:
         """
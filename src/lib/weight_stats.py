@@ -0,0 +1,315 @@
+"""
+SQL-side weight statistics.
+
+Aggregation runs in SQLite rather than over ORM objects: measurements are
+grouped into periods (day, week, month, year) with ``GROUP BY`` and rolling
+means are window functions over the daily aggregates, so Python only ever
+sees one row per period. That keeps statistics fast on years of scale data
+with several weigh-ins a day.
+
+Rolling means are calendar windows (``RANGE`` frames over the day number),
+weighted by the number of measurements on each day: a 7-day mean is the mean
+of every measurement taken in the 7 days ending on that day.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.db.models import WeightMeasurement as WeightMeasurementModel
+from src.lib.weight_manager import WeightSummary
+
+GRANULARITIES = ("day", "week", "month", "year")
+DEFAULT_ROLLING_WINDOWS = (7, 30)
+
+# Percentage change between the oldest and most recent week that counts as a trend
+TREND_THRESHOLD_PCT = 1.0
+TREND_DAYS = 7
+
+
+def period_start(column: Any, granularity: str) -> Any:
+    """
+    SQL expression for the first day of the period containing ``column``.
+
+    Weeks start on Monday. The result is a ``YYYY-MM-DD`` string.
+
+    Raises:
+        ValueError: If the granularity is not one of ``GRANULARITIES``
+    """
+    if granularity == "day":
+        return func.date(column)
+    if granularity == "week":
+        # 'weekday 0' moves forward to Sunday (or stays on it)
+        return func.date(column, "weekday 0", "-6 days")
+    if granularity == "month":
+        return func.strftime("%Y-%m-01", column)
+    if granularity == "year":
+        return func.strftime("%Y-01-01", column)
+    raise ValueError(
+        f"Invalid granularity: '{granularity}'. Valid options: {', '.join(GRANULARITIES)}"
+    )
+
+
+def _rolling_column(days: int) -> str:
+    return f"rolling_{days}d_kg"
+
+
+class WeightStatisticsEngine:
+    """Computes weight statistics with SQL aggregates and window functions."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the statistics engine.
+
+        Args:
+            db_session: SQLAlchemy database session
+
+        Raises:
+            ValueError: If db_session is None
+        """
+        if db_session is None:
+            raise ValueError("db_session is required")
+        self.db_session = db_session
+
+    @staticmethod
+    def _where(
+        start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> list[Any]:
+        clauses = []
+        if start_date:
+            clauses.append(WeightMeasurementModel.measurement_time >= start_date)
+        if end_date:
+            clauses.append(WeightMeasurementModel.measurement_time <= end_date)
+        return clauses
+
+    def _daily(self, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """Subquery with one row per day: day, count, total_kg, mean_kg, min_kg, max_kg."""
+        day = period_start(WeightMeasurementModel.measurement_time, "day")
+        weight = WeightMeasurementModel.weight_kg
+        return (
+            select(
+                day.label("day"),
+                func.count().label("count"),
+                func.sum(weight).label("total_kg"),
+                func.avg(weight).label("mean_kg"),
+                func.min(weight).label("min_kg"),
+                func.max(weight).label("max_kg"),
+            )
+            .where(*self._where(start_date, end_date))
+            .group_by(day)
+            .subquery("daily")
+        )
+
+    def resample(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        granularity: str = "day",
+    ):
+        """
+        Aggregate measurements per period.
+
+        Args:
+            start_date: Optional start (inclusive)
+            end_date: Optional end (inclusive)
+            granularity: One of ``GRANULARITIES``
+
+        Returns:
+            DataFrame with ``period`` (datetime64), ``count``, ``mean_kg``,
+            ``min_kg``, ``max_kg``, ``first_kg`` and ``last_kg`` (the first and
+            last measurement of the period), ordered by period
+        """
+        period = period_start(WeightMeasurementModel.measurement_time, granularity)
+        weight = WeightMeasurementModel.weight_kg
+        time = WeightMeasurementModel.measurement_time
+        ranked = (
+            select(
+                period.label("period"),
+                weight.label("weight_kg"),
+                func.first_value(weight)
+                .over(partition_by=period, order_by=time)
+                .label("first_kg"),
+                func.first_value(weight)
+                .over(partition_by=period, order_by=time.desc())
+                .label("last_kg"),
+            )
+            .where(*self._where(start_date, end_date))
+            .subquery("ranked")
+        )
+        statement = (
+            select(
+                ranked.c.period,
+                func.count().label("count"),
+                func.avg(ranked.c.weight_kg).label("mean_kg"),
+                func.min(ranked.c.weight_kg).label("min_kg"),
+                func.max(ranked.c.weight_kg).label("max_kg"),
+                func.min(ranked.c.first_kg).label("first_kg"),
+                func.min(ranked.c.last_kg).label("last_kg"),
+            )
+            .group_by(ranked.c.period)
+            .order_by(ranked.c.period)
+        )
+        return self._frame(
+            statement,
+            {
+                "period": "datetime64[ns]",
+                "count": "int64",
+                **{
+                    name: "float64"
+                    for name in ("mean_kg", "min_kg", "max_kg", "first_kg", "last_kg")
+                },
+            },
+        )
+
+    def _rolling_statement(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        windows: Sequence[int],
+    ):
+        # Windows at the start of the range need the days before it
+        lookback_start = start_date - timedelta(days=max(windows)) if start_date else None
+        daily = self._daily(lookback_start, end_date)
+        day_number = func.julianday(daily.c.day)
+
+        rolling = [
+            (
+                func.sum(daily.c.total_kg).over(order_by=day_number, range_=(-(days - 1), 0))
+                / func.sum(daily.c.count).over(order_by=day_number, range_=(-(days - 1), 0))
+            ).label(_rolling_column(days))
+            for days in windows
+        ]
+        windowed = select(
+            daily.c.day, daily.c.count, daily.c.mean_kg, daily.c.min_kg, daily.c.max_kg, *rolling
+        ).subquery("windowed")
+
+        statement = select(*windowed.c).order_by(windowed.c.day)
+        if start_date:
+            statement = statement.where(windowed.c.day >= start_date.strftime("%Y-%m-%d"))
+        return statement
+
+    def rolling_means(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        windows: Sequence[int] = DEFAULT_ROLLING_WINDOWS,
+    ):
+        """
+        Daily aggregates with rolling calendar-window means.
+
+        Measurements before ``start_date`` still count towards the windows of
+        the first days in the range.
+
+        Args:
+            start_date: Optional start (inclusive)
+            end_date: Optional end (inclusive)
+            windows: Window lengths in days
+
+        Returns:
+            DataFrame with ``day`` (datetime64), ``count``, ``mean_kg``,
+            ``min_kg``, ``max_kg`` and one ``rolling_<n>d_kg`` column per
+            window, for each day with measurements
+
+        Raises:
+            ValueError: If a window is shorter than one day
+        """
+        if not windows or min(windows) < 1:
+            raise ValueError("Rolling windows must be at least 1 day")
+        statement = self._rolling_statement(start_date, end_date, windows)
+        return self._frame(
+            statement,
+            {
+                "day": "datetime64[ns]",
+                "count": "int64",
+                **{name: "float64" for name in ("mean_kg", "min_kg", "max_kg")},
+                **{_rolling_column(days): "float64" for days in windows},
+            },
+        )
+
+    def _frame(self, statement: Any, dtypes: dict[str, str]):
+        from src.db.columnar import (  # pylint: disable=import-outside-toplevel
+            result_to_frame,
+        )
+
+        return result_to_frame(self.db_session.execute(statement), dtypes)
+
+    def summary(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> Optional[WeightSummary]:
+        """
+        Summary statistics for a date range.
+
+        The 7- and 30-day moving averages are the rolling means on the last
+        day with measurements, reported once the range covers that many
+        measurement days. The trend compares the mean of the last
+        ``TREND_DAYS`` measurement days with the oldest ones (up to
+        ``TREND_DAYS``, never overlapping the recent ones).
+
+        Args:
+            start_date: Optional start (inclusive)
+            end_date: Optional end (inclusive)
+
+        Returns:
+            WeightSummary, or None if there are no measurements in the range
+        """
+        where = self._where(start_date, end_date)
+        weight = WeightMeasurementModel.weight_kg
+        time = WeightMeasurementModel.measurement_time
+
+        count, avg_weight, min_weight, max_weight = self.db_session.execute(
+            select(func.count(), func.avg(weight), func.min(weight), func.max(weight)).where(*where)
+        ).one()
+        if not count:
+            return None
+
+        first_weight = self.db_session.scalar(
+            select(weight).where(*where).order_by(time, WeightMeasurementModel.id).limit(1)
+        )
+        last_weight = self.db_session.scalar(
+            select(weight)
+            .where(*where)
+            .order_by(time.desc(), WeightMeasurementModel.id.desc())
+            .limit(1)
+        )
+        sources = dict(
+            self.db_session.execute(
+                select(WeightMeasurementModel.data_source, func.count())
+                .where(*where)
+                .group_by(WeightMeasurementModel.data_source)
+            ).all()
+        )
+
+        days = self.db_session.execute(
+            self._rolling_statement(start_date, end_date, DEFAULT_ROLLING_WINDOWS)
+        ).all()
+        day_count = len(days)
+        last_day = days[-1]._mapping
+        moving_avg_7day = last_day[_rolling_column(7)] if day_count >= 7 else None
+        moving_avg_30day = last_day[_rolling_column(30)] if day_count >= 30 else None
+
+        trend = "stable"
+        older_days = min(TREND_DAYS, day_count - TREND_DAYS)
+        if older_days > 0:
+            means = [row.mean_kg for row in days]
+            recent_avg = sum(means[-TREND_DAYS:]) / TREND_DAYS
+            older_avg = sum(means[:older_days]) / older_days
+            change_pct = ((recent_avg - older_avg) / older_avg) * 100
+            if change_pct > TREND_THRESHOLD_PCT:
+                trend = "gaining"
+            elif change_pct < -TREND_THRESHOLD_PCT:
+                trend = "losing"
+
+        return WeightSummary(
+            total_measurements=count,
+            avg_weight_kg=round(avg_weight, 1),
+            min_weight_kg=round(min_weight, 1),
+            max_weight_kg=round(max_weight, 1),
+            weight_change_kg=round(last_weight - first_weight, 1),
+            measurements_by_source=sources,
+            moving_avg_7day=round(moving_avg_7day, 1) if moving_avg_7day else None,
+            moving_avg_30day=round(moving_avg_30day, 1) if moving_avg_30day else None,
+            trend=trend,
+        )
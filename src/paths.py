@@ -17,9 +17,11 @@ class PATHS(CustomStrEnum):
     OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
     MAPS_DIR = os.path.join(OUTPUT_DIR, "maps")
     GRAPHS_DIR = os.path.join(OUTPUT_DIR, "graphs")
+    STATIC_ASSETS_DIR = os.path.join(OUTPUT_DIR, "static")
     ARTIFACTS_DIR = os.path.join(PROJECT_ROOT, "artifacts")
     ARTIFACTS_DB_DIR = os.path.join(ARTIFACTS_DIR, "db")
     ARTIFACTS_DB_BACKUPS_DIR = os.path.join(ARTIFACTS_DB_DIR, "backups")
+    DB_SNAPSHOTS_DIR = os.path.join(ARTIFACTS_DB_BACKUPS_DIR, "snapshots")
     GDRIVE_DIR = os.path.join(LOCAL_DIR, "gdrive")
     RULES_DIR = os.path.join(PROJECT_ROOT, "rules")
     RULES_REVISIONS_DIR = os.path.join(RULES_DIR, "revisions")
@@ -28,6 +30,9 @@ class PATHS(CustomStrEnum):
     DB_PATH_DEV = os.path.join(DB_DIR, "onsen.dev.db")
     DB_PATH_PROD = os.path.join(DB_DIR, "onsen.prod.db")
     RECOMMENDATION_CACHE_DB = os.path.join(CACHE_DIR, "recommendation_cache.sqlite3")
+    GRAPH_CACHE_DB = os.path.join(CACHE_DIR, "graph_cache.sqlite3")
+    ANALYSIS_CACHE_DB = os.path.join(CACHE_DIR, "analysis_cache.sqlite3")
+    FEATURE_STORE_DB = os.path.join(CACHE_DIR, "feature_store.sqlite3")
     HOLIDAYS_CACHE_FILE = os.path.join(CACHE_DIR, "japan_holidays.json")
     SCRAPED_ONSEN_DATA_FILE = os.path.join(OUTPUT_DIR, "scraped_onsen_data.json")
     ONSEN_MAPPING_FILE = os.path.join(OUTPUT_DIR, "onsen_mapping.json")
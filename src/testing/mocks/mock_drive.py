@@ -0,0 +1,189 @@
+"""
+In-memory stand-in for the Google Drive v3 ``files()`` API.
+
+Implements the subset used by ``GoogleDriveBackup``: ``list``/``get``/``create``
+requests with ``execute()``, and resumable media uploads driven by
+``next_chunk()`` that follow googleapiclient's ``HttpRequest`` protocol,
+including the upload status query (``request.http``) used to resume a saved
+``resumable_uri``. Upload sessions live on
+the service, so a new backup manager (a "restarted process") can resume them.
+"""
+
+import itertools
+import re
+import threading
+from collections import Counter
+from typing import Any, Optional
+
+import httplib2
+from googleapiclient.http import MediaUploadProgress
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+
+class ConnectionLost(Exception):
+    """Raised by the fake service to simulate a dropped upload."""
+
+
+class _Request:
+    def __init__(self, run):
+        self._run = run
+
+    def execute(self) -> Any:
+        return self._run()
+
+
+class _SessionHttp:
+    """Answers the resumable upload status query (an empty PUT) for the fake sessions."""
+
+    def __init__(self, service: "FakeDriveService"):
+        self._service = service
+
+    def request(self, uri: str, method: str = "GET", body: Any = None, headers: Optional[dict] = None):
+        if method != "PUT" or body or not (headers or {}).get("Content-Range", "").startswith("bytes */"):
+            raise NotImplementedError("Only upload status queries are supported")
+
+        received = self._service.session_progress(uri)
+        if received is None:
+            return httplib2.Response({"status": 404}), b"Not Found"
+        self._service.resumed_from.append(received)
+        info = {"status": 308}
+        if received:
+            info["range"] = f"bytes=0-{received - 1}"
+        return httplib2.Response(info), b""
+
+
+class _UploadRequest:
+    """Resumable upload request mirroring ``googleapiclient.http.HttpRequest``."""
+
+    def __init__(self, service: "FakeDriveService", body: dict, media: Any):
+        self._service = service
+        self._body = body
+        self._media = media
+        self.http = _SessionHttp(service)
+        self.resumable_uri: Optional[str] = None
+        self.resumable_progress = 0
+
+    def next_chunk(self) -> tuple[Optional[MediaUploadProgress], Optional[dict]]:
+        service = self._service
+        size = self._media.size()
+
+        if self.resumable_uri is None:
+            self.resumable_uri = service.start_session(self._body)
+
+        chunk = self._media.getbytes(self.resumable_progress, self._media.chunksize())
+        service.receive_chunk(self.resumable_uri, chunk)
+        self.resumable_progress += len(chunk)
+
+        if self.resumable_progress >= size:
+            return None, service.finish_session(self.resumable_uri)
+        return MediaUploadProgress(self.resumable_progress, size), None
+
+
+class _Files:
+    def __init__(self, service: "FakeDriveService"):
+        self._service = service
+
+    def list(self, q: str = "", **_kwargs) -> _Request:
+        return _Request(lambda: {"files": self._service.query(q)})
+
+    def get(self, fileId: str, **_kwargs) -> _Request:  # pylint: disable=invalid-name
+        return _Request(lambda: dict(self._service.stored[fileId]))
+
+    def create(self, body: dict, media_body: Any = None, **_kwargs) -> Any:
+        if media_body is not None:
+            return _UploadRequest(self._service, body, media_body)
+        return _Request(lambda: self._service.add_file(body, b""))
+
+
+class FakeDriveService:
+    """
+    Thread-safe in-memory Drive service.
+
+    Attributes:
+        stored: File id -> metadata (``content`` holds uploaded bytes)
+        calls: Counter of API calls by name (``list``, ``create``, ``chunk``, ...)
+        resumed_from: Byte offsets at which interrupted uploads were resumed
+        fail_after_chunks: Raise ``ConnectionLost`` once this many more chunks
+            have been received (``None`` disables)
+    """
+
+    def __init__(self):
+        self.stored: dict[str, dict[str, Any]] = {}
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.calls: Counter = Counter()
+        self.resumed_from: list[int] = []
+        self.fail_after_chunks: Optional[int] = None
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def files(self) -> _Files:
+        """The ``files()`` resource, as on a real Drive service."""
+        return _Files(self)
+
+    def add_file(self, body: dict, content: bytes) -> dict:
+        with self._lock:
+            self.calls["create"] += 1
+            file_id = f"id{next(self._ids)}"
+            self.stored[file_id] = {
+                "id": file_id,
+                "name": body["name"],
+                "mimeType": body.get("mimeType", "application/octet-stream"),
+                "parents": list(body.get("parents", [])),
+                "properties": dict(body.get("properties", {})),
+                "size": str(len(content)),
+                "content": content,
+                "trashed": False,
+            }
+            return {"id": file_id, "name": body["name"], "size": str(len(content))}
+
+    def query(self, q: str) -> list[dict]:
+        """Evaluate the ``name``/``mimeType``/``in parents`` clauses of a Drive query."""
+        with self._lock:
+            self.calls["list"] += 1
+            name = re.search(r"name='([^']*)'", q)
+            mime_type = re.search(r"mimeType='([^']*)'", q)
+            parent = re.search(r"'([^']*)' in parents", q)
+            return [
+                {key: value for key, value in f.items() if key != "content"}
+                for f in self.stored.values()
+                if not f["trashed"]
+                and (not name or f["name"] == name.group(1))
+                and (not mime_type or f["mimeType"] == mime_type.group(1))
+                and (not parent or parent.group(1) in f["parents"])
+            ]
+
+    def start_session(self, body: dict) -> str:
+        with self._lock:
+            self.calls["start_session"] += 1
+            uri = f"https://upload.fake/session/{next(self._ids)}"
+            self.sessions[uri] = {"body": body, "data": bytearray()}
+            return uri
+
+    def session_progress(self, uri: str) -> Optional[int]:
+        """Bytes received by an upload session, or None if it does not exist."""
+        with self._lock:
+            if uri not in self.sessions:
+                return None
+            return len(self.sessions[uri]["data"])
+
+    def receive_chunk(self, uri: str, chunk: bytes) -> None:
+        with self._lock:
+            if self.fail_after_chunks is not None:
+                if self.fail_after_chunks <= 0:
+                    raise ConnectionLost("connection lost")
+                self.fail_after_chunks -= 1
+            self.calls["chunk"] += 1
+            self.sessions[uri]["data"].extend(chunk)
+
+    def finish_session(self, uri: str) -> dict:
+        with self._lock:
+            session = self.sessions.pop(uri)
+            return self.add_file(session["body"], bytes(session["data"]))
+
+    def uploaded_names(self) -> list[str]:
+        """Names of all non-folder files, sorted."""
+        with self._lock:
+            return sorted(
+                f["name"] for f in self.stored.values() if f["mimeType"] != FOLDER_MIME_TYPE
+            )
@@ -0,0 +1,154 @@
+"""
+Locally served stand-in for the onsen detail pages.
+
+``FakeOnsenSite`` runs a threaded HTTP server on localhost that serves
+detail pages with the same body structure as the real site (header, region,
+"N番 name", media block with map iframe, information table), so the scraper
+can be exercised end to end without touching the network. Pages carry an
+``ETag`` and answer conditional requests with ``304 Not Modified``.
+"""
+
+import hashlib
+import html
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.const import CONST
+
+
+def build_onsen_detail_page(
+    ban_number: str,
+    name: str,
+    region: str = "別府",
+    latitude: Optional[float] = 33.2774556,
+    longitude: Optional[float] = 131.5059894,
+    table: Optional[dict[str, str]] = None,
+    deleted: bool = False,
+) -> str:
+    """Render a detail page shaped like the real site's markup."""
+    image = CONST.DELETED_IMAGE_URL if deleted else "photo/photo1.jpg"
+    map_src = (
+        f"https://maps.google.co.jp/maps?&amp;output=embed&amp;q={latitude},{longitude}"
+        if latitude is not None and longitude is not None
+        else ""
+    )
+    rows = "\n".join(
+        f"<tr><td>{html.escape(key)}</td><td>{html.escape(value)}</td></tr>"
+        for key, value in (table or {}).items()
+    )
+    return f"""<html lang="ja"><head>
+<meta charset="utf-8">
+<title>温泉ハンター</title>
+<script type="text/javascript">function returnButtonClicked() {{ history.back(); }}</script>
+</head>
+<body>
+<div id="headerDIV">
+	<table><tbody><tr><td><input type="button" value="戻る" onclick="returnButtonClicked()"></td>
+	<td><span>温泉詳細</span></td></tr></tbody></table>
+</div>
+<div style="font-size:14px">{html.escape(region)}</div>
+<div style="font-size:20px">{html.escape(ban_number)}番&nbsp;&nbsp;{html.escape(name)}</div>
+<div>
+	<div><img src="{image}"></div>
+	<iframe src="{map_src}"></iframe>
+</div>
+<div>
+	<table>
+		<tbody>{rows}</tbody>
+	</table>
+</div>
+<div><div id="copyRight">Copyright(c) APC</div></div>
+</body></html>
+"""
+
+
+class FakeOnsenSite:
+    """
+    Threaded local server for onsen detail pages.
+
+    Attributes:
+        pages: Onsen ID -> page HTML (edit to simulate site changes)
+        requests: Counter of requests by onsen ID
+        not_modified: Counter of 304 responses by onsen ID
+        request_times: Monotonic arrival time of every request
+        failing: Onsen IDs that answer ``500 Internal Server Error``
+    """
+
+    def __init__(self, pages: Optional[dict[str, str]] = None):
+        self.pages: dict[str, str] = dict(pages or {})
+        self.requests: Counter = Counter()
+        self.not_modified: Counter = Counter()
+        self.request_times: list[float] = []
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url_template(self) -> str:
+        """Detail page URL template with an ``{onsen_id}`` placeholder."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/dhunter/details_onsen.jsp?t={{onsen_id}}"
+
+    def _handler_class(self) -> type:
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                onsen_id = parse_qs(urlparse(self.path).query).get("t", [""])[0]
+                with site._lock:  # pylint: disable=protected-access
+                    site.requests[onsen_id] += 1
+                    site.request_times.append(time.monotonic())
+                    page = site.pages.get(onsen_id)
+                    failing = onsen_id in site.failing
+
+                if failing:
+                    self.send_error(500)
+                    return
+                if page is None:
+                    self.send_error(404)
+                    return
+
+                body = page.encode("utf-8")
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    with site._lock:  # pylint: disable=protected-access
+                        site.not_modified[onsen_id] += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                # Like the real site: charset only in the page's meta tag
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeOnsenSite":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOnsenSite":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -8,11 +8,15 @@ This module creates sophisticated mock datasets with:
 - Seasonal effects and temporal trends
 - Heart rate data integration
 - Geographic patterns
+
+``RealisticDataGenerator`` builds visits one at a time; ``VectorizedDataGenerator``
+draws the same distributions a whole column at a time with NumPy and is meant
+for load-testing datasets of millions of visits and activities.
 """
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 import random
 import numpy as np
 from faker import Faker
@@ -21,8 +25,14 @@ from src.testing.mocks.user_profiles import (
     UserProfile,
     get_random_profile,
     ALL_PROFILES,
+    QUALITY_SEEKER,
+    BUDGET_TRAVELER,
+    EXPLORER,
+    LOCAL_REGULAR,
+    TOURIST,
 )
 from src.testing.mocks.mock_visit_data import MockOnsenVisit
+from src.types.exercise import ExerciseType
 
 fake = Faker(['ja_JP', 'en_US'])
 
@@ -557,29 +567,583 @@ class RealisticDataGenerator:
         return visits
 
 
-# Pre-configured scenarios for common use cases
-def create_analysis_ready_dataset(
-    onsen_ids: list[int],
-    num_visits: int = 100,
-    start_date: Optional[datetime] = None,
-    days: int = 90,
-) -> list[MockOnsenVisit]:
-    """
-    Create a comprehensive dataset ready for all analysis types.
+GENERATION_CHUNK_SIZE = 100_000
+"""Visits drawn per chunk by ``VectorizedDataGenerator``.
 
-    Features:
-    - Mix of all user profiles
-    - Seasonal coverage
-    - Price-quality correlations
-    - Realistic missing data
-    - Suitable for econometric analysis
+Fixed (rather than tied to the insert batch size) so the generated data
+depends only on the configuration and seed.
+"""
+
+
+def _cumulative(weights: np.ndarray) -> np.ndarray:
+    """Normalize each row of a weight matrix into a cumulative distribution."""
+    weights = np.asarray(weights, dtype=np.float64)
+    cumulative = np.cumsum(weights / weights.sum(axis=-1, keepdims=True), axis=-1)
+    cumulative[..., -1] = 1.0
+    return cumulative
+
+
+def _minutes(values: np.ndarray) -> np.ndarray:
+    """Integer minutes as a ``timedelta64`` array."""
+    return np.asarray(values).astype('timedelta64[m]')
+
+
+def _choice_by_row(rng: np.random.Generator, cumulative: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Draw one category index per element, each from its own row's distribution."""
+    draws = rng.random(len(rows))
+    return (draws[:, None] >= cumulative[rows]).sum(axis=1)
+
+
+class VectorizedDataGenerator(RealisticDataGenerator):
+    """
+    Column-at-a-time counterpart of ``RealisticDataGenerator``.
+
+    Every field is drawn for a whole chunk of visits at once from a seeded
+    ``numpy.random.Generator``, using the same profile distributions, price
+    tiers, seasonal weather, temperature and crowd tables, and rating
+    correlations as ``generate_visit``. Output is identical for the same
+    configuration and seed, and memory stays bounded by the chunk size, so
+    millions of visits can be streamed into the database.
+
+    The per-visit history of the scalar generator is approximated with
+    per-user draws: users with low experience seeking revisit a small set of
+    favorite onsens, users with high experience seeking ignore popularity
+    weights, and the learning effect uses each user's chronological visit
+    number. With ``total_visits`` the visit count is exact, split across users
+    in proportion to their profile's visit frequency.
     """
+
+    FAVORITES_PER_USER = 3
+
+    def __init__(self, config: ScenarioConfig, seed: Optional[int] = None):
+        """
+        Args:
+            config: Scenario configuration
+            seed: Random seed (default: fresh entropy, available as ``self.seed``)
+        """
+        super().__init__(config)
+        self.seed = np.random.SeedSequence(seed).entropy
+        self._setup_tables()
+
+    def _rng(self, stream: int, index: int) -> np.random.Generator:
+        """Independent generator for one stream (schedule, visits, activities) and chunk."""
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(stream, index)))
+
+    def _setup_tables(self) -> None:
+        """Turn the scalar generator's lookup rules into arrays indexed by category."""
+        profiles = self.config.profiles
+        self.SEASONS = ['spring', 'summer', 'autumn', 'winter']
+        self.FEES = sorted(self.PRICE_TIERS)
+
+        # Month (1-12) -> season index
+        self._month_season = np.array([3, 3, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3])
+
+        # Hour ranges per time of day; night wraps past midnight
+        self._hour_low = np.array([6, 12, 18, 23])
+        self._hour_high = np.array([12, 18, 23, 26])
+        self._time_cumulative = _cumulative([
+            [1.0 if time in profile.preferred_times else 0.0 for time in self.TIME_OF_DAY]
+            for profile in profiles
+        ])
+
+        weather_probabilities = {
+            'spring': {'sunny': 0.4, 'partly cloudy': 0.3, 'cloudy': 0.2, 'rainy': 0.1},
+            'summer': {'sunny': 0.6, 'partly cloudy': 0.2, 'cloudy': 0.1, 'rainy': 0.1},
+            'autumn': {'sunny': 0.5, 'partly cloudy': 0.25, 'cloudy': 0.15, 'rainy': 0.1},
+            'winter': {
+                'cloudy': 0.3, 'sunny': 0.3, 'partly cloudy': 0.2, 'snowy': 0.15, 'rainy': 0.05,
+            },
+        }
+        self._weather_cumulative = _cumulative([
+            [weather_probabilities[season].get(weather, 0.0) for weather in self.WEATHER_CONDITIONS]
+            for season in self.SEASONS
+        ])
+
+        # Temperature mean by (season, time of day) and clip bounds by season
+        base_temps = {'spring': (15, 22), 'summer': (26, 34), 'autumn': (14, 21), 'winter': (4, 12)}
+        self._temp_mean = np.array([
+            [(low + high) / 2 - 3, high, (low + high) / 2, low]
+            for low, high in (base_temps[season] for season in self.SEASONS)
+        ])
+        self._temp_low = np.array([base_temps[season][0] - 5 for season in self.SEASONS])
+        self._temp_high = np.array([base_temps[season][1] + 5 for season in self.SEASONS])
+
+        # Crowd level by (weekend * 4 + time of day)
+        crowd_weights = {
+            (True, 'morning'): {'quiet': 0.3, 'moderate': 0.5, 'busy': 0.2},
+            (True, 'afternoon'): {'moderate': 0.2, 'busy': 0.5, 'crowded': 0.3},
+            (True, 'evening'): {'busy': 0.4, 'moderate': 0.4, 'crowded': 0.2},
+            (True, 'night'): {'quiet': 0.5, 'moderate': 0.3, 'empty': 0.2},
+            (False, 'morning'): {'empty': 0.4, 'quiet': 0.6},
+            (False, 'afternoon'): {'quiet': 0.6, 'moderate': 0.4},
+            (False, 'evening'): {'moderate': 0.4, 'busy': 0.3, 'quiet': 0.3},
+            (False, 'night'): {'empty': 0.5, 'quiet': 0.5},
+        }
+        self._crowd_cumulative = _cumulative([
+            [crowd_weights[(weekend, time)].get(level, 0.0) for level in self.CROWD_LEVELS]
+            for weekend in (False, True)
+            for time in self.TIME_OF_DAY
+        ])
+
+        # Entry fee weights per profile (same rules as _select_entry_fee)
+        fee_weights = []
+        for profile in profiles:
+            affordable = [fee <= profile.max_acceptable_price for fee in self.FEES]
+            if not any(affordable):
+                affordable[0] = True
+            ranks = np.cumsum(affordable)
+            if profile.price_sensitivity > 0.7:
+                weights = 1 / ranks
+            elif profile.price_sensitivity < 0.3:
+                weights = ranks.astype(np.float64)
+            else:
+                weights = np.ones(len(self.FEES))
+            fee_weights.append(np.where(affordable, weights, 0.0))
+        self._fee_cumulative = _cumulative(fee_weights)
+
+        tiers = [self.PRICE_TIERS[fee] for fee in self.FEES]
+        self._cleanliness_boost = np.array([tier['cleanliness_boost'] for tier in tiers])
+        self._atmosphere_boost = np.array([tier['atmosphere_boost'] for tier in tiers])
+        self._facility_probability = np.array([tier['facility_probability'] for tier in tiers])
+
+        weather_view_effect = {'sunny': 1, 'partly cloudy': 0, 'cloudy': -1, 'rainy': -2, 'snowy': 1}
+        self._view_effect = np.array([weather_view_effect[w] for w in self.WEATHER_CONDITIONS])
+
+        # Personal rating terms per profile (see UserProfile.generate_personal_rating)
+        self._rating_weights = np.array([
+            [profile.rating_correlations.get(component, 0.33)
+             for component in ('cleanliness', 'atmosphere', 'view')]
+            for profile in profiles
+        ])
+        self._crowd_effect = np.array([
+            [
+                {
+                    'empty': 0.5 if profile.crowd_tolerance < 0.3 else 0.8,
+                    'quiet': 0.8 if profile.crowd_tolerance < 0.5 else 0.9,
+                    'moderate': 0.7,
+                    'busy': 0.5 if profile.crowd_tolerance > 0.7 else 0.3,
+                    'crowded': 0.3 if profile.crowd_tolerance > 0.7 else -0.5,
+                }[level]
+                for level in self.CROWD_LEVELS
+            ]
+            for profile in profiles
+        ])
+        self._weather_effect = np.array([
+            [
+                {
+                    'sunny': 0.5,
+                    'cloudy': 0.2,
+                    'partly cloudy': 0.3,
+                    'rainy': -0.3 if profile.weather_sensitivity > 0.5 else 0.2,
+                    'snowy': 0.5 if profile.weather_sensitivity > 0.5 else 0.1,
+                }[weather] * profile.weather_sensitivity
+                for weather in self.WEATHER_CONDITIONS
+            ]
+            for profile in profiles
+        ])
+        self._max_price = np.array([profile.max_acceptable_price for profile in profiles])
+        self._price_sensitivity = np.array([profile.price_sensitivity for profile in profiles])
+        self._rating_bias = np.array([profile.rating_bias for profile in profiles])
+        self._rating_variance = np.array([profile.rating_variance for profile in profiles])
+
+        self._experience_seeking = np.array([profile.experience_seeking for profile in profiles])
+        self._visits_per_month = np.array([profile.visits_per_month for profile in profiles])
+        self._exercise_probability = np.array([profile.exercise_probability for profile in profiles])
+        self._travel_low = np.array([profile.typical_travel_time_range[0] for profile in profiles])
+        self._travel_high = np.array([profile.typical_travel_time_range[1] for profile in profiles]) + 1
+
+        self.TRAVEL_MODES = list(dict.fromkeys(
+            mode for profile in profiles for mode in profile.preferred_travel_modes
+        ))
+        self._travel_cumulative = _cumulative([
+            [profile.preferred_travel_modes.get(mode, 0.0) for mode in self.TRAVEL_MODES]
+            for profile in profiles
+        ])
+        self.COMPANIONS = list(dict.fromkeys(
+            companion for profile in profiles for companion in profile.social_preference
+        ))
+        self._companion_cumulative = _cumulative([
+            [profile.social_preference.get(companion, 0.0) for companion in self.COMPANIONS]
+            for profile in profiles
+        ])
+
+        onsen_ids = np.asarray(self.config.onsen_ids, dtype=np.int64)
+        if len(onsen_ids) == 0:
+            raise ValueError("onsen_ids must not be empty")
+        self._onsen_ids = onsen_ids
+        popularity = self.config.onsen_visit_probabilities or {}
+        self._onsen_cumulative = _cumulative(
+            [popularity.get(int(onsen_id), 1.0) for onsen_id in onsen_ids]
+        )
+
+    def _schedule(self) -> dict[str, np.ndarray]:
+        """
+        Draw who visits when, sorted chronologically.
+
+        Returns:
+            Per-visit ``user``, ``profile``, ``time_of_day``, ``minute_offset``
+            (minutes since the start date) and ``visit_number`` arrays, plus
+            per-user ``favorites``
+        """
+        config = self.config
+        rng = self._rng(0, 0)
+        num_profiles = len(config.profiles)
+        weights = np.asarray(config.profile_weights, dtype=np.float64)
+        weights = weights / weights.sum()
+
+        if config.total_visits:
+            num_users = max(1, config.total_visits // 20)
+        else:
+            num_users = num_profiles
+        user_profile = rng.choice(num_profiles, size=num_users, p=weights)
+
+        if config.visits_per_user:
+            counts = np.full(num_users, config.visits_per_user)
+        else:
+            frequency = self._visits_per_month[user_profile]
+            counts = rng.multinomial(config.total_visits, frequency / frequency.sum())
+
+        favorites = (
+            rng.random((num_users, self.FAVORITES_PER_USER))[..., None] >= self._onsen_cumulative
+        ).sum(axis=-1)
+
+        user = np.repeat(np.arange(num_users), counts)
+        profile = user_profile[user]
+        num_visits = len(user)
+
+        days = (config.end_date - config.start_date).days
+        day = rng.integers(0, days + 1, size=num_visits)
+        time_of_day = _choice_by_row(rng, self._time_cumulative, profile)
+        hour = rng.integers(self._hour_low[time_of_day], self._hour_high[time_of_day]) % 24
+        minute = rng.integers(0, 60, size=num_visits)
+        minute_offset = day * 1440 + hour * 60 + minute
+
+        order = np.argsort(minute_offset, kind='stable')
+        user, profile = user[order], profile[order]
+        time_of_day, minute_offset = time_of_day[order], minute_offset[order]
+
+        # Chronological visit number within each user's history
+        by_user = np.lexsort((np.arange(num_visits), user))
+        group_starts = np.flatnonzero(np.r_[True, np.diff(user[by_user]) != 0])
+        group_sizes = np.diff(np.r_[group_starts, num_visits])
+        visit_number = np.empty(num_visits, dtype=np.int64)
+        visit_number[by_user] = np.arange(num_visits) - np.repeat(group_starts, group_sizes) + 1
+
+        return {
+            'user': user,
+            'profile': profile,
+            'time_of_day': time_of_day,
+            'minute_offset': minute_offset,
+            'visit_number': visit_number,
+            'favorites': favorites,
+        }
+
+    def _visit_chunk(
+        self, rng: np.random.Generator, schedule: dict[str, np.ndarray], rows: slice
+    ) -> dict[str, np.ndarray]:
+        """Draw every visit column for one chunk of the schedule."""
+        config = self.config
+        user = schedule['user'][rows]
+        profile = schedule['profile'][rows]
+        time_of_day = schedule['time_of_day'][rows]
+        visit_number = schedule['visit_number'][rows]
+        n = len(user)
+
+        start = np.datetime64(config.start_date.replace(hour=0, minute=0, second=0, microsecond=0), 'us')
+        visit_time = start + schedule['minute_offset'][rows].astype('timedelta64[m]')
+        season = self._month_season[visit_time.astype('datetime64[M]').astype(np.int64) % 12]
+        # 1970-01-01 was a Thursday (weekday 3)
+        weekday = (visit_time.astype('datetime64[D]').astype(np.int64) + 3) % 7
+
+        # Onsen: popularity-weighted, explorers spread out, regulars revisit favorites
+        onsen = (rng.random(n)[:, None] >= self._onsen_cumulative).sum(axis=1)
+        seeking = self._experience_seeking[profile]
+        explorer = seeking > 0.7
+        onsen[explorer] = rng.integers(0, len(self._onsen_ids), size=int(explorer.sum()))
+        loyal = (seeking < 0.3) & (visit_number > 1) & (rng.random(n) < 0.7)
+        favorite = rng.integers(0, self.FAVORITES_PER_USER, size=n)
+        onsen[loyal] = schedule['favorites'][user[loyal], favorite[loyal]]
+
+        # Weather and temperature
+        if config.enable_seasonal_effects:
+            weather = _choice_by_row(rng, self._weather_cumulative, season)
+            temperature = np.clip(
+                rng.normal(self._temp_mean[season, time_of_day], 2),
+                self._temp_low[season],
+                self._temp_high[season],
+            ).round(1)
+        else:
+            weather = rng.integers(0, len(self.WEATHER_CONDITIONS), size=n)
+            temperature = rng.uniform(5, 35, size=n).round(1)
+
+        crowd = _choice_by_row(rng, self._crowd_cumulative, (weekday >= 5) * 4 + time_of_day)
+
+        # Entry fee and price-correlated facilities
+        fee_index = _choice_by_row(rng, self._fee_cumulative, profile)
+        entry_fee = np.asarray(self.FEES)[fee_index]
+        facility = self._facility_probability[fee_index]
+        had_sauna = rng.random(n) < facility
+        had_outdoor_bath = rng.random(n) < facility
+        had_rest_area = rng.random(n) < np.maximum(0.7, facility)
+        had_food_service = rng.random(n) < facility - 0.1
+        had_soap = rng.random(n) < 0.9
+        massage_chair = rng.random(n) < 0.3
+
+        # Correlated facility ratings (see _generate_correlated_ratings)
+        cleanliness_base = 7 + (rng.random(n)[:, None] >= np.array([0.1, 0.4, 0.8])).sum(axis=1)
+        cleanliness = np.clip(cleanliness_base + self._cleanliness_boost[fee_index], 1, 10)
+        atmosphere = np.clip(
+            np.rint(cleanliness + rng.normal(0, 1, n) + self._atmosphere_boost[fee_index]), 1, 10
+        ).astype(np.int64)
+        view = np.clip(rng.integers(6, 11, size=n) + self._view_effect[weather], 1, 10)
+        navigability = rng.integers(6, 11, size=n)
+        accessibility = rng.integers(5, 11, size=n)
+        accessibility = np.clip(accessibility - (entry_fee < 300), 1, 10)
+        locker = rng.integers(7, 11, size=n)
+        changing_room = np.clip(cleanliness + rng.integers(-1, 2, size=n), 1, 10)
+        smell = rng.integers(3, 9, size=n)
+
+        # Personal rating (see UserProfile.generate_personal_rating)
+        weights = self._rating_weights[profile]
+        max_price = self._max_price[profile]
+        sensitivity = self._price_sensitivity[profile]
+        price_effect = np.where(
+            entry_fee > max_price,
+            -sensitivity * 2,
+            (1 - entry_fee / max_price) * sensitivity * 0.5,
+        )
+        score = (
+            weights[:, 0] * cleanliness
+            + weights[:, 1] * atmosphere
+            + weights[:, 2] * view
+            + price_effect
+            + self._crowd_effect[profile, crowd]
+            + self._weather_effect[profile, weather]
+            + self._rating_bias[profile]
+            + rng.normal(0, 1, n) * self._rating_variance[profile]
+        )
+        personal_rating = np.clip(np.rint(score), 1, 10).astype(np.int64)
+        if config.enable_learning_effects:
+            # int(min(1, (visit_count - 5) * 0.05)) only reaches 1 from the 25th visit
+            personal_rating = np.minimum(10, personal_rating + (visit_number >= 25))
+
+        # Travel and company
+        travel_mode = _choice_by_row(rng, self._travel_cumulative, profile)
+        travel_time = rng.integers(self._travel_low[profile], self._travel_high[profile])
+        companion = _choice_by_row(rng, self._companion_cumulative, profile)
+        companions = np.array(self.COMPANIONS, dtype=object)
+
+        stay = rng.integers(45, 91, size=n)
+        in_group = np.isin(companions[companion], ['family', 'group'])
+        stay += np.where(in_group, rng.integers(15, 31, size=n), 0)
+        stay += np.where(had_rest_area & (rng.random(n) < 0.6), rng.integers(10, 21, size=n), 0)
+
+        def pick(options: list[str]) -> np.ndarray:
+            return np.array(options, dtype=object)[rng.integers(0, len(options), size=n)]
+
+        crowd_level = np.array(self.CROWD_LEVELS, dtype=object)[crowd]
+
+        # Logic chains of MockOnsenVisit: optional features are only used when present
+        return {
+            'onsen_id': self._onsen_ids[onsen],
+            'entry_fee_yen': entry_fee,
+            'payment_method': pick(self.PAYMENT_METHODS),
+            'weather': np.array(self.WEATHER_CONDITIONS, dtype=object)[weather],
+            'temperature_outside_celsius': temperature,
+            'visit_time': visit_time,
+            'stay_length_minutes': stay,
+            'visited_with': companions[companion],
+            'travel_mode': np.array(self.TRAVEL_MODES, dtype=object)[travel_mode],
+            'travel_time_minutes': travel_time,
+            'accessibility_rating': accessibility,
+            'crowd_level': crowd_level,
+            'interacted_with_locals': (crowd_level != 'empty') & (rng.random(n) < 0.5),
+            'view_rating': view,
+            'navigability_rating': navigability,
+            'cleanliness_rating': cleanliness,
+            'main_bath_type': pick(self.MAIN_BATH_TYPES),
+            'main_bath_temperature': rng.uniform(38, 43, size=n).round(1),
+            'water_color': pick(self.WATER_COLORS),
+            'smell_intensity_rating': smell,
+            'changing_room_cleanliness_rating': changing_room,
+            'locker_availability_rating': locker,
+            'had_soap': had_soap,
+            'had_sauna': had_sauna,
+            'sauna_visited': had_sauna & (rng.random(n) < 0.5),
+            'had_outdoor_bath': had_outdoor_bath,
+            'outdoor_bath_visited': had_outdoor_bath & (rng.random(n) < 0.5),
+            'had_rest_area': had_rest_area,
+            'rest_area_used': had_rest_area & (rng.random(n) < 0.5),
+            'had_food_service': had_food_service,
+            'food_service_used': had_food_service & (rng.random(n) < 0.5),
+            'massage_chair_available': massage_chair,
+            'pre_visit_mood': pick(['stressed', 'tired', 'anxious', 'neutral']),
+            'post_visit_mood': pick(['relaxed', 'very relaxed', 'energetic', 'refreshed']),
+            'energy_level_change': rng.integers(1, 4, size=n),
+            'hydration_level': rng.integers(5, 10, size=n),
+            'multi_onsen_day': np.zeros(n, dtype=bool),
+            'atmosphere_rating': atmosphere,
+            'personal_rating': personal_rating,
+        }
+
+    def _activity_chunk(
+        self,
+        rng: np.random.Generator,
+        visits: dict[str, np.ndarray],
+        profile: np.ndarray,
+        heart_rate_coverage: float,
+        include_exercise: bool,
+    ) -> dict[str, np.ndarray]:
+        """Draw onsen monitoring sessions and pre-visit workouts for one chunk."""
+        n = len(profile)
+
+        # Heart rate monitoring during the visit, linked to it
+        monitored = np.flatnonzero(rng.random(n) < heart_rate_coverage)
+        m = len(monitored)
+        monitor_start = visits['visit_time'][monitored] + _minutes(rng.integers(0, 6, size=m))
+        monitor_duration = np.maximum(
+            15, visits['stay_length_minutes'][monitored] - rng.integers(0, 16, size=m)
+        )
+        monitor_hr = rng.normal(95, 8, size=m)
+
+        # Workouts before the visit, by the profile's exercise habit
+        if include_exercise:
+            exercised = np.flatnonzero(rng.random(n) < self._exercise_probability[profile])
+        else:
+            exercised = np.array([], dtype=np.int64)
+        e = len(exercised)
+        kind = rng.integers(0, len(self.EXERCISE_TYPES), size=e)
+        # running, walking, cycling, swimming, hiking
+        speed_kmh = np.array([10.0, 5.0, 20.0, 2.0, 4.0])[kind]
+        kcal_per_minute = np.array([11.0, 4.5, 8.0, 9.0, 7.0])[kind]
+        base_hr = np.array([150.0, 105.0, 135.0, 130.0, 120.0])[kind]
+        climb = np.array([60.0, 30.0, 120.0, 0.0, 400.0])[kind]
+        exercise_duration = rng.integers(20, 91, size=e)
+        exercise_end = visits['visit_time'][exercised] - _minutes(rng.integers(15, 121, size=e))
+        exercise_hr = base_hr + rng.normal(0, 8, size=e)
+        exercise_types = np.array(self.EXERCISE_TYPES, dtype=object)[kind]
+
+        visit_ids = np.empty(m + e, dtype=object)
+        visit_ids[:m] = visits['id'][monitored]
+        visit_ids[m:] = None
+        avg_hr = np.concatenate([monitor_hr, exercise_hr])
+        duration = np.concatenate([monitor_duration, exercise_duration])
+        start = np.concatenate([monitor_start, exercise_end - _minutes(exercise_duration)])
+
+        return {
+            'visit_id': visit_ids,
+            'recording_start': start,
+            'recording_end': start + _minutes(duration),
+            'duration_minutes': duration,
+            'activity_type': np.concatenate([
+                np.full(m, ExerciseType.ONSEN_MONITORING.value, dtype=object), exercise_types
+            ]),
+            'activity_name': np.concatenate([
+                np.full(m, 'Onsen visit', dtype=object),
+                np.array([f'Pre-onsen {name}' for name in self.EXERCISE_TYPES], dtype=object)[kind],
+            ]),
+            'distance_km': np.concatenate([
+                np.full(m, np.nan),
+                (speed_kmh * exercise_duration / 60 * rng.lognormal(0, 0.15, size=e)).round(2),
+            ]),
+            'calories_burned': np.concatenate([
+                (monitor_duration * 1.5).astype(np.int64),
+                np.rint(kcal_per_minute * exercise_duration * rng.normal(1, 0.1, size=e)).astype(np.int64),
+            ]),
+            'elevation_gain_m': np.concatenate([
+                np.full(m, np.nan), (climb * rng.uniform(0.3, 1.5, size=e)).round(1),
+            ]),
+            'avg_heart_rate': avg_hr.round(1),
+            'min_heart_rate': (avg_hr - rng.uniform(10, 40, size=m + e)).round(1),
+            'max_heart_rate': (avg_hr + rng.uniform(10, 30, size=m + e)).round(1),
+            'indoor_outdoor': np.concatenate([
+                np.where(visits['outdoor_bath_visited'][monitored], 'outdoor', 'indoor').astype(object),
+                np.where(exercise_types == 'swimming', 'indoor', 'outdoor').astype(object),
+            ]),
+            'weather_conditions': np.concatenate([
+                visits['weather'][monitored], visits['weather'][exercised]
+            ]),
+        }
+
+    def iter_chunks(
+        self,
+        first_visit_id: int = 1,
+        heart_rate_coverage: float = 0.0,
+        include_exercise: bool = False,
+    ) -> Iterator[tuple[dict[str, np.ndarray], dict[str, np.ndarray]]]:
+        """
+        Generate the scenario chunk by chunk, in chronological order.
+
+        Column names match ``OnsenVisit`` and ``Activity``, so each chunk can
+        be passed straight to ``src.db.columnar.insert_columns``.
+
+        Args:
+            first_visit_id: Id given to the first visit; ids are consecutive so
+                activities can reference their visit before it is inserted
+            heart_rate_coverage: Fraction of visits with an ``onsen_monitoring``
+                activity linked to them
+            include_exercise: Also draw workouts before visits, according to
+                each profile's ``exercise_probability``
+
+        Yields:
+            ``(visit_columns, activity_columns)`` per chunk of at most
+            ``GENERATION_CHUNK_SIZE`` visits
+        """
+        schedule = self._schedule()
+        total = len(schedule['user'])
+
+        for index, start in enumerate(range(0, total, GENERATION_CHUNK_SIZE)):
+            rows = slice(start, min(start + GENERATION_CHUNK_SIZE, total))
+            visits = self._visit_chunk(self._rng(1, index), schedule, rows)
+            visits['id'] = np.arange(first_visit_id + start, first_visit_id + rows.stop)
+            activities = self._activity_chunk(
+                self._rng(2, index),
+                visits,
+                schedule['profile'][rows],
+                heart_rate_coverage,
+                include_exercise,
+            )
+            yield visits, activities
+
+    def generate_columns(
+        self,
+        heart_rate_coverage: float = 0.0,
+        include_exercise: bool = False,
+    ) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """
+        Generate the whole scenario in memory.
+
+        Args:
+            heart_rate_coverage: See ``iter_chunks``
+            include_exercise: See ``iter_chunks``
+
+        Returns:
+            Tuple of (visit columns, activity columns)
+        """
+        chunks = list(self.iter_chunks(
+            heart_rate_coverage=heart_rate_coverage, include_exercise=include_exercise
+        ))
+        if not chunks:
+            return {}, {}
+        return tuple(
+            {name: np.concatenate([chunk[part][name] for chunk in chunks]) for name in chunks[0][part]}
+            for part in (0, 1)
+        )
+
+
+# Pre-configured scenarios for common use cases
+def _analysis_ready_config(
+    onsen_ids: list[int],
+    num_visits: int,
+    start_date: Optional[datetime],
+    days: int,
+) -> ScenarioConfig:
     if start_date is None:
         start_date = datetime.now() - timedelta(days=days)
 
     end_date = start_date + timedelta(days=days)
 
-    config = ScenarioConfig(
+    return ScenarioConfig(
         start_date=start_date,
         end_date=end_date,
         profiles=ALL_PROFILES,
@@ -594,6 +1158,74 @@ def create_analysis_ready_dataset(
         missing_data_rate=0.05,
     )
 
+
+def _econometric_config(onsen_ids: list[int], num_visits: int) -> ScenarioConfig:
+    return ScenarioConfig(
+        start_date=datetime.now() - timedelta(days=180),
+        end_date=datetime.now(),
+        profiles=[QUALITY_SEEKER, BUDGET_TRAVELER, EXPLORER, TOURIST],
+        profile_weights=[0.3, 0.3, 0.2, 0.2],
+        onsen_ids=onsen_ids,
+        total_visits=num_visits,
+        enable_seasonal_effects=True,
+        enable_price_quality_correlation=True,
+        enable_weather_effects=True,
+        enable_learning_effects=True,
+        add_missing_data=True,
+        missing_data_rate=0.03,
+    )
+
+
+def _tourist_config(onsen_ids: list[int], trip_days: int, visits_per_day: int) -> ScenarioConfig:
+    start_date = datetime.now() - timedelta(days=trip_days)
+
+    return ScenarioConfig(
+        start_date=start_date,
+        end_date=datetime.now(),
+        profiles=[TOURIST],
+        onsen_ids=onsen_ids,
+        visits_per_user=trip_days * visits_per_day,
+        enable_seasonal_effects=True,
+        enable_price_quality_correlation=True,
+        enable_weather_effects=True,
+        enable_fatigue_effects=True,
+        add_missing_data=False,  # Tourists tend to record everything
+    )
+
+
+def _local_regular_config(onsen_ids: list[int], months: int) -> ScenarioConfig:
+    return ScenarioConfig(
+        start_date=datetime.now() - timedelta(days=months * 30),
+        end_date=datetime.now(),
+        profiles=[LOCAL_REGULAR],
+        onsen_ids=onsen_ids,
+        visits_per_user=months * 12,  # ~12 visits per month
+        enable_seasonal_effects=True,
+        enable_price_quality_correlation=True,
+        enable_weather_effects=True,
+        enable_learning_effects=True,
+        add_missing_data=True,
+        missing_data_rate=0.08,
+    )
+
+
+def create_analysis_ready_dataset(
+    onsen_ids: list[int],
+    num_visits: int = 100,
+    start_date: Optional[datetime] = None,
+    days: int = 90,
+) -> list[MockOnsenVisit]:
+    """
+    Create a comprehensive dataset ready for all analysis types.
+
+    Features:
+    - Mix of all user profiles
+    - Seasonal coverage
+    - Price-quality correlations
+    - Realistic missing data
+    - Suitable for econometric analysis
+    """
+    config = _analysis_ready_config(onsen_ids, num_visits, start_date, days)
     generator = RealisticDataGenerator(config)
     return generator.generate_scenario()
 
@@ -611,22 +1243,7 @@ def create_econometric_test_dataset(
     - User profile-based heterogeneity
     - Sufficient variation for regression
     """
-    config = ScenarioConfig(
-        start_date=datetime.now() - timedelta(days=180),
-        end_date=datetime.now(),
-        profiles=[QUALITY_SEEKER, BUDGET_TRAVELER, EXPLORER, TOURIST],
-        profile_weights=[0.3, 0.3, 0.2, 0.2],
-        onsen_ids=onsen_ids,
-        total_visits=num_visits,
-        enable_seasonal_effects=True,
-        enable_price_quality_correlation=True,
-        enable_weather_effects=True,
-        enable_learning_effects=True,
-        add_missing_data=True,
-        missing_data_rate=0.03,
-    )
-
-    generator = RealisticDataGenerator(config)
+    generator = RealisticDataGenerator(_econometric_config(onsen_ids, num_visits))
     return generator.generate_scenario()
 
 
@@ -643,22 +1260,7 @@ def create_tourist_scenario(
     - Geographic clustering
     - Intensive short-term patterns
     """
-    start_date = datetime.now() - timedelta(days=trip_days)
-
-    config = ScenarioConfig(
-        start_date=start_date,
-        end_date=datetime.now(),
-        profiles=[TOURIST],
-        onsen_ids=onsen_ids,
-        visits_per_user=trip_days * visits_per_day,
-        enable_seasonal_effects=True,
-        enable_price_quality_correlation=True,
-        enable_weather_effects=True,
-        enable_fatigue_effects=True,
-        add_missing_data=False,  # Tourists tend to record everything
-    )
-
-    generator = RealisticDataGenerator(config)
+    generator = RealisticDataGenerator(_tourist_config(onsen_ids, trip_days, visits_per_day))
     return generator.generate_scenario()
 
 
@@ -674,19 +1276,47 @@ def create_local_regular_scenario(
     - Loyalty patterns
     - Long-term health tracking
     """
-    config = ScenarioConfig(
-        start_date=datetime.now() - timedelta(days=months * 30),
-        end_date=datetime.now(),
-        profiles=[LOCAL_REGULAR],
-        onsen_ids=onsen_ids,
-        visits_per_user=months * 12,  # ~12 visits per month
-        enable_seasonal_effects=True,
-        enable_price_quality_correlation=True,
-        enable_weather_effects=True,
-        enable_learning_effects=True,
-        add_missing_data=True,
-        missing_data_rate=0.08,
-    )
-
-    generator = RealisticDataGenerator(config)
+    generator = RealisticDataGenerator(_local_regular_config(onsen_ids, months))
     return generator.generate_scenario()
+
+
+VECTORIZED_SCENARIOS = ['comprehensive', 'econometric', 'tourist', 'local_regular']
+
+
+def scenario_config(
+    scenario: str,
+    onsen_ids: list[int],
+    num_visits: int = 100,
+    days: int = 90,
+    months: int = 12,
+    trip_days: int = 7,
+    visits_per_day: int = 3,
+) -> ScenarioConfig:
+    """
+    Build the configuration behind a named pre-configured scenario.
+
+    Used to run the same scenarios through ``VectorizedDataGenerator``.
+
+    Args:
+        scenario: One of ``VECTORIZED_SCENARIOS``
+        onsen_ids: Onsens to visit
+        num_visits: Target visits (comprehensive, econometric)
+        days: Date range in days (comprehensive)
+        months: Date range in months (local_regular)
+        trip_days: Trip length (tourist)
+        visits_per_day: Visits per trip day (tourist)
+
+    Raises:
+        ValueError: If the scenario is unknown
+    """
+    if scenario == 'comprehensive':
+        return _analysis_ready_config(onsen_ids, num_visits, None, days)
+    if scenario == 'econometric':
+        return _econometric_config(onsen_ids, num_visits)
+    if scenario == 'tourist':
+        return _tourist_config(onsen_ids, trip_days, visits_per_day)
+    if scenario == 'local_regular':
+        return _local_regular_config(onsen_ids, months)
+    raise ValueError(
+        f"Unknown scenario: {scenario}. Available: {', '.join(VECTORIZED_SCENARIOS)}"
+    )
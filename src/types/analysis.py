@@ -3,10 +3,12 @@ Analysis types and enums for the onsen analysis system.
 """
 
 from enum import StrEnum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, date
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class AnalysisType(StrEnum):
@@ -172,6 +174,9 @@ class AnalysisRequest:
         None  # min_lat, max_lat, min_lon, max_lon
     )
     custom_metrics: Optional[dict[str, str]] = None  # name: expression
+    # Clustering overrides: max_clusters, silhouette_sample_size,
+    # minibatch_threshold, warm_start, n_jobs
+    model_options: Optional[dict[str, Any]] = None
     output_format: ReportFormat = ReportFormat.HTML
     include_raw_data: bool = False
     include_statistical_tests: bool = True
@@ -187,7 +192,7 @@ class AnalysisResult:
     """
 
     request: AnalysisRequest
-    data: pd.DataFrame
+    data: "pd.DataFrame"
     metrics: dict[str, dict[str, float]]
     visualizations: dict[str, Any]
     models: Optional[dict[str, Any]] = None
@@ -4,6 +4,7 @@ Integration tests for weight tracking database operations.
 
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from src.db.models import WeightMeasurement as WeightMeasurementModel
 from src.lib.weight_manager import WeightMeasurement, WeightDataManager
@@ -342,3 +343,58 @@ class TestWeightDatabaseIntegration:
         assert range_measurements[0].measurement_time.day == 18  # Earliest first
         assert range_measurements[1].measurement_time.day == 19
         assert range_measurements[2].measurement_time.day == 20
+
+    def test_bulk_import_skips_duplicates(self, mock_db):
+        """Re-importing measurements (and repeats within a batch) stores nothing twice."""
+        base = datetime(2025, 11, 1, 7, 30, 0)
+        measurements = [
+            WeightMeasurement(
+                measurement_time=base + timedelta(days=day),
+                weight_kg=72.0 + day / 10,
+                data_source="csv",
+            )
+            for day in range(5)
+        ]
+        manager = WeightDataManager(mock_db)
+        manager.store_measurements_bulk(measurements[:3])
+
+        repeated = measurements + [measurements[4]]
+        # Same time and weight from another source is a different measurement
+        repeated.append(
+            WeightMeasurement(measurement_time=base, weight_kg=72.0, data_source="manual")
+        )
+        records = manager.store_measurements_bulk(repeated, batch_size=2)
+
+        assert [(r.measurement_time.day, r.data_source) for r in records] == [
+            (4, "csv"),
+            (5, "csv"),
+            (1, "manual"),
+        ]
+        assert all(r.id is not None for r in records)
+        assert mock_db.query(WeightMeasurementModel).count() == 6
+
+    def test_bulk_import_hashes_source_file_once(self, mock_db, tmp_path):
+        """Every row from one file shares a hash computed a single time."""
+        source = tmp_path / "weights.csv"
+        source.write_text("timestamp,weight_kg\n", encoding="utf-8")
+        measurements = [
+            WeightMeasurement(
+                measurement_time=datetime(2025, 11, 1, 7, 0) + timedelta(hours=hour),
+                weight_kg=72.0,
+                data_source="csv",
+                source_file=str(source),
+            )
+            for hour in range(50)
+        ]
+        manager = WeightDataManager(mock_db)
+
+        with patch.object(
+            WeightDataManager,
+            "_calculate_file_hash",
+            wraps=WeightDataManager._calculate_file_hash,
+        ) as hash_spy:
+            manager.store_measurements_stream(measurements, batch_size=10)
+
+        assert hash_spy.call_count == 1
+        hashes = {row.data_hash for row in mock_db.query(WeightMeasurementModel)}
+        assert len(hashes) == 1 and None not in hashes
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for analysis tests.
+"""
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _rating_data(n: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame(
+        {
+            "cleanliness_rating": rng.integers(1, 11, n),
+            "atmosphere_rating": rng.integers(1, 11, n),
+            "view_rating": rng.integers(1, 11, n),
+            "main_bath_temperature": rng.normal(41, 1.5, n),
+            "stay_length_minutes": rng.integers(20, 120, n),
+            "entry_fee_yen": rng.integers(100, 1000, n),
+            "had_sauna": rng.random(n) > 0.5,
+            "had_outdoor_bath": rng.random(n) > 0.5,
+            "weather": rng.choice(["sunny", "rain"], n),
+        }
+    )
+    data["personal_rating"] = (
+        0.4 * data["cleanliness_rating"]
+        + 0.3 * data["atmosphere_rating"]
+        + 0.5 * data["had_sauna"]
+        + rng.normal(0, 1, n)
+    )
+    data["log_entry_fee_yen"] = np.log(data["entry_fee_yen"])
+    return data
+
+
+@pytest.fixture
+def make_rating_data() -> Callable[..., pd.DataFrame]:
+    """Factory for synthetic visit data where ratings depend on a few regressors."""
+    return _rating_data
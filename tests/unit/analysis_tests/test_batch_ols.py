@@ -0,0 +1,101 @@
+"""
+Tests for the batched OLS screening kernel.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.analysis.econometrics import BatchOLS, EconometricAnalyzer
+from src.analysis.model_search import ModelSearchEngine
+
+POOL = [
+    "cleanliness_rating",
+    "atmosphere_rating",
+    "view_rating",
+    "main_bath_temperature",
+    "stay_length_minutes",
+    "log_entry_fee_yen",
+    "had_sauna",
+    "had_outdoor_bath",
+]
+
+
+class TestBatchOLS:
+    """Test the batch kernel against the statsmodels estimator."""
+
+    @pytest.mark.parametrize(
+        "indep_vars",
+        [
+            ["cleanliness_rating"],
+            ["cleanliness_rating", "atmosphere_rating", "had_sauna"],
+            ["view_rating", "main_bath_temperature", "log_entry_fee_yen"],
+        ],
+    )
+    def test_matches_statsmodels(self, indep_vars, make_rating_data):
+        data = make_rating_data()
+        data.loc[::7, "view_rating"] = np.nan
+        design = data[["personal_rating"] + POOL].astype(float)
+
+        screen = BatchOLS(design, "personal_rating", POOL).fit(indep_vars)
+        full = EconometricAnalyzer().estimate_ols(design, "personal_rating", indep_vars)
+
+        assert screen.n_obs == full.n_obs
+        np.testing.assert_allclose(screen.coefficients, full.coefficients["coefficient"])
+        np.testing.assert_allclose(screen.std_errors, full.coefficients["std_error"])
+        np.testing.assert_allclose(screen.p_values, full.coefficients["p_value"], atol=1e-12)
+        assert screen.r_squared == pytest.approx(full.r_squared)
+        assert screen.adj_r_squared == pytest.approx(full.adj_r_squared)
+        assert screen.f_statistic == pytest.approx(full.f_statistic)
+        assert screen.aic == pytest.approx(full.aic)
+        assert screen.bic == pytest.approx(full.bic)
+        np.testing.assert_allclose(screen.vif[1:], full.multicollinearity["VIF"].iloc[1:])
+
+    def test_unknown_variable_is_skipped(self, make_rating_data):
+        data = make_rating_data()
+        batch = BatchOLS(data[["personal_rating"] + POOL].astype(float), "personal_rating", POOL)
+
+        results = batch.fit_many([("ok", ["view_rating"]), ("bad", ["weather"])])
+
+        assert [r.model_name for r in results] == ["ok"]
+
+    def test_screens_hundreds_of_specifications_quickly(self, make_rating_data):
+        data = make_rating_data(500)
+        batch = BatchOLS(data[["personal_rating"] + POOL].astype(float), "personal_rating", POOL)
+        specs = [
+            (f"m{mask}", [v for i, v in enumerate(POOL) if mask >> i & 1])
+            for mask in range(1, 2 ** len(POOL))
+        ]
+
+        start = time.perf_counter()
+        results = batch.fit_many(specs)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == len(specs)
+        assert elapsed < 2.0
+
+
+class TestScreenedSearch:
+    """Test screening inside the specification search."""
+
+    def test_screening_keeps_top_specifications(self, make_rating_data):
+        data = make_rating_data()
+        full = ModelSearchEngine(EconometricAnalyzer()).search_models(data)
+
+        engine = ModelSearchEngine(EconometricAnalyzer())
+        screened = engine.search_models(data, screen_top_n=3)
+
+        assert len(screened) == 3
+        assert len(engine.screening_results) == len(full)
+        assert [r.model_name for r in screened] == [r.model_name for r in full[:3]]
+
+    def test_screening_is_default_beyond_max_models(self, make_rating_data):
+        data = make_rating_data()
+        explicit = ModelSearchEngine(EconometricAnalyzer()).search_models(data, screen_top_n=3)
+
+        engine = ModelSearchEngine(EconometricAnalyzer())
+        default = engine.search_models(data, max_models=3)
+
+        assert engine.screening_results
+        assert [r.model_name for r in default] == [r.model_name for r in explicit]
@@ -0,0 +1,121 @@
+"""
+Tests for cluster-count selection in the model engine.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.engine import AnalysisEngine, _fit_model
+from src.analysis.models import ModelEngine
+from src.types.analysis import (
+    AnalysisRequest,
+    AnalysisType,
+    DataCategory,
+    ModelConfig,
+    ModelType,
+)
+
+
+def _blobs(n: int, centers: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    means = rng.uniform(-20, 20, (centers, 3))
+    points = means[rng.integers(0, centers, n)] + rng.normal(0, 1, (n, 3))
+    return pd.DataFrame(points, columns=["a", "b", "c"])
+
+
+def _config(**options) -> ModelConfig:
+    return ModelConfig(
+        type=ModelType.KMEANS,
+        target_column="",
+        feature_columns=["a", "b", "c"],
+        custom_config=options or None,
+    )
+
+
+class TestClusterSearch:
+    """Test sampled, warm-started and parallel k selection."""
+
+    def test_selects_true_cluster_count(self, tmp_path):
+        engine = ModelEngine(str(tmp_path))
+        result = engine.create_clustering_model(_blobs(600), _config(silhouette_sample_size=200))
+
+        search = result["cluster_search"]
+        assert result["n_clusters"] == 4
+        assert search["selected_k"] == 4
+        assert search["silhouette_sample_size"] == 200
+        assert search["algorithm"] == "KMeans"
+        assert search["warm_start"] is False
+        assert set(search["timings"]) == set(range(2, 11))
+
+    def test_warm_start_is_opt_in(self, tmp_path):
+        engine = ModelEngine(str(tmp_path))
+        result = engine.create_clustering_model(_blobs(600), _config(warm_start=True))
+
+        assert result["cluster_search"]["warm_start"] is True
+        assert result["n_clusters"] == 4
+
+    def test_large_input_uses_minibatch(self, tmp_path):
+        engine = ModelEngine(str(tmp_path))
+        result = engine.create_clustering_model(
+            _blobs(3000), _config(minibatch_threshold=1000, max_clusters=6)
+        )
+
+        assert result["cluster_search"]["algorithm"] == "MiniBatchKMeans"
+        assert type(result["model"]).__name__ == "MiniBatchKMeans"
+        assert result["n_clusters"] == 4
+
+    def test_summary_reports_search(self, tmp_path):
+        engine = ModelEngine(str(tmp_path))
+        engine.create_clustering_model(_blobs(300), _config(max_clusters=5))
+
+        summary = engine.get_model_summary(engine.list_models()[0])
+
+        assert summary["cluster_search"]["selected_k"] == 4
+        assert summary["cluster_search"]["total_seconds"] >= 0
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        data = _blobs(400)
+        sequential = ModelEngine(str(tmp_path)).create_clustering_model(
+            data, _config(max_clusters=5)
+        )
+        parallel = ModelEngine(str(tmp_path), n_jobs=2).create_clustering_model(
+            data, _config(max_clusters=5)
+        )
+
+        assert parallel["cluster_search"]["warm_start"] is False
+        assert parallel["cluster_search"]["scores"] == sequential["cluster_search"]["scores"]
+        assert parallel["n_clusters"] == sequential["n_clusters"]
+
+
+class TestEngineClusterOptions:
+    """Test that request options and the job count reach the model engine."""
+
+    def test_request_options_reach_cluster_search(self, mock_db, tmp_path):
+        engine = AnalysisEngine(mock_db, str(tmp_path), use_result_cache=False, jobs=3)
+        request = AnalysisRequest(
+            analysis_type=AnalysisType.DESCRIPTIVE,
+            data_categories=[DataCategory.SPATIAL],
+            metrics=[],
+            visualizations=[],
+            models=[ModelType.KMEANS],
+            model_options={"silhouette_sample_size": 100, "warm_start": True},
+        )
+        engine._setup_analysis_directory(request)
+
+        config = engine._create_model_config(ModelType.KMEANS, _blobs(50), request)
+
+        assert engine.model_engine.n_jobs == 3
+        assert config.custom_config == {"silhouette_sample_size": 100, "warm_start": True}
+
+    def test_pool_workers_search_k_sequentially(self, monkeypatch, tmp_path):
+        seen = []
+        original = ModelEngine._search_cluster_counts
+
+        def record(self, X, *args, **kwargs):
+            seen.append(kwargs["n_jobs"])
+            return original(self, X, *args, **kwargs)
+
+        monkeypatch.setattr(ModelEngine, "_search_cluster_counts", record)
+        _fit_model(str(tmp_path), _blobs(200), _config(max_clusters=4))
+
+        assert seen == [1]
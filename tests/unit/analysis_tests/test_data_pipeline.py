@@ -0,0 +1,110 @@
+"""
+Tests for in-place dtype coercion and derived columns in the data pipeline.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.data_pipeline import DataPipeline
+from src.analysis.memory_profile import MemoryTracker, run_measured
+
+
+def _raw_visits() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "visit_time": ["2025-01-05 09:30", None, "2025-07-14 21:00"],
+            "entry_fee_yen": ["500", "x", 700],
+            "had_sauna": [1, 0, 1],
+            "cleanliness_rating": [8.0, np.nan, 6.0],
+            "navigability_rating": [7.0, np.nan, 5.0],
+            "view_rating": [9.0, np.nan, np.inf],
+            "atmosphere_rating": [6.0, 3.0, 5.0],
+            "changing_room_cleanliness_rating": [5.0, np.nan, 4.0],
+            "personal_rating": [9, 4, 7],
+            "temperature_outside_celsius": [3.5, -np.inf, 28.0],
+        }
+    )
+
+
+class TestCleanDataframe:
+    def test_coerces_once_and_adds_derived_columns_in_place(self):
+        raw = _raw_visits()
+
+        df = DataPipeline(None)._clean_dataframe(raw)
+
+        assert df is raw
+        assert pd.api.types.is_datetime64_any_dtype(df["visit_time"])
+        assert df["entry_fee_yen"].tolist()[::2] == [500, 700]
+        assert np.isnan(df.loc[1, "entry_fee_yen"])
+        assert df["had_sauna"].dtype == bool
+        assert np.isnan(df.loc[2, "view_rating"]) and np.isnan(df.loc[1, "temperature_outside_celsius"])
+        assert df["visit_season"].tolist()[::2] == ["Winter", "Summer"]
+        assert df["visit_day_of_week"].iloc[0] == "Sunday"
+        assert df["rating_count"].tolist() == [5, 1, 4]
+        assert df["average_rating"].tolist() == [7.0, 3.0, 5.0]
+        assert df.loc[0, "experience_quality_score"] == 7.0
+
+    def test_matches_pandas_row_means(self):
+        rng = np.random.default_rng(0)
+        ratings = rng.integers(1, 11, (200, 5)).astype(float)
+        ratings[rng.random((200, 5)) < 0.3] = np.nan
+        columns = [
+            "cleanliness_rating",
+            "navigability_rating",
+            "view_rating",
+            "atmosphere_rating",
+            "changing_room_cleanliness_rating",
+        ]
+        frame = pd.DataFrame(ratings, columns=columns)
+
+        df = DataPipeline(None)._clean_dataframe(frame.copy())
+
+        np.testing.assert_allclose(df["average_rating"], frame.mean(axis=1))
+        np.testing.assert_allclose(df["experience_quality_score"], frame.mean(axis=1))
+        np.testing.assert_array_equal(df["rating_count"], frame.notna().sum(axis=1))
+
+    def test_typed_columns_are_not_reconverted(self):
+        frame = pd.DataFrame(
+            {"visit_time": pd.to_datetime(["2025-03-01 10:00"]), "entry_fee_yen": [450]}
+        )
+        fee = frame["entry_fee_yen"].to_numpy()
+
+        DataPipeline(None)._clean_dataframe(frame)
+
+        assert np.shares_memory(frame["entry_fee_yen"].to_numpy(), fee)
+
+    def test_cache_shares_the_frame(self):
+        pipeline = DataPipeline(None)
+        frame = _raw_visits()
+
+        pipeline.cache_data("key", frame)
+
+        assert pipeline.get_cached_data("key") is frame
+
+
+class TestMemoryTracker:
+    def test_records_stage_peaks(self):
+        tracker = MemoryTracker(interval=0.001)
+
+        with tracker.stage("allocate"):
+            block = np.ones(8 * 1024 * 1024)  # 64 MiB
+            block.sum()
+            del block
+
+        report = tracker.report()
+        stage = report["stages"]["allocate"]
+        assert set(stage) == {"peak_rss_mb", "start_rss_mb", "end_rss_mb"}
+        if stage["start_rss_mb"] is not None:
+            assert stage["peak_rss_mb"] >= stage["start_rss_mb"] + 32
+        assert report["process_peak_rss_mb"] is None or report["process_peak_rss_mb"] > 0
+
+    def test_worker_peaks_are_reported_with_their_stage(self):
+        tracker = MemoryTracker()
+        result, peak = run_measured(np.ones, 1024)
+
+        tracker.record_worker_peak("models", peak)
+        tracker.record_worker_peak("models", None)
+
+        assert result.shape == (1024,)
+        if peak is not None:
+            assert tracker.report()["stages"]["models"] == {"worker_peak_rss_mb": peak}
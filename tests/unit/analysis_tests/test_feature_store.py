@@ -0,0 +1,156 @@
+"""
+Tests for the copy-free feature pipeline and the persistent feature store.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.feature_engineering import FeatureEngineer
+from src.analysis.feature_store import FeatureStore
+
+
+def _visits(count: int = 60, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'id': np.arange(1, count + 1),
+        'onsen_id': rng.integers(1, 8, count),
+        'visit_time': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 300, count), unit='D')
+        + pd.to_timedelta(rng.integers(0, 24 * 60, count), unit='min'),
+        'personal_rating': rng.integers(1, 11, count).astype(float),
+        'entry_fee_yen': rng.integers(100, 900, count),
+        'stay_length_minutes': rng.integers(10, 120, count),
+        'main_bath_temperature': rng.normal(42, 1, count),
+        'temperature_outside_celsius': rng.normal(15, 8, count),
+        'crowd_level': rng.integers(1, 6, count),
+        'weather': rng.choice(['sunny', 'rain'], count),
+        'average_heart_rate': rng.normal(85, 10, count),
+        'min_heart_rate': rng.normal(65, 5, count),
+        'max_heart_rate': rng.normal(110, 10, count),
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(str(tmp_path / "features.sqlite3"))
+
+
+class TestFeatureEngineer:
+    def test_leaves_input_untouched(self):
+        data = _visits()
+        original = data.copy()
+
+        result = FeatureEngineer().engineer_features(data)
+
+        pd.testing.assert_frame_equal(data, original)
+        assert result['visit_time'].is_monotonic_increasing
+        assert result['cumulative_visit_count'].tolist() == list(range(1, len(data) + 1))
+
+    def test_aggregation_returns_fresh_range_index(self):
+        data = _visits()
+        data.index = data.index * 3 + 5
+
+        result = FeatureEngineer().engineer_features(data)
+
+        pd.testing.assert_index_equal(result.index, pd.RangeIndex(len(data)))
+
+    def test_interactions_keep_pair_order(self):
+        data = _visits()
+        pairs = [('entry_fee_yen', 'weather'), ('crowd_level', 'stay_length_minutes')]
+
+        result = FeatureEngineer().add_interactions(data, custom_pairs=pairs)
+
+        assert list(result.columns[len(data.columns):]) == [
+            'entry_fee_yen_X_weather_sunny', 'entry_fee_yen_X_weather_rain',
+            'crowd_level_X_stay_length_minutes',
+        ]
+
+    def test_onsen_aggregates_match_groupby(self):
+        data = _visits()
+
+        result = FeatureEngineer().engineer_features(data).set_index('id').loc[data['id']]
+
+        grouped = data.groupby('onsen_id')['personal_rating']
+        np.testing.assert_allclose(result['onsen_avg_rating'], grouped.transform('mean'))
+        np.testing.assert_array_equal(result['onsen_visit_count'], grouped.transform('count'))
+        np.testing.assert_array_equal(
+            result['onsen_median_stay'], data.groupby('onsen_id')['stay_length_minutes'].transform('median')
+        )
+
+    def test_single_steps_keep_their_columns(self):
+        data = _visits().drop(columns=['visit_time'])
+
+        result = FeatureEngineer().add_heart_rate_features(data)
+
+        assert list(result.columns[:len(data.columns)]) == list(data.columns)
+        np.testing.assert_allclose(result['hr_range'], data['max_heart_rate'] - data['min_heart_rate'])
+
+
+class TestFeatureStore:
+    def test_matches_in_memory_pipeline(self, store):
+        data = _visits()
+
+        engineer = FeatureEngineer(feature_store=store)
+        result = engineer.engineer_features(data)
+
+        pd.testing.assert_frame_equal(result, FeatureEngineer().engineer_features(data))
+        assert engineer.store_stats['computed'] == len(data)
+        assert engineer.get_feature_summary()['feature_store']['reused'] == 0
+
+    def test_computes_only_new_and_changed_visits(self, store):
+        data = _visits()
+        FeatureEngineer(feature_store=store).engineer_features(data)
+
+        extra = _visits(3, seed=1).assign(id=[1001, 1002, 1003], onsen_id=[2, 2, 2])
+        updated = pd.concat([data, extra], ignore_index=True)
+        updated.loc[0, 'personal_rating'] = 0.5
+        updated = updated[updated['id'] != 5]
+
+        engineer = FeatureEngineer(feature_store=store)
+        result = engineer.engineer_features(updated)
+
+        pd.testing.assert_frame_equal(result, FeatureEngineer().engineer_features(updated))
+        stats = engineer.store_stats
+        assert (stats['computed'], stats['removed']) == (4, 1)
+        assert stats['reused'] == len(updated) - 4
+        touched = {2, data.loc[0, 'onsen_id'], data.loc[4, 'onsen_id']}
+        assert stats['onsens_refreshed'] == len(touched)
+
+    def test_read_column_by_visit(self, store):
+        data = _visits()
+        engineer = FeatureEngineer(feature_store=store)
+        engineer.engineer_features(data)
+        version = engineer.store_stats['version']
+
+        column = store.read_column(version, 'is_weekend', [3, 1, 999])
+
+        expected = (data.set_index('id').loc[[3, 1], 'visit_time'].dt.dayofweek >= 5).astype(float)
+        assert column.index.tolist() == [3, 1, 999]
+        assert column.iloc[:2].tolist() == expected.tolist()
+        assert np.isnan(column.iloc[2])
+        assert store.read_column(version, 'is_weekend').dtype == np.int64
+        assert store.stats()['visits'] == len(data)
+
+    def test_changed_columns_use_a_new_version(self, store):
+        data = _visits()
+        first = FeatureEngineer(feature_store=store)
+        first.engineer_features(data)
+
+        second = FeatureEngineer(feature_store=store)
+        second.engineer_features(data.drop(columns=['average_heart_rate']))
+
+        assert second.store_stats['version'] != first.store_stats['version']
+        assert second.store_stats['reused'] == 0
+        assert store.clear(first.store_stats['version']) == len(data)
+        assert store.stats()['versions'] == 1
+
+    def test_skipped_without_unique_ids(self, store):
+        data = _visits()
+        data.loc[1, 'id'] = data.loc[0, 'id']
+
+        engineer = FeatureEngineer(feature_store=store)
+        result = engineer.engineer_features(data)
+
+        assert engineer.store_stats == {}
+        assert store.stats()['visits'] == 0
+        assert len(result) == len(data)
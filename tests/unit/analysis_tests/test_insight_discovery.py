@@ -0,0 +1,97 @@
+"""
+Tests for the exploratory scans and fingerprint cache of insight discovery.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.analysis.insight_discovery import InsightDiscovery
+from src.analysis.result_cache import AnalysisResultCache
+
+
+def _visits(count: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    stay = rng.integers(10, 120, count).astype(float)
+    season = rng.choice(['Winter', 'Spring', 'Summer', 'Autumn'], count)
+    weekend = rng.integers(0, 2, count)
+    rating = 5 + 0.03 * stay + np.where(season == 'Winter', 1.0, 0.0) + 0.6 * weekend + rng.normal(0, 1, count)
+    data = pd.DataFrame({
+        'personal_rating': rating,
+        'stay_length_minutes': stay,
+        'entry_fee_yen': rng.integers(100, 1500, count).astype(float),
+        'visit_season': season,
+        'is_weekend': weekend,
+    })
+    data.loc[rng.random(count) < 0.05, 'stay_length_minutes'] = np.nan
+    return data
+
+
+class TestExploratoryScans:
+    def test_threshold_matches_masked_t_test(self):
+        data = _visits()
+
+        insight = next(
+            i for i in InsightDiscovery()._find_threshold_effects(data, 'personal_rating')
+            if i.variable == 'stay_length_minutes'
+        )
+
+        valid = data[['stay_length_minutes', 'personal_rating']].dropna()
+        below = valid.loc[valid['stay_length_minutes'] <= 30, 'personal_rating']
+        above = valid.loc[valid['stay_length_minutes'] > 30, 'personal_rating']
+        t_stat, p_val = stats.ttest_ind(below, above)
+        assert insight.effect_size == pytest.approx(above.mean() - below.mean())
+        assert insight.p_value == pytest.approx(p_val)
+        assert f"t={t_stat:.2f}" in insight.technical_note
+        assert insight.confidence_interval[1] - insight.effect_size == pytest.approx(1.96 * below.std())
+
+    def test_temporal_matches_scipy(self):
+        data = _visits()
+
+        insights = {i.variable: i for i in InsightDiscovery()._find_temporal_patterns(data, 'personal_rating')}
+
+        groups = [group['personal_rating'] for _, group in data.groupby('visit_season')]
+        assert insights['visit_season'].p_value == pytest.approx(stats.f_oneway(*groups).pvalue)
+        weekend = data.loc[data['is_weekend'] == 1, 'personal_rating']
+        weekday = data.loc[data['is_weekend'] == 0, 'personal_rating']
+        assert insights['is_weekend'].p_value == pytest.approx(stats.ttest_ind(weekend, weekday).pvalue)
+        assert insights['is_weekend'].effect_size == pytest.approx(weekend.mean() - weekday.mean())
+
+    def test_small_groups_are_skipped(self):
+        data = _visits(count=15)
+
+        assert InsightDiscovery()._find_temporal_patterns(data, 'personal_rating') == []
+
+
+class TestInsightCache:
+    def test_unchanged_data_reuses_findings(self):
+        discovery = InsightDiscovery()
+        data = _visits()
+
+        first = discovery.discover_insights([], data)
+        second = discovery.discover_insights([], data.copy())
+
+        assert second == first
+        assert discovery.cache_stats == {'hits': 1, 'misses': 1}
+
+    def test_changed_data_recomputes(self):
+        discovery = InsightDiscovery()
+        data = _visits()
+        discovery.discover_insights([], data)
+
+        data.loc[0, 'personal_rating'] += 1
+        discovery.discover_insights([], data)
+
+        assert discovery.cache_stats['misses'] == 2
+
+    def test_findings_persist_across_instances(self, tmp_path):
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+        data = _visits()
+        first = InsightDiscovery(result_cache=cache).discover_insights([], data)
+
+        discovery = InsightDiscovery(result_cache=cache)
+        second = discovery.discover_insights([], data)
+
+        assert second == first
+        assert discovery.cache_stats['hits'] == 1
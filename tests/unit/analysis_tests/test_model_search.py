@@ -0,0 +1,36 @@
+"""
+Tests for the automated model specification search.
+"""
+
+from src.analysis.econometrics import EconometricAnalyzer
+from src.analysis.model_search import ModelSearchEngine
+
+
+class TestModelSearch:
+    """Test sequential and parallel specification search."""
+
+    def test_sequential_search_ranks_models(self, make_rating_data):
+        engine = ModelSearchEngine(EconometricAnalyzer())
+        results = engine.search_models(make_rating_data(), include_polynomials=False)
+
+        names = [r.model_name for r in results]
+        assert "Baseline: Core Quality" in names
+        # Boolean facility dummies are estimable; the string weather column is not
+        assert "Full Model: All Main Effects" not in names
+        assert len(engine.analyzer.models_estimated) == len(results)
+
+    def test_parallel_ranking_matches_sequential(self, make_rating_data):
+        data = make_rating_data()
+        sequential = ModelSearchEngine(EconometricAnalyzer()).search_models(data)
+        parallel_engine = ModelSearchEngine(EconometricAnalyzer())
+        parallel = parallel_engine.search_models(data, n_jobs=2)
+
+        assert [r.model_name for r in parallel] == [r.model_name for r in sequential]
+        assert [r.adj_r_squared for r in parallel] == [r.adj_r_squared for r in sequential]
+        assert len(parallel_engine.analyzer.models_estimated) == len(parallel)
+
+    def test_time_budget_stops_search(self, make_rating_data):
+        engine = ModelSearchEngine(EconometricAnalyzer())
+        results = engine.search_models(make_rating_data(), time_budget=0.0)
+
+        assert results == []
@@ -0,0 +1,173 @@
+"""
+Tests for the persistent analysis result cache.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from src.analysis.engine import AnalysisEngine
+from src.analysis.result_cache import AnalysisResultCache, compute_data_fingerprint
+from src.db.models import Onsen
+from src.types.analysis import (
+    AnalysisRequest,
+    AnalysisType,
+    DataCategory,
+    MetricType,
+    VisualizationConfig,
+    VisualizationType,
+)
+
+
+def _add_onsens(session, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        session.add(
+            Onsen(
+                id=i,
+                ban_number=str(i),
+                name=f"Onsen {i}",
+                latitude=33.0 + i * 0.01,
+                longitude=131.0 + i * 0.01,
+            )
+        )
+    session.commit()
+
+
+class TestAnalysisResultCache:
+    """Test the on-disk result store."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("key", "fp", {"metrics": {"a": 1}})
+
+        assert cache.get("key", "fp") == {"metrics": {"a": 1}}
+        assert cache.stats()["entries"] == 1
+
+    def test_fingerprint_mismatch_invalidates(self, tmp_path):
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("key", "old", {"metrics": {}})
+
+        assert cache.get("key", "new") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_bounded_eviction(self, tmp_path):
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"), max_size_bytes=3000)
+        for i in range(5):
+            cache.set(f"key{i}", "fp", {"blob": "x" * 1000})
+
+        stats = cache.stats()
+        assert stats["size_bytes"] <= 3000
+        assert cache.get("key4", "fp") is not None
+        assert cache.get("key0", "fp") is None
+
+    def test_clear(self, tmp_path):
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("a", "fp", {})
+        cache.set("b", "fp", {})
+
+        assert cache.clear() == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_old_table_layout_is_replaced(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE analysis_results (request_key TEXT PRIMARY KEY, payload BLOB)"
+            )
+
+        cache = AnalysisResultCache(str(path))
+        cache.set("key", "fp", {"metrics": {}})
+
+        assert cache.get("key", "fp") == {"metrics": {}}
+
+    def test_data_fingerprint_tracks_inserts(self, mock_db):
+        _add_onsens(mock_db, 1, 3)
+        before = compute_data_fingerprint(mock_db, ["onsens"])
+        assert before == compute_data_fingerprint(mock_db, ["onsens"])
+
+        _add_onsens(mock_db, 10, 1)
+        assert compute_data_fingerprint(mock_db, ["onsens"]) != before
+
+    def test_data_fingerprint_tracks_updates(self, mock_db):
+        _add_onsens(mock_db, 1, 3)
+        before = compute_data_fingerprint(mock_db, ["onsens"])
+
+        mock_db.get(Onsen, 2).name = "Renamed"
+        mock_db.commit()
+
+        assert compute_data_fingerprint(mock_db, ["onsens"]) != before
+
+    def test_data_fingerprint_tracks_replaced_rows(self, mock_db):
+        _add_onsens(mock_db, 1, 3)
+        before = compute_data_fingerprint(mock_db, ["onsens"])
+
+        mock_db.delete(mock_db.get(Onsen, 2))
+        mock_db.commit()
+        mock_db.add(Onsen(id=2, ban_number="2", name="Rebuilt", latitude=33.0, longitude=131.0))
+        mock_db.commit()
+
+        assert compute_data_fingerprint(mock_db, ["onsens"]) != before
+
+
+class TestEngineResultCache:
+    """Test result caching across engine instances."""
+
+    def _request(self) -> AnalysisRequest:
+        return AnalysisRequest(
+            analysis_type=AnalysisType.DESCRIPTIVE,
+            data_categories=[DataCategory.SPATIAL],
+            metrics=[MetricType.MEAN],
+            visualizations=[],
+            include_statistical_tests=False,
+        )
+
+    def test_second_engine_reuses_results(self, mock_db, tmp_path):
+        _add_onsens(mock_db, 1, 5)
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+
+        first = AnalysisEngine(
+            mock_db, str(tmp_path / "out"), result_cache=cache
+        ).run_analysis(self._request())
+        second = AnalysisEngine(
+            mock_db, str(tmp_path / "out"), result_cache=cache
+        ).run_analysis(self._request())
+
+        assert not first.errors
+        assert first.metadata["result_cache_hit"] is False
+        assert second.metadata["result_cache_hit"] is True
+        assert second.metrics == first.metrics
+        assert second.insights == first.insights
+
+    def test_new_data_invalidates_results(self, mock_db, tmp_path):
+        _add_onsens(mock_db, 1, 5)
+        cache = AnalysisResultCache(str(tmp_path / "cache.sqlite3"))
+        engine = AnalysisEngine(mock_db, str(tmp_path / "out"), result_cache=cache)
+
+        engine.run_analysis(self._request())
+        _add_onsens(mock_db, 20, 2)
+        result = engine.run_analysis(self._request())
+
+        assert result.metadata["result_cache_hit"] is False
+        assert result.data.shape[0] == 7
+
+    def test_cached_visualizations_are_copied_to_new_output(self, mock_db, tmp_path):
+        old_file = tmp_path / "old_run" / "visualizations" / "trend_1.png"
+        old_file.parent.mkdir(parents=True)
+        old_file.write_bytes(b"png")
+        engine = AnalysisEngine(mock_db, str(tmp_path / "out"), use_result_cache=False)
+        engine._setup_analysis_directory(self._request())
+
+        restored = engine._restore_cached_visualizations(
+            {
+                "trend": {
+                    "visualization": None,
+                    "config": VisualizationConfig(
+                        type=VisualizationType.TREND, title="Trend", save_path=str(old_file)
+                    ),
+                    "type": "trend",
+                }
+            }
+        )
+
+        new_path = Path(restored["trend"]["config"].save_path)
+        assert new_path.parent == engine.output_dir / "visualizations"
+        assert new_path.read_bytes() == b"png"
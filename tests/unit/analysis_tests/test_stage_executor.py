@@ -0,0 +1,112 @@
+"""
+Tests for the analysis stage executor and parallel analysis runs.
+"""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.engine import AnalysisEngine
+from src.analysis.memory_profile import MemoryTracker
+from src.analysis.stage_executor import AnalysisStage, StageExecutor
+from src.types.analysis import (
+    AnalysisRequest,
+    AnalysisType,
+    DataCategory,
+    MetricType,
+    VisualizationType,
+)
+
+
+class TestStageExecutor:
+    """Test DAG ordering, concurrency and timings."""
+
+    def test_dependencies_receive_results(self):
+        stages = [
+            AnalysisStage("total", lambda r: r["a"] + r["b"], depends_on=("a", "b")),
+            AnalysisStage("a", lambda _: 1),
+            AnalysisStage("b", lambda _: 2),
+        ]
+
+        for workers in (1, 3):
+            results, timings = StageExecutor(workers).run(stages)
+            assert results == {"a": 1, "b": 2, "total": 3}
+            assert set(timings) == {"a", "b", "total"}
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _wait(_):
+            barrier.wait()
+            return True
+
+        stages = [AnalysisStage("a", _wait), AnalysisStage("b", _wait)]
+        results, _ = StageExecutor(2).run(stages)
+
+        assert results == {"a": True, "b": True}
+
+    def test_memory_recorded_per_stage(self):
+        memory = MemoryTracker()
+        stages = [AnalysisStage("a", lambda _: 1), AnalysisStage("b", lambda r: r["a"], depends_on=("a",))]
+
+        StageExecutor(2, memory=memory).run(stages)
+
+        assert set(memory.report()["stages"]) == {"a", "b"}
+
+    def test_unknown_dependency(self):
+        with pytest.raises(ValueError, match="unknown stage"):
+            StageExecutor().run([AnalysisStage("a", lambda _: 1, depends_on=("x",))])
+
+    def test_cycle_detected(self):
+        stages = [
+            AnalysisStage("a", lambda _: 1, depends_on=("b",)),
+            AnalysisStage("b", lambda _: 1, depends_on=("a",)),
+        ]
+        with pytest.raises(ValueError, match="Cyclic"):
+            StageExecutor(2).run(stages)
+
+    def test_stage_errors_propagate(self):
+        def _fail(_):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            StageExecutor(2).run([AnalysisStage("a", _fail)])
+
+
+class TestParallelAnalysis:
+    """Test run_analysis with worker processes."""
+
+    def test_parallel_run_records_stage_timings(self, tmp_path, monkeypatch):
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "personal_rating": rng.integers(1, 10, 40),
+                "entry_fee_yen": rng.integers(100, 1000, 40),
+            }
+        )
+        engine = AnalysisEngine(None, str(tmp_path), use_result_cache=False, jobs=2)
+        monkeypatch.setattr(engine, "_get_analysis_data", lambda *_: data)
+
+        request = AnalysisRequest(
+            analysis_type=AnalysisType.DESCRIPTIVE,
+            data_categories=[DataCategory.VISIT_RATINGS],
+            metrics=[MetricType.MEAN],
+            visualizations=[VisualizationType.HISTOGRAM],
+        )
+        result = engine.run_analysis(request)
+
+        assert not result.errors
+        assert result.metadata["jobs"] == 2
+        assert {"metrics", "visualizations", "insights", "statistical_tests"} <= set(
+            result.metadata["stage_timings"]
+        )
+        assert set(result.metadata["memory"]["stages"]) == {"load"} | set(
+            result.metadata["stage_timings"]
+        )
+        saved = Path(result.visualizations["histogram"]["config"].save_path)
+        assert saved.exists() or saved.with_suffix(".html").exists()
+        if result.metadata["memory"]["stages"]["metrics"]["peak_rss_mb"] is not None:
+            assert result.metadata["memory"]["stages"]["visualizations"]["worker_peak_rss_mb"] > 0
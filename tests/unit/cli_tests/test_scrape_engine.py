@@ -0,0 +1,250 @@
+"""
+Unit tests for the parallel, incremental scraping engine.
+
+Pages are served by a local fake site, so the HTTP path runs end to end.
+"""
+
+import json
+from argparse import Namespace
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.cli.commands.onsen.scrape_data import (
+    load_existing_data,
+    process_scraped_onsen_data,
+    scrape_individual_onsens,
+)
+from src.cli.commands.onsen.scrape_data.engine import (
+    DriverPool,
+    HttpPageFetcher,
+    RateLimiter,
+    ScrapeJournal,
+    journal_path,
+    scrape_onsens,
+    select_onsens_to_scrape,
+)
+from src.cli.commands.onsen.scrape_data.html_parser import (
+    extract_detailed_onsen_data_from_html,
+)
+from src.testing.mocks.mock_onsen_site import FakeOnsenSite, build_onsen_detail_page
+
+TABLE = {
+    "営業形態": "市営温泉",
+    "住所": "大分県別府市元町16-23",
+    "入浴料金": "300円",
+    "最寄バス停": "別府駅西口　5分",
+    "備考": "",
+}
+
+MAPPING = {"101": "1", "102": "2", "103": "3"}
+
+
+def _pages() -> dict[str, str]:
+    return {
+        onsen_id: build_onsen_detail_page(ban, f"温泉{ban}", table=TABLE)
+        for onsen_id, ban in MAPPING.items()
+    }
+
+
+@pytest.fixture
+def site():
+    with FakeOnsenSite(_pages()) as fake_site:
+        yield fake_site
+
+
+@pytest.fixture
+def output_paths(tmp_path):
+    paths = SimpleNamespace(
+        OUTPUT_DIR=str(tmp_path),
+        SCRAPED_ONSEN_DATA_FILE=str(tmp_path / "scraped_onsen_data.json"),
+        ONSEN_MAPPING_FILE=str(tmp_path / "onsen_mapping.json"),
+    )
+    with patch("src.cli.commands.onsen.scrape_data.PATHS", paths):
+        yield paths
+
+
+def _run(site, output_paths, **overrides):  # pylint: disable=unused-argument
+    """Run the individual-scraping step against the fake site."""
+    args = Namespace(engine="http", workers=3, delay=0.0, max_age_days=None, force=False)
+    vars(args).update(overrides)
+    existing = load_existing_data()
+    with patch(
+        "src.cli.commands.onsen.scrape_data.HttpPageFetcher",
+        lambda limiter: HttpPageFetcher(limiter, url_template=site.url_template),
+    ):
+        stats = scrape_individual_onsens(args, MAPPING, existing)
+    return stats, existing
+
+
+class TestHtmlParser:
+    """The static parser extracts what the Selenium extractor does."""
+
+    def test_extracts_detail_page(self):
+        html = build_onsen_detail_page("1", "竹瓦温泉", table=TABLE)
+
+        data = extract_detailed_onsen_data_from_html(html)
+
+        assert data["region"] == "別府"
+        assert data["ban_number"] == "1"
+        assert data["name"] == "竹瓦温泉"
+        assert data["deleted"] is False
+        assert data["map_url"].endswith("&output=embed&q=33.2774556,131.5059894")
+        assert (data["latitude"], data["longitude"]) == (33.2774556, 131.5059894)
+        # Ideographic spaces are kept and empty values are dropped, like Selenium's .text
+        assert data["最寄バス停"] == "別府駅西口　5分"
+        assert "備考" not in data
+
+    def test_deleted_onsen_without_map(self):
+        html = build_onsen_detail_page("9", "旧温泉", latitude=None, deleted=True)
+
+        data = extract_detailed_onsen_data_from_html(html)
+
+        assert data["deleted"] is True
+        assert data["map_url"] == ""
+        assert data["latitude"] is None and data["longitude"] is None
+
+
+class TestRateLimiter:
+    def test_spaces_calls_by_min_interval(self):
+        now = [100.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+
+        limiter = RateLimiter(0.5, clock=lambda: now[0], sleep=sleep)
+        for _ in range(3):
+            limiter.wait()
+
+        assert sleeps == [0.5, 1.0]
+
+    def test_workers_share_the_limit(self, site):
+        fetcher = HttpPageFetcher(RateLimiter(0.05), url_template=site.url_template)
+
+        stats = scrape_onsens(
+            list(MAPPING), {}, fetcher, Mock(), process_scraped_onsen_data, workers=3
+        )
+
+        assert stats.scraped == 3
+        times = sorted(site.request_times)
+        assert all(b - a >= 0.04 for a, b in zip(times, times[1:]))
+
+
+class TestDriverPool:
+    def test_reuses_bounded_drivers(self):
+        created = []
+
+        def factory():
+            created.append(Mock())
+            return created[-1]
+
+        pool = DriverPool(2, factory=factory)
+        with pool.driver() as first:
+            with pool.driver() as second:
+                assert first is not second
+        for _ in range(5):
+            with pool.driver() as driver:
+                assert driver in (first, second)
+        pool.close()
+
+        assert len(created) == 2
+        assert all(driver.quit.call_count == 1 for driver in created)
+
+
+class TestSelection:
+    def test_selects_new_failed_changed_and_stale(self):
+        now = datetime(2025, 9, 1)
+        fresh = (now - timedelta(days=1)).isoformat()
+        old = (now - timedelta(days=60)).isoformat()
+        existing = {
+            "101": {"extracted_data": {"ban_number": "1"}, "scraped_at": fresh},
+            "102": {"extracted_data": {"ban_number": "2"}, "scraped_at": old},
+            "103": {"extracted_data": {}, "error": "timeout"},
+            "104": {"extracted_data": {"ban_number": "99"}, "scraped_at": fresh},
+        }
+        mapping = {**MAPPING, "104": "4", "105": "5"}
+
+        assert select_onsens_to_scrape(mapping, existing, now=now) == {
+            "103": "error",
+            "104": "changed",
+            "105": "new",
+        }
+        assert select_onsens_to_scrape(
+            mapping, existing, max_age=timedelta(days=30), now=now
+        ) == {"102": "stale", "103": "error", "104": "changed", "105": "new"}
+        assert set(select_onsens_to_scrape(mapping, existing, force=True)) == set(mapping)
+
+
+class TestIncrementalScrape:
+    def test_scrapes_and_checkpoints_every_onsen(self, site, output_paths):
+        stats, data = _run(site, output_paths)
+
+        assert (stats.scraped, stats.unchanged, stats.failed) == (3, 0, 0)
+        with open(output_paths.SCRAPED_ONSEN_DATA_FILE, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved == data
+        assert saved["102"]["mapped_data"]["name"] == "温泉2"
+        assert saved["102"]["content_hash"] and saved["102"]["scraped_at"]
+        # The journal is folded into the output file once the run completes
+        assert ScrapeJournal(journal_path(output_paths.SCRAPED_ONSEN_DATA_FILE)).load() == {}
+
+    def test_rerun_skips_current_entries(self, site, output_paths):
+        _run(site, output_paths)
+
+        stats, _ = _run(site, output_paths)
+
+        assert stats.skipped == 3 and stats.scraped == 0
+        assert all(count == 1 for count in site.requests.values())
+
+    def test_stale_entries_use_conditional_requests(self, site, output_paths):
+        _, first = _run(site, output_paths)
+        site.pages["103"] = build_onsen_detail_page("3", "新しい温泉", table=TABLE)
+
+        stats, data = _run(site, output_paths, max_age_days=0)
+
+        assert (stats.scraped, stats.unchanged) == (1, 2)
+        assert site.not_modified == {"101": 1, "102": 1}
+        assert data["101"]["mapped_data"] == first["101"]["mapped_data"]
+        assert data["103"]["mapped_data"]["name"] == "新しい温泉"
+
+    def test_resumes_from_checkpoint(self, site, output_paths):
+        _, first = _run(site, output_paths)
+        # Simulate a run killed after checkpointing onsen 101 but before saving
+        with open(output_paths.SCRAPED_ONSEN_DATA_FILE, "w", encoding="utf-8") as f:
+            json.dump({}, f)
+        journal = ScrapeJournal(journal_path(output_paths.SCRAPED_ONSEN_DATA_FILE))
+        journal.append("101", first["101"])
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"onsen_id": "102", "ent')  # torn final line
+
+        stats, data = _run(site, output_paths)
+
+        assert stats.skipped == 1 and stats.scraped == 2
+        assert site.requests["101"] == 1
+        assert set(data) == set(MAPPING)
+
+    def test_failures_are_recorded_and_retried(self, site, output_paths):
+        site.failing.add("102")
+
+        stats, data = _run(site, output_paths)
+
+        assert stats.failed == 1
+        assert "error" in data["102"]
+
+        site.failing.clear()
+        stats, data = _run(site, output_paths)
+
+        assert stats.scraped == 1 and stats.skipped == 2
+        assert "error" not in data["102"]
+
+    def test_failure_keeps_previous_good_entry(self, site, output_paths):
+        _, first = _run(site, output_paths)
+        site.failing.add("101")
+
+        stats, data = _run(site, output_paths, force=True)
+
+        assert stats.failed == 1
+        assert data["101"] == first["101"]
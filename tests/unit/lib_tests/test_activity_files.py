@@ -0,0 +1,331 @@
+"""
+Unit tests for streaming activity file export (GPX, TCX, FIT, JSON, CSV).
+"""
+
+import csv
+import json
+import struct
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.lib.activity_files import FIT_HEADER_SIZE, fit_crc, fit_timestamp
+from src.lib.strava_converter import StravaFileExporter
+from src.types.strava import (
+    StravaActivityDetail,
+    StravaConversionError,
+    StravaFileError,
+    StravaStream,
+)
+
+GPX_NS = {"gpx": "http://www.topografix.com/GPX/1/1"}
+TCX_NS = {"tcx": "http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2"}
+START = datetime(2025, 11, 3, 9, 0)
+
+
+def _stream(stream_type, data):
+    return StravaStream(
+        stream_type=stream_type, data=data, original_size=len(data), resolution="high"
+    )
+
+
+def _activity(activity_id=12345678, name="Morning Run <Beppu>", activity_type="Run", start_date=START):
+    return StravaActivityDetail(
+        id=activity_id,
+        name=name,
+        activity_type=activity_type,
+        sport_type=activity_type,
+        start_date=start_date,
+        start_date_local=START + timedelta(hours=9),
+        timezone="Asia/Tokyo",
+        distance_m=30.0,
+        moving_time_s=3,
+        elapsed_time_s=4,
+        calories=12,
+        has_heartrate=True,
+        average_heartrate=125.0,
+        max_heartrate=130.0,
+    )
+
+
+def _streams(samples=4, latlng=True):
+    streams = {
+        "time": _stream("time", list(range(samples))),
+        "heartrate": _stream("heartrate", [120 + i % 11 for i in range(samples)]),
+        "altitude": _stream("altitude", [10.5 + i for i in range(samples)]),
+        "distance": _stream("distance", [10.0 * i for i in range(samples)]),
+        "velocity_smooth": _stream("velocity_smooth", [2.5] * samples),
+        "cadence": _stream("cadence", [80] * samples),
+    }
+    if latlng:
+        points = [[33.28 + i * 1e-5, 131.49 + i * 1e-5] for i in range(samples)]
+        points[1] = []  # dropout
+        streams["latlng"] = _stream("latlng", points)
+    return streams
+
+
+def _fit_messages(data):
+    """Decode a FIT file written with fixed-size definitions into (global, fields) tuples."""
+    definitions = {}
+    messages = []
+    offset = data[0]
+    end = offset + struct.unpack_from("<I", data, 4)[0]
+    while offset < end:
+        header = data[offset]
+        offset += 1
+        local = header & 0x0F
+        if header & 0x40:
+            _, _, global_number, count = struct.unpack_from("<BBHB", data, offset)
+            offset += 5
+            fields = [struct.unpack_from("<BBB", data, offset + 3 * i) for i in range(count)]
+            offset += 3 * count
+            formats = {1: "B", 2: "H", 4: "I"}
+            signed = {0x85: "i"}
+            fmt = "<" + "".join(signed.get(base, formats[size]) for _, size, base in fields)
+            definitions[local] = (global_number, [number for number, _, _ in fields], struct.Struct(fmt))
+        else:
+            global_number, numbers, layout = definitions[local]
+            values = layout.unpack_from(data, offset)
+            offset += layout.size
+            messages.append((global_number, dict(zip(numbers, values))))
+    return messages
+
+
+class TestGpx:
+    def test_structure_matches_previous_exporter(self, tmp_path):
+        path = tmp_path / "run.gpx"
+
+        StravaFileExporter.export_to_gpx(_activity(), _streams(), path)
+
+        root = ET.parse(path).getroot()
+        assert root.get("version") == "1.1"
+        assert root.find("gpx:metadata/gpx:name", GPX_NS).text == "Morning Run <Beppu>"
+        assert root.find("gpx:trk/gpx:type", GPX_NS).text == "Run"
+        points = root.findall(".//gpx:trkpt", GPX_NS)
+        # The point without a position is skipped
+        assert len(points) == 3
+        assert points[0].get("lat") == "33.28"
+        assert points[0].find("gpx:ele", GPX_NS).text == "10.5"
+        assert points[1].find("gpx:time", GPX_NS).text == "2025-11-03T09:00:02Z"
+        assert points[2].find("gpx:extensions/gpx:hr", GPX_NS).text == "123"
+
+    def test_memory_does_not_grow_with_track_length(self, tmp_path):
+        def peak_for(samples):
+            streams = _streams(samples)
+            tracemalloc.start()
+            try:
+                StravaFileExporter.export_to_gpx(_activity(), streams, tmp_path / "run.gpx")
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak_for(2_000), peak_for(40_000)
+
+        assert large < small * 2
+
+    def test_failed_export_keeps_previous_file(self, tmp_path):
+        class Unprintable:
+            def __format__(self, spec):
+                raise RuntimeError("bad sample")
+
+        path = tmp_path / "run.gpx"
+        StravaFileExporter.export_to_gpx(_activity(), _streams(), path)
+        previous = path.read_bytes()
+        streams = _streams()
+        streams["altitude"] = _stream("altitude", [1.0, 2.0, Unprintable(), 4.0])
+
+        with pytest.raises(StravaFileError, match="bad sample"):
+            StravaFileExporter.export_to_gpx(_activity(), streams, path)
+
+        assert list(tmp_path.iterdir()) == [path]
+        assert path.read_bytes() == previous
+
+
+class TestTcx:
+    def test_track_points_keep_indoor_samples(self, tmp_path):
+        path = tmp_path / "run.tcx"
+
+        StravaFileExporter.export_to_tcx(_activity(), _streams(latlng=False), path)
+
+        activity = ET.parse(path).getroot().find("tcx:Activities/tcx:Activity", TCX_NS)
+        assert activity.get("Sport") == "Running"
+        lap = activity.find("tcx:Lap", TCX_NS)
+        assert lap.find("tcx:TotalTimeSeconds", TCX_NS).text == "4.0"
+        assert lap.find("tcx:Calories", TCX_NS).text == "12"
+        points = lap.findall("tcx:Track/tcx:Trackpoint", TCX_NS)
+        assert len(points) == 4
+        assert points[0].find("tcx:Position", TCX_NS) is None
+        assert points[3].find("tcx:HeartRateBpm/tcx:Value", TCX_NS).text == "123"
+        assert points[3].find("tcx:DistanceMeters", TCX_NS).text == "30.0"
+
+    def test_requires_time_stream(self, tmp_path):
+        streams = _streams()
+        del streams["time"]
+
+        with pytest.raises(StravaConversionError, match="time"):
+            StravaFileExporter.export_to_tcx(_activity(), streams, tmp_path / "run.tcx")
+
+
+class TestFit:
+    def test_header_and_file_crc(self, tmp_path):
+        path = tmp_path / "run.fit"
+
+        StravaFileExporter.export_to_fit(_activity(), _streams(), path)
+
+        data = path.read_bytes()
+        size, protocol, profile, data_size, signature, header_crc = struct.unpack_from(
+            "<BBHI4sH", data
+        )
+        assert (size, protocol, signature) == (FIT_HEADER_SIZE, 0x20, b".FIT")
+        assert profile > 0
+        assert header_crc == fit_crc(data[:12])
+        assert len(data) == FIT_HEADER_SIZE + data_size + 2
+        # A CRC over the data and its own checksum is zero
+        assert fit_crc(data) == 0
+
+    def test_records_and_session(self, tmp_path):
+        path = tmp_path / "run.fit"
+
+        StravaFileExporter.export_to_fit(_activity(), _streams(), path)
+
+        messages = _fit_messages(path.read_bytes())
+        numbers = [number for number, _ in messages]
+        assert numbers[0] == 0 and numbers[-1] == 34
+        records = [fields for number, fields in messages if number == 20]
+        assert len(records) == 4
+        assert records[0][253] == fit_timestamp(START)
+        assert records[0][0] == round(33.28 * 2**31 / 180)
+        assert records[1][0] == 0x7FFFFFFF  # no position
+        assert records[2][2] == round((12.5 + 500) * 5)
+        assert records[3][3] == 123
+        assert records[3][5] == 3000
+        assert records[3][6] == 2500
+        session = next(fields for number, fields in messages if number == 18)
+        assert session[7] == 4000 and session[9] == 3000
+        assert (session[16], session[17], session[5]) == (125, 130, 1)
+
+    def test_crc_matches_reference_algorithm(self):
+        table = [
+            0x0000, 0xCC01, 0xD801, 0x1400, 0xF001, 0x3C00, 0x2800, 0xE401,
+            0xA001, 0x6C00, 0x7800, 0xB401, 0x5000, 0x9C01, 0x8801, 0x4400,
+        ]
+
+        def reference(data):
+            crc = 0
+            for byte in data:
+                tmp = table[crc & 0xF]
+                crc = ((crc >> 4) & 0x0FFF) ^ tmp ^ table[byte & 0xF]
+                tmp = table[crc & 0xF]
+                crc = ((crc >> 4) & 0x0FFF) ^ tmp ^ table[(byte >> 4) & 0xF]
+            return crc
+
+        data = bytes(range(256)) * 3
+        assert fit_crc(data) == reference(data)
+
+
+class TestAwareStartDate:
+    """The Strava client parses ``start_date`` as an aware UTC time."""
+
+    AWARE_START = datetime(2025, 11, 3, 18, 0, tzinfo=timezone(timedelta(hours=9)))
+
+    def test_fit_uses_utc_start(self, tmp_path):
+        path = tmp_path / "run.fit"
+
+        StravaFileExporter.export_to_fit(_activity(start_date=self.AWARE_START), _streams(), path)
+
+        records = [fields for number, fields in _fit_messages(path.read_bytes()) if number == 20]
+        assert records[0][253] == fit_timestamp(START)
+
+    def test_xml_timestamps_are_utc(self, tmp_path):
+        activity = _activity(start_date=self.AWARE_START)
+        StravaFileExporter.export_to_tcx(activity, _streams(), tmp_path / "run.tcx")
+        StravaFileExporter.export_to_gpx(activity, _streams(), tmp_path / "run.gpx")
+
+        tcx = ET.parse(tmp_path / "run.tcx").getroot()
+        times = [element.text for element in tcx.iter(f"{{{TCX_NS['tcx']}}}Time")]
+        assert times[0] == "2025-11-03T09:00:00Z"
+        gpx = ET.parse(tmp_path / "run.gpx").getroot()
+        assert [element.text for element in gpx.iter(f"{{{GPX_NS['gpx']}}}time")][0] == "2025-11-03T09:00:00Z"
+        assert "+00:00" not in (tmp_path / "run.tcx").read_text(encoding="utf-8")
+
+
+class TestJsonAndCsv:
+    def test_json_matches_full_document(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(StravaFileExporter, "JSON_CHUNK_SIZE", 3)
+        path = tmp_path / "run.json"
+        streams = _streams(10)
+
+        StravaFileExporter.export_to_json(_activity(), streams, path)
+
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["name"] == "Morning Run <Beppu>"
+        assert document["start_date"] == START.isoformat()
+        assert document["streams"]["latlng"]["data"] == streams["latlng"].data
+        assert document["streams"]["heartrate"] == {
+            "data": streams["heartrate"].data,
+            "original_size": 10,
+            "resolution": "high",
+        }
+
+    @pytest.mark.parametrize("streams", [None, {"time": _stream("time", [])}])
+    def test_json_without_stream_data(self, tmp_path, streams):
+        path = tmp_path / "run.json"
+
+        StravaFileExporter.export_to_json(_activity(), streams, path)
+
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["id"] == 12345678
+        assert ("streams" in document) == bool(streams)
+
+    def test_hr_csv_estimates_missing_offsets(self, tmp_path):
+        path = tmp_path / "run_hr.csv"
+
+        StravaFileExporter.export_hr_to_csv(
+            _activity(),
+            _stream("heartrate", [100, 101, 102]),
+            _stream("time", [0, 5]),
+            path,
+        )
+
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        local_start = START + timedelta(hours=9)
+        assert [row["timestamp"] for row in rows] == [
+            local_start.isoformat(),
+            (local_start + timedelta(seconds=5)).isoformat(),
+            (local_start + timedelta(seconds=2)).isoformat(),
+        ]
+        assert [row["heart_rate"] for row in rows] == ["100", "101", "102"]
+
+
+class TestBatchExport:
+    def test_exports_in_parallel_and_records_failures(self, tmp_path):
+        def fetch(activity_id):
+            if activity_id == 3:
+                raise RuntimeError("rate limited")
+            return _activity(activity_id, name=f"Run {activity_id}"), _streams(latlng=activity_id != 2)
+
+        reported = []
+        result = StravaFileExporter.export_batch(
+            [1, 2, 3],
+            fetch,
+            tmp_path,
+            ["gpx", "fit", "hr_csv"],
+            workers=2,
+            on_result=lambda activity_id, paths, error: reported.append((activity_id, error)),
+        )
+
+        assert set(result.exported) == {1, 2}
+        assert set(result.exported[1]) == {"gpx", "fit", "hr_csv"}
+        assert result.exported[1]["gpx"].name == "20251103_180000_Run 1_1.gpx"
+        assert all(path.exists() for path in result.exported[1].values())
+        assert result.skipped == {2: [("gpx", "No GPS data available")]}
+        assert result.failed == {3: "rate limited"}
+        assert sorted(reported) == [(1, None), (2, None), (3, "rate limited")]
+        assert len(list(tmp_path.iterdir())) == 5
+
+    def test_invalid_workers(self, tmp_path):
+        with pytest.raises(ValueError, match="workers"):
+            StravaFileExporter.export_batch([1], lambda _: None, tmp_path, ["json"], workers=0)
@@ -0,0 +1,221 @@
+"""
+Unit tests for the streaming Apple Health export reader.
+"""
+
+import argparse
+import tracemalloc
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.db.models import Activity, WeightMeasurement as WeightMeasurementModel
+from src.lib.apple_health import (
+    AppleHealthWorkout,
+    HeartRateSample,
+    HeartRateSeries,
+    iter_export,
+    parse_health_timestamp,
+    read_export,
+)
+from src.lib.weight_manager import (
+    WeightDataImporter,
+    WeightDataManager,
+    WeightMeasurement,
+)
+from src.cli.commands.weight.import_ import import_weight_data, store_new_activities
+
+HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE HealthData [
+<!ELEMENT HealthData (ExportDate,Me,(Record|Workout)*)>
+]>
+<HealthData locale="en_JP">
+ <ExportDate value="2025-11-10 09:00:00 +0900"/>
+ <Me HKCharacteristicTypeIdentifierBiologicalSex="HKBiologicalSexNotSet"/>
+"""
+
+RECORDS = """
+ <Record type="HKQuantityTypeIdentifierStepCount" sourceName="iPhone" unit="count" startDate="2025-11-01 07:00:00 +0900" endDate="2025-11-01 07:05:00 +0900" value="120"/>
+ <Record type="HKQuantityTypeIdentifierBodyMass" sourceName="Scale" unit="kg" creationDate="2025-11-01 07:30:00 +0900" startDate="2025-11-01 07:29:00 +0900" endDate="2025-11-01 07:29:00 +0900" value="72.5">
+  <MetadataEntry key="HKWasUserEntered" value="0"/>
+ </Record>
+ <Record type="HKQuantityTypeIdentifierBodyMass" sourceName="Health" unit="lb" creationDate="2025-11-02 07:30:00 +0900" startDate="2025-11-02 07:30:00 +0900" endDate="2025-11-02 07:30:00 +0900" value="160"/>
+ <Record type="HKQuantityTypeIdentifierHeartRate" sourceName="Watch" unit="count/min" startDate="2025-11-03 18:05:00 +0900" endDate="2025-11-03 18:05:00 +0900" value="130">
+  <MetadataEntry key="HKMetadataKeyHeartRateMotionContext" value="2"/>
+ </Record>
+ <Record type="HKQuantityTypeIdentifierHeartRate" sourceName="Watch" unit="count/min" startDate="2025-11-03 18:01:00 +0900" endDate="2025-11-03 18:01:00 +0900" value="110"/>
+ <Record type="HKQuantityTypeIdentifierHeartRate" sourceName="Watch" unit="count/min" startDate="2025-11-03 21:00:00 +0900" endDate="2025-11-03 21:00:00 +0900" value="60"/>
+"""
+
+WORKOUTS = """
+ <Workout workoutActivityType="HKWorkoutActivityTypeRunning" duration="30" durationUnit="min" sourceName="Watch" startDate="2025-11-03 18:00:00 +0900" endDate="2025-11-03 18:30:00 +0900">
+  <MetadataEntry key="HKIndoorWorkout" value="0"/>
+  <WorkoutStatistics type="HKQuantityTypeIdentifierDistanceWalkingRunning" startDate="2025-11-03 18:00:00 +0900" endDate="2025-11-03 18:30:00 +0900" sum="5.2" unit="km"/>
+  <WorkoutStatistics type="HKQuantityTypeIdentifierActiveEnergyBurned" startDate="2025-11-03 18:00:00 +0900" endDate="2025-11-03 18:30:00 +0900" sum="310.4" unit="kcal"/>
+  <WorkoutStatistics type="HKQuantityTypeIdentifierHeartRate" startDate="2025-11-03 18:00:00 +0900" endDate="2025-11-03 18:30:00 +0900" average="140" minimum="100" maximum="170" unit="count/min"/>
+ </Workout>
+ <Workout workoutActivityType="HKWorkoutActivityTypeTraditionalStrengthTraining" duration="45" durationUnit="min" totalDistance="0" totalDistanceUnit="km" totalEnergyBurned="200" totalEnergyBurnedUnit="kcal" sourceName="Watch" startDate="2025-11-04 19:00:00 +0900" endDate="2025-11-04 19:45:00 +0900"/>
+"""
+
+FOOTER = "</HealthData>\n"
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / "export.xml"
+    path.write_text(HEADER + RECORDS + WORKOUTS + FOOTER, encoding="utf-8")
+    return str(path)
+
+
+class TestIterExport:
+    def test_weight_only_by_default(self, export_file):
+        items = list(iter_export(export_file))
+
+        assert all(isinstance(item, WeightMeasurement) for item in items)
+        assert [item.measurement_time for item in items] == [
+            datetime(2025, 11, 1, 7, 30),
+            datetime(2025, 11, 2, 7, 30),
+        ]
+        assert items[0].weight_kg == 72.5
+        assert items[1].weight_kg == pytest.approx(72.57, abs=0.01)
+        assert items[0].source_file == export_file
+
+    def test_all_kinds_in_one_pass(self, export_file):
+        items = list(iter_export(export_file, kinds=("weight", "heart_rate", "workout")))
+
+        kinds = [type(item) for item in items]
+        assert kinds.count(WeightMeasurement) == 2
+        assert kinds.count(HeartRateSample) == 3
+        assert kinds.count(AppleHealthWorkout) == 2
+
+        run, gym = [item for item in items if isinstance(item, AppleHealthWorkout)]
+        assert run.distance_km == 5.2
+        assert run.calories_burned == 310
+        assert (run.avg_heart_rate, run.min_heart_rate, run.max_heart_rate) == (140, 100, 170)
+        assert run.indoor is False
+        assert gym.calories_burned == 200
+        assert gym.indoor is None
+
+    def test_unknown_kind(self, export_file):
+        with pytest.raises(ValueError, match="Unknown Apple Health record kind"):
+            list(iter_export(export_file, kinds=("steps",)))
+
+    def test_malformed_export(self, tmp_path):
+        path = tmp_path / "export.xml"
+        path.write_text(HEADER + RECORDS, encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid Apple Health export"):
+            list(iter_export(str(path)))
+
+    def test_memory_does_not_grow_with_export_size(self, tmp_path):
+        step = RECORDS.splitlines()[1] + "\n"
+
+        def peak_for(copies):
+            path = tmp_path / f"export_{copies}.xml"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(HEADER)
+                for _ in range(copies):
+                    f.write(step)
+                f.write(RECORDS + FOOTER)
+            tracemalloc.start()
+            try:
+                assert len(list(iter_export(str(path)))) == 2
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak_for(1_000), peak_for(20_000)
+
+        # A tree would take roughly 20x more; streaming stays flat
+        assert large < small * 2
+
+    def test_parse_health_timestamp(self):
+        assert parse_health_timestamp("2025-11-01 07:30:05 +0900") == datetime(
+            2025, 11, 1, 7, 30, 5
+        )
+        with pytest.raises(ValueError, match="Could not parse timestamp"):
+            parse_health_timestamp("yesterday")
+
+
+class TestReadExport:
+    def test_joins_heart_rate_with_workouts(self, export_file):
+        export = read_export(export_file, include_workouts=True)
+
+        assert len(export.measurements) == 2
+        assert export.heart_rate_samples == 3
+        run, gym = export.activities
+        assert run.activity_type == "running"
+        assert run.indoor_outdoor == "outdoor"
+        # Samples inside the workout window, in time order, replace the summary
+        assert [point["hr"] for point in run.route_data] == [110.0, 130.0]
+        assert (run.avg_heart_rate, run.min_heart_rate, run.max_heart_rate) == (120.0, 110.0, 130.0)
+        assert gym.activity_type == "gym"
+        assert gym.route_data is None
+        assert run.strava_id != gym.strava_id
+
+    def test_weights_only(self, export_file):
+        export = read_export(export_file)
+
+        assert len(export.measurements) == 2
+        assert export.activities == [] and export.heart_rate_samples == 0
+
+    def test_heart_rate_series_sorts_out_of_order_samples(self):
+        series = HeartRateSeries()
+        for minute, bpm in [(5, 130), (1, 110), (9, 90)]:
+            series.append(HeartRateSample(datetime(2025, 11, 3, 18, minute), bpm))
+
+        window = series.window(datetime(2025, 11, 3, 18, 0), datetime(2025, 11, 3, 18, 6))
+
+        assert [sample.bpm for sample in window] == [110.0, 130.0]
+        assert window[0].timestamp == datetime(2025, 11, 3, 18, 1)
+
+
+class TestImport:
+    def test_weight_importer_streams_apple_health(self, export_file):
+        measurements = WeightDataImporter.import_from_file(export_file)
+
+        assert len(measurements) == 2
+        assert measurements[0].data_source == "apple_health"
+
+    def test_no_body_mass_records(self, tmp_path):
+        path = tmp_path / "export.xml"
+        path.write_text(HEADER + WORKOUTS + FOOTER, encoding="utf-8")
+
+        with pytest.raises(ValueError, match="No BodyMass records"):
+            WeightDataImporter.import_from_file(str(path))
+
+    def test_store_measurements_stream(self, db_session, export_file):
+        manager = WeightDataManager(db_session)
+
+        stored = manager.store_measurements_stream(
+            WeightDataImporter.iter_apple_health(export_file), batch_size=1
+        )
+
+        assert stored == 2
+        assert db_session.query(WeightMeasurementModel).count() == 2
+
+    def test_cli_streams_into_batched_inserts(self, db_session, export_file):
+        args = argparse.Namespace(
+            file_path=export_file, format=None, notes="scale", validate_only=False,
+            include_workouts=True,
+        )
+        with patch("src.cli.commands.weight.import_.get_db") as get_db, \
+             patch("src.cli.commands.weight.import_.show_database_banner"), \
+             patch.object(
+                 WeightDataManager, "store_measurements_stream",
+                 autospec=True, side_effect=WeightDataManager.store_measurements_stream,
+             ) as stream:
+            get_db.return_value.__enter__.return_value = db_session
+            assert import_weight_data(args) == 0
+
+        assert stream.call_count == 1
+        stored = db_session.query(WeightMeasurementModel).all()
+        assert [m.notes for m in stored] == ["scale", "scale"]
+        assert db_session.query(Activity).count() == 2
+
+    def test_workouts_are_imported_once(self, db_session, export_file):
+        activities = read_export(export_file, include_workouts=True).activities
+
+        assert store_new_activities(db_session, activities) == 2
+        assert store_new_activities(db_session, activities) == 0
+        assert db_session.query(Activity).count() == 2
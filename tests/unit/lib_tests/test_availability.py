@@ -0,0 +1,175 @@
+"""
+Unit tests for the vectorized availability index.
+"""
+
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from src.lib.availability import AvailabilityIndex
+from src.lib.parsers.closed_days import (
+    AbsoluteDatesRule,
+    ClosedDaysParsed,
+    MonthlyOrdinalWeekdayRule,
+    MonthlySpecificDaysRule,
+    WeeklyClosedRule,
+)
+from src.lib.parsers.usage_time import MonthRange, TimeWindow, UsageTimeParsed
+from src.lib.recommendation import OnsenRecommendationEngine
+
+USAGE_TIMES = [
+    "11:00～21:00",
+    "6:30～14:00/15:00～22:30",
+    "15:00〜深夜0:00",
+    "平日14:00～17:00 日・祝15:00～17:00",
+    "祝15:00～17:00",
+    "IN15:00 OUT10:00",
+    "休業中",
+    "11:00～15:00(要問合せ)",
+    "要問合せ",
+    None,
+]
+
+CLOSED_DAYS = [
+    "なし",
+    "火曜日",
+    "月・火・水曜 (祝日の場合は営業)",
+    "第３水曜日",
+    "毎月5・20日",
+    "12/31～1/3",
+    "1/1～3",
+    "火・水曜※イベント時は営業12/31～1/3",
+    "不定休(家族湯は水曜）",
+    "土日祝日",
+    "水曜日(祝日の場合は翌日)",
+    None,
+]
+
+
+def _parsed_usage(*windows, is_closed=False):
+    return UsageTimeParsed(raw="custom", normalized="custom", windows=list(windows), is_closed=is_closed)
+
+
+def _parsed_closed(*rules):
+    return ClosedDaysParsed(raw="custom", normalized="custom", rules=list(rules))
+
+
+# Parsed objects covering branches the sample strings do not reach
+CUSTOM = [
+    (
+        _parsed_usage(TimeWindow(time(22, 0), time(2, 0), end_next_day=True, days_of_week={4, 5})),
+        _parsed_closed(MonthlySpecificDaysRule(days={1, 15}, shift_to_next_day_if_holiday=True)),
+    ),
+    (
+        _parsed_usage(
+            TimeWindow(time(9, 0), time(17, 0), month_ranges=[MonthRange(11, 3)]),
+            TimeWindow(time(9, 0), time(19, 0), month_ranges=[MonthRange(4, 10)]),
+        ),
+        _parsed_closed(
+            MonthlyOrdinalWeekdayRule(ordinals={2, 4}, weekday=0, shift_to_next_day_if_holiday=True)
+        ),
+    ),
+    (
+        _parsed_usage(TimeWindow(time(10, 0), None), TimeWindow(time(6, 0), time(8, 0))),
+        _parsed_closed(WeeklyClosedRule(weekdays={0}, closes_on_holidays_too=True)),
+    ),
+    (
+        _parsed_usage(TimeWindow(time(10, 0), time(20, 0), days_of_week={0, 1, 2}, includes_holidays=True)),
+        _parsed_closed(AbsoluteDatesRule(dates_mmdd={(5, 5)}, ranges=[(8, 13, 8, 16)])),
+    ),
+    (
+        _parsed_usage(TimeWindow(time(0, 0), time(0, 0)), is_closed=True),
+        _parsed_closed(WeeklyClosedRule(weekdays=set(), closes_on_holidays_too=True)),
+    ),
+    (_parsed_usage(), None),
+]
+
+
+@pytest.fixture
+def engine_and_onsens():
+    engine = OnsenRecommendationEngine(Mock(spec=Session))
+    onsens = [
+        SimpleNamespace(id=len(USAGE_TIMES) * i + j + 1, usage_time=usage, closed_days=closed)
+        for i, closed in enumerate(CLOSED_DAYS)
+        for j, usage in enumerate(USAGE_TIMES)
+    ]
+    for usage, closed in CUSTOM:
+        onsen = SimpleNamespace(id=len(onsens) + 1, usage_time=f"custom-{len(onsens)}", closed_days=None)
+        engine._usage_time_cache[onsen.id] = (onsen.usage_time, usage)
+        if closed is not None:
+            onsen.closed_days = f"custom-{len(onsens)}"
+            engine._closed_days_cache[onsen.id] = (onsen.closed_days, closed)
+        onsens.append(onsen)
+    return engine, onsens
+
+
+def _scalar(engine, onsens, when, min_hours):
+    return [onsen for onsen in onsens if engine._is_onsen_available(onsen, when, min_hours)]
+
+
+# Across new year, Golden Week, Obon and a Monday holiday, every 50 minutes
+TIMES = [
+    start + timedelta(minutes=50 * step)
+    for start in (
+        datetime(2024, 12, 30, 0, 10),
+        datetime(2025, 5, 2, 0, 20),
+        datetime(2025, 8, 12, 0, 0),
+        datetime(2025, 11, 2, 0, 30, 15),
+    )
+    for step in range(4 * 24 * 60 // 50)
+]
+
+
+@pytest.mark.parametrize("min_hours", [None, 1, 3])
+def test_matches_scalar_evaluation(engine_and_onsens, min_hours):
+    engine, onsens = engine_and_onsens
+
+    for when in TIMES:
+        expected = _scalar(engine, onsens, when, min_hours)
+        assert engine.get_available_onsens(when, min_hours, onsens=onsens) == expected, when
+
+
+def test_availability_matrix_matches_single_times(engine_and_onsens):
+    engine, onsens = engine_and_onsens
+    index = engine.get_availability_index(onsens)
+
+    matrix = index.availability(TIMES, min_hours_after=2)
+
+    assert matrix.shape == (len(TIMES), len(onsens))
+    for row, when in zip(matrix, TIMES):
+        np.testing.assert_array_equal(row, index.available_at(when, 2))
+    # Reused for the same onsens
+    assert engine.get_availability_index(list(onsens)) is index
+
+
+def test_open_heatmap():
+    index = AvailabilityIndex(
+        [10, 20],
+        [
+            _parsed_usage(TimeWindow(time(9, 0), time(17, 0))),
+            _parsed_usage(TimeWindow(time(22, 0), time(2, 0), end_next_day=True)),
+        ],
+        [None, _parsed_closed(WeeklyClosedRule(weekdays={1}))],
+    )
+
+    times, heatmap = index.open_heatmap(date(2025, 11, 3), step_minutes=60)
+
+    assert len(times) == 24 and heatmap.shape == (24, 2)
+    assert [t.hour for t, is_open in zip(times, heatmap[:, 0]) if is_open] == list(range(9, 17))
+    assert [t.hour for t, is_open in zip(times, heatmap[:, 1]) if is_open] == [0, 1, 22, 23]
+    # Tuesday: the second onsen is closed all day
+    assert not index.open_heatmap(date(2025, 11, 4))[1][:, 1].any()
+    with pytest.raises(ValueError, match="step_minutes"):
+        index.open_heatmap(date(2025, 11, 3), step_minutes=7)
+
+
+def test_empty_and_mismatched_inputs():
+    index = AvailabilityIndex([], [], [])
+
+    assert index.availability([datetime(2025, 1, 1, 12)]).shape == (1, 0)
+    with pytest.raises(ValueError, match="same length"):
+        AvailabilityIndex([1], [], [])
@@ -0,0 +1,120 @@
+"""Unit tests for the client-side GeoJSON map mode."""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.interactive_maps import InteractiveMapGenerator
+from src.db.models import Onsen, OnsenVisit
+from src.lib.client_map import DATA_FILE_SUFFIX, use_client_side
+from src.lib.map_generator import generate_all_onsens_map
+
+
+def _load_data_file(html_path: str) -> dict:
+    data_path = os.path.splitext(html_path)[0] + DATA_FILE_SUFFIX
+    with open(data_path, encoding="utf-8") as f:
+        content = f.read()
+    return json.loads(content[content.index("=") + 1:].rstrip().rstrip(";"))
+
+
+def _add_onsens(db_session, count: int) -> list[Onsen]:
+    rng = np.random.default_rng(0)
+    onsens = [
+        Onsen(
+            id=i,
+            ban_number=str(i),
+            name=f"Onsen <{i}>",
+            latitude=33.28 + rng.normal(0, 0.02),
+            longitude=131.5 + rng.normal(0, 0.02),
+            address="Beppu" if i % 2 else None,
+        )
+        for i in range(1, count + 1)
+    ]
+    db_session.add_all(onsens)
+    db_session.commit()
+    return onsens
+
+
+class TestAllOnsensClientSide:
+    """Tests for generate_all_onsens_map in client-side mode."""
+
+    def test_writes_data_file_without_per_marker_popups(self, db_session, tmp_path):
+        onsens = _add_onsens(db_session, 5)
+        db_session.add(OnsenVisit(id=1, onsen_id=2))
+        db_session.commit()
+
+        with patch("src.lib.map_generator.PATHS", SimpleNamespace(MAPS_DIR=str(tmp_path))):
+            path = generate_all_onsens_map(
+                onsens, db_session, output_filename="all.html",
+                show_locations=False, client_side=True,
+            )
+
+        html = Path(path).read_text(encoding="utf-8")
+        assert "all.data.js" in html
+        assert "markerClusterGroup" in html
+        assert "Onsen &lt;1&gt;" not in html and "Onsen <1>" not in html
+
+        features = _load_data_file(path)["features"]
+        assert len(features) == 5
+        visited = {f["properties"]["title"]: f["properties"]["visited"] for f in features}
+        assert visited["2. Onsen <2>"] == "Yes"
+        assert visited["1. Onsen <1>"] == "No"
+        # Empty values are dropped rather than stored as nulls
+        assert "hours" not in features[0]["properties"]
+
+    def test_html_size_stays_flat(self, db_session, tmp_path):
+        onsens = _add_onsens(db_session, 400)
+
+        sizes = []
+        with patch("src.lib.map_generator.PATHS", SimpleNamespace(MAPS_DIR=str(tmp_path))):
+            for count in (10, 400):
+                path = generate_all_onsens_map(
+                    onsens[:count], db_session, output_filename=f"map_{count}.html",
+                    show_locations=False, client_side=True,
+                )
+                sizes.append(os.path.getsize(path))
+
+        # Only the data file name and map center differ
+        assert abs(sizes[1] - sizes[0]) < 50
+
+    def test_mode_defaults_to_catalogue_size(self):
+        assert use_client_side(10, None) is False
+        assert use_client_side(10_000, None) is True
+        assert use_client_side(10_000, False) is False
+
+
+class TestComprehensiveMapClientSide:
+    """Tests for InteractiveMapGenerator.create_comprehensive_onsen_map in client-side mode."""
+
+    @pytest.mark.filterwarnings("ignore:CartoDB tiles now require an API key")
+    def test_formats_popup_properties(self, db_session, tmp_path):
+        data = pd.DataFrame(
+            {
+                "name": ["A", "B"],
+                "latitude": [33.28, 33.29],
+                "longitude": [131.50, 131.51],
+                "personal_rating": [9.5, np.nan],
+                "entry_fee_yen": [300, 500],
+                "visit_count": [2, 0],
+                "had_sauna": [True, False],
+            }
+        )
+
+        path = InteractiveMapGenerator(tmp_path).create_comprehensive_onsen_map(
+            data, db_session, map_name="overview.html", show_locations=False, client_side=True
+        )
+
+        properties = [f["properties"] for f in _load_data_file(str(path))["features"]]
+        assert properties[0]["color"] == "darkgreen"
+        assert properties[0]["personal_rating"] == "9.5/10"
+        assert properties[0]["visits"] == "2 time(s)"
+        assert properties[0]["facilities"] == "🧖 Sauna"
+        assert properties[1]["color"] == "gray"
+        assert "visits" not in properties[1]
+        assert "Clustered View" not in path.read_text(encoding="utf-8")
@@ -0,0 +1,155 @@
+"""Unit tests for Google Drive directory sync against an in-memory Drive."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+# pylint: disable=wrong-import-position
+
+from src.lib.cloud_backup import DEFAULT_CONFIG, GoogleDriveBackup
+from src.testing.mocks.mock_drive import FakeDriveService
+
+CHUNK = 256 * 1024
+
+
+@pytest.fixture
+def drive():
+    return FakeDriveService()
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    root = tmp_path / "backups"
+    (root / "2025" / "01").mkdir(parents=True)
+    for i in range(6):
+        (root / f"onsen_{i}.db").write_bytes(os.urandom(1000 + i))
+    (root / "2025" / "01" / "nested.db").write_bytes(b"nested")
+    return root
+
+
+def _manager(tmp_path, drive) -> GoogleDriveBackup:
+    return GoogleDriveBackup(
+        token_file=str(tmp_path / "gdrive" / "token.json"),
+        service=drive,
+        chunk_size=CHUNK,
+    )
+
+
+def test_sync_mirrors_tree_and_skips_unchanged_files(tmp_path, drive, backup_dir):
+    stats = _manager(tmp_path, drive).sync_directory(str(backup_dir), "db_backups", max_workers=4)
+
+    assert stats["uploaded"] == 7 and stats["failed"] == 0
+    assert drive.uploaded_names() == sorted(
+        [f"onsen_{i}.db" for i in range(6)] + ["nested.db"]
+    )
+    nested = next(f for f in drive.stored.values() if f["name"] == "nested.db")
+    parent = drive.stored[nested["parents"][0]]
+    assert parent["name"] == "01" and drive.stored[parent["parents"][0]]["name"] == "2025"
+
+    # A fresh process: nothing is hashed and Drive is not queried at all
+    drive.calls.clear()
+    manager = _manager(tmp_path, drive)
+    with patch.object(manager, "_calculate_file_hash") as hash_spy:
+        stats = manager.sync_directory(str(backup_dir), "db_backups")
+
+    assert stats == {"uploaded": 0, "skipped": 7, "failed": 0, "total_size": 0}
+    hash_spy.assert_not_called()
+    assert sum(drive.calls.values()) == 0
+
+
+def test_only_modified_files_are_uploaded(tmp_path, drive, backup_dir):
+    _manager(tmp_path, drive).sync_directory(str(backup_dir), "db_backups")
+
+    (backup_dir / "onsen_0.db").write_bytes(b"changed")
+    touched = backup_dir / "onsen_1.db"
+    os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+    drive.calls.clear()
+
+    stats = _manager(tmp_path, drive).sync_directory(str(backup_dir), "db_backups")
+
+    assert stats["uploaded"] == 1 and stats["skipped"] == 6
+    # Folder ids come from the cache, and known files need no existence query
+    assert drive.calls["list"] == 0
+
+
+def test_interrupted_upload_resumes_after_restart(tmp_path, drive):
+    data = os.urandom(4 * CHUNK + 123)
+    source = tmp_path / "big"
+    source.mkdir()
+    (source / "onsen.db").write_bytes(data)
+
+    drive.fail_after_chunks = 2
+    stats = _manager(tmp_path, drive).sync_directory(str(source))
+    assert stats["failed"] == 1
+
+    drive.fail_after_chunks = None
+    stats = _manager(tmp_path, drive).sync_directory(str(source))
+
+    assert stats["uploaded"] == 1
+    assert drive.resumed_from == [2 * CHUNK]
+    uploaded = next(f for f in drive.stored.values() if f["name"] == "onsen.db")
+    assert uploaded["content"] == data
+    assert not _manager(tmp_path, drive).sync_state.sessions
+
+
+def test_existing_remote_files_are_adopted(tmp_path, drive, backup_dir):
+    _manager(tmp_path, drive).sync_directory(str(backup_dir))
+    (tmp_path / "gdrive" / "sync_state.json").unlink()
+
+    stats = _manager(tmp_path, drive).sync_directory(str(backup_dir))
+
+    assert stats["uploaded"] == 0 and stats["skipped"] == 7
+    assert len(drive.uploaded_names()) == 7
+
+
+def test_expired_upload_session_restarts(tmp_path, drive):
+    data = os.urandom(3 * CHUNK)
+    source = tmp_path / "big"
+    source.mkdir()
+    (source / "onsen.db").write_bytes(data)
+
+    drive.fail_after_chunks = 1
+    _manager(tmp_path, drive).sync_directory(str(source))
+    drive.sessions.clear()  # the server discarded the session
+
+    drive.fail_after_chunks = None
+    stats = _manager(tmp_path, drive).sync_directory(str(source))
+
+    assert stats["uploaded"] == 1
+    assert drive.resumed_from == []
+    uploaded = next(f for f in drive.stored.values() if f["name"] == "onsen.db")
+    assert uploaded["content"] == data
+
+
+def test_manifest_is_saved_in_batches(tmp_path, drive, backup_dir):
+    manager = _manager(tmp_path, drive)
+
+    with patch.dict(DEFAULT_CONFIG, {"state_save_interval": 3}), patch.object(
+        manager.sync_state, "save", wraps=manager.sync_state.save
+    ) as save_spy:
+        stats = manager.sync_directory(str(backup_dir), max_workers=4)
+
+    assert stats["uploaded"] == 7
+    # Two periodic saves plus the final one
+    assert save_spy.call_count == 3
+    assert len(_manager(tmp_path, drive).sync_state.files) == 7
+
+
+def test_failed_upload_forgets_folder_ids_after_the_pool(tmp_path, drive, backup_dir):
+    manager = _manager(tmp_path, drive)
+    upload = manager._upload_media
+
+    def flaky(local_path, parent_id, file_hash):
+        if local_path.endswith("onsen_0.db"):
+            raise ConnectionError("upload failed")
+        return upload(local_path, parent_id, file_hash)
+
+    with patch.object(manager, "_upload_media", side_effect=flaky):
+        stats = manager.sync_directory(str(backup_dir), max_workers=4)
+
+    assert stats["uploaded"] == 6 and stats["failed"] == 1
+    assert manager.sync_state.folders == {}
+    assert len(_manager(tmp_path, drive).sync_state.files) == 6
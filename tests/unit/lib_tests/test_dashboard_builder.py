@@ -0,0 +1,126 @@
+"""Unit tests for dashboard graph generation and the figure cache."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lib.graphing.base import (
+    DashboardConfig,
+    DataSource,
+    GraphCategory,
+    GraphDefinition,
+    GraphType,
+)
+from src.lib.graphing.dashboard_builder import DashboardBuilder
+from src.lib.graphing.figure_cache import (
+    FigureCache,
+    graph_cache_key,
+    graph_data_fingerprint,
+)
+
+
+def _visits(n: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {
+            "id": range(1, n + 1),
+            "visit_time": pd.date_range("2025-01-01", periods=n, freq="12h"),
+            "entry_fee_yen": rng.integers(100, 800, n),
+            "weather": rng.choice(["sunny", "rainy"], n),
+            "personal_rating": rng.integers(1, 11, n),
+        }
+    )
+
+
+GRAPHS = [
+    GraphDefinition(
+        title="Fees", graph_type=GraphType.HISTOGRAM, data_source=DataSource.VISIT,
+        category=GraphCategory.FINANCIAL, field="entry_fee_yen",
+    ),
+    GraphDefinition(
+        title="Weather", graph_type=GraphType.PIE, data_source=DataSource.VISIT,
+        category=GraphCategory.CATEGORICAL, field="weather",
+    ),
+    GraphDefinition(
+        title="Rating vs Fee", graph_type=GraphType.SCATTER, data_source=DataSource.VISIT,
+        category=GraphCategory.RATINGS, field="entry_fee_yen", field_y="personal_rating",
+    ),
+]
+
+
+def _build(builder: DashboardBuilder, data: pd.DataFrame, tmp_path) -> str:
+    config = DashboardConfig(
+        title="Test", data_source=DataSource.VISIT, graph_definitions=GRAPHS,
+        output_filename="dashboard.html",
+    )
+    with patch.object(builder, "_fetch_visit_data", return_value=data), \
+         patch("src.lib.graphing.dashboard_builder.PATHS", SimpleNamespace(GRAPHS_DIR=str(tmp_path))):
+        return builder.build(config, auto_open=False)
+
+
+class TestFigureCache:
+    """Tests for per-graph figure reuse."""
+
+    def test_only_affected_graphs_regenerate(self, tmp_path):
+        cache = FigureCache(str(tmp_path / "graphs.sqlite3"))
+        data = _visits()
+
+        builder = DashboardBuilder(None, figure_cache=cache)
+        assert _build(builder, data, tmp_path)
+
+        changed = data.copy()
+        changed.loc[0, "weather"] = "snow"
+        builder = DashboardBuilder(None, figure_cache=cache)
+        with patch.object(builder.generator, "generate", wraps=builder.generator.generate) as spy:
+            assert _build(builder, changed, tmp_path)
+
+        assert [call.args[0].title for call in spy.call_args_list] == ["Weather"]
+
+    def test_generator_version_is_part_of_key(self):
+        key = graph_cache_key(GRAPHS[0])
+        with patch(
+            "src.lib.graphing.figure_cache.graph_generator_version", return_value="changed"
+        ):
+            assert graph_cache_key(GRAPHS[0]) != key
+
+    def test_fingerprint_ignores_unreferenced_columns(self):
+        data = _visits()
+        changed = data.copy()
+        changed["personal_rating"] = 5
+
+        assert graph_data_fingerprint(GRAPHS[0], data) == graph_data_fingerprint(GRAPHS[0], changed)
+        assert graph_data_fingerprint(GRAPHS[2], data) != graph_data_fingerprint(GRAPHS[2], changed)
+
+    def test_referenced_fields(self):
+        radar = GraphDefinition(
+            title="Radar", graph_type=GraphType.RADAR, data_source=DataSource.VISIT,
+            category=GraphCategory.RATINGS, field="view_rating, sauna_rating",
+            filters={"had_sauna": True},
+        )
+
+        assert radar.referenced_fields() == ["view_rating", "sauna_rating", "had_sauna"]
+        assert GRAPHS[2].referenced_fields() == ["entry_fee_yen", "personal_rating"]
+
+
+class TestParallelGeneration:
+    """Tests for generating graphs in worker processes."""
+
+    @pytest.mark.parametrize("jobs", [2])
+    def test_parallel_matches_sequential_order(self, tmp_path, jobs):
+        data = _visits()
+        builder = DashboardBuilder(None, use_figure_cache=False)
+        prepared = builder._prepare_data(data, DataSource.VISIT)
+
+        sequential = builder._generate_figures(GRAPHS, prepared)
+        parallel = DashboardBuilder(None, jobs=jobs, use_figure_cache=False)._generate_figures(
+            GRAPHS, prepared
+        )
+
+        assert [fig.data[0].type for fig in parallel] == ["histogram", "pie", "scatter"]
+        assert [json.loads(fig.to_json()) for fig in parallel] == [
+            json.loads(fig.to_json()) for fig in sequential
+        ]
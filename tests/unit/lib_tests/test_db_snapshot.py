@@ -0,0 +1,134 @@
+"""Unit tests for consistent, deduplicated database snapshots."""
+
+import argparse
+import os
+import sqlite3
+
+import pytest
+
+from src.cli.commands.database.backup import backup_db
+from src.cli.commands.database.restore import restore_db
+from src.lib.db_snapshot import CHUNK_SIZE, SnapshotStore, consistent_copy
+
+
+def _make_db(path, rows: int = 2000) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE visits (id INTEGER PRIMARY KEY, notes TEXT)")
+        conn.executemany(
+            "INSERT INTO visits (notes) VALUES (?)",
+            [(os.urandom(200).hex(),) for _ in range(rows)],
+        )
+    conn.close()
+
+
+def _count(path) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM visits").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_snapshots_are_incremental_and_restorable(tmp_path):
+    db_path = tmp_path / "onsen.db"
+    _make_db(db_path)
+    store = SnapshotStore(tmp_path / "store")
+
+    first = store.create(db_path)
+    assert first.new_chunks == len(first.chunks) > 4
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO visits (notes) VALUES ('one more')")
+    conn.close()
+    second = store.create(db_path)
+
+    # Only the pages touched by the insert are stored again
+    assert 0 < second.new_chunks <= 3
+    assert second.new_bytes < CHUNK_SIZE * 3
+
+    store.restore(tmp_path / "restored.db", first.snapshot_id)
+    assert _count(tmp_path / "restored.db") == 2000
+    store.restore(tmp_path / "restored.db")
+    assert _count(tmp_path / "restored.db") == 2001
+
+
+def test_restore_replaces_database_under_open_connection(tmp_path):
+    db_path = tmp_path / "onsen.db"
+    _make_db(db_path, rows=10)
+    store = SnapshotStore(tmp_path / "store", compress=False)
+    snapshot = store.create(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DELETE FROM visits")
+        conn.commit()
+        store.restore(db_path, snapshot.snapshot_id)
+        assert conn.execute("SELECT COUNT(*) FROM visits").fetchone()[0] == 10
+    finally:
+        conn.close()
+
+
+def test_corrupt_chunk_is_detected(tmp_path):
+    db_path = tmp_path / "onsen.db"
+    _make_db(db_path, rows=10)
+    store = SnapshotStore(tmp_path / "store", compress=False)
+    snapshot = store.create(db_path)
+
+    chunk = store.chunks_dir / snapshot.chunks[0][:2] / snapshot.chunks[0]
+    chunk.write_bytes(b"garbage")
+
+    with pytest.raises(ValueError, match="Corrupt"):
+        store.restore(tmp_path / "restored.db")
+    assert not (tmp_path / "restored.db").exists()
+
+
+def test_prune_removes_unreferenced_chunks(tmp_path):
+    db_path = tmp_path / "onsen.db"
+    _make_db(db_path, rows=500)
+    store = SnapshotStore(tmp_path / "store")
+    store.create(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE visits SET notes = 'changed'")
+    conn.close()
+    latest = store.create(db_path)
+
+    removed, removed_chunks = store.prune(keep_recent=1)
+
+    assert len(removed) == 1 and removed_chunks > 0
+    assert [s.snapshot_id for s in store.snapshots()] == [latest.snapshot_id]
+    store.restore(tmp_path / "restored.db")
+    assert _count(tmp_path / "restored.db") == 500
+
+
+def test_backup_and_restore_commands(tmp_path):
+    db_path = tmp_path / "onsen.db"
+    _make_db(db_path, rows=50)
+    store_dir = tmp_path / "snapshots"
+
+    backup_db(
+        argparse.Namespace(
+            database=str(db_path), snapshot=True, backup_folder=str(store_dir),
+            no_compress=False, keep=None, to_latest_artifact=False, no_interactive=True,
+        )
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM visits")
+    conn.close()
+
+    restore_args = dict(
+        database=str(db_path), snapshot_dir=str(store_dir), snapshot_id=None,
+        output=None, list=False, force=False, no_interactive=True,
+    )
+    restore_db(argparse.Namespace(**restore_args))
+    assert _count(db_path) == 0  # refused without --force
+
+    restore_db(argparse.Namespace(**{**restore_args, "force": True}))
+    assert _count(db_path) == 50
+    # The replaced state was kept as a snapshot
+    assert [s.label for s in SnapshotStore(store_dir).snapshots()] == [None, "pre-restore"]
+
+
+def test_consistent_copy(tmp_path):
+    _make_db(tmp_path / "a.db", rows=5)
+    consistent_copy(tmp_path / "a.db", tmp_path / "b.db")
+    assert _count(tmp_path / "b.db") == 5
@@ -0,0 +1,153 @@
+"""
+Unit tests for the rule-based Japanese holiday table.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lib.japan_holidays import (
+    FIRST_YEAR,
+    LAST_YEAR,
+    HolidayTable,
+    compute_holidays,
+    get_holiday_table,
+    holiday_mask,
+    is_japanese_holiday,
+)
+from src.lib.parsers.usage_time import (
+    CachedJapanHolidayService,
+    MockHolidayService,
+    PrecomputedJapanHolidayService,
+    get_holiday_service,
+    is_holiday,
+    set_holiday_service,
+)
+
+# Cabinet Office calendar
+PUBLISHED = {
+    2019: [
+        "01-01", "01-14", "02-11", "03-21", "04-29", "04-30", "05-01", "05-02",
+        "05-03", "05-04", "05-05", "05-06", "07-15", "08-11", "08-12", "09-16",
+        "09-23", "10-14", "10-22", "11-03", "11-04", "11-23",
+    ],
+    2020: [
+        "01-01", "01-13", "02-11", "02-23", "02-24", "03-20", "04-29", "05-03",
+        "05-04", "05-05", "05-06", "07-23", "07-24", "08-10", "09-21", "09-22",
+        "11-03", "11-23",
+    ],
+    2021: [
+        "01-01", "01-11", "02-11", "02-23", "03-20", "04-29", "05-03", "05-04",
+        "05-05", "07-22", "07-23", "08-08", "08-09", "09-20", "09-23", "11-03",
+        "11-23",
+    ],
+    2025: [
+        "01-01", "01-13", "02-11", "02-23", "02-24", "03-20", "04-29", "05-03",
+        "05-04", "05-05", "05-06", "07-21", "08-11", "09-15", "09-23", "10-13",
+        "11-03", "11-23", "11-24",
+    ],
+    2026: [
+        "01-01", "01-12", "02-11", "02-23", "03-20", "04-29", "05-03", "05-04",
+        "05-05", "05-06", "07-20", "08-11", "09-21", "09-22", "09-23", "10-12",
+        "11-03", "11-23",
+    ],
+}
+
+
+class TestComputeHolidays:
+    @pytest.mark.parametrize("year", sorted(PUBLISHED))
+    def test_matches_published_calendar(self, year):
+        assert [f"{day:%m-%d}" for day in compute_holidays(year)] == PUBLISHED[year]
+
+    @pytest.mark.parametrize(
+        "day, name",
+        [
+            (date(1973, 4, 30), "休日"),  # first substitute holiday
+            (date(1988, 5, 4), "休日"),  # first citizens' holiday
+            (date(2009, 9, 22), "休日"),  # sandwiched between Respect for the Aged and the equinox
+            (date(2008, 5, 6), "休日"),  # substitute moves past consecutive holidays
+            (date(1989, 2, 24), "昭和天皇の大喪の礼"),
+            (date(1999, 1, 15), "成人の日"),
+            (date(2000, 1, 10), "成人の日"),
+            (date(2018, 12, 23), "天皇誕生日"),
+        ],
+    )
+    def test_rule_changes(self, day, name):
+        assert compute_holidays(day.year)[day] == name
+
+    def test_rules_not_yet_in_force(self):
+        # Substitute holidays started on 1973-04-12; 1972-01-16 was a Monday after a Sunday holiday
+        assert date(1972, 1, 16) not in compute_holidays(1972)
+        # Before 2007 a Sunday between two holidays stays a plain Sunday
+        assert date(1997, 5, 4) not in compute_holidays(1997)
+        assert date(2019, 12, 23) not in compute_holidays(2019)
+
+
+class TestHolidayTable:
+    def test_matches_rules_for_every_year(self):
+        table = get_holiday_table()
+
+        expected = [
+            day.toordinal()
+            for year in range(FIRST_YEAR, LAST_YEAR + 1)
+            for day in compute_holidays(year)
+        ]
+
+        assert list(table.ordinals) == expected
+        assert sorted(expected) == expected
+        assert all(table.contains(date.fromordinal(ordinal)) for ordinal in expected)
+        assert sum(bin(byte).count("1") for byte in table.bits) == len(table)
+
+    def test_lookups(self):
+        table = HolidayTable.build(2024, 2026)
+
+        assert table.contains(date(2025, 1, 1))
+        assert table.contains(datetime(2025, 11, 24, 16, 30))
+        assert not table.contains(date(2025, 1, 2))
+        assert not table.contains(date(2023, 1, 1))  # outside the table
+        assert not table.contains(date(2027, 1, 1))
+        assert table.holidays_in_year(2025) == set(compute_holidays(2025))
+        assert table.holidays_in_year(2030) == frozenset()
+
+    def test_vectorized_membership(self):
+        days = pd.date_range("1948-12-25", "2151-01-05", freq="D")
+
+        mask = holiday_mask(days)
+
+        expected = np.array([is_japanese_holiday(day.date()) for day in days])
+        np.testing.assert_array_equal(mask, expected)
+        assert mask.sum() == len(get_holiday_table())
+
+    def test_vectorized_membership_accepts_dates_and_nat(self):
+        series = pd.Series(pd.to_datetime(["2025-01-01 09:00", None, "2025-01-02 18:00"]))
+
+        assert holiday_mask(series).tolist() == [True, False, False]
+        assert holiday_mask([date(2025, 5, 6), date(2025, 5, 7)]).tolist() == [True, False]
+
+
+class TestHolidayService:
+    def test_default_service_needs_no_network(self, monkeypatch):
+        def offline(*_args, **_kwargs):
+            raise AssertionError("network access")
+
+        monkeypatch.setattr(CachedJapanHolidayService, "get_holidays", offline)
+        original = get_holiday_service()
+        set_holiday_service(None)
+        try:
+            assert isinstance(get_holiday_service(), PrecomputedJapanHolidayService)
+            assert is_holiday(datetime(2025, 11, 24, 12, 0))
+            assert not is_holiday(datetime(2025, 11, 25, 12, 0))
+            assert get_holiday_service().get_holidays(2025) == set(compute_holidays(2025))
+        finally:
+            set_holiday_service(original)
+
+    def test_fallback_outside_table(self):
+        service = PrecomputedJapanHolidayService(
+            fallback=MockHolidayService({2200: {date(2200, 6, 1)}})
+        )
+
+        assert service.is_holiday(date(2200, 6, 1))
+        assert service.get_holidays(2200) == {date(2200, 6, 1)}
+        assert not PrecomputedJapanHolidayService().is_holiday(date(2200, 1, 1))
@@ -0,0 +1,116 @@
+"""Unit tests for shared static assets and output cleanup."""
+
+import os
+
+import plotly
+import plotly.graph_objects as go
+
+from src.lib.static_assets import (
+    cleanup_generated_outputs,
+    ensure_plotly_bundle,
+    find_stale_outputs,
+    write_plotly_html,
+)
+
+
+def _touch(path, content=""):
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestPlotlyBundle:
+    """Tests for writing HTML against the shared plotly bundle."""
+
+    def test_html_references_shared_bundle(self, tmp_path):
+        assets = tmp_path / "static"
+        graphs = tmp_path / "graphs"
+        graphs.mkdir()
+
+        for name in ("a.html", "b.html"):
+            write_plotly_html(go.Figure(go.Bar(x=[1], y=[2])), graphs / name, assets)
+
+        bundle = assets / f"plotly-{plotly.__version__}.min.js"
+        html = (graphs / "a.html").read_text(encoding="utf-8")
+        assert f'src="../static/{bundle.name}"' in html
+        assert (graphs / "a.html").stat().st_size < 100_000
+        assert [p.name for p in assets.iterdir()] == [bundle.name]
+
+    def test_bundle_written_once(self, tmp_path):
+        first = ensure_plotly_bundle(tmp_path)
+        mtime = os.stat(first).st_mtime_ns
+
+        assert ensure_plotly_bundle(tmp_path) == first
+        assert os.stat(first).st_mtime_ns == mtime
+
+    def test_bundle_is_world_readable(self, tmp_path):
+        bundle = ensure_plotly_bundle(tmp_path)
+
+        assert bundle.stat().st_mode & 0o777 == 0o644
+
+
+class TestCleanupGeneratedOutputs:
+    """Tests for garbage-collecting timestamped outputs."""
+
+    def test_keeps_newest_per_prefix(self, tmp_path):
+        for day in range(1, 5):
+            _touch(tmp_path / f"visit_dashboard_2025010{day}_120000.html")
+            _touch(tmp_path / f"all_onsens_map_2025010{day}_120000.html")
+            _touch(tmp_path / f"all_onsens_map_2025010{day}_120000.data.js")
+        _touch(tmp_path / "custom_name.html")
+
+        stale = find_stale_outputs([tmp_path], keep_recent=2)
+
+        assert len(stale) == 6
+        assert all("20250101" in p.name or "20250102" in p.name for p in stale)
+        assert tmp_path / "custom_name.html" not in stale
+
+    def test_removes_unreferenced_old_bundles(self, tmp_path):
+        assets = tmp_path / "static"
+        assets.mkdir()
+        current = ensure_plotly_bundle(assets)
+        used = _touch(assets / "plotly-1.0.0.min.js")
+        unused = _touch(assets / "plotly-0.9.0.min.js")
+        _touch(tmp_path / "old_20240101_000000.html", '<script src="../static/plotly-0.9.0.min.js">')
+        _touch(tmp_path / "old_20240102_000000.html", '<script src="../static/plotly-1.0.0.min.js">')
+
+        dry = cleanup_generated_outputs([tmp_path], keep_recent=1, dry_run=True, assets_dir=assets)
+        assert (tmp_path / "old_20240101_000000.html").exists()
+
+        removed = cleanup_generated_outputs([tmp_path], keep_recent=1, assets_dir=assets)
+
+        assert removed == dry
+        assert set(removed) == {tmp_path / "old_20240101_000000.html", unused}
+        assert current.exists() and used.exists()
+
+    def test_keeps_bundles_used_by_nested_analysis_html(self, tmp_path):
+        assets = tmp_path / "static"
+        assets.mkdir()
+        ensure_plotly_bundle(assets)
+        used = _touch(assets / "plotly-1.0.0.min.js")
+        graphs = tmp_path / "graphs"
+        graphs.mkdir()
+        run_dir = tmp_path / "analysis" / "run_1" / "visualizations"
+        run_dir.mkdir(parents=True)
+        _touch(
+            run_dir / "trend.html",
+            '<script src="../../../static/plotly-1.0.0.min.js">',
+        )
+
+        removed = cleanup_generated_outputs([graphs], keep_recent=1, assets_dir=assets)
+
+        assert removed == []
+        assert used.exists()
+
+    def test_reference_dirs_keep_bundles_alive(self, tmp_path):
+        assets = tmp_path / "output" / "static"
+        assets.mkdir(parents=True)
+        ensure_plotly_bundle(assets)
+        used = _touch(assets / "plotly-1.0.0.min.js")
+        elsewhere = tmp_path / "custom_analysis"
+        (elsewhere / "run").mkdir(parents=True)
+        _touch(elsewhere / "run" / "plot.html", '<script src="plotly-1.0.0.min.js">')
+
+        assert used in cleanup_generated_outputs([], assets_dir=assets, dry_run=True)
+        assert cleanup_generated_outputs(
+            [], assets_dir=assets, reference_dirs=[elsewhere], dry_run=True
+        ) == []
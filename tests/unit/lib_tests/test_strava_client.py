@@ -0,0 +1,138 @@
+"""Tests for Strava client rate limiting and token refresh under concurrency."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.lib import strava_client as strava_client_module
+from src.lib.strava_client import StravaClient
+from src.types.strava import StravaCredentials, StravaRateLimitError, StravaToken
+
+
+class _Response:
+    def __init__(self, status_code: int = 200, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return {"ok": True}
+
+
+def _client(tmp_path, expires_in: int = 3600, wait_for_rate_limit: bool = False) -> StravaClient:
+    client = StravaClient(
+        StravaCredentials(client_id="id", client_secret="secret"),
+        str(tmp_path / "token.json"),
+        wait_for_rate_limit=wait_for_rate_limit,
+    )
+    client.token = StravaToken(
+        access_token="old",
+        refresh_token="refresh",
+        expires_at=int(time.time()) + expires_in,
+    )
+    return client
+
+
+def test_rate_limit_raises_by_default(tmp_path, monkeypatch) -> None:
+    client = _client(tmp_path)
+    client.rate_limit.requests_15min = client.rate_limit.LIMIT_15MIN
+    client.rate_limit.reset_15min = datetime.now() + timedelta(seconds=30)
+    client.rate_limit.reset_daily = datetime.now() + timedelta(days=1)
+    monkeypatch.setattr(
+        strava_client_module.time, "sleep", lambda _: pytest.fail("should not wait")
+    )
+
+    with pytest.raises(StravaRateLimitError):
+        client._make_request("GET", "/athlete")
+
+
+def test_429_raises_by_default(tmp_path, monkeypatch) -> None:
+    client = _client(tmp_path)
+    monkeypatch.setattr(
+        strava_client_module.requests,
+        "request",
+        lambda **_: _Response(429, {"Retry-After": "60"}),
+    )
+
+    with pytest.raises(StravaRateLimitError):
+        client._make_request("GET", "/athlete")
+    assert client.rate_limit.requests_15min == client.rate_limit.LIMIT_15MIN
+
+
+def test_waits_for_rate_limit_window_when_enabled(tmp_path, monkeypatch) -> None:
+    client = _client(tmp_path, wait_for_rate_limit=True)
+    client.rate_limit.requests_15min = client.rate_limit.LIMIT_15MIN
+    client.rate_limit.reset_15min = datetime.now() + timedelta(seconds=30)
+    client.rate_limit.reset_daily = datetime.now() + timedelta(days=1)
+
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        client.rate_limit.reset_15min = datetime.now()
+
+    monkeypatch.setattr(strava_client_module.time, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        strava_client_module.requests, "request", lambda **_: _Response()
+    )
+
+    assert client._make_request("GET", "/athlete") == {"ok": True}
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 30
+    assert client.rate_limit.requests_15min == 1
+
+
+def test_daily_limit_still_raises(tmp_path) -> None:
+    client = _client(tmp_path, wait_for_rate_limit=True)
+    client.rate_limit.requests_daily = client.rate_limit.LIMIT_DAILY
+    client.rate_limit.reset_15min = datetime.now() + timedelta(minutes=15)
+    client.rate_limit.reset_daily = datetime.now() + timedelta(hours=5)
+
+    with pytest.raises(StravaRateLimitError):
+        client._make_request("GET", "/athlete")
+
+
+def test_concurrent_requests_are_counted_exactly(tmp_path, monkeypatch) -> None:
+    client = _client(tmp_path)
+    monkeypatch.setattr(
+        strava_client_module.requests, "request", lambda **_: _Response()
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: client._make_request("GET", "/athlete"), range(80)))
+
+    assert client.rate_limit.requests_15min == 80
+
+
+def test_expired_token_is_refreshed_once_across_threads(tmp_path, monkeypatch) -> None:
+    client = _client(tmp_path, expires_in=-60)
+    refreshes = []
+    barrier = threading.Barrier(4)
+
+    def fake_refresh() -> None:
+        refreshes.append(1)
+        client.token = StravaToken(
+            access_token="new",
+            refresh_token="refresh",
+            expires_at=int(time.time()) + 3600,
+        )
+
+    def request(**kwargs):
+        assert kwargs["headers"]["Authorization"] == "Bearer new"
+        return _Response()
+
+    def call(_):
+        barrier.wait()
+        return client._make_request("GET", "/athlete")
+
+    monkeypatch.setattr(client, "_refresh_token", fake_refresh)
+    monkeypatch.setattr(strava_client_module.requests, "request", request)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(call, range(4)))
+
+    assert len(refreshes) == 1
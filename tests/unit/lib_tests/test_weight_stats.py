@@ -0,0 +1,135 @@
+"""
+Unit tests for SQL-side weight statistics.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lib.weight_manager import WeightDataManager, WeightMeasurement
+from src.lib.weight_stats import WeightStatisticsEngine
+
+START = datetime(2025, 1, 6, 7, 0)  # a Monday
+
+
+def _store(db_session, weights_by_day, hours=(0,)):
+    """Store one measurement per hour offset for each day offset."""
+    measurements = [
+        WeightMeasurement(
+            measurement_time=START + timedelta(days=day, hours=hour),
+            weight_kg=weight + hour / 100,
+            data_source="scale",
+        )
+        for day, weight in weights_by_day.items()
+        for hour in hours
+    ]
+    WeightDataManager(db_session).store_measurements_bulk(measurements)
+    return measurements
+
+
+def _frame(measurements):
+    return pd.DataFrame(
+        {
+            "time": [m.measurement_time for m in measurements],
+            "weight": [m.weight_kg for m in measurements],
+        }
+    ).set_index("time")
+
+
+class TestResample:
+    @pytest.mark.parametrize("granularity, rule", [("day", "D"), ("week", "W-SUN"), ("month", "MS")])
+    def test_matches_pandas_resampling(self, db_session, granularity, rule):
+        measurements = _store(
+            db_session, {day: 72 + np.sin(day / 5) for day in range(0, 70, 2)}, hours=(0, 12)
+        )
+
+        frame = WeightStatisticsEngine(db_session).resample(granularity=granularity)
+
+        expected = _frame(measurements)["weight"].resample(rule, label="left").agg(
+            ["count", "mean", "min", "max", "first", "last"]
+        )
+        expected = expected[expected["count"] > 0]
+        assert frame["count"].tolist() == expected["count"].tolist()
+        np.testing.assert_allclose(frame["mean_kg"], expected["mean"])
+        np.testing.assert_allclose(frame["min_kg"], expected["min"])
+        np.testing.assert_allclose(frame["max_kg"], expected["max"])
+        np.testing.assert_allclose(frame["first_kg"], expected["first"])
+        np.testing.assert_allclose(frame["last_kg"], expected["last"])
+        assert frame["period"].dtype == "datetime64[ns]"
+        if granularity == "week":
+            assert (frame["period"].dt.dayofweek == 0).all()
+
+    def test_date_range_and_invalid_granularity(self, db_session):
+        _store(db_session, {day: 70.0 for day in range(10)})
+        engine = WeightStatisticsEngine(db_session)
+
+        frame = engine.resample(START + timedelta(days=2), START + timedelta(days=4))
+
+        assert frame["count"].sum() == 3
+        with pytest.raises(ValueError, match="Invalid granularity"):
+            engine.resample(granularity="fortnight")
+
+
+class TestRollingMeans:
+    def test_calendar_windows_weighted_by_measurement(self, db_session):
+        # Gaps and two weigh-ins on some days
+        measurements = _store(db_session, {day: 70 + day / 10 for day in range(0, 40, 3)})
+        _store(db_session, {day: 69.0 for day in range(0, 40, 6)}, hours=(5,))
+        everything = _frame(measurements).combine_first(
+            _frame(
+                [
+                    WeightMeasurement(START + timedelta(days=d, hours=5), 69.05, "scale")
+                    for d in range(0, 40, 6)
+                ]
+            )
+        )
+
+        frame = WeightStatisticsEngine(db_session).rolling_means()
+
+        daily = everything["weight"].resample("D").agg(["sum", "count"])
+        expected_7 = daily["sum"].rolling(7, min_periods=1).sum() / daily["count"].rolling(
+            7, min_periods=1
+        ).sum()
+        expected_7 = expected_7[daily["count"] > 0]
+        np.testing.assert_allclose(frame["rolling_7d_kg"], expected_7.to_numpy())
+        assert len(frame) == len(expected_7)
+
+    def test_windows_look_back_before_the_range(self, db_session):
+        _store(db_session, {0: 80.0, 5: 70.0})
+
+        frame = WeightStatisticsEngine(db_session).rolling_means(
+            start_date=START + timedelta(days=5), windows=(7,)
+        )
+
+        assert len(frame) == 1
+        assert frame["rolling_7d_kg"].iloc[0] == pytest.approx(75.0)
+
+
+class TestSummary:
+    def test_multiple_daily_measurements(self, db_session):
+        _store(db_session, {day: 75.0 - day * 0.3 for day in range(40)}, hours=(0, 1, 2))
+
+        summary = WeightStatisticsEngine(db_session).summary()
+
+        assert summary.total_measurements == 120
+        assert summary.trend == "losing"
+        # Last 7 days are days 33-39; their measurements average day 36's weight
+        assert summary.moving_avg_7day == round(75.0 - 36 * 0.3 + 0.01, 1)
+        assert summary.moving_avg_30day == round(75.0 - 24.5 * 0.3 + 0.01, 1)
+        assert summary.weight_change_kg == round((75.0 - 39 * 0.3 + 0.02) - 75.0, 1)
+
+    def test_seven_days_is_stable_not_an_error(self, db_session):
+        _store(db_session, {day: 70.0 + day for day in range(7)})
+
+        summary = WeightDataManager(db_session).get_summary()
+
+        assert summary.trend == "stable"
+        assert summary.moving_avg_7day == 73.0
+        assert summary.moving_avg_30day is None
+
+    def test_empty_range(self, db_session):
+        _store(db_session, {0: 70.0})
+
+        assert WeightStatisticsEngine(db_session).summary(START + timedelta(days=1)) is None
@@ -0,0 +1,97 @@
+"""
+Tests for the vectorized scenario generator.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.db.models import Activity, OnsenVisit
+from src.db.columnar import insert_columns
+from src.testing.mocks.scenario_builder import (
+    ScenarioConfig,
+    VectorizedDataGenerator,
+    scenario_config,
+)
+from src.testing.mocks.user_profiles import ALL_PROFILES, LOCAL_REGULAR
+
+
+def _config(**overrides) -> ScenarioConfig:
+    params = {
+        "start_date": datetime(2024, 1, 1),
+        "end_date": datetime(2024, 12, 31),
+        "profiles": ALL_PROFILES,
+        "onsen_ids": list(range(1, 21)),
+        "total_visits": 5000,
+    }
+    params.update(overrides)
+    return ScenarioConfig(**params)
+
+
+def test_same_seed_reproduces_columns():
+    first, _ = VectorizedDataGenerator(_config(), seed=7).generate_columns()
+    second, _ = VectorizedDataGenerator(_config(), seed=7).generate_columns()
+    other, _ = VectorizedDataGenerator(_config(), seed=8).generate_columns()
+
+    assert first.keys() == second.keys()
+    for name in first:
+        np.testing.assert_array_equal(first[name], second[name])
+    assert not np.array_equal(first["personal_rating"], other["personal_rating"])
+
+
+def test_columns_follow_scenario_rules():
+    visits, _ = VectorizedDataGenerator(_config(), seed=1).generate_columns()
+
+    assert len(visits["id"]) == 5000
+    assert set(visits) <= set(OnsenVisit.__table__.columns.keys())
+    assert np.all(np.diff(visits["visit_time"]) >= np.timedelta64(0))
+    assert set(np.unique(visits["onsen_id"])) <= set(range(1, 21))
+    for name in ("personal_rating", "cleanliness_rating", "atmosphere_rating", "view_rating"):
+        assert visits[name].min() >= 1 and visits[name].max() <= 10
+
+    # Logic chains: features are only used when present
+    assert not np.any(visits["sauna_visited"] & ~visits["had_sauna"])
+    assert not np.any(visits["food_service_used"] & ~visits["had_food_service"])
+    assert not np.any(visits["interacted_with_locals"] & (visits["crowd_level"] == "empty"))
+
+    # Price-quality correlation of the scalar generator is preserved
+    assert np.corrcoef(visits["entry_fee_yen"], visits["cleanliness_rating"])[0, 1] > 0.3
+
+    # Snow only falls in winter
+    months = visits["visit_time"].astype("datetime64[M]").astype(int) % 12 + 1
+    assert set(months[visits["weather"] == "snowy"]) <= {12, 1, 2}
+
+
+def test_local_regular_scenario_has_fixed_visit_count():
+    config = scenario_config("local_regular", [1, 2, 3, 4, 5], months=2)
+    visits, _ = VectorizedDataGenerator(config, seed=3).generate_columns()
+
+    assert config.profiles == [LOCAL_REGULAR]
+    assert len(visits["id"]) == 24
+
+
+def test_unknown_scenario_is_rejected():
+    with pytest.raises(ValueError, match="Unknown scenario"):
+        scenario_config("pricing", [1])
+
+
+def test_activities_reference_their_visits(db_session, sample_onsen):
+    generator = VectorizedDataGenerator(
+        _config(onsen_ids=[sample_onsen.id], total_visits=300), seed=5
+    )
+    for visits, activities in generator.iter_chunks(
+        first_visit_id=1, heart_rate_coverage=0.5, include_exercise=True
+    ):
+        insert_columns(db_session, OnsenVisit, visits)
+        insert_columns(db_session, Activity, activities)
+    db_session.commit()
+
+    assert db_session.query(OnsenVisit).count() == 300
+    monitoring = db_session.query(Activity).filter(Activity.visit_id.isnot(None)).all()
+    assert 100 < len(monitoring) < 200
+    for activity in monitoring[:20]:
+        assert activity.activity_type == "onsen_monitoring"
+        assert activity.recording_start >= activity.visit.visit_time
+    workouts = db_session.query(Activity).filter(Activity.visit_id.is_(None)).count()
+    assert workouts > 0
@@ -0,0 +1,130 @@
+"""
+Tests for CLI start-up: the cached parser manifest, per-group parser
+construction and the start-up profiling mode.
+"""
+
+import json
+
+import pytest
+
+from src.cli import manifest as manifest_module
+from src.cli.__main__ import (
+    find_command_group,
+    get_command_group_config,
+    get_command_group_mapping,
+    main,
+)
+from src.cli.cmd_list import CLI_COMMANDS
+from src.cli.startup_profile import (
+    HEAVY_PACKAGES,
+    PROBE_ENV,
+    PROBE_MARKER,
+    _run_probe,
+    package_import_times,
+)
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    return str(tmp_path / "cli_manifest.json")
+
+
+class TestManifest:
+    def test_covers_every_command(self):
+        manifest = manifest_module.build_manifest(get_command_group_mapping())
+
+        count = sum(len(commands) for commands in manifest["groups"].values())
+        assert count == len(CLI_COMMANDS)
+        spec = manifest["groups"]["visit"]["list"]
+        assert spec["module"] == "src.cli.commands.visit.list"
+        assert spec["func"] == "list_visits"
+        assert spec["args"][0]["kwargs"]["type"] is int
+
+    def test_cached_manifest_round_trips(self, manifest_path, monkeypatch):
+        mapping = get_command_group_mapping()
+        built = manifest_module.load_manifest(mapping, manifest_path)
+
+        def fail_build(_mapping):
+            raise AssertionError("manifest should be read from the cache")
+
+        monkeypatch.setattr(manifest_module, "build_manifest", fail_build)
+        cached = manifest_module.load_manifest(mapping, manifest_path)
+
+        assert json.loads(json.dumps(cached["source"])) == json.loads(json.dumps(built["source"]))
+        assert cached["groups"] == built["groups"]
+
+    def test_stale_manifest_is_rebuilt(self, manifest_path):
+        mapping = get_command_group_mapping()
+        manifest_module.load_manifest(mapping, manifest_path)
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        cached["source"][1] -= 1  # cmd_list.py modified since
+        cached["groups"] = {}
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+
+        rebuilt = manifest_module.load_manifest(mapping, manifest_path)
+
+        assert "visit" in rebuilt["groups"]
+
+
+class TestParser:
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["visit", "list"], "visit"),
+            (["--env", "prod", "onsen", "recommend"], "onsen"),
+            (["--database", "visit.db", "visit", "list"], "visit"),
+            (["--env=dev", "weight", "list"], "weight"),
+            (["--help"], None),
+            (["unknown"], None),
+        ],
+    )
+    def test_find_command_group(self, argv, expected):
+        assert find_command_group(argv, list(get_command_group_config())) == expected
+
+    def test_only_invoked_group_is_built(self, monkeypatch, capsys):
+        monkeypatch.setenv(PROBE_ENV, "1")
+
+        main(["--database", "unused.db", "visit", "list", "--limit", "3"])
+
+        line = capsys.readouterr().out.strip()
+        assert line.startswith(PROBE_MARKER)
+        payload = json.loads(line[len(PROBE_MARKER):])
+        assert payload["handler"] == "src.cli.commands.visit.list.list_visits"
+        assert set(payload["phases"]) == {"cli_import", "manifest", "parser", "handler_import"}
+
+        # Other groups have no subcommands registered, so they are not parsed
+        with pytest.raises(SystemExit):
+            main(["onsen-typo", "list"])
+
+
+class TestStartupBudget:
+    @pytest.mark.parametrize(
+        "argv",
+        [["visit", "list"], ["onsen", "recommend"], ["location", "list"]],
+    )
+    def test_common_commands_skip_heavy_packages(self, argv):
+        _, payload, _ = _run_probe(argv, [])
+
+        assert payload["handler"]
+        assert payload["heavy_packages"] == []
+
+    def test_package_import_times_look_through_project_modules(self):
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 |     sqlalchemy.util",
+                "import time:      2000 |       2100 |   sqlalchemy",
+                "import time:       500 |       2600 | src.db.models",
+                "import time:       300 |        300 | loguru",
+            ]
+        )
+
+        assert package_import_times(output) == {
+            "sqlalchemy (via src.db.models)": 2.1,
+            "loguru": 0.3,
+        }
+
+    def test_heavy_packages_are_third_party(self):
+        assert "src" not in HEAVY_PACKAGES
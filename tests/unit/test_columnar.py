@@ -0,0 +1,140 @@
+"""Unit tests for typed columnar database reads."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from src.db.columnar import fetch_columns, insert_columns, result_to_frame
+from src.db.models import Activity, OnsenVisit
+from src.lib.graphing.base import DataSource, GraphCategory, GraphDefinition, GraphType
+from src.lib.graphing.dashboard_builder import (
+    VISIT_COLUMNS,
+    DashboardBuilder,
+    visit_columns_for,
+)
+
+
+@pytest.fixture
+def visits(db_session, sample_onsen):
+    db_session.add_all(
+        [
+            OnsenVisit(
+                onsen_id=sample_onsen.id, visit_time=datetime(2025, 1, 1, 10),
+                entry_fee_yen=300, personal_rating=8, had_sauna=True, weather="sunny",
+            ),
+            OnsenVisit(
+                onsen_id=sample_onsen.id, visit_time=datetime(2025, 1, 2, 18),
+                entry_fee_yen=500, personal_rating=None, had_sauna=None, weather=None,
+            ),
+        ]
+    )
+    db_session.commit()
+    return db_session
+
+
+def test_fetch_columns_reads_typed_arrays(visits):
+    df = fetch_columns(
+        visits, OnsenVisit,
+        ["id", "visit_time", "entry_fee_yen", "personal_rating", "had_sauna", "weather"],
+        order_by=OnsenVisit.id,
+    )
+
+    assert list(df.columns) == [
+        "id", "visit_time", "entry_fee_yen", "personal_rating", "had_sauna", "weather",
+    ]
+    assert str(df["id"].dtype) == "int64"
+    assert str(df["visit_time"].dtype) == "datetime64[ns]"
+    assert str(df["entry_fee_yen"].dtype) == "int64"
+    # Nullable columns fall back to the dtypes pandas infers from rows
+    assert str(df["personal_rating"].dtype) == "float64"
+    assert df["had_sauna"].tolist() == [True, None]
+    assert df["weather"].tolist() == ["sunny", None]
+
+
+def test_fetch_columns_filters_and_rejects_unknown_columns(visits):
+    df = fetch_columns(visits, OnsenVisit, ["entry_fee_yen"], where=[OnsenVisit.entry_fee_yen > 400])
+    assert df["entry_fee_yen"].tolist() == [500]
+
+    with pytest.raises(ValueError, match="not_a_column"):
+        fetch_columns(visits, OnsenVisit, ["not_a_column"])
+
+    empty = fetch_columns(visits, OnsenVisit, ["id"], where=[OnsenVisit.id < 0])
+    assert empty.empty and list(empty.columns) == ["id"]
+
+
+def test_result_to_frame_infers_unknown_columns(visits):
+    result = visits.execute(
+        text("SELECT visit_time, AVG(entry_fee_yen) AS avg_fee FROM onsen_visits GROUP BY id")
+    )
+    df = result_to_frame(result, {"visit_time": "datetime64[ns]"})
+
+    assert str(df["visit_time"].dtype) == "datetime64[ns]"
+    assert str(df["avg_fee"].dtype) == "float64"
+
+
+@pytest.mark.usefixtures("sample_onsen")
+def test_insert_columns_round_trips_through_the_orm(db_session):
+    inserted = insert_columns(
+        db_session,
+        Activity,
+        {
+            "recording_start": np.array(["2025-01-01T10:00", "2025-01-02T07:30"], dtype="datetime64[us]"),
+            "recording_end": np.array(["2025-01-01T11:00", "2025-01-02T08:00"], dtype="datetime64[us]"),
+            "activity_type": np.array(["onsen_monitoring", "running"], dtype=object),
+            "distance_km": np.array([np.nan, 5.25]),
+            "duration_minutes": np.array([60, 30]),
+            "visit_id": np.array([None, None], dtype=object),
+        },
+        batch_size=1,
+    )
+    db_session.commit()
+
+    assert inserted == 2
+    activities = db_session.query(Activity).order_by(Activity.id).all()
+    assert activities[0].recording_start == datetime(2025, 1, 1, 10)
+    assert activities[0].distance_km is None
+    assert activities[1].distance_km == 5.25
+    assert activities[1].duration_minutes == 30
+    # Model defaults are still applied
+    assert isinstance(activities[1].created_at, datetime)
+
+
+def test_insert_columns_rejects_bad_input(db_session):
+    with pytest.raises(ValueError, match="Unknown columns"):
+        insert_columns(db_session, OnsenVisit, {"nope": np.array([1])})
+    with pytest.raises(ValueError, match="same length"):
+        insert_columns(db_session, OnsenVisit, {"onsen_id": np.array([1]), "entry_fee_yen": np.array([1, 2])})
+
+
+def test_dashboard_fetches_only_referenced_columns(visits):
+    graphs = [
+        GraphDefinition(
+            title="Sauna", graph_type=GraphType.PIE, data_source=DataSource.VISIT,
+            category=GraphCategory.CATEGORICAL, field="sauna_usage_status",
+        ),
+        GraphDefinition(
+            title="Hour", graph_type=GraphType.HISTOGRAM, data_source=DataSource.VISIT,
+            category=GraphCategory.TIME, field="visit_hour", color_field="weather",
+        ),
+    ]
+    columns = visit_columns_for(graphs)
+    assert columns == ["id", "visit_time", "weather", "had_sauna", "sauna_visited"]
+
+    builder = DashboardBuilder(visits)
+    subset = builder._fetch_visit_data(columns)
+    full = builder._fetch_visit_data()
+
+    assert list(full.columns) == VISIT_COLUMNS
+    assert subset.equals(full[columns])
+    prepared = builder._prepare_data(subset, DataSource.VISIT)
+    assert prepared["sauna_usage_status"].tolist() == ["Available & Not Used", "Not Available"]
+
+
+def test_wildcard_graph_needs_all_columns():
+    graph = GraphDefinition(
+        title="All", graph_type=GraphType.BAR, data_source=DataSource.VISIT,
+        category=GraphCategory.TIME, field="*",
+    )
+    assert visit_columns_for([graph]) == VISIT_COLUMNS
@@ -0,0 +1,135 @@
+"""Unit tests for streaming, diffing onsen imports."""
+
+import json
+
+import pytest
+
+import src.db.import_data as import_data
+from src.db.import_data import import_onsen_data, iter_json_object
+from src.db.models import Onsen
+
+
+def _entry(onsen_id: int, **overrides) -> dict:
+    mapped = {
+        "ban_number": str(onsen_id),
+        "name": f"温泉 {onsen_id}",
+        "region": "別府",
+        "latitude": 33.2 + onsen_id / 1000,
+        "longitude": 131.5,
+        "usage_time": "6:30～22:30",
+    }
+    mapped.update(overrides)
+    return {"onsen_id": str(onsen_id), "raw_html": "<html>\"x\"</html>" * 50, "mapped_data": mapped}
+
+
+def _write(path, entries: dict) -> str:
+    path.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def cleared(monkeypatch):
+    namespaces = []
+    monkeypatch.setattr(import_data, "clear_recommendation_cache", namespaces.append)
+    return namespaces
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_object_matches_json_load(tmp_path, chunk_size):
+    data = {
+        "1": _entry(1),
+        "2": {"n": 12345678901234, "f": -1.5e-3, "s": "a\\\"}{", "l": [1, [2, {}]], "t": True},
+        "3": None,
+    }
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    assert dict(iter_json_object(str(path), chunk_size=chunk_size)) == data
+
+
+def test_iter_json_object_rejects_truncated_files(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({"1": _entry(1), "2": _entry(2)})[:-40], encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_json_object(str(path), chunk_size=16))
+
+
+def test_import_writes_only_changed_rows(db_session, tmp_path, cleared):
+    entries = {str(i): _entry(i) for i in range(1, 6)}
+    entries["x"] = _entry(99)
+    entries["7"] = _entry(7, name=None)
+    path = _write(tmp_path / "scrape.json", entries)
+
+    summary = import_onsen_data(db_session, path, batch_size=2)
+    assert summary == {"inserted": 5, "updated": 0, "unchanged": 0, "skipped": 2}
+    assert db_session.query(Onsen).count() == 5
+    assert len(cleared) == 2
+
+    # Re-importing the same scrape touches nothing
+    cleared.clear()
+    summary = import_onsen_data(db_session, path)
+    assert summary == {"inserted": 0, "updated": 0, "unchanged": 5, "skipped": 2}
+    assert not cleared
+
+    # Text changes update the row without invalidating distance caches
+    entries["2"] = _entry(2, usage_time="10:00～21:00")
+    summary = import_onsen_data(db_session, _write(tmp_path / "scrape.json", entries))
+    assert summary["updated"] == 1 and summary["unchanged"] == 4
+    assert not cleared
+    db_session.expire_all()
+    assert db_session.get(Onsen, 2).usage_time == "10:00～21:00"
+
+    # A moved onsen refreshes location-dependent caches
+    entries["3"] = _entry(3, latitude=33.5)
+    summary = import_onsen_data(db_session, _write(tmp_path / "scrape.json", entries))
+    assert summary["updated"] == 1
+    assert len(cleared) == 2
+
+
+@pytest.mark.usefixtures("cleared")
+def test_import_matches_by_ban_number_and_moves_ids(db_session, tmp_path):
+    db_session.add(Onsen(id=40, ban_number="4", name="old", region="別府"))
+    db_session.commit()
+
+    summary = import_onsen_data(db_session, _write(tmp_path / "scrape.json", {"4": _entry(4)}))
+
+    assert summary["updated"] == 1
+    db_session.expire_all()
+    onsen = db_session.query(Onsen).filter_by(ban_number="4").one()
+    assert onsen.id == 4
+    assert onsen.name == "温泉 4"
+
+
+@pytest.mark.usefixtures("cleared")
+def test_import_writes_in_file_order_when_ban_numbers_move(db_session, tmp_path):
+    db_session.add_all(
+        [
+            Onsen(id=3, ban_number="D", name="old", region="別府"),
+            Onsen(id=4, ban_number="B", name="old", region="別府"),
+        ]
+    )
+    db_session.commit()
+    entries = {
+        "4": _entry(4, ban_number="E"),
+        "2": _entry(2, ban_number="E"),
+        "5": _entry(5, ban_number="B"),
+    }
+
+    summary = import_onsen_data(db_session, _write(tmp_path / "scrape.json", entries), batch_size=2)
+
+    assert summary["inserted"] + summary["updated"] == 3
+    db_session.expire_all()
+    rows = {onsen.ban_number: onsen.id for onsen in db_session.query(Onsen)}
+    assert rows == {"D": 3, "E": 2, "B": 5}
+
+
+def test_malformed_file_imports_nothing(db_session, tmp_path, cleared):
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({"1": _entry(1), "2": _entry(2)})[:-40], encoding="utf-8")
+
+    summary = import_onsen_data(db_session, str(path), batch_size=1)
+
+    assert summary["inserted"] == 0
+    assert db_session.query(Onsen).count() == 0
+    assert not cleared
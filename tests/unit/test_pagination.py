@@ -0,0 +1,91 @@
+"""Unit tests for keyset-paginated listing queries."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from src.cli.commands.visit.list import list_visits
+from src.db.models import OnsenVisit
+from src.db.pagination import iter_keyset
+from src.lib.onsen_filter import ONSEN_SUMMARY_COLUMNS, format_onsen_summary_table, iter_onsen_summary_table
+
+
+@pytest.fixture
+def visits(db_session, sample_onsen):
+    start = datetime(2025, 1, 1, 10)
+    # Repeated and missing visit times exercise the tie-breaker and NULL ordering
+    times = [start, start, start + timedelta(days=1), None, start + timedelta(days=2), None, start]
+    db_session.add_all(
+        [OnsenVisit(onsen_id=sample_onsen.id, visit_time=time, personal_rating=i) for i, time in enumerate(times)]
+    )
+    db_session.commit()
+    return db_session
+
+
+def _expected_ids(session, descending):
+    rows = session.execute(select(OnsenVisit.id, OnsenVisit.visit_time)).all()
+    with_time = sorted((row for row in rows if row.visit_time), key=lambda row: (row.visit_time, row.id),
+                       reverse=descending)
+    without_time = sorted((row for row in rows if row.visit_time is None), key=lambda row: row.id,
+                          reverse=descending)
+    return [row.id for row in with_time + without_time]
+
+
+def _ids(session, **kwargs):
+    rows = iter_keyset(
+        session, select(OnsenVisit.id, OnsenVisit.visit_time), OnsenVisit.visit_time, OnsenVisit.id, **kwargs
+    )
+    return [row.id for row in rows]
+
+
+class TestIterKeyset:
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_batches_follow_a_single_ordered_scan(self, visits, descending):
+        expected = _expected_ids(visits, descending)
+
+        assert _ids(visits, descending=descending, batch_size=2) == expected
+        assert _ids(visits, descending=descending, batch_size=100) == expected
+
+    def test_limit_offset_and_cursor(self, visits):
+        expected = _expected_ids(visits, True)
+
+        assert _ids(visits, descending=True, limit=3, offset=2, batch_size=2) == expected[2:5]
+        assert _ids(visits, descending=True, after=expected[1], batch_size=2) == expected[2:]
+        # Cursor on a NULL visit time continues among the NULLs
+        assert _ids(visits, descending=True, after=expected[-2]) == expected[-1:]
+        assert _ids(visits, limit=0) == []
+
+    def test_unknown_cursor(self, visits):
+        with pytest.raises(ValueError, match="999"):
+            _ids(visits, after=999)
+
+
+class TestListingCommands:
+    def test_visit_list_pages(self, visits, capsys):
+        @contextmanager
+        def session(url=None):  # pylint: disable=unused-argument
+            yield visits
+
+        expected = _expected_ids(visits, True)
+        with patch("src.cli.commands.visit.list.get_db", session):
+            list_visits(SimpleNamespace(database="unused.db", limit=2, offset=None, after=None))
+            first = capsys.readouterr().out
+            list_visits(SimpleNamespace(database="unused.db", limit=2, offset=None, after=expected[1]))
+            second = capsys.readouterr().out
+
+        assert [line for line in first.splitlines() if line.startswith("Visit ID")] == [
+            f"Visit ID: {visit_id}" for visit_id in expected[:2]
+        ]
+        assert "Onsen: テスト温泉 (ID: 1)" in first
+        assert f"Next page: --after {expected[1]}" in first
+        assert f"Visit ID: {expected[2]}" in second
+
+    def test_summary_table_streams_rows(self, db_session, sample_onsen):
+        rows = db_session.execute(select(*ONSEN_SUMMARY_COLUMNS)).all()
+
+        assert "\n".join(iter_onsen_summary_table(rows)) == format_onsen_summary_table([sample_onsen])
+        assert list(iter_onsen_summary_table([])) == ["No onsens found."]